@@ -0,0 +1,194 @@
+"""Reading analytics computed with NumPy.
+
+Each user's history is pulled as two compact columnar arrays, one query
+each: the finish dates of their finished books, and ``(book, time, page,
+day)`` for their notes, ``day`` being the note's date in the current time
+zone, like the finish dates. Everything else is array arithmetic:
+
+- ``heatmap``: books finished per day, one array per calendar year
+- ``streaks``: longest and current runs of consecutive active days, where
+  a day is active if the user finished a book or wrote a note
+- ``monthly``: books finished per month from the first to the last finish,
+  with a trailing 12-month average and the slope over the last 12 months
+- ``pace``: pages per day, from how far ``page_number`` moved between a
+  book's first and last notes
+
+Results are cached under the user's ``books`` and ``user_notes`` version
+stamps and today's date (the current streak depends on it), so any write
+to the user's books or notes starts a fresh computation.
+"""
+from datetime import datetime
+
+import numpy as np
+from django.conf import settings
+from django.core.cache import cache
+from django.utils import timezone
+
+from . import versions
+from .models import Book, Note
+
+SECONDS_PER_DAY = 86400
+
+
+def _finish_days(user):
+    dates = Book.objects.filter(
+        user=user, finished=True, finish_date__isnull=False
+    ).values_list("finish_date", flat=True)
+    return np.array(list(dates), dtype="datetime64[D]")
+
+
+def _note_columns(user):
+    rows = Note.objects.filter(book__user=user).values_list("book_id", "created_at", "page_number")
+    book_ids, times, pages = [], [], []
+    for book_id, created_at, page in rows:
+        book_ids.append(book_id)
+        times.append(created_at.timestamp())
+        pages.append(-1 if page is None else page)
+    times = np.array(times, dtype=np.float64)
+    return (
+        np.array(book_ids, dtype=np.int64),
+        times,
+        np.array(pages, dtype=np.int64),
+        _local_days(times),
+    )
+
+
+def _utc_offset(timestamp, tz):
+    return datetime.fromtimestamp(timestamp, tz).utcoffset().total_seconds()
+
+
+def _local_days(times):
+    """Dates in the current time zone of the UTC timestamps ``times``.
+
+    Looks the offset up once per UTC day rather than per note (calling
+    ``timezone.localtime`` on each note doubled the fetch time); only
+    notes on days whose offset changes get one lookup each.
+    """
+    tz = timezone.get_current_timezone()
+    utc_days, inverse = np.unique(times // SECONDS_PER_DAY, return_inverse=True)
+    starts = np.array([_utc_offset(day * SECONDS_PER_DAY, tz) for day in utc_days])
+    ends = np.array([_utc_offset((day + 1) * SECONDS_PER_DAY - 1, tz) for day in utc_days])
+    offsets = starts[inverse]
+    changing = np.flatnonzero((starts != ends)[inverse])
+    offsets[changing] = [_utc_offset(t, tz) for t in times[changing]]
+    return ((times + offsets) // SECONDS_PER_DAY).astype(np.int64).astype("datetime64[D]")
+
+
+def heatmap(days):
+    """``{year: {"start": "YYYY-01-01", "counts": [per day]}}``."""
+    if not days.size:
+        return {}
+    years = days.astype("datetime64[Y]")
+    first, last = years.min(), years.max()
+    start = first.astype("datetime64[D]")
+    end = (last + 1).astype("datetime64[D]")
+    counts = np.bincount((days - start).astype(np.int64), minlength=int((end - start).astype(np.int64)))
+
+    result = {}
+    boundaries = np.arange(first, last + 2).astype("datetime64[D]")
+    offsets = (boundaries - start).astype(np.int64)
+    for year_start, lo, hi in zip(boundaries[:-1], offsets[:-1], offsets[1:]):
+        result[str(year_start)[:4]] = {"start": str(year_start), "counts": counts[lo:hi].tolist()}
+    return result
+
+
+def streaks(active_days, today):
+    """Longest and current runs of consecutive days in ``active_days``."""
+    empty = {"days": 0, "start": None, "end": None}
+    days = np.unique(active_days)
+    if not days.size:
+        return {"longest": empty, "current": empty}
+
+    breaks = np.flatnonzero(np.diff(days).astype(np.int64) != 1)
+    starts = np.concatenate(([0], breaks + 1))
+    ends = np.concatenate((breaks, [days.size - 1]))
+    lengths = ends - starts + 1
+
+    def run(i):
+        return {"days": int(lengths[i]), "start": str(days[starts[i]]), "end": str(days[ends[i]])}
+
+    # The current streak survives until a full day passes with no activity.
+    current = run(-1) if (np.datetime64(today, "D") - days[-1]).astype(np.int64) <= 1 else empty
+    return {"longest": run(int(lengths.argmax())), "current": current}
+
+
+def monthly(days, today):
+    """Books finished per month, a trailing 12-month mean and recent trend."""
+    if not days.size:
+        return {"months": [], "counts": [], "rolling_12": [], "trend_per_month": 0.0}
+    months = days.astype("datetime64[M]")
+    first = months.min()
+    last = max(months.max(), np.datetime64(today, "M"))
+    counts = np.bincount((months - first).astype(np.int64), minlength=int((last - first).astype(np.int64)) + 1)
+
+    # Mean of the 12 months ending at each month (fewer at the start).
+    cumulative = np.concatenate(([0], np.cumsum(counts)))
+    index = np.arange(1, counts.size + 1)
+    window = np.minimum(index, 12)
+    rolling = (cumulative[index] - cumulative[index - window]) / window
+
+    recent = counts[-12:]
+    trend = float(np.polyfit(np.arange(recent.size), recent, 1)[0]) if recent.size >= 2 else 0.0
+    return {
+        "months": [str(m) for m in np.arange(first, last + 1)],
+        "counts": counts.tolist(),
+        "rolling_12": np.round(rolling, 2).tolist(),
+        "trend_per_month": round(trend, 3),
+    }
+
+
+def pace(book_ids, times, pages):
+    """Pages per day, from page progress between each book's notes."""
+    mask = pages >= 0
+    book_ids, times, pages = book_ids[mask], times[mask] / SECONDS_PER_DAY, pages[mask]
+    if not book_ids.size:
+        return {"books_measured": 0, "pages_tracked": 0, "median_pages_per_day": None, "pages_per_day": None}
+
+    order = np.lexsort((times, book_ids))
+    book_ids, times, pages = book_ids[order], times[order], pages[order]
+    group_starts = np.flatnonzero(np.concatenate(([True], book_ids[1:] != book_ids[:-1])))
+
+    span = np.maximum.reduceat(times, group_starts) - np.minimum.reduceat(times, group_starts)
+    progress = np.maximum.reduceat(pages, group_starts) - np.minimum.reduceat(pages, group_starts)
+    # Notes minutes apart would claim absurd speeds; count at least a day.
+    span = np.maximum(span, 1.0)
+    measured = progress > 0
+    if not measured.any():
+        return {"books_measured": 0, "pages_tracked": 0, "median_pages_per_day": None, "pages_per_day": None}
+
+    span, progress = span[measured], progress[measured]
+    return {
+        "books_measured": int(measured.sum()),
+        "pages_tracked": int(progress.sum()),
+        "median_pages_per_day": round(float(np.median(progress / span)), 2),
+        "pages_per_day": round(float(progress.sum() / span.sum()), 2),
+    }
+
+
+def compute(user, today=None):
+    today = today or timezone.localdate()
+    finish_days = _finish_days(user)
+    book_ids, times, pages, note_days = _note_columns(user)
+
+    years, year_counts = np.unique(finish_days.astype("datetime64[Y]"), return_counts=True)
+    return {
+        "total_finished": int(finish_days.size),
+        "by_year": {str(year): int(count) for year, count in zip(years, year_counts)},
+        "heatmap": heatmap(finish_days),
+        "streaks": streaks(np.concatenate((finish_days, note_days)), today),
+        "monthly": monthly(finish_days, today),
+        "pace": pace(book_ids, times, pages),
+    }
+
+
+def get(user):
+    """Return the cached analytics for user, computing them if needed."""
+    today = timezone.localdate()
+    books_version, notes_version = versions.get_many(("books", user.pk), ("user_notes", user.pk))
+    key = f"analytics:{user.pk}:{books_version}:{notes_version}:{today.isoformat()}"
+    result = cache.get(key)
+    if result is None:
+        result = compute(user, today)
+        cache.set(key, result, getattr(settings, "ANALYTICS_CACHE_TTL", 86400))
+    return result
+
@@ -1,6 +1,10 @@
-from django.http import JsonResponse
+from django.http import JsonResponse, StreamingHttpResponse
 from .models import Book, Note
+from . import analytics, export, feed, importer, note_batch, search, search_cache, user_search, versions
+from .pagination import InvalidCursor, page_size, paginate
+from jobs.queue import enqueue
 from django.contrib.auth.decorators import login_required
+import io
 import json
 from django.views.decorators.http import require_POST, require_GET
 from django.shortcuts import get_object_or_404
@@ -26,6 +30,7 @@ def add_book(request):
                 author=author,
                 user=request.user
             )
+            enqueue("books.enrich_book", {"book_id": book.id})
 
             return JsonResponse({
                 "id": book.id,
@@ -38,17 +43,27 @@ def add_book(request):
 
     return JsonResponse({"error": "Invalid request"}, status=400)
 
+def _own_book_stamps(request, pk):
+    if not Book.objects.filter(pk=pk, user=request.user).exists():
+        return None
+    return [("notes", pk)]
+
 @login_required
+@versions.conditional(_own_book_stamps)
 def book_notes_api(request, pk):
     book = get_object_or_404(Book, pk=pk, user=request.user)
+    notes = Note.objects.filter(book=book).values("id", "content", "page_number", "chapter", "created_at")
+    try:
+        notes, next_cursor = paginate(notes, request)
+    except InvalidCursor as e:
+        return JsonResponse({"error": str(e)}, status=400)
 
-    notes = list(
-        Note.objects.filter(book=book)
-        .values("id", "content", "page_number", "chapter", "created_at")
-        .order_by("-created_at")
-    )
-
-    return JsonResponse(notes, safe=False)
+    # The body stays a plain list for existing clients; the cursor for the
+    # next page travels in a header.
+    response = JsonResponse(notes, safe=False)
+    if next_cursor:
+        response["X-Next-Cursor"] = next_cursor
+    return response
 
 @login_required
 @require_POST
@@ -90,12 +105,14 @@ def add_note_api(request, pk):
 def delete_note_api(request, pk):
     note = get_object_or_404(Note, pk=pk, book__user=request.user)
     note.delete()
+    versions.bump("notes", note.book_id)
+    versions.bump("user_notes", request.user.pk)
     return JsonResponse({"success": True})
 
 @login_required
 @require_POST
 def edit_note_api(request, pk):
-    note = get_object_or_404(Note, pk=pk, book__user=request.user)
+    note = get_object_or_404(Note.objects.select_related("book"), pk=pk, book__user=request.user)
 
     data = json.loads(request.body)
     content = data.get("content")
@@ -117,23 +134,78 @@ def edit_note_api(request, pk):
         "chapter": note.chapter,
     })
 
+@login_required
+@require_POST
+def batch_notes_api(request, pk):
+    """POST /api/books/<pk>/notes/batch/  {"operations": [...]}, see note_batch"""
+    book = get_object_or_404(Book, pk=pk, user=request.user)
+    try:
+        data = json.loads(request.body)
+    except (json.JSONDecodeError, UnicodeDecodeError):
+        return JsonResponse({"error": "Invalid JSON"}, status=400)
+
+    try:
+        result = note_batch.apply(book, data.get("operations") if isinstance(data, dict) else None)
+    except note_batch.BatchError as e:
+        return JsonResponse({"error": str(e), "errors": e.errors}, status=400)
+    return JsonResponse(result)
+
+@login_required
+@require_GET
+def reading_analytics(request):
+    """GET /api/stats/ — heatmap, streaks, monthly trend and reading pace"""
+    return JsonResponse(analytics.get(request.user))
+
+@login_required
+@require_GET
+def export_library(request):
+    """GET /api/export/?format=ndjson|json — the whole library with notes"""
+    fmt = request.GET.get("format", "ndjson")
+    if fmt not in export.FORMATS:
+        return JsonResponse({"error": "Unknown format"}, status=400)
+
+    response = StreamingHttpResponse(
+        export.stream_library(request.user, fmt),
+        content_type=export.FORMATS[fmt],
+    )
+    response["Content-Disposition"] = f'attachment; filename="library.{fmt}"'
+    return response
+
+@login_required
+@require_POST
+def import_library(request):
+    """POST /api/import/  multipart: file, format=csv|ndjson"""
+    upload = request.FILES.get("file")
+    if upload is None:
+        return JsonResponse({"error": "file is required"}, status=400)
+
+    fmt = request.POST.get("format") or ("ndjson" if upload.name.endswith((".ndjson", ".jsonl")) else "csv")
+    if fmt not in importer.FORMATS:
+        return JsonResponse({"error": "Unknown format"}, status=400)
+
+    stream = io.TextIOWrapper(upload.file, encoding="utf-8-sig", newline="")
+    try:
+        summary = importer.import_library(request.user, stream, fmt)
+    except UnicodeDecodeError:
+        # Only raised before any row was read; later decode errors come
+        # back as a row error next to what was imported.
+        return JsonResponse({"error": "File must be UTF-8 encoded"}, status=400)
+
+    return JsonResponse(summary, status=201 if summary["created"] else 200)
+
 @login_required
 @require_GET
-def open_library_search(request):
+async def open_library_search(request):
     query = request.GET.get("q")
 
     if not query:
         return JsonResponse({"error": "No query provided"}, status=400)
 
-    url = "https://openlibrary.org/search.json"
-
-    response = requests.get(url, params={"q": query})
-
-    if response.status_code != 200:
+    try:
+        data = await search_cache.asearch(query)
+    except (requests.RequestException, ValueError):
         return JsonResponse({"error": "Open Library error"}, status=500)
 
-    data = response.json()
-
     # Return only what we care about
     results = []
 
@@ -151,27 +223,7 @@ def open_library_search(request):
 from .models import FriendRequest
 from django.contrib.auth.models import User
 from django.db.models import Q
-
-
-def get_friends(user):
-    """Return queryset of Users who are accepted friends of user."""
-    accepted = FriendRequest.objects.filter(
-        Q(from_user=user, accepted=True) | Q(to_user=user, accepted=True)
-    )
-    friend_ids = []
-    for req in accepted:
-        if req.from_user == user:
-            friend_ids.append(req.to_user_id)
-        else:
-            friend_ids.append(req.from_user_id)
-    return User.objects.filter(id__in=friend_ids)
-
-
-def are_friends(user_a, user_b):
-    return FriendRequest.objects.filter(
-        Q(from_user=user_a, to_user=user_b, accepted=True) |
-        Q(from_user=user_b, to_user=user_a, accepted=True)
-    ).exists()
+from .friends import annotate_status, are_friends, friend_ids, get_friends
 
 
 @login_required
@@ -181,32 +233,16 @@ def search_users(request):
     if not q:
         return JsonResponse({'results': []})
 
-    users = User.objects.filter(username__icontains=q).exclude(id=request.user.id)[:10]
-    friends = get_friends(request.user)
-    friend_ids = set(friends.values_list('id', flat=True))
-
-    # pending requests sent by me
-    pending_sent = set(
-        FriendRequest.objects.filter(from_user=request.user, accepted=False)
-        .values_list('to_user_id', flat=True)
-    )
-    # pending requests sent to me
-    pending_received = set(
-        FriendRequest.objects.filter(to_user=request.user, accepted=False)
-        .values_list('from_user_id', flat=True)
+    users = user_search.search(
+        q,
+        exclude_id=request.user.id,
+        limit=10,
+        queryset=annotate_status(User.objects.all(), request.user),
     )
-
-    results = []
-    for u in users:
-        if u.id in friend_ids:
-            status = 'friend'
-        elif u.id in pending_sent:
-            status = 'pending_sent'
-        elif u.id in pending_received:
-            status = 'pending_received'
-        else:
-            status = 'none'
-        results.append({'id': u.id, 'username': u.username, 'status': status})
+    results = [
+        {'id': u.id, 'username': u.username, 'status': u.friendship_status}
+        for u in users
+    ]
 
     return JsonResponse({'results': results})
 
@@ -255,6 +291,7 @@ def respond_friend_request(request, request_id):
 
 
 @login_required
+@versions.conditional(lambda request: [("friends", request.user.pk)])
 def list_friends(request):
     """GET /api/friends/"""
     friends = get_friends(request.user)
@@ -263,6 +300,7 @@ def list_friends(request):
 
 
 @login_required
+@versions.conditional(lambda request: [("friend_requests", request.user.pk)])
 def list_friend_requests(request):
     """GET /api/friends/requests/ — incoming pending requests"""
     incoming = FriendRequest.objects.filter(to_user=request.user, accepted=False).select_related('from_user')
@@ -270,20 +308,45 @@ def list_friend_requests(request):
     return JsonResponse({'requests': data})
 
 
+def _friend_books_stamps(request, username):
+    friend_id = User.objects.filter(username=username).values_list('id', flat=True).first()
+    if friend_id is None or not are_friends(request.user, friend_id):
+        return None
+    return [('books', friend_id), ('friends', request.user.pk)]
+
+
 @login_required
+@versions.conditional(_friend_books_stamps)
 def friend_books(request, username):
     """GET /api/friends/<username>/books/"""
     friend = get_object_or_404(User, username=username)
     if not are_friends(request.user, friend):
         return JsonResponse({'error': 'Not friends'}, status=403)
 
-    books = Book.objects.filter(user=friend).values(
-        'id', 'title', 'author', 'finished', 'finish_date', 'cover_url', 'created_at'
+    try:
+        books, next_cursor = paginate(
+            Book.objects.filter(user=friend).values(
+                'id', 'title', 'author', 'finished', 'finish_date', 'cover_url', 'created_at'
+            ),
+            request,
+        )
+    except InvalidCursor as e:
+        return JsonResponse({'error': str(e)}, status=400)
+    return JsonResponse({'books': books, 'username': username, 'next_cursor': next_cursor})
+
+
+def _friend_book_notes_stamps(request, username, book_id):
+    friend_id = (
+        Book.objects.filter(id=book_id, user__username=username)
+        .values_list('user_id', flat=True).first()
     )
-    return JsonResponse({'books': list(books), 'username': username})
+    if friend_id is None or not are_friends(request.user, friend_id):
+        return None
+    return [('notes', book_id), ('friends', request.user.pk)]
 
 
 @login_required
+@versions.conditional(_friend_book_notes_stamps)
 def friend_book_notes(request, username, book_id):
     """GET /api/friends/<username>/books/<book_id>/notes/"""
     friend = get_object_or_404(User, username=username)
@@ -291,11 +354,40 @@ def friend_book_notes(request, username, book_id):
         return JsonResponse({'error': 'Not friends'}, status=403)
 
     book = get_object_or_404(Book, id=book_id, user=friend)
-    notes = list(
-        book.notes.values('id', 'content', 'page_number', 'chapter', 'created_at')
-        .order_by('-created_at')
-    )
-    return JsonResponse({'notes': notes, 'book_title': book.title})
+    try:
+        notes, next_cursor = paginate(
+            book.notes.values('id', 'content', 'page_number', 'chapter', 'created_at'),
+            request,
+        )
+    except InvalidCursor as e:
+        return JsonResponse({'error': str(e)}, status=400)
+    return JsonResponse({'notes': notes, 'book_title': book.title, 'next_cursor': next_cursor})
+
+
+@login_required
+@require_GET
+def friend_feed(request):
+    """GET /api/friends/feed/?cursor=... — friends' recent activity, newest first"""
+    try:
+        events, next_cursor = feed.feed(request.user, page_size(request), request.GET.get('cursor'))
+    except feed.InvalidCursor as e:
+        return JsonResponse({'error': str(e)}, status=400)
+    return JsonResponse({'events': events, 'next_cursor': next_cursor})
+
+
+@login_required
+@require_GET
+def search_library(request):
+    """GET /api/search/?q=text&scope=mine|friends — ranked books and notes"""
+    q = request.GET.get('q', '').strip()
+    if not q:
+        return JsonResponse({'error': 'No query provided'}, status=400)
+
+    user_ids = {request.user.id}
+    if request.GET.get('scope') == 'friends':
+        user_ids |= friend_ids(request.user)
+
+    return JsonResponse(search.search(q, user_ids))
 
 
 @login_required
@@ -0,0 +1,46 @@
+"""Process-shared counters stored in Django's cache.
+
+Counters live in the ``default`` cache so that, with a shared backend, every
+worker increments the same value. With the per-process default (LocMem)
+each worker counts only its own requests: the metrics endpoint then reports
+the worker that served it, and ``manage.py cache_stats``, a process of its
+own, prints its own counts with a warning.
+"""
+from asgiref.sync import sync_to_async
+from django.core.cache import caches
+from django.core.cache.backends.dummy import DummyCache
+from django.core.cache.backends.locmem import LocMemCache
+
+KEY_PREFIX = "counter:"
+
+
+def is_shared():
+    """Whether other processes see the counters (not a per-process cache)."""
+    return not isinstance(caches["default"], (LocMemCache, DummyCache))
+
+
+def incr(name, delta=1):
+    cache = caches["default"]
+    key = KEY_PREFIX + name
+    try:
+        cache.incr(key, delta)
+    except ValueError:
+        # First hit for this counter; if another worker won the race to
+        # create it, fall back to incrementing theirs.
+        if not cache.add(key, delta, timeout=None):
+            cache.incr(key, delta)
+
+
+async def aincr(name, delta=1):
+    # Not cache.aincr: the base implementation is a get followed by a set,
+    # which loses concurrent increments. The sync incr is atomic.
+    await sync_to_async(incr, thread_sensitive=False)(name, delta)
+
+
+def get_many(names):
+    values = caches["default"].get_many([KEY_PREFIX + name for name in names])
+    return {name: values.get(KEY_PREFIX + name, 0) for name in names}
+
+
+def reset(names):
+    caches["default"].delete_many([KEY_PREFIX + name for name in names])
@@ -0,0 +1,185 @@
+"""On-disk cache behind the cover image proxy.
+
+Each cover is fetched once through the pooled Open Library client and stored
+under the SHA-256 of its bytes (``objects/ab/abcd....``); a small pointer
+file per source URL (``urls/<sha1 of url>``) records which object it maps
+to. Reads touch the object's mtime, and when the cache grows beyond
+``COVER_CACHE_MAX_BYTES`` the least recently used objects are removed.
+Each process keeps a running total of the cache's size, adding what it
+writes, and only walks the directory when the total passes the limit or
+every ``RESCAN_INTERVAL`` seconds (to count other processes' writes).
+
+Only raster images are cached and served: an upstream response with any
+other Content-Type, SVG included since it can carry script, is refused.
+
+Size variants map onto Open Library's own ``-S``/``-M``/``-L`` renditions,
+so nothing is resized locally.
+"""
+import hashlib
+import os
+import re
+import tempfile
+import threading
+import time
+from pathlib import Path
+from urllib.parse import urlparse
+
+from django.conf import settings
+
+from . import openlibrary
+
+SIZES = ("S", "M", "L")
+DEFAULT_HOSTS = ("covers.openlibrary.org",)
+
+RESCAN_INTERVAL = 300
+
+_SIZE_SUFFIX = re.compile(r"-[SML](\.\w+)$")
+_evict_lock = threading.Lock()  # guards the two below
+_usage = None  # bytes in objects/ at the last scan, plus writes since
+_scanned_at = 0.0
+
+
+class CoverError(Exception):
+    pass
+
+
+class CoverUnavailable(CoverError):
+    """Open Library's response was not a usable image."""
+
+
+def _root():
+    return Path(getattr(settings, "COVER_CACHE_DIR", settings.BASE_DIR / "cover_cache"))
+
+
+def is_proxied(url):
+    hosts = getattr(settings, "COVER_PROXY_HOSTS", DEFAULT_HOSTS)
+    return bool(url) and urlparse(url).hostname in hosts
+
+
+def variant_url(url, size):
+    """Point an Open Library cover URL at the requested size rendition."""
+    return _SIZE_SUFFIX.sub(f"-{size}\\1", url)
+
+
+def _pointer_path(url):
+    return _root() / "urls" / hashlib.sha1(url.encode()).hexdigest()
+
+
+def _object_path(digest):
+    return _root() / "objects" / digest[:2] / digest
+
+
+def _write_atomic(path, data):
+    path.parent.mkdir(parents=True, exist_ok=True)
+    fd, tmp = tempfile.mkstemp(dir=path.parent)
+    with os.fdopen(fd, "wb") as f:
+        f.write(data)
+    os.replace(tmp, path)
+
+
+def get(url, size="M"):
+    """Return ``(path, digest, content_type)`` for the cover, fetching it if needed.
+
+    Raises ``CoverError`` for URLs outside the allowed hosts and
+    ``requests.RequestException`` if the upstream fetch fails.
+    """
+    if not is_proxied(url):
+        raise CoverError("Cover host not allowed")
+    if size not in SIZES:
+        raise CoverError("Unknown size")
+
+    source = variant_url(url, size)
+    pointer = _pointer_path(source)
+    try:
+        digest, content_type = pointer.read_text().split("\n", 1)
+        path = _object_path(digest)
+        os.utime(path)
+        return path, digest, content_type
+    except (FileNotFoundError, ValueError):
+        pass
+
+    response = openlibrary.get(source)
+    response.raise_for_status()
+    content_type = response.headers.get("Content-Type", "")
+    if not is_image(content_type):
+        raise CoverUnavailable(f"Not an image: {content_type or 'no Content-Type'}")
+    data = response.content
+    digest = hashlib.sha256(data).hexdigest()
+
+    path = _object_path(digest)
+    if not path.exists():
+        _write_atomic(path, data)
+        _added(len(data))
+    _write_atomic(pointer, f"{digest}\n{content_type}".encode())
+    return path, digest, content_type
+
+
+def is_image(content_type):
+    media_type = content_type.split(";", 1)[0].strip().lower()
+    return media_type.startswith("image/") and media_type != "image/svg+xml"
+
+
+def open_cover(url, size="M"):
+    """Like ``get``, but return an open file instead of a path.
+
+    Another request's ``evict`` can remove the object between ``get``
+    returning its path and the file being opened; it is then fetched again.
+    """
+    path, digest, content_type = get(url, size)
+    try:
+        return path.open("rb"), digest, content_type
+    except FileNotFoundError:
+        path, digest, content_type = get(url, size)
+        return path.open("rb"), digest, content_type
+
+
+def _max_bytes():
+    return getattr(settings, "COVER_CACHE_MAX_BYTES", 200 * 1024 * 1024)
+
+
+def _added(size):
+    """Count a newly written object, and evict if the cache may be full."""
+    global _usage
+    with _evict_lock:
+        fresh = _usage is not None and time.monotonic() - _scanned_at < RESCAN_INTERVAL
+        if fresh:
+            _usage += size
+            if _usage <= _max_bytes():
+                return
+    evict()
+
+
+def evict(max_bytes=None):
+    """Remove least recently used objects until the cache fits ``max_bytes``.
+
+    Walks the whole cache, and resets the running total to what it finds.
+    Pointers to removed objects are left behind; they are treated as misses
+    and rewritten on the next request.
+    """
+    global _usage, _scanned_at
+    if max_bytes is None:
+        max_bytes = _max_bytes()
+
+    with _evict_lock:
+        objects = []
+        total = 0
+        for path in (_root() / "objects").glob("*/*"):
+            try:
+                stat = path.stat()
+            except FileNotFoundError:
+                continue
+            objects.append((stat.st_mtime, stat.st_size, path))
+            total += stat.st_size
+
+        removed = 0
+        if total > max_bytes:
+            # Evict down to 90% so every write doesn't trigger another pass.
+            target = max_bytes * 0.9
+            for _, size, path in sorted(objects):
+                if total <= target:
+                    break
+                path.unlink(missing_ok=True)
+                total -= size
+                removed += 1
+        _usage, _scanned_at = total, time.monotonic()
+        return removed
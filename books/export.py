@@ -0,0 +1,111 @@
+"""Streaming export of a user's library.
+
+Books are read in keyset-paginated chunks and each chunk's notes through a
+server-side cursor (``QuerySet.iterator``), so memory use depends on the
+chunk size rather than on the size of the library.
+"""
+import json
+from itertools import groupby
+from operator import itemgetter
+
+from django.core.serializers.json import DjangoJSONEncoder
+
+from .models import Book, Note
+
+BOOK_FIELDS = ("id", "title", "author", "finished", "finish_date", "cover_url", "created_at")
+NOTE_FIELDS = ("id", "content", "page_number", "chapter", "created_at")
+
+CHUNK_SIZE = 500
+BUFFER_SIZE = 64 * 1024
+
+FORMATS = {
+    "ndjson": "application/x-ndjson",
+    "json": "application/json",
+}
+
+
+def iter_library(user, chunk_size=CHUNK_SIZE):
+    """Yield ``(book, notes)`` for each of user's books, ordered by id.
+
+    ``book`` is a dict of BOOK_FIELDS and ``notes`` an iterator of note dicts
+    that must be consumed before the next pair is requested.
+    """
+    last_id = 0
+    while True:
+        books = list(
+            Book.objects.filter(user=user, id__gt=last_id)
+            .order_by("id")
+            .values(*BOOK_FIELDS)[:chunk_size]
+        )
+        if not books:
+            return
+
+        notes = (
+            Note.objects.filter(book__user=user, book_id__gte=books[0]["id"], book_id__lte=books[-1]["id"])
+            .order_by("book_id", "id")
+            .values("book_id", *NOTE_FIELDS)
+            .iterator(chunk_size=chunk_size * 4)
+        )
+        groups = groupby(notes, key=itemgetter("book_id"))
+        group = next(groups, None)
+
+        for book in books:
+            if group is not None and group[0] == book["id"]:
+                yield book, group[1]
+                group = next(groups, None)
+            else:
+                yield book, iter(())
+
+        last_id = books[-1]["id"]
+
+
+def _dumps(obj):
+    return json.dumps(obj, cls=DjangoJSONEncoder)
+
+
+def _note(note):
+    return {field: note[field] for field in NOTE_FIELDS}
+
+
+def _ndjson(user):
+    # One line per book with its notes nested.
+    for book, notes in iter_library(user):
+        book["notes"] = [_note(note) for note in notes]
+        yield _dumps(book) + "\n"
+
+
+def _json(user):
+    yield '{"books": ['
+    separator = ""
+    for book, notes in iter_library(user):
+        # Open the book object and stream its notes into it one by one.
+        yield separator + _dumps(book)[:-1] + ', "notes": ['
+        note_separator = ""
+        for note in notes:
+            yield note_separator + _dumps(_note(note))
+            note_separator = ", "
+        yield "]}"
+        separator = ", "
+    yield "]}\n"
+
+
+def _buffered(pieces, size=BUFFER_SIZE):
+    buffer = []
+    length = 0
+    for piece in pieces:
+        buffer.append(piece)
+        length += len(piece)
+        if length >= size:
+            yield "".join(buffer)
+            buffer = []
+            length = 0
+    if buffer:
+        yield "".join(buffer)
+
+
+def stream_library(user, format="ndjson"):
+    """Return an iterator of text chunks with user's library in ``format``."""
+    if format not in FORMATS:
+        raise ValueError(f"Unknown export format: {format}")
+    pieces = _ndjson(user) if format == "ndjson" else _json(user)
+    return _buffered(pieces)
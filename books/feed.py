@@ -0,0 +1,289 @@
+"""Friend activity feed.
+
+The feed interleaves three kinds of events from a user's friends, newest
+first: books added (``created_at``), books finished (``finish_date``, taken
+as midnight UTC) and notes written (``created_at``).
+
+It is built on read as a lazy k-way merge. Every (friend, kind) pair is a
+stream that starts with that friend's newest few events, fetched for all
+friends at once with one query per kind: a ``LATERAL`` join on PostgreSQL
+and a correlated ``IN`` subquery on SQLite, so each friend costs one short
+index range scan instead of the database sorting everyone's history.
+``heapq.merge`` pulls from the streams, and a stream that runs dry before
+the page is full fetches its friend's next chunk on its own. Only the
+events that make the page are then loaded in full.
+
+The first ``FEED_CACHE_SIZE`` events are cached per user for
+``FEED_CACHE_TTL`` seconds under the user's friends version stamp, so
+paging through the top of the feed costs no queries and friending or
+unfriending someone starts a new feed. Pages past the cached window are
+computed directly from the cursor.
+"""
+import base64
+import heapq
+import itertools
+import math
+from datetime import date, datetime, time, timezone as dt_timezone
+
+from django.conf import settings
+from django.core.cache import cache
+from django.db import connection
+
+from . import versions
+from .friends import friend_ids
+from .models import Book, Note
+
+ADDED = "added"
+FINISHED = "finished"
+NOTE = "note"
+
+# Orders events that share a timestamp.
+KIND_RANK = {ADDED: 0, FINISHED: 1, NOTE: 2}
+KINDS = {rank: kind for kind, rank in KIND_RANK.items()}
+
+# Each kind's newest-first slice for one friend. ``{columns}`` is ``id, at``
+# (or just ``id`` inside SQLite's IN subquery), ``{friend}`` the friend's id
+# expression and ``{before}`` an optional condition on ``at``.
+_SLICES = {
+    ADDED: """
+        SELECT {columns} FROM books_book b
+        WHERE b.user_id = {friend} {before}
+        ORDER BY b.created_at DESC, b.id DESC LIMIT %s
+    """,
+    FINISHED: """
+        SELECT {columns} FROM books_book b
+        WHERE b.user_id = {friend} AND b.finished AND b.finish_date IS NOT NULL {before}
+        ORDER BY b.finish_date DESC, b.id DESC LIMIT %s
+    """,
+    NOTE: """
+        SELECT {columns} FROM books_note n JOIN books_book nb ON nb.id = n.book_id
+        WHERE nb.user_id = {friend} {before}
+        ORDER BY n.created_at DESC, n.id DESC LIMIT %s
+    """,
+}
+
+_AT_COLUMNS = {ADDED: "b.created_at", FINISHED: "b.finish_date", NOTE: "n.created_at"}
+_ID_COLUMNS = {ADDED: "b.id", FINISHED: "b.id", NOTE: "n.id"}
+_TABLES = {ADDED: "books_book", FINISHED: "books_book", NOTE: "books_note"}
+
+_POSTGRES_BATCH = """
+    SELECT f.user_id, s.id, s.at
+    FROM unnest(%s::bigint[]) AS f(user_id)
+    CROSS JOIN LATERAL ({slice}) AS s(id, at)
+"""
+
+_SQLITE_BATCH = """
+    SELECT u.id, x.id, x.{at}
+    FROM auth_user u JOIN {table} x ON x.id IN ({slice})
+    WHERE u.id IN ({user_ids})
+"""
+
+
+class InvalidCursor(ValueError):
+    pass
+
+
+def encode_cursor(event):
+    raw = f"{event['at'].isoformat()}|{event['type']}|{event['id']}"
+    return base64.urlsafe_b64encode(raw.encode()).decode().rstrip("=")
+
+
+def decode_cursor(cursor):
+    """Return the ``(at, kind rank, id)`` key encoded in ``cursor``."""
+    try:
+        raw = base64.urlsafe_b64decode(cursor + "=" * (-len(cursor) % 4)).decode()
+        at, kind, pk = raw.split("|")
+        return (datetime.fromisoformat(at), KIND_RANK[kind], int(pk))
+    except (ValueError, KeyError, UnicodeDecodeError) as exc:
+        raise InvalidCursor("Invalid cursor") from exc
+
+
+def _aware(value):
+    if isinstance(value, str):
+        value = datetime.fromisoformat(value) if " " in value or "T" in value else date.fromisoformat(value)
+    if not isinstance(value, datetime):
+        return datetime.combine(value, time.min, tzinfo=dt_timezone.utc)
+    if value.tzinfo is None:
+        return value.replace(tzinfo=dt_timezone.utc)
+    return value
+
+
+def _db_value(kind, at):
+    """``at`` as a query parameter for the kind's timestamp column."""
+    if kind == FINISHED:
+        return connection.ops.adapt_datefield_value(at.date())
+    return connection.ops.adapt_datetimefield_value(at)
+
+
+def _before(kind, key, strict):
+    """SQL condition and params for rows before ``key`` (an event key)."""
+    if key is None:
+        return "", []
+    at, pk = _db_value(kind, key[0]), key[2]
+    column, id_column = _AT_COLUMNS[kind], _ID_COLUMNS[kind]
+    if strict:
+        return f"AND ({column} < %s OR ({column} = %s AND {id_column} < %s))", [at, at, pk]
+    # Inclusive; events at exactly the cursor time are checked against the
+    # full key after merging.
+    return f"AND {column} <= %s", [at]
+
+
+def _slice_sql(kind, friend, condition, id_only=False):
+    columns = _ID_COLUMNS[kind] if id_only else f"{_ID_COLUMNS[kind]}, {_AT_COLUMNS[kind]}"
+    return _SLICES[kind].format(columns=columns, friend=friend, before=condition)
+
+
+def _first_slices(kind, user_ids, size, before):
+    """``{friend id: [(id, at), ...]}`` with up to ``size`` rows per friend."""
+    condition, params = _before(kind, before, strict=False)
+    if connection.vendor == "postgresql":
+        sql = _POSTGRES_BATCH.format(slice=_slice_sql(kind, "f.user_id", condition))
+        params = [list(user_ids), *params, size]
+    else:
+        sql = _SQLITE_BATCH.format(
+            at=_AT_COLUMNS[kind].split(".")[1],
+            table=_TABLES[kind],
+            slice=_slice_sql(kind, "u.id", condition, id_only=True),
+            user_ids=", ".join(["%s"] * len(user_ids)),
+        )
+        params = [*params, size, *user_ids]
+
+    slices = {}
+    with connection.cursor() as cursor:
+        cursor.execute(sql, params)
+        for friend_id, pk, at in cursor.fetchall():
+            slices.setdefault(friend_id, []).append((pk, at))
+    for rows in slices.values():
+        rows.sort(key=lambda row: (row[1], row[0]), reverse=True)
+    return slices
+
+
+def _next_slice(kind, friend_id, after, size):
+    condition, params = _before(kind, after, strict=True)
+    with connection.cursor() as cursor:
+        cursor.execute(_slice_sql(kind, "%s", condition), [friend_id, *params, size])
+        return cursor.fetchall()
+
+
+def _stream(kind, friend_id, rows, size):
+    """Yield ``(at, kind rank, id)`` keys for one friend and kind, newest first."""
+    rank = KIND_RANK[kind]
+    while True:
+        key = None
+        for pk, at in rows:
+            key = (_aware(at), rank, pk)
+            yield key
+        if len(rows) < size:
+            return
+        size *= 4
+        rows = _next_slice(kind, friend_id, key, size)
+
+
+def _hydrate(keys):
+    book_ids = [pk for _, rank, pk in keys if KINDS[rank] != NOTE]
+    note_ids = [pk for _, rank, pk in keys if KINDS[rank] == NOTE]
+    books = {
+        row["id"]: row
+        for row in Book.objects.filter(id__in=book_ids)
+        .values("id", "title", "author", "cover_url", "user__username")
+    } if book_ids else {}
+    notes = {
+        row["id"]: row
+        for row in Note.objects.filter(id__in=note_ids)
+        .values("id", "book_id", "book__title", "book__user__username", "content", "page_number", "chapter")
+    } if note_ids else {}
+
+    events = []
+    for at, rank, pk in keys:
+        kind = KINDS[rank]
+        if kind == NOTE:
+            row = notes.get(pk)
+            if row is None:
+                continue
+            events.append({
+                "type": kind,
+                "at": at,
+                "id": pk,
+                "username": row["book__user__username"],
+                "book": {"id": row["book_id"], "title": row["book__title"]},
+                "note": {"content": row["content"], "page_number": row["page_number"], "chapter": row["chapter"]},
+            })
+        else:
+            row = books.get(pk)
+            if row is None:
+                continue
+            events.append({
+                "type": kind,
+                "at": at,
+                "id": pk,
+                "username": row["user__username"],
+                "book": {"id": pk, "title": row["title"], "author": row["author"], "cover_url": row["cover_url"]},
+            })
+    return events
+
+
+def collect(user_ids, limit, before=None):
+    """Return up to ``limit`` events by ``user_ids``, older than ``before``.
+
+    ``before`` is an event key as returned by ``decode_cursor``.
+    """
+    user_ids = list(user_ids)
+    # Enough rows per friend that most pages never need a follow-up query,
+    # without fetching ``limit`` rows from every one of many friends.
+    size = min(limit, max(2, math.ceil(2 * limit / len(user_ids))))
+
+    streams = []
+    for kind in KIND_RANK:
+        for friend_id, rows in _first_slices(kind, user_ids, size, before).items():
+            streams.append(_stream(kind, friend_id, rows, size))
+
+    merged = heapq.merge(*streams, reverse=True)
+    if before is not None:
+        merged = (key for key in merged if key < before)
+    return _hydrate(list(itertools.islice(merged, limit)))
+
+
+def _window(user, ids, version):
+    size = getattr(settings, "FEED_CACHE_SIZE", 100)
+    cache_key = f"feed:{user.pk}:{version}"
+    window = cache.get(cache_key)
+    if window is None:
+        # One event past the window, so a page ending at its edge can still
+        # tell whether another page follows.
+        events = collect(ids, size + 1)
+        window = {"events": events, "complete": len(events) <= size}
+        cache.set(cache_key, window, getattr(settings, "FEED_CACHE_TTL", 30))
+    return window
+
+
+def _key(event):
+    return (event["at"], KIND_RANK[event["type"]], event["id"])
+
+
+def feed(user, size, cursor=None):
+    """Return ``(events, next_cursor)`` for one page of user's feed.
+
+    Raises ``InvalidCursor`` for a malformed cursor.
+    """
+    before = decode_cursor(cursor) if cursor else None
+    # Read once: the friend set and the window are both keyed on it.
+    version = versions.get("friends", user.pk)
+    ids = friend_ids(user, version)
+    if not ids:
+        return [], None
+
+    window = _window(user, ids, version)
+    events = window["events"]
+    start = 0
+    if before is not None:
+        start = next((i for i, event in enumerate(events) if _key(event) < before), len(events))
+
+    if start + size < len(events) or window["complete"]:
+        page = events[start:start + size + 1]
+    else:
+        page = collect(ids, size + 1, before=before)
+
+    if len(page) <= size:
+        return page, None
+    page = page[:size]
+    return page, encode_cursor(page[-1])
@@ -0,0 +1,103 @@
+"""Friendship lookups.
+
+Friendships are accepted ``FriendRequest`` rows in either direction. A
+user's friend-id set is resolved with a single query, backed by the
+``(from_user, accepted)`` and ``(to_user, accepted)`` indexes, and cached
+in the ``default`` cache under the user's ``friends`` version stamp (see
+``versions.py``). The FriendRequest signal handlers bump it, so accepting,
+declining and removing friends (from the API or the admin) all drop the
+affected users' cached sets.
+
+``are_friends``, which gates access to a friend's books and notes, reads
+the same cached set. The stamp is bumped in the transaction that changes
+the friendship and read from the database on every call, so a set cached
+under the current stamp always reflects the last committed change.
+"""
+
+from django.conf import settings
+from django.contrib.auth.models import User
+from django.core.cache import cache
+from django.db.models import Case, CharField, Exists, OuterRef, Value, When
+
+from . import counters, versions
+from .models import FriendRequest
+
+COUNTERS = ("friends_cache.hit", "friends_cache.miss")
+
+
+def _sent(user):
+    return FriendRequest.objects.filter(from_user=user, accepted=True)
+
+
+def _received(user):
+    return FriendRequest.objects.filter(to_user=user, accepted=True)
+
+
+def _query_friend_ids(user_id):
+    sent = _sent(user_id).values_list("to_user_id", flat=True)
+    received = _received(user_id).values_list("from_user_id", flat=True)
+    return set(sent.union(received))
+
+
+def friend_ids(user, version=None):
+    """Return the set of ids of user's accepted friends.
+
+    ``version`` is the user's ``friends`` stamp, for callers that have
+    already read it; by default it is read here.
+    """
+    user_id = getattr(user, "pk", user)
+    if version is None:
+        version = versions.get("friends", user_id)
+    key = f"friends:{user_id}:{version}"
+
+    ids = cache.get(key)
+    if ids is not None:
+        counters.incr("friends_cache.hit")
+        return ids
+
+    counters.incr("friends_cache.miss")
+    ids = _query_friend_ids(user_id)
+    cache.set(key, ids, getattr(settings, "FRIENDS_CACHE_TTL", 3600))
+    return ids
+
+
+def get_friends(user):
+    """Return queryset of Users who are accepted friends of user."""
+    return User.objects.filter(id__in=friend_ids(user))
+
+
+def are_friends(user_a, user_b):
+    """Return whether the two users (or user ids) are friends."""
+    return getattr(user_b, "pk", user_b) in friend_ids(user_a)
+
+
+def annotate_status(queryset, user):
+    """Annotate a User queryset with ``friendship_status`` relative to user.
+
+    The status is ``friend``, ``pending_sent``, ``pending_received`` or
+    ``none``, computed in the database with correlated EXISTS subqueries.
+    """
+    sent = FriendRequest.objects.filter(from_user=user, to_user=OuterRef("pk"))
+    received = FriendRequest.objects.filter(from_user=OuterRef("pk"), to_user=user)
+    return queryset.annotate(friendship_status=Case(
+        When(Exists(sent.filter(accepted=True)), then=Value("friend")),
+        When(Exists(received.filter(accepted=True)), then=Value("friend")),
+        When(Exists(sent.filter(accepted=False)), then=Value("pending_sent")),
+        When(Exists(received.filter(accepted=False)), then=Value("pending_received")),
+        default=Value("none"),
+        output_field=CharField(),
+    ))
+
+
+def stats():
+    values = counters.get_many(COUNTERS)
+    lookups = values["friends_cache.hit"] + values["friends_cache.miss"]
+    return {
+        "hits": values["friends_cache.hit"],
+        "misses": values["friends_cache.miss"],
+        "hit_rate": values["friends_cache.hit"] / lookups if lookups else 0.0,
+    }
+
+
+def reset_stats():
+    counters.reset(COUNTERS)
@@ -0,0 +1,260 @@
+"""Bulk import of books and notes.
+
+Rows are parsed from a stream (Goodreads/plain CSV or NDJSON in the export
+format), validated one by one and written in batches with ``bulk_create``,
+one transaction per batch. Books whose normalized title and author already
+exist in the user's library, or earlier in the same file, are skipped.
+"""
+import csv
+import json
+from collections import Counter
+from datetime import date, datetime
+
+from django.core.exceptions import ValidationError
+from django.core.validators import URLValidator
+from django.db import transaction
+
+from . import stats, versions
+from .models import Book, Note
+
+FORMATS = ("csv", "ndjson")
+
+BATCH_SIZE = 500
+MAX_REPORTED_ERRORS = 100
+
+# Accepted CSV headers (lower-cased) for each field; the first ones are
+# Goodreads' export columns.
+CSV_COLUMNS = {
+    "title": ("title",),
+    "author": ("author",),
+    "shelf": ("exclusive shelf", "shelf"),
+    "finished": ("finished",),
+    "finish_date": ("date read", "finish_date"),
+    "cover_url": ("cover_url",),
+}
+
+DATE_FORMATS = ("%Y/%m/%d", "%Y-%m-%d")
+
+# IntegerField's range on every supported database.
+INT_RANGE = (-2 ** 31, 2 ** 31 - 1)
+
+_validate_url = URLValidator()
+
+
+class RowError(ValueError):
+    pass
+
+
+def normalize(title, author):
+    return " ".join(title.casefold().split()), " ".join(author.casefold().split())
+
+
+def _str(data, field):
+    value = data.get(field)
+    if value is None:
+        return ""
+    if not isinstance(value, str):
+        raise RowError(f"{field} must be a string")
+    return value.strip()
+
+
+def _parse_date(value):
+    if not value:
+        return None
+    if not isinstance(value, str):
+        raise RowError(f"Invalid date: {value!r}")
+    for fmt in DATE_FORMATS:
+        try:
+            return datetime.strptime(value, fmt).date()
+        except ValueError:
+            pass
+    raise RowError(f"Invalid date: {value!r}")
+
+
+def _parse_bool(value):
+    if isinstance(value, bool):
+        return value
+    return str(value).strip().lower() in ("1", "true", "yes", "y")
+
+
+def _int_or_none(value, field):
+    if value in (None, ""):
+        return None
+    number = value
+    if isinstance(value, float) and value.is_integer():
+        number = int(value)
+    elif isinstance(value, str):
+        try:
+            number = int(value)
+        except ValueError:
+            pass
+    # Floats are only accepted when whole: int() would truncate 2.7 to 2.
+    if type(number) is not int or not INT_RANGE[0] <= number <= INT_RANGE[1]:
+        raise RowError(f"Invalid {field}: {value!r}")
+    return number
+
+
+def _clean_book(data):
+    title = _str(data, "title")
+    author = _str(data, "author")
+    if not title or not author:
+        raise RowError("Missing title or author")
+    if len(title) > 255 or len(author) > 255:
+        raise RowError("Title or author longer than 255 characters")
+
+    finish_date = data.get("finish_date")
+    if not isinstance(finish_date, date):
+        finish_date = _parse_date(finish_date)
+
+    cover_url = _str(data, "cover_url") or None
+    if cover_url:
+        try:
+            _validate_url(cover_url)
+        except ValidationError:
+            raise RowError(f"Invalid cover_url: {cover_url!r}")
+
+    return {
+        "title": title,
+        "author": author,
+        "finished": _parse_bool(data.get("finished")) or finish_date is not None,
+        "finish_date": finish_date,
+        "cover_url": cover_url,
+    }
+
+
+def _clean_note(data):
+    if not isinstance(data, dict):
+        raise RowError("Each note must be an object")
+    content = _str(data, "content")
+    if not content:
+        raise RowError("Note content is required")
+    return {
+        "content": content,
+        "page_number": _int_or_none(data.get("page_number"), "page_number"),
+        "chapter": _int_or_none(data.get("chapter"), "chapter"),
+    }
+
+
+def parse_csv(stream):
+    """Yield ``(row_number, book_data, notes)`` from a CSV text stream."""
+    reader = csv.DictReader(stream)
+    headers = {name.strip().lower(): name for name in reader.fieldnames or ()}
+    columns = {}
+    for field, aliases in CSV_COLUMNS.items():
+        for alias in aliases:
+            if alias in headers:
+                columns[field] = headers[alias]
+                break
+
+    for row_number, row in enumerate(reader, start=2):
+        data = {field: (row.get(column) or "").strip() for field, column in columns.items()}
+        if data.get("shelf") == "read":
+            data["finished"] = True
+        yield row_number, data, []
+
+
+def parse_ndjson(stream):
+    """Yield ``(line_number, book_data, notes)`` from an NDJSON text stream."""
+    for line_number, line in enumerate(stream, start=1):
+        if not line.strip():
+            continue
+        try:
+            data = json.loads(line)
+        except ValueError:
+            yield line_number, None, []
+            continue
+        if not isinstance(data, dict):
+            yield line_number, None, []
+            continue
+        yield line_number, data, data.get("notes") or []
+
+
+def import_library(user, stream, format="csv", batch_size=BATCH_SIZE, progress=None):
+    """Import books (and notes) from ``stream`` into user's library.
+
+    Returns a summary dict with ``created``, ``notes_created``, ``duplicates``,
+    ``errors`` (the first MAX_REPORTED_ERRORS as ``{"row", "error"}``) and
+    ``error_count``. ``progress`` is called with the number of rows processed
+    after each batch.
+
+    A UnicodeDecodeError before the first row propagates and nothing is
+    written. Later ones end the import: the rows read so far are kept (earlier
+    batches are already committed) and the error is reported as a row error.
+    """
+    if format not in FORMATS:
+        raise ValueError(f"Unknown import format: {format}")
+    rows = parse_csv(stream) if format == "csv" else parse_ndjson(stream)
+
+    existing = {
+        normalize(title, author)
+        for title, author in Book.objects.filter(user=user).values_list("title", "author").iterator()
+    }
+    summary = {"created": 0, "notes_created": 0, "duplicates": 0, "errors": [], "error_count": 0}
+    batch = []
+    processed = 0
+    last_row = 0
+
+    def error(row_number, message):
+        summary["error_count"] += 1
+        if len(summary["errors"]) < MAX_REPORTED_ERRORS:
+            summary["errors"].append({"row": row_number, "error": message})
+
+    try:
+        for row_number, data, raw_notes in rows:
+            processed += 1
+            last_row = row_number
+            try:
+                if data is None:
+                    raise RowError("Invalid JSON object")
+                book = _clean_book(data)
+                if not isinstance(raw_notes, list):
+                    raise RowError("notes must be a list")
+                notes = [_clean_note(note) for note in raw_notes]
+            except RowError as e:
+                error(row_number, str(e))
+                continue
+
+            key = normalize(book["title"], book["author"])
+            if key in existing:
+                summary["duplicates"] += 1
+                continue
+            existing.add(key)
+
+            batch.append((Book(user=user, **book), notes))
+            if len(batch) >= batch_size:
+                _write_batch(batch, summary)
+                batch = []
+                if progress:
+                    progress(processed)
+    except UnicodeDecodeError:
+        if not processed:
+            raise
+        # The stream decodes a block at a time, so rows shortly before the
+        # bad bytes may be missing too.
+        error(last_row + 1, "File is not valid UTF-8 from here on; the rest was not imported")
+
+    if batch:
+        _write_batch(batch, summary)
+    if progress:
+        progress(processed)
+    return summary
+
+
+def _write_batch(batch, summary):
+    with transaction.atomic():
+        books = Book.objects.bulk_create([book for book, _ in batch])
+        notes = [
+            Note(book=book, **note)
+            for book, (_, book_notes) in zip(books, batch)
+            for note in book_notes
+        ]
+        Note.objects.bulk_create(notes, batch_size=BATCH_SIZE)
+        stats.apply_counts(
+            books[0].user_id,
+            Counter(month for month in map(stats.finish_month, books) if month),
+        )
+        # bulk_create sends no post_save signals.
+        versions.bump("books", books[0].user_id)
+        versions.bump("user_notes", books[0].user_id)
+    summary["created"] += len(books)
+    summary["notes_created"] += len(notes)
@@ -0,0 +1,81 @@
+import re
+
+from django.contrib.auth.models import User
+from django.core.management.base import BaseCommand, CommandError
+from django.db import connection
+from django.db.models import Count, Q
+from django.utils import timezone
+
+from books.models import Book, FriendRequest, Note, ReadingStatsMonthly, VersionStamp
+
+# Plan lines that mean a whole table is read.
+FULL_SCAN_PATTERNS = {
+    "sqlite": re.compile(r"\bSCAN (\w+)$"),
+    "postgresql": re.compile(r"Seq Scan on (\w+)"),
+}
+
+
+def hot_queries(user):
+    """The queries behind the app's hot paths, for one user's data."""
+    book = Book.objects.filter(user=user).annotate(n=Count("notes")).order_by("-n").first()
+    year = timezone.now().year
+
+    queries = {
+        "books_list": Book.objects.filter(user=user).order_by("-created_at", "-id"),
+        "books_list?status=finished": Book.objects.filter(user=user, finished=True).order_by("-created_at", "-id"),
+        "books_list?status=reading": Book.objects.filter(user=user, finished=False).order_by("-created_at", "-id"),
+        "reading_stats": ReadingStatsMonthly.objects.filter(user=user, year=year),
+        "finished_books_by_date": Book.objects.filter(
+            user=user, finished=True, finish_date__isnull=False
+        ).order_by("finish_date"),
+        "friend_books": Book.objects.filter(user=user).order_by("-created_at", "-id")[:51],
+        "friends_sent": FriendRequest.objects.filter(from_user=user, accepted=True).values_list("to_user_id"),
+        "friends_received": FriendRequest.objects.filter(to_user=user, accepted=True).values_list("from_user_id"),
+        "list_friend_requests": FriendRequest.objects.filter(to_user=user, accepted=False),
+    }
+    if book is not None:
+        queries["book_notes_api"] = Note.objects.filter(book=book).order_by("-created_at", "-id")[:51]
+    queries["version_stamps"] = VersionStamp.objects.filter(
+        Q(scope="books", obj_id__in=[user.pk]) | Q(scope="friends", obj_id__in=[user.pk])
+    )
+    return queries
+
+
+class Command(BaseCommand):
+    help = (
+        "EXPLAIN the hot queries for a user and fail if any of them reads a "
+        "whole table. Run it against realistically sized data: planners "
+        "prefer sequential scans on small tables."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument("--user", help="Username to audit (default: the user with the most books).")
+        parser.add_argument("--verbose-plans", action="store_true", help="Print every plan, not only failures.")
+
+    def handle(self, *args, **options):
+        if options["user"]:
+            user = User.objects.filter(username=options["user"]).first()
+        else:
+            user = User.objects.annotate(n=Count("book")).order_by("-n").first()
+        if user is None:
+            raise CommandError("No user to audit; seed some data first.")
+
+        pattern = FULL_SCAN_PATTERNS.get(connection.vendor)
+        if pattern is None:
+            raise CommandError(f"Unsupported database backend: {connection.vendor}")
+
+        failures = []
+        for name, queryset in hot_queries(user).items():
+            plan = queryset.explain()
+            scans = [m.group(1) for line in plan.splitlines() if (m := pattern.search(line.strip()))]
+            if scans:
+                failures.append(name)
+                self.stdout.write(self.style.ERROR(f"FULL SCAN  {name}: {', '.join(scans)}"))
+            else:
+                self.stdout.write(f"ok         {name}")
+            if scans or options["verbose_plans"]:
+                self.stdout.write("    " + plan.replace("\n", "\n    "))
+
+        if failures:
+            raise CommandError(f"{len(failures)} hot queries fall back to a full table scan.")
+        self.stdout.write(self.style.SUCCESS(f"All hot queries use indexes for {user.username}."))
@@ -0,0 +1,136 @@
+import random
+import statistics
+import time
+from datetime import timedelta
+
+from django.conf import settings
+from django.contrib.auth.models import User
+from django.core.management.base import BaseCommand, CommandError
+from django.db import connection, transaction
+from django.test import override_settings
+from django.test.utils import CaptureQueriesContext
+from django.utils import timezone
+
+from books import analytics, versions
+from books.models import Book, Note
+
+
+class Rollback(Exception):
+    pass
+
+
+class Command(BaseCommand):
+    help = (
+        "Time the reading analytics for a user with many finished books. "
+        "The data is created inside a transaction that is rolled back afterwards."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument("--books", type=int, default=10000, help="Finished books to generate.")
+        parser.add_argument("--notes-per-book", type=int, default=3)
+        parser.add_argument("--years", type=int, default=10, help="Spread finish dates over this many years.")
+        parser.add_argument("--repeat", type=int, default=10, help="Timed runs of each step.")
+        parser.add_argument("--seed", type=int, default=42)
+
+    def handle(self, *args, **options):
+        if min(options["books"], options["years"], options["repeat"]) < 1:
+            raise CommandError("--books, --years and --repeat must be positive.")
+        if not 0 <= options["notes_per_book"] < 500:
+            raise CommandError("--notes-per-book must be between 0 and 499.")
+
+        # A private cache: the rolled-back user's id and version stamps can be
+        # handed out again, and the next owner mustn't find the benchmark's
+        # results under them.
+        bench_caches = {
+            **settings.CACHES,
+            "default": {
+                "BACKEND": "django.core.cache.backends.locmem.LocMemCache",
+                "LOCATION": "bench_analytics",
+            },
+        }
+        try:
+            with transaction.atomic(), override_settings(CACHES=bench_caches):
+                self.run(options)
+                raise Rollback
+        except Rollback:
+            pass
+
+    def generate(self, options):
+        rng = random.Random(options["seed"])
+        now = timezone.now()
+        span = options["years"] * 365
+        user = User.objects.create_user(username="__bench_analytics__")
+
+        books = Book.objects.bulk_create(
+            (
+                Book(
+                    user=user,
+                    title=f"Book {i}",
+                    author=f"Author {i % 500}",
+                    finished=True,
+                    finish_date=(now - timedelta(days=rng.randint(0, span))).date(),
+                )
+                for i in range(options["books"])
+            ),
+            batch_size=1000,
+        )
+        notes = Note.objects.bulk_create(
+            (
+                Note(book=book, content="bench", page_number=page)
+                for book in books
+                for page in rng.sample(range(1, 500), options["notes_per_book"])
+            ),
+            batch_size=1000,
+        )
+        # created_at is auto_now_add, so spread the notes out afterwards to
+        # give streaks and pace something to measure.
+        for note in notes:
+            note.created_at = now - timedelta(days=rng.uniform(0, span))
+        Note.objects.bulk_update(notes, ["created_at"], batch_size=1000)
+        return user, len(notes)
+
+    def run(self, options):
+        user, n_notes = self.generate(options)
+        self.stdout.write(f"{options['books']} finished books and {n_notes} notes over {options['years']} years")
+
+        fetch, compute, cold = [], [], []
+        for _ in range(options["repeat"]):
+            start = time.perf_counter()
+            analytics._finish_days(user)
+            analytics._note_columns(user)
+            fetch.append((time.perf_counter() - start) * 1000)
+
+            start = time.perf_counter()
+            analytics.compute(user)
+            compute.append((time.perf_counter() - start) * 1000)
+
+            versions.bump("user_notes", user.pk)
+            with CaptureQueriesContext(connection) as queries:
+                start = time.perf_counter()
+                result = analytics.get(user)
+                cold.append((time.perf_counter() - start) * 1000)
+        cold_queries = len(queries)
+
+        warm = []
+        with CaptureQueriesContext(connection) as queries:
+            for _ in range(options["repeat"]):
+                start = time.perf_counter()
+                analytics.get(user)
+                warm.append((time.perf_counter() - start) * 1000)
+        warm_queries = len(queries) / options["repeat"]
+
+        for label, timings, extra in (
+            ("fetch columns", fetch, ""),
+            ("compute", compute, "  (includes the fetch)"),
+            ("get, cold", cold, f"  {cold_queries} queries"),
+            ("get, cached", warm, f"  {warm_queries:.0f} queries"),
+        ):
+            self.stdout.write(
+                f"  {label:<14} median {statistics.median(timings):7.1f} ms  "
+                f"max {max(timings):7.1f} ms{extra}"
+            )
+        self.stdout.write(
+            f"  longest streak {result['streaks']['longest']['days']} days, "
+            f"{result['pace']['pages_per_day']} pages/day over {result['pace']['books_measured']} books"
+        )
+        self.stdout.write(self.style.SUCCESS("Done (generated data rolled back)."))
@@ -0,0 +1,177 @@
+import asyncio
+import json
+import multiprocessing
+import statistics
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+from asgiref.sync import ThreadSensitiveContext
+from django.conf import settings
+from django.core.management.base import BaseCommand, CommandError
+from django.test import AsyncClient, Client, override_settings
+from django.urls import reverse
+
+from books import openlibrary
+
+PAYLOAD = json.dumps({
+    "numFound": 3,
+    "docs": [
+        {"title": f"Bench {i}", "author_name": ["Bench"], "first_publish_year": 2000 + i}
+        for i in range(3)
+    ],
+}).encode()
+
+
+def serve_upstream(delay, ready):
+    """Stand in for Open Library: answer every request after ``delay``.
+
+    Runs in a process of its own, on an event loop, so that neither the
+    GIL nor a thread per connection slows it down under load.
+    """
+    response = (
+        b"HTTP/1.1 200 OK\r\nContent-Type: application/json\r\n"
+        b"Content-Length: %d\r\n\r\n%s" % (len(PAYLOAD), PAYLOAD)
+    )
+
+    async def handle(reader, writer):
+        try:
+            while await reader.readuntil(b"\r\n\r\n"):
+                await asyncio.sleep(delay)
+                writer.write(response)
+                await writer.drain()
+        except (asyncio.IncompleteReadError, ConnectionError):
+            pass
+        finally:
+            writer.close()
+
+    async def main():
+        server = await asyncio.start_server(handle, "127.0.0.1", 0, backlog=1024)
+        ready.send(server.sockets[0].getsockname()[1])
+        await server.serve_forever()
+
+    asyncio.run(main())
+
+
+class Command(BaseCommand):
+    help = (
+        "Load-test book_search, whose cache misses wait on Open Library, "
+        "through Django's WSGI handler (a fixed pool of server threads) and "
+        "its ASGI handler (one event loop). Open Library is replaced by a "
+        "local server that answers after --upstream-delay, and every query "
+        "is new, so every request waits on it."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument("--requests", type=int, default=500, help="Requests per handler.")
+        parser.add_argument("--concurrency", type=int, default=50, help="Clients sending requests at once.")
+        parser.add_argument(
+            "--threads", type=int, default=8,
+            help="WSGI server threads, e.g. gunicorn --threads (default: 8).",
+        )
+        parser.add_argument("--upstream-delay", type=float, default=0.1, help="Seconds Open Library takes.")
+
+    def handle(self, *args, **options):
+        for name in ("requests", "concurrency", "threads"):
+            if options[name] < 1:
+                raise CommandError(f"--{name} must be positive.")
+
+        ready, port = multiprocessing.Pipe()
+        upstream = multiprocessing.Process(
+            target=serve_upstream, args=(options["upstream_delay"], ready), daemon=True,
+        )
+        upstream.start()
+        try:
+            with override_settings(
+                OPEN_LIBRARY_URL=f"http://127.0.0.1:{port.recv()}",
+                OPEN_LIBRARY_POOL_SIZE=options["concurrency"],
+                OPEN_LIBRARY_ASYNC_POOL_SIZE=options["concurrency"],
+                # The test client's default host is "testserver".
+                ALLOWED_HOSTS=[*settings.ALLOWED_HOSTS, "testserver"],
+            ):
+                # Rebuild the clients so they pick up the stub's URL.
+                openlibrary._client = None
+                openlibrary._async_clients.clear()
+                self.stdout.write(
+                    f"{options['requests']} requests per handler, {options['concurrency']} at once, "
+                    f"Open Library answering in {options['upstream_delay'] * 1000:.0f} ms"
+                )
+                self.report(f"WSGI, {options['threads']} threads", *self.run_wsgi(options))
+                self.report("ASGI", *asyncio.run(self.run_asgi(options)))
+        finally:
+            openlibrary._client = None
+            openlibrary._async_clients.clear()
+            upstream.terminate()
+            upstream.join()
+
+    def run_wsgi(self, options):
+        # Requests beyond the server's thread count wait for a free thread,
+        # first come first served like the server's accept backlog; that
+        # wait is part of their latency.
+        server = ThreadPoolExecutor(max_workers=options["threads"])
+        local = threading.local()
+
+        def serve(n):
+            if not hasattr(local, "client"):
+                local.client = Client()
+            return local.client.get(reverse("books:book_search"), {"q": f"wsgi bench {n}"})
+
+        queries = iter(range(options["requests"]))
+        lock = threading.Lock()
+        timings, errors = [], []
+
+        def user():
+            while True:
+                with lock:
+                    n = next(queries, None)
+                if n is None:
+                    return
+                start = time.perf_counter()
+                response = server.submit(serve, n).result()
+                elapsed = (time.perf_counter() - start) * 1000
+                with lock:
+                    timings.append(elapsed)
+                    if response.status_code != 200:
+                        errors.append(response.status_code)
+
+        users = [threading.Thread(target=user) for _ in range(options["concurrency"])]
+        start = time.perf_counter()
+        with server:
+            for thread in users:
+                thread.start()
+            for thread in users:
+                thread.join()
+        return timings, errors, time.perf_counter() - start
+
+    async def run_asgi(self, options):
+        queries = iter(range(options["requests"]))
+        timings, errors = [], []
+
+        async def user():
+            client = AsyncClient()
+            for n in queries:
+                start = time.perf_counter()
+                # ASGIHandler gives each request its own thread for sync
+                # code; the test client does not.
+                async with ThreadSensitiveContext():
+                    response = await client.get(reverse("books:book_search"), {"q": f"asgi bench {n}"})
+                timings.append((time.perf_counter() - start) * 1000)
+                if response.status_code != 200:
+                    errors.append(response.status_code)
+
+        start = time.perf_counter()
+        await asyncio.gather(*(user() for _ in range(options["concurrency"])))
+        return timings, errors, time.perf_counter() - start
+
+    def report(self, label, timings, errors, wall):
+        timings.sort()
+
+        def pct(p):
+            return timings[min(len(timings) - 1, round(p * len(timings)) - 1)]
+
+        self.stdout.write(
+            f"  {label:<18} {len(timings) / wall:7.1f} req/s  median {statistics.median(timings):7.1f} ms  "
+            f"p95 {pct(0.95):7.1f} ms  p99 {pct(0.99):7.1f} ms"
+        )
+        if errors:
+            self.stderr.write(self.style.ERROR(f"  {len(errors)} requests failed (status {sorted(set(errors))})"))
@@ -0,0 +1,111 @@
+import statistics
+import time
+
+from django.conf import settings
+from django.contrib.auth.models import User
+from django.core.cache import caches
+from django.core.management.base import BaseCommand, CommandError
+from django.db import connection, transaction
+from django.test import RequestFactory, override_settings
+from django.test.utils import CaptureQueriesContext
+
+from books.models import Book
+from books.pagination import encode_cursor, page_size
+from books.views import books_list
+
+
+class Rollback(Exception):
+    pass
+
+
+class Command(BaseCommand):
+    help = (
+        "Time books_list for a user with a large library, with the template "
+        "fragment cache cold and warm. The books are created inside a "
+        "transaction that is rolled back afterwards, and fragments go to a "
+        "private in-memory cache."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument("--books", type=int, default=5000, help="Library size to generate.")
+        parser.add_argument("--repeat", type=int, default=10, help="Timed renders per page.")
+
+    def handle(self, *args, **options):
+        if options["books"] < 1 or options["repeat"] < 1:
+            raise CommandError("--books and --repeat must be positive.")
+
+        # A private fragment cache, so "cold" can clear it without touching
+        # the real one.
+        bench_caches = {
+            **settings.CACHES,
+            "template_fragments": {
+                "BACKEND": "django.core.cache.backends.locmem.LocMemCache",
+                "LOCATION": "bench_books_list",
+                "TIMEOUT": None,
+                "OPTIONS": {"MAX_ENTRIES": 10 * options["books"]},
+            },
+        }
+        try:
+            with transaction.atomic(), override_settings(CACHES=bench_caches):
+                self.run(options["books"], options["repeat"])
+                raise Rollback
+        except Rollback:
+            pass
+
+    def run(self, n_books, repeat):
+        user = User.objects.create_user(username="__bench_books_list__")
+        Book.objects.bulk_create(
+            (
+                Book(
+                    user=user,
+                    title=f"Book {i}",
+                    author=f"Author {i % 500}",
+                    finished=i % 3 == 0,
+                    cover_url=f"https://covers.openlibrary.org/b/id/{i}-M.jpg",
+                )
+                for i in range(n_books)
+            ),
+            batch_size=1000,
+        )
+
+        factory = RequestFactory()
+        fragments = caches["template_fragments"]
+
+        def render(query):
+            request = factory.get("/books/" + query)
+            request.user = user
+            with CaptureQueriesContext(connection) as queries:
+                start = time.perf_counter()
+                response = books_list(request)
+                elapsed = (time.perf_counter() - start) * 1000
+            return elapsed, response, len(queries)
+
+        self.stdout.write(f"books_list with {n_books} books, {repeat} renders each")
+        for query in ("", "?status=reading", "?status=finished"):
+            for label, warm in (("cold", False), ("warm", True)):
+                timings = []
+                if warm:
+                    render(query)
+                for _ in range(repeat):
+                    if not warm:
+                        fragments.clear()
+                    elapsed, response, n_queries = render(query)
+                    timings.append(elapsed)
+                self.stdout.write(
+                    f"  {query or '(all)':<18} {label}  median {statistics.median(timings):7.1f} ms  "
+                    f"max {max(timings):7.1f} ms  {len(response.content) / 1024:7.1f} KiB  "
+                    f"{n_queries} queries"
+                )
+
+        # Every page of the library, as if following the "Older books" links.
+        size = page_size(factory.get("/books/"))
+        rows = list(Book.objects.filter(user=user).order_by("-created_at", "-id").values_list("created_at", "id"))
+        queries = [""] + [
+            "?status=all&cursor=" + encode_cursor(*rows[i - 1]) for i in range(size, len(rows), size)
+        ]
+        for label in ("cold", "warm"):
+            if label == "cold":
+                fragments.clear()
+            total = sum(render(query)[0] for query in queries)
+            self.stdout.write(f"  all {len(queries)} pages {label}  {total:7.1f} ms total")
+        self.stdout.write(self.style.SUCCESS("Done (generated data rolled back)."))
@@ -0,0 +1,81 @@
+import statistics
+import time
+
+from django.core.management.base import BaseCommand, CommandError
+from django.core.signals import request_finished, request_started
+from django.db import connections
+from django.db.backends.signals import connection_created
+
+
+class Command(BaseCommand):
+    help = (
+        "Measure what connection handling adds to each request. Simulates "
+        "requests (request_started, one query, request_finished) with a new "
+        "connection per request, and then with the configured persistent "
+        "connections or pool."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument("--requests", type=int, default=200)
+        parser.add_argument("--database", default="default")
+
+    def handle(self, *args, **options):
+        if options["requests"] < 1:
+            raise CommandError("--requests must be positive.")
+        connection = connections[options["database"]]
+        settings_dict = connection.settings_dict
+        pool = settings_dict["OPTIONS"].get("pool")
+        configured = "pool" if pool else f"CONN_MAX_AGE={settings_dict['CONN_MAX_AGE']}"
+
+        self.stdout.write(
+            f"{connection.vendor}, {options['requests']} requests each, "
+            f"health checks {'on' if settings_dict['CONN_HEALTH_CHECKS'] else 'off'}"
+        )
+        original = (settings_dict["CONN_MAX_AGE"], pool)
+        try:
+            connection.close()
+            settings_dict["CONN_MAX_AGE"] = 0
+            settings_dict["OPTIONS"].pop("pool", None)
+            self.report("new connection", self.run(connection, options["requests"]))
+        finally:
+            connection.close()
+            settings_dict["CONN_MAX_AGE"], pool = original
+            if pool:
+                settings_dict["OPTIONS"]["pool"] = pool
+        self.report(configured, self.run(connection, options["requests"]))
+        if pool:
+            stats = connection.pool.get_stats()
+            self.stdout.write(f"  pool: {stats.get('connections_num', 0)} connections opened")
+        connection.close()
+
+    def run(self, connection, n_requests):
+        opened = []
+
+        def count(sender, connection, **kwargs):
+            opened.append(connection.alias)
+
+        connection_created.connect(count)
+        timings = []
+        try:
+            for _ in range(n_requests):
+                start = time.perf_counter()
+                # The same signals Django's handlers send; close_old_connections
+                # listens to both.
+                request_started.send(sender=self.__class__)
+                with connection.cursor() as cursor:
+                    cursor.execute("SELECT 1")
+                    cursor.fetchone()
+                request_finished.send(sender=self.__class__)
+                timings.append((time.perf_counter() - start) * 1000)
+        finally:
+            connection_created.disconnect(count)
+        return timings, len(opened)
+
+    def report(self, label, result):
+        timings, opened = result
+        timings.sort()
+        p95 = timings[min(len(timings) - 1, round(0.95 * len(timings)) - 1)]
+        self.stdout.write(
+            f"  {label:<20} median {statistics.median(timings):7.3f} ms  "
+            f"p95 {p95:7.3f} ms  {opened} connect() calls"
+        )
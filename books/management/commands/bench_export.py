@@ -0,0 +1,97 @@
+import os
+import time
+import tracemalloc
+
+from django.contrib.auth.models import User
+from django.core.management.base import BaseCommand, CommandError
+from django.db import connection, transaction
+from django.test.utils import CaptureQueriesContext
+
+from books import export
+from books.models import Book, Note
+
+
+class Rollback(Exception):
+    pass
+
+
+def rss_bytes():
+    """Current resident set size, or None where /proc is unavailable."""
+    try:
+        with open("/proc/self/statm") as f:
+            return int(f.read().split()[1]) * os.sysconf("SC_PAGE_SIZE")
+    except (OSError, ValueError):
+        return None
+
+
+class Command(BaseCommand):
+    help = (
+        "Stream a growing library through the export and report peak memory "
+        "at each size, to show that it stays flat. The data is created "
+        "inside a transaction that is rolled back afterwards."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument("--notes", type=int, default=100_000, help="Notes at the largest size.")
+        parser.add_argument("--notes-per-book", type=int, default=10)
+        parser.add_argument("--steps", type=int, default=4, help="Library sizes to measure, up to --notes.")
+        parser.add_argument("--format", choices=sorted(export.FORMATS), default="ndjson")
+
+    def handle(self, *args, **options):
+        if min(options["notes"], options["notes_per_book"], options["steps"]) < 1:
+            raise CommandError("--notes, --notes-per-book and --steps must be positive.")
+        try:
+            with transaction.atomic():
+                self.run(options)
+                raise Rollback
+        except Rollback:
+            pass
+
+    def grow(self, user, n_books, start):
+        books = Book.objects.bulk_create(
+            (Book(user=user, title=f"Book {start + i}", author="Author") for i in range(n_books)),
+            batch_size=2000,
+        )
+        Note.objects.bulk_create(
+            (
+                Note(book=book, content=f"Note {i} " + "lorem ipsum " * 10, page_number=i)
+                for book in books
+                for i in range(self.notes_per_book)
+            ),
+            batch_size=2000,
+        )
+
+    def run(self, options):
+        self.notes_per_book = options["notes_per_book"]
+        user = User.objects.create_user(username="__bench_export__")
+        total_books = max(1, options["notes"] // self.notes_per_book)
+        books = 0
+
+        self.stdout.write(
+            f"{options['format']} export, {self.notes_per_book} notes per book; "
+            "peaks are measured while streaming (tracemalloc slows the timings)"
+        )
+        for step in range(1, options["steps"] + 1):
+            target = total_books * step // options["steps"]
+            self.grow(user, target - books, books)
+            books = target
+
+            n_bytes, peak_rss, baseline = 0, 0, rss_bytes()
+            tracemalloc.start()
+            with CaptureQueriesContext(connection) as queries:
+                start = time.perf_counter()
+                for chunk in export.stream_library(user, options["format"]):
+                    n_bytes += len(chunk)
+                    if baseline is not None:
+                        peak_rss = max(peak_rss, rss_bytes() - baseline)
+                elapsed = time.perf_counter() - start
+            _, peak_python = tracemalloc.get_traced_memory()
+            tracemalloc.stop()
+
+            rss = f"{peak_rss / 2 ** 20:6.1f} MiB" if baseline is not None else "   n/a"
+            self.stdout.write(
+                f"  {books * self.notes_per_book:>8} notes  {n_bytes / 2 ** 20:7.1f} MiB out  "
+                f"{elapsed:6.2f} s  peak Python {peak_python / 2 ** 20:5.1f} MiB  "
+                f"RSS growth {rss}  {len(queries)} queries"
+            )
+        self.stdout.write(self.style.SUCCESS("Done (generated data rolled back)."))
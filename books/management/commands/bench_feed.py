@@ -0,0 +1,103 @@
+import random
+import statistics
+import time
+from datetime import date, timedelta
+
+from django.contrib.auth.models import User
+from django.core.cache import cache
+from django.core.management.base import BaseCommand, CommandError
+from django.db import connection, transaction
+from django.test.utils import CaptureQueriesContext
+
+from books import feed
+from books.models import Book, FriendRequest, Note
+
+
+class Rollback(Exception):
+    pass
+
+
+class Command(BaseCommand):
+    help = (
+        "Time the friend feed for a user with many friends. The data is "
+        "created inside a transaction that is rolled back afterwards."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument("--friends", type=int, default=1000)
+        parser.add_argument("--books-per-friend", type=int, default=30)
+        parser.add_argument("--notes-per-book", type=int, default=2)
+        parser.add_argument("--page-size", type=int, default=50)
+        parser.add_argument("--pages", type=int, default=5, help="Pages to walk with the cursor.")
+        parser.add_argument("--repeat", type=int, default=5)
+
+    def handle(self, *args, **options):
+        if options["friends"] < 1 or options["repeat"] < 1:
+            raise CommandError("--friends and --repeat must be positive.")
+        try:
+            with transaction.atomic():
+                self.run(options)
+                raise Rollback
+        except Rollback:
+            pass
+
+    def seed(self, options):
+        rng = random.Random(0)
+        user = User.objects.create_user(username="__bench_feed__")
+        friends = User.objects.bulk_create(
+            User(username=f"__bench_feed_{i}__") for i in range(options["friends"])
+        )
+        FriendRequest.objects.bulk_create(
+            FriendRequest(from_user=user, to_user=friend, accepted=True) for friend in friends
+        )
+        today = date.today()
+        books = Book.objects.bulk_create(
+            (
+                Book(
+                    user=friend,
+                    title=f"Book {i}",
+                    author="Author",
+                    finished=i % 2 == 0,
+                    finish_date=today - timedelta(days=rng.randint(0, 1000)) if i % 2 == 0 else None,
+                )
+                for friend in friends
+                for i in range(options["books_per_friend"])
+            ),
+            batch_size=2000,
+        )
+        Note.objects.bulk_create(
+            (Note(book=book, content="note") for book in books for _ in range(options["notes_per_book"])),
+            batch_size=2000,
+        )
+        return user, len(books)
+
+    def timed(self, func, repeat, clear_cache=False):
+        timings = []
+        for _ in range(repeat):
+            if clear_cache:
+                cache.clear()
+            with CaptureQueriesContext(connection) as queries:
+                start = time.perf_counter()
+                result = func()
+                timings.append((time.perf_counter() - start) * 1000)
+        return statistics.median(timings), len(queries), result
+
+    def run(self, options):
+        user, n_books = self.seed(options)
+        size, repeat = options["page_size"], options["repeat"]
+        self.stdout.write(f"Feed for {options['friends']} friends, {n_books} books, page size {size}")
+
+        ms, queries, _ = self.timed(lambda: feed.feed(user, size), repeat, clear_cache=True)
+        self.stdout.write(f"  first page, cold cache  {ms:8.1f} ms  {queries} queries")
+        ms, queries, _ = self.timed(lambda: feed.feed(user, size), repeat)
+        self.stdout.write(f"  first page, warm cache  {ms:8.1f} ms  {queries} queries")
+
+        cursor = None
+        for page in range(1, options["pages"] + 1):
+            ms, queries, (events, next_cursor) = self.timed(lambda: feed.feed(user, size, cursor), repeat)
+            self.stdout.write(f"  page {page:<3} (warm)         {ms:8.1f} ms  {queries} queries  {len(events)} events")
+            if next_cursor is None:
+                break
+            cursor = next_cursor
+
+        self.stdout.write(self.style.SUCCESS("Done (generated data rolled back)."))
@@ -0,0 +1,91 @@
+import csv
+import io
+import json
+import time
+
+from django.contrib.auth.models import User
+from django.core.management.base import BaseCommand, CommandError
+from django.db import connection, transaction
+from django.test.utils import CaptureQueriesContext
+
+from books import importer
+
+
+class Rollback(Exception):
+    pass
+
+
+def generate(fmt, rows, notes_per_row):
+    """A file of ``rows`` distinct books in ``fmt``, every tenth one finished."""
+    out = io.StringIO()
+    if fmt == "csv":
+        writer = csv.writer(out)
+        writer.writerow(["Title", "Author", "Exclusive Shelf", "Date Read"])
+        for i in range(rows):
+            finished = i % 10 == 0
+            writer.writerow([
+                f"Book {i}", f"Author {i % 997}",
+                "read" if finished else "to-read",
+                f"2023/{i % 12 + 1:02d}/01" if finished else "",
+            ])
+    else:
+        for i in range(rows):
+            row = {"title": f"Book {i}", "author": f"Author {i % 997}"}
+            if i % 10 == 0:
+                row["finish_date"] = f"2023-{i % 12 + 1:02d}-01"
+            row["notes"] = [
+                {"content": f"Note {n} " + "lorem ipsum " * 10, "page_number": n}
+                for n in range(notes_per_row)
+            ]
+            out.write(json.dumps(row) + "\n")
+    out.seek(0)
+    return out
+
+
+class Command(BaseCommand):
+    help = (
+        "Import a generated library and report rows/sec for each batch size. "
+        "The data is created inside a transaction that is rolled back "
+        "afterwards."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument("--rows", type=int, default=20_000)
+        parser.add_argument("--notes-per-row", type=int, default=2, help="NDJSON only; CSV rows have no notes.")
+        parser.add_argument("--format", choices=importer.FORMATS, default="ndjson")
+        parser.add_argument(
+            "--batch-size", type=int, action="append", dest="batch_sizes",
+            help=f"Repeat to compare several (default: {importer.BATCH_SIZE}).",
+        )
+
+    def handle(self, *args, **options):
+        batch_sizes = options["batch_sizes"] or [importer.BATCH_SIZE]
+        if min(options["rows"], *batch_sizes) < 1 or options["notes_per_row"] < 0:
+            raise CommandError("--rows and --batch-size must be positive.")
+        notes_per_row = options["notes_per_row"] if options["format"] == "ndjson" else 0
+        self.stdout.write(
+            f"{options['format']} import of {options['rows']} rows, {notes_per_row} notes per row"
+        )
+        for batch_size in batch_sizes:
+            stream = generate(options["format"], options["rows"], notes_per_row)
+            try:
+                with transaction.atomic():
+                    self.run(stream, options["format"], batch_size)
+                    raise Rollback
+            except Rollback:
+                pass
+        self.stdout.write(self.style.SUCCESS("Done (generated data rolled back)."))
+
+    def run(self, stream, fmt, batch_size):
+        user = User.objects.create_user(username="__bench_import__")
+        with CaptureQueriesContext(connection) as queries:
+            start = time.perf_counter()
+            summary = importer.import_library(user, stream, fmt, batch_size=batch_size)
+            elapsed = time.perf_counter() - start
+        rows = summary["created"] + summary["duplicates"] + summary["error_count"]
+        self.stdout.write(
+            f"  batch {batch_size:>6}  {rows / elapsed:9.0f} rows/s  {elapsed:6.2f} s  "
+            f"{summary['created']} books  {summary['notes_created']} notes  {len(queries)} queries"
+        )
+        if summary["error_count"]:
+            self.stderr.write(self.style.ERROR(f"  {summary['error_count']} rows failed: {summary['errors'][:3]}"))
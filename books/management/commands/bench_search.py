@@ -0,0 +1,140 @@
+import itertools
+import random
+import statistics
+import time
+
+from django.contrib.auth.models import User
+from django.core.management import call_command
+from django.core.management.base import BaseCommand, CommandError
+from django.db import connection, transaction
+
+from books import search
+from books.models import Book, FriendRequest, Note
+
+SYLLABLES = ("ka", "lo", "mi", "ne", "ru", "sa", "ti", "vo", "ze", "bar", "del", "fin", "gor", "hul", "pen", "tor")
+
+
+class Rollback(Exception):
+    pass
+
+
+class Command(BaseCommand):
+    help = (
+        "Time full-text search over a large generated note corpus, for a user "
+        "searching their own and their friends' notes. The data is created "
+        "inside a transaction that is rolled back afterwards."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument("--notes", type=int, default=1_000_000)
+        parser.add_argument("--users", type=int, default=1000)
+        parser.add_argument("--notes-per-book", type=int, default=25)
+        parser.add_argument("--friends", type=int, default=50, help="Friends of the searching user.")
+        parser.add_argument("--queries", type=int, default=50, help="Timed searches per query class.")
+        parser.add_argument("--seed", type=int, default=42)
+        parser.add_argument(
+            "--optimize", action="store_true",
+            help="Run rebuild_search_index --optimize after seeding, as a nightly job would.",
+        )
+
+    def handle(self, *args, **options):
+        if min(options["notes"], options["users"], options["notes_per_book"], options["queries"]) < 1:
+            raise CommandError("--notes, --users, --notes-per-book and --queries must be positive.")
+        if not 0 <= options["friends"] < options["users"]:
+            raise CommandError("--friends must be between 0 and --users - 1.")
+        try:
+            with transaction.atomic():
+                self.run(options)
+                raise Rollback
+        except Rollback:
+            pass
+
+    def vocabulary(self, rng):
+        words = sorted({
+            "".join(rng.choice(SYLLABLES) for _ in range(rng.randint(2, 4)))
+            for _ in range(20000)
+        })
+        rng.shuffle(words)
+        # Zipf-like: the word of rank r is drawn with weight 1/r.
+        weights = list(itertools.accumulate(1 / rank for rank in range(1, len(words) + 1)))
+        return words, weights
+
+    def seed(self, rng, options, words, weights):
+        users = User.objects.bulk_create(
+            User(username=f"__bench_search_{i}__") for i in range(options["users"])
+        )
+        per_book = options["notes_per_book"]
+        n_books = max(1, options["notes"] // per_book)
+        books = Book.objects.bulk_create(
+            (
+                Book(user=users[i % len(users)], title=" ".join(rng.choices(words, cum_weights=weights, k=3)),
+                     author="Author")
+                for i in range(n_books)
+            ),
+            batch_size=2000,
+        )
+
+        def notes():
+            for book in books:
+                for page in range(per_book):
+                    yield Note(
+                        book=book,
+                        content=" ".join(rng.choices(words, cum_weights=weights, k=12)),
+                        page_number=page + 1,
+                    )
+
+        # In slices, so the generated notes never sit in memory all at once.
+        it = notes()
+        while batch := list(itertools.islice(it, 20000)):
+            Note.objects.bulk_create(batch, batch_size=2000)
+
+        searcher = users[0]
+        FriendRequest.objects.bulk_create(
+            FriendRequest(from_user=searcher, to_user=friend, accepted=True)
+            for friend in users[1:options["friends"] + 1]
+        )
+        return searcher, [user.pk for user in users[:options["friends"] + 1]], n_books * per_book
+
+    def run(self, options):
+        rng = random.Random(options["seed"])
+        words, weights = self.vocabulary(rng)
+
+        start = time.perf_counter()
+        searcher, scope, n_notes = self.seed(rng, options, words, weights)
+        self.stdout.write(
+            f"{n_notes} notes over {options['users']} users created in {time.perf_counter() - start:.1f}s; "
+            f"searching {len(scope)} users' notes ({connection.vendor})"
+        )
+        if options["optimize"]:
+            start = time.perf_counter()
+            call_command("rebuild_search_index", optimize=True, stdout=self.stdout)
+            self.stdout.write(f"  optimized in {time.perf_counter() - start:.1f}s")
+
+        n = options["queries"]
+        classes = {
+            "common word": [words[rng.randrange(10)] for _ in range(n)],
+            "mid word": [words[rng.randrange(100, 1000)] for _ in range(n)],
+            "rare word": [words[rng.randrange(5000, len(words))] for _ in range(n)],
+            "prefix": [words[rng.randrange(100, 1000)][:3] for _ in range(n)],
+            "two words": [f"{words[rng.randrange(50)]} {words[rng.randrange(100, 1000)]}" for _ in range(n)],
+        }
+        all_timings = []
+        for label, queries in classes.items():
+            timings, hits = [], 0
+            for q in queries:
+                start = time.perf_counter()
+                result = search.search(q, scope)
+                timings.append((time.perf_counter() - start) * 1000)
+                hits += len(result["notes"]) + len(result["books"])
+            all_timings += timings
+            self.report(label, timings, f"  {hits / n:.1f} results")
+        self.report("all", all_timings)
+        self.stdout.write(self.style.SUCCESS("Done (generated data rolled back)."))
+
+    def report(self, label, timings, extra=""):
+        timings = sorted(timings)
+        p95 = timings[min(len(timings) - 1, round(0.95 * len(timings)) - 1)]
+        self.stdout.write(
+            f"  {label:<12} median {statistics.median(timings):8.2f} ms  p95 {p95:8.2f} ms  "
+            f"max {timings[-1]:8.2f} ms{extra}"
+        )
@@ -0,0 +1,102 @@
+import random
+import statistics
+import time
+
+from django.contrib.auth.models import User
+from django.core.management.base import BaseCommand, CommandError
+from django.db import connection, transaction
+from django.db.models import Case, IntegerField, Value, When
+from django.db.models.functions import Length
+from django.test.utils import CaptureQueriesContext
+
+from books import user_search
+from books.friends import annotate_status
+
+SYLLABLES = ("an", "bo", "ca", "de", "el", "fi", "ga", "ho", "is", "ju", "ka", "li", "mo", "no", "ra", "su", "ta", "vi")
+
+
+class Rollback(Exception):
+    pass
+
+
+class Command(BaseCommand):
+    help = (
+        "Time username search (the friends page search box) over many users, "
+        "through the in-memory index and through a plain icontains query. "
+        "The users are created inside a transaction that is rolled back "
+        "afterwards."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument("--users", type=int, default=1_000_000)
+        parser.add_argument("--queries", type=int, default=200, help="Timed searches per method.")
+        parser.add_argument("--seed", type=int, default=42)
+
+    def handle(self, *args, **options):
+        if options["users"] < 1 or options["queries"] < 1:
+            raise CommandError("--users and --queries must be positive.")
+        try:
+            with transaction.atomic():
+                self.run(options)
+                raise Rollback
+        except Rollback:
+            pass
+        finally:
+            # The index holds the rolled-back users.
+            user_search._index = None
+
+    def username(self, rng, i):
+        return "".join(rng.choice(SYLLABLES) for _ in range(rng.randint(2, 4))) + str(i)
+
+    def run(self, options):
+        rng = random.Random(options["seed"])
+        start = time.perf_counter()
+        User.objects.bulk_create(
+            (User(username=self.username(rng, i)) for i in range(options["users"])),
+            batch_size=5000,
+        )
+        user = User.objects.create_user(username="__bench_user_search__")
+        self.stdout.write(f"{options['users']} users created in {time.perf_counter() - start:.1f}s")
+
+        user_search._index = None
+        start = time.perf_counter()
+        index = user_search.get_index()
+        self.stdout.write(f"  index build    {(time.perf_counter() - start) * 1000:9.1f} ms  {len(index.names)} names")
+
+        # Prefixes and substrings of 1 to 4 characters, as typed into the box.
+        names = rng.sample(index.names, min(options["queries"], len(index.names)))
+        queries = []
+        for name in names:
+            length = rng.randint(1, 4)
+            offset = 0 if rng.random() < 0.5 else rng.randint(0, max(0, len(name) - length))
+            queries.append(name[offset:offset + length])
+        short = [q for q in queries if len(q) <= 2]
+
+        queryset = annotate_status(User.objects.all(), user)
+        self.report("index", queries, lambda q: index.search(q, 10, user.pk))
+        self.report("index, 1-2 ch", short, lambda q: index.search(q, 10, user.pk))
+        self.report("search()", queries, lambda q: user_search.search(q, user.pk, 10, queryset))
+        self.report("icontains", queries[:max(1, len(queries) // 10)], lambda q: list(
+            queryset.filter(username__icontains=q).exclude(id=user.pk)
+            .annotate(is_prefix=Case(
+                When(username__istartswith=q, then=Value(0)), default=Value(1), output_field=IntegerField(),
+            ))
+            .order_by("is_prefix", Length("username"), "username")[:10]
+        ))
+        self.stdout.write(self.style.SUCCESS("Done (generated data rolled back)."))
+
+    def report(self, label, queries, func):
+        timings = []
+        # Seeding filled the query log; CaptureQueriesContext counts from it.
+        connection.queries_log.clear()
+        with CaptureQueriesContext(connection) as captured:
+            for q in queries:
+                start = time.perf_counter()
+                func(q)
+                timings.append((time.perf_counter() - start) * 1000)
+        timings.sort()
+        p95 = timings[min(len(timings) - 1, round(0.95 * len(timings)) - 1)]
+        self.stdout.write(
+            f"  {label:<14} median {statistics.median(timings):8.2f} ms  p95 {p95:8.2f} ms  "
+            f"{len(captured) / len(queries):.0f} queries each  ({len(queries)} searches)"
+        )
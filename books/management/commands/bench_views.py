@@ -0,0 +1,319 @@
+import itertools
+import json
+import platform
+import statistics
+import time
+from typing import NamedTuple
+
+import django
+from django.conf import settings
+from django.contrib.auth.models import User
+from django.core.files.uploadedfile import SimpleUploadedFile
+from django.core.management.base import BaseCommand, CommandError
+from django.db import connection, transaction
+from django.db.models import Count
+from django.test import Client, override_settings
+from django.test.utils import CaptureQueriesContext
+from django.utils import timezone
+
+from books.friends import friend_ids
+from books.models import Book, FriendRequest, Note
+
+
+class Rollback(Exception):
+    pass
+
+
+class Scenario(NamedTuple):
+    name: str
+    method: str
+    path: object  # str, or a callable run (untimed) before each request
+    body: object = None  # dict, or a callable like ``path``
+    json: bool = False
+
+
+def scenarios(ctx):
+    """A scenario for every route in books/urls.py.
+
+    ``ctx`` holds the user and ids picked from the seeded data. Routes that
+    consume a row (deletes, accepting a request) get a fresh one before
+    each request; everything is rolled back at the end of the run.
+    """
+    user, book, note = ctx["user"], ctx["book"], ctx["note"]
+    friend, friend_book, stranger = ctx["friend"], ctx["friend_book"], ctx["stranger"]
+
+    def new_book():
+        return Book.objects.create(user=user, title="Bench", author="Bench").pk
+
+    def new_note():
+        return Note.objects.create(book_id=book, content="bench").pk
+
+    def incoming_request():
+        FriendRequest.objects.filter(from_user_id=stranger, to_user=user).delete()
+        return FriendRequest.objects.create(from_user_id=stranger, to_user=user).pk
+
+    def unsent_request():
+        FriendRequest.objects.filter(from_user=user, to_user_id=stranger).delete()
+        return "/books/api/friends/request/send/"
+
+    def befriend_stranger():
+        FriendRequest.objects.get_or_create(from_user=user, to_user_id=stranger, defaults={"accepted": True})
+        return "/books/api/friends/remove/"
+
+    imports = itertools.count()
+
+    def import_file():
+        # Fresh titles each time, so rows are inserted rather than skipped.
+        n = next(imports)
+        rows = "".join(f'{{"title": "Imported {n}-{i}", "author": "Bench"}}\n' for i in range(20))
+        return {"file": SimpleUploadedFile("library.ndjson", rows.encode()), "format": "ndjson"}
+
+    return [
+        Scenario("books:list", "get", "/books/"),
+        Scenario("books:list?status=finished", "get", "/books/?status=finished"),
+        Scenario("books:detail", "get", f"/books/{book}/"),
+        Scenario("books:reading_stats", "get", "/books/reading_stats/"),
+        Scenario("books:friends", "get", "/books/friends/"),
+        Scenario("books:list_friends", "get", "/books/api/friends/"),
+        Scenario("books:list_friend_requests", "get", "/books/api/friends/requests/"),
+        Scenario("books:search_users", "get", "/books/api/friends/search/?q=bench_1"),
+        Scenario("books:friend_feed", "get", "/books/api/friends/feed/"),
+        Scenario("books:friend_books", "get", f"/books/api/friends/{friend}/books/"),
+        Scenario("books:friend_book_notes", "get", f"/books/api/friends/{friend}/books/{friend_book}/notes/"),
+        Scenario("books:book_notes_api", "get", f"/books/api/books/{book}/notes/"),
+        Scenario("books:search_library", "get", "/books/api/search/?q=river&scope=friends"),
+        Scenario("books:export_library", "get", "/books/api/export/?format=ndjson"),
+        Scenario("books:metrics", "get", "/books/metrics/"),
+        Scenario("books:add", "post", "/books/add/", {"title": "Bench", "author": "Bench"}, json=True),
+        Scenario("books:add_from_search", "post", "/books/add-from-search/", {"title": "Bench", "author": "Bench"}),
+        Scenario("books:finish_book", "post", f"/books/{book}/finish/"),
+        Scenario("books:update_finish_date", "post", f"/books/{book}/update-date/", {"finish_date": "2024-05-01"}),
+        Scenario("books:delete", "post", lambda: f"/books/{new_book()}/delete/"),
+        Scenario("books:add_note_api", "post", f"/books/api/books/{book}/notes/add/", {"content": "bench"}, json=True),
+        Scenario("books:edit_note_api", "post", f"/books/api/notes/{note}/edit/", {"content": "edited"}, json=True),
+        Scenario("books:delete_note_api", "post", lambda: f"/books/api/notes/{new_note()}/delete/"),
+        Scenario(
+            "books:batch_notes_api", "post", f"/books/api/books/{book}/notes/batch/",
+            lambda: {"operations": [
+                *({"op": "create", "content": f"bench {i}", "page_number": i} for i in range(20)),
+                {"op": "update", "id": note, "content": "edited"},
+                {"op": "delete", "id": new_note()},
+            ]},
+            json=True,
+        ),
+        Scenario("books:send_friend_request", "post", unsent_request, {"to_user_id": stranger}, json=True),
+        Scenario(
+            "books:respond_friend_request", "post",
+            lambda: f"/books/api/friends/request/{incoming_request()}/respond/", {"accept": True}, json=True,
+        ),
+        Scenario("books:remove_friend", "post", befriend_stranger, {"user_id": stranger}, json=True),
+        Scenario("books:import_library", "post", "/books/api/import/", import_file),
+    ]
+
+
+EXTERNAL = [
+    Scenario("books:book_search", "get", "/books/search/?q=dune"),
+    Scenario("books:open_library_search", "get", "/books/api/open-library-search/?q=dune"),
+    Scenario("books:cover", "get", "/books/covers/?src=https://covers.openlibrary.org/b/id/8231856-M.jpg"),
+]
+
+# Compared against the baseline; higher is worse for all of them.
+COMPARED = ("p50_ms", "p95_ms", "mean_queries")
+
+
+def percentile(sorted_values, pct):
+    index = min(len(sorted_values) - 1, max(0, round(pct / 100 * len(sorted_values)) - 1))
+    return sorted_values[index]
+
+
+class Command(BaseCommand):
+    help = (
+        "Drive every books/ route through the test client and report "
+        "throughput, p50/p95/p99 latency and query counts as JSON. Seed "
+        "data first with seed_bench. Writes are rolled back at the end."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument("--user", help="User to run as (default: the seeded user with the most books).")
+        parser.add_argument("--requests", type=int, default=50, help="Timed requests per scenario.")
+        parser.add_argument("--warmup", type=int, default=5)
+        parser.add_argument("--only", action="append", default=[], help="Run scenarios whose name contains this.")
+        parser.add_argument("--include-external", action="store_true", help="Also run routes that call Open Library.")
+        parser.add_argument("--without-metrics", action="store_true", help="Disable MetricsMiddleware for the run.")
+        parser.add_argument("--output", help="Write the JSON report here instead of stdout.")
+        parser.add_argument("--baseline", help="Compare against an earlier JSON report.")
+        parser.add_argument("--threshold", type=float, default=10.0, help="Percent slowdown counted as a regression.")
+        parser.add_argument("--fail-on-regression", action="store_true")
+
+    def handle(self, *args, **options):
+        middleware = settings.MIDDLEWARE
+        if options["without_metrics"]:
+            middleware = [m for m in middleware if m != "books.middleware.MetricsMiddleware"]
+
+        report = None
+        try:
+            # The test client's default host is "testserver", which
+            # ALLOWED_HOSTS would answer with 400.
+            with transaction.atomic(), override_settings(
+                MIDDLEWARE=middleware, ALLOWED_HOSTS=[*settings.ALLOWED_HOSTS, "testserver"],
+            ):
+                report = self.run(self.pick_user(options["user"]), options)
+                raise Rollback
+        except Rollback:
+            pass
+
+        output = json.dumps(report, indent=2)
+        if options["output"]:
+            with open(options["output"], "w") as f:
+                f.write(output + "\n")
+            self.stderr.write(f"Wrote {options['output']}")
+        else:
+            self.stdout.write(output)
+
+        failed = [name for name, result in report["results"].items() if not result["ok"]]
+        for name in failed:
+            self.stderr.write(self.style.ERROR(f"{name}: unexpected status {report['results'][name]['status']}"))
+
+        if options["baseline"]:
+            regressions = self.compare(report, options["baseline"], options["threshold"])
+            if regressions and options["fail_on_regression"]:
+                raise CommandError(f"{regressions} regressions against {options['baseline']}")
+        if failed:
+            raise CommandError(f"{len(failed)} scenarios answered with a status other than 2xx/3xx")
+
+    def pick_user(self, username):
+        if username:
+            user = User.objects.filter(username=username).first()
+        else:
+            user = (
+                User.objects.filter(username__startswith="bench_")
+                .annotate(n=Count("book")).order_by("-n").first()
+            )
+        if user is None:
+            raise CommandError("No user to run as; seed data with seed_bench first.")
+        if not user.is_staff:
+            # The metrics route is staff-only; the change is rolled back.
+            User.objects.filter(pk=user.pk).update(is_staff=True)
+            user.is_staff = True
+        return user
+
+    def context(self, user):
+        book = Book.objects.filter(user=user).annotate(n=Count("notes")).order_by("-n").first()
+        if book is None:
+            raise CommandError(f"{user.username} has no books.")
+        friends = friend_ids(user)
+        friend_book = (
+            Book.objects.filter(user_id__in=friends).annotate(n=Count("notes")).order_by("-n")
+            .select_related("user").first()
+        )
+        if friend_book is None:
+            raise CommandError(f"{user.username} has no friends with books.")
+        stranger = (
+            User.objects.exclude(pk__in=friends | {user.pk})
+            .exclude(received_requests__from_user=user)
+            .exclude(sent_requests__to_user=user)
+            .values_list("pk", flat=True).first()
+        )
+        return {
+            "user": user,
+            "book": book.pk,
+            "note": Note.objects.filter(book=book).values_list("pk", flat=True).first()
+            or Note.objects.create(book=book, content="bench").pk,
+            "friend": friend_book.user.username,
+            "friend_book": friend_book.pk,
+            "stranger": stranger,
+        }
+
+    def run(self, user, options):
+        client = Client()
+        client.force_login(user)
+        ctx = self.context(user)
+        selected = scenarios(ctx) + (EXTERNAL if options["include_external"] else [])
+        if options["only"]:
+            selected = [s for s in selected if any(part in s.name for part in options["only"])]
+
+        results = {}
+        for scenario in selected:
+            self.stderr.write(f"{scenario.name} ...")
+            results[scenario.name] = self.measure(client, scenario, options)
+
+        return {
+            "meta": {
+                "timestamp": timezone.now().isoformat(),
+                "user": user.username,
+                "books": Book.objects.filter(user=user).count(),
+                "users": User.objects.count(),
+                "friend_requests": FriendRequest.objects.count(),
+                "requests_per_scenario": options["requests"],
+                "metrics_middleware": not options["without_metrics"],
+                "database": connection.vendor,
+                "python": platform.python_version(),
+                "django": django.get_version(),
+            },
+            "results": results,
+        }
+
+    def measure(self, client, scenario, options):
+        def prepare():
+            path = scenario.path() if callable(scenario.path) else scenario.path
+            body = scenario.body() if callable(scenario.body) else scenario.body
+            return path, body or {}
+
+        def call(path, body):
+            if scenario.method == "get":
+                response = client.get(path)
+            elif scenario.json:
+                response = client.post(path, json.dumps(body), content_type="application/json")
+            else:
+                response = client.post(path, body)
+            if response.streaming:
+                b"".join(response.streaming_content)
+            return response
+
+        for _ in range(options["warmup"]):
+            call(*prepare())
+
+        timings, queries, statuses = [], [], {}
+        for _ in range(options["requests"]):
+            path, body = prepare()
+            with CaptureQueriesContext(connection) as captured:
+                start = time.perf_counter()
+                response = call(path, body)
+                timings.append((time.perf_counter() - start) * 1000)
+            queries.append(len(captured))
+            statuses[response.status_code] = statuses.get(response.status_code, 0) + 1
+
+        timings.sort()
+        return {
+            "throughput_rps": round(len(timings) / (sum(timings) / 1000), 1),
+            "p50_ms": round(percentile(timings, 50), 2),
+            "p95_ms": round(percentile(timings, 95), 2),
+            "p99_ms": round(percentile(timings, 99), 2),
+            "mean_ms": round(statistics.fmean(timings), 2),
+            "mean_queries": round(statistics.fmean(queries), 1),
+            "max_queries": max(queries),
+            "status": {str(code): count for code, count in sorted(statuses.items())},
+            # Timings of error responses say nothing about the view.
+            "ok": all(200 <= code < 400 for code in statuses),
+        }
+
+    def compare(self, report, baseline_path, threshold):
+        with open(baseline_path) as f:
+            baseline = json.load(f)["results"]
+
+        regressions = 0
+        for name, result in report["results"].items():
+            before = baseline.get(name)
+            if before is None or not result["ok"]:
+                continue
+            for key in COMPARED:
+                old, new = before[key], result[key]
+                change = (new - old) / old * 100 if old else (100.0 if new else 0.0)
+                if change > threshold:
+                    regressions += 1
+                    self.stderr.write(self.style.ERROR(f"{name} {key}: {old} -> {new} (+{change:.0f}%)"))
+                elif change < -threshold:
+                    self.stderr.write(self.style.SUCCESS(f"{name} {key}: {old} -> {new} ({change:.0f}%)"))
+        if not regressions:
+            self.stderr.write(self.style.SUCCESS(f"No regressions over {threshold:.0f}%."))
+        return regressions
@@ -0,0 +1,36 @@
+from django.core.management.base import BaseCommand
+
+from books import counters, friends, search_cache
+
+
+class Command(BaseCommand):
+    help = "Show hit/miss counters for the search and friend-set caches."
+
+    def add_arguments(self, parser):
+        parser.add_argument("--reset", action="store_true", help="Reset the counters after printing them.")
+
+    def handle(self, *args, **options):
+        if not counters.is_shared():
+            self.stderr.write(self.style.WARNING(
+                "The counters are in the default cache, which is per-process (the "
+                "LocMem default), so these are only this command's own counts. Set "
+                "CACHE_BACKEND to a shared backend, or read each worker's counts "
+                "from /books/metrics/."
+            ))
+        stats = search_cache.stats()
+        self.stdout.write("Open Library search cache")
+        self.stdout.write(f"  hits:       {stats['hits']}")
+        self.stdout.write(f"  stale hits: {stats['stale_hits']}")
+        self.stdout.write(f"  misses:     {stats['misses']}")
+        self.stdout.write(f"  coalesced:  {stats['coalesced']}")
+        self.stdout.write(f"  hit rate:   {stats['hit_rate']:.1%}")
+
+        stats = friends.stats()
+        self.stdout.write("Friend-set cache")
+        self.stdout.write(f"  hits:       {stats['hits']}")
+        self.stdout.write(f"  misses:     {stats['misses']}")
+        self.stdout.write(f"  hit rate:   {stats['hit_rate']:.1%}")
+
+        if options["reset"]:
+            search_cache.reset_stats()
+            friends.reset_stats()
@@ -0,0 +1,29 @@
+import sys
+
+from django.contrib.auth.models import User
+from django.core.management.base import BaseCommand, CommandError
+
+from books import export
+
+
+class Command(BaseCommand):
+    help = "Stream a user's books and notes as NDJSON or JSON."
+
+    def add_arguments(self, parser):
+        parser.add_argument("username")
+        parser.add_argument("--format", choices=sorted(export.FORMATS), default="ndjson")
+        parser.add_argument("--output", "-o", help="File to write to (default: stdout).")
+
+    def handle(self, *args, **options):
+        try:
+            user = User.objects.get(username=options["username"])
+        except User.DoesNotExist:
+            raise CommandError(f"User {options['username']!r} does not exist")
+
+        out = open(options["output"], "w", encoding="utf-8") if options["output"] else sys.stdout
+        try:
+            for chunk in export.stream_library(user, options["format"]):
+                out.write(chunk)
+        finally:
+            if out is not sys.stdout:
+                out.close()
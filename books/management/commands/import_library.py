@@ -0,0 +1,42 @@
+import time
+
+from django.contrib.auth.models import User
+from django.core.management.base import BaseCommand, CommandError
+
+from books import importer
+
+
+class Command(BaseCommand):
+    help = "Bulk import books (and notes) from a Goodreads/CSV export or NDJSON file."
+
+    def add_arguments(self, parser):
+        parser.add_argument("username")
+        parser.add_argument("path")
+        parser.add_argument("--format", choices=importer.FORMATS, help="Defaults to the file extension.")
+        parser.add_argument("--batch-size", type=int, default=importer.BATCH_SIZE)
+
+    def handle(self, *args, **options):
+        try:
+            user = User.objects.get(username=options["username"])
+        except User.DoesNotExist:
+            raise CommandError(f"User {options['username']!r} does not exist")
+
+        path = options["path"]
+        fmt = options["format"] or ("ndjson" if path.endswith((".ndjson", ".jsonl")) else "csv")
+        start = time.perf_counter()
+
+        def progress(rows):
+            elapsed = time.perf_counter() - start
+            self.stdout.write(f"{rows} rows processed ({rows / elapsed:.0f} rows/sec)")
+
+        with open(path, encoding="utf-8-sig", newline="") as stream:
+            summary = importer.import_library(
+                user, stream, fmt, batch_size=options["batch_size"], progress=progress
+            )
+
+        for err in summary["errors"]:
+            self.stderr.write(f"row {err['row']}: {err['error']}")
+        self.stdout.write(self.style.SUCCESS(
+            f"Imported {summary['created']} books and {summary['notes_created']} notes; "
+            f"{summary['duplicates']} duplicates skipped, {summary['error_count']} rows rejected."
+        ))
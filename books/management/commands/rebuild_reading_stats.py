@@ -0,0 +1,22 @@
+from django.contrib.auth.models import User
+from django.core.management.base import BaseCommand, CommandError
+
+from books import stats
+
+
+class Command(BaseCommand):
+    help = "Recompute the monthly reading stats rollup from the books table."
+
+    def add_arguments(self, parser):
+        parser.add_argument("--user", help="Only rebuild this username's rows.")
+
+    def handle(self, *args, **options):
+        user = None
+        if options["user"]:
+            try:
+                user = User.objects.get(username=options["user"])
+            except User.DoesNotExist:
+                raise CommandError(f"User {options['user']!r} does not exist")
+
+        rows = stats.rebuild(user)
+        self.stdout.write(self.style.SUCCESS(f"Wrote {rows} rollup rows."))
@@ -0,0 +1,36 @@
+import importlib
+
+from django.core.management.base import BaseCommand
+from django.db import connection
+
+fulltext = importlib.import_module("books.migrations.0017_fulltext_owner")
+
+
+class Command(BaseCommand):
+    help = (
+        "Reinstall the SQLite FTS5 tables and triggers and reindex every note "
+        "and book. PostgreSQL's expression indexes need no maintenance."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--optimize", action="store_true",
+            help="Only merge the existing index into one segment; worth running nightly.",
+        )
+
+    def handle(self, *args, **options):
+        if connection.vendor != "sqlite":
+            self.stdout.write("Nothing to do on this database backend.")
+            return
+
+        if options["optimize"]:
+            with connection.cursor() as cursor:
+                for statement in fulltext.SQLITE_OPTIMIZE:
+                    cursor.execute(statement)
+            self.stdout.write(self.style.SUCCESS("Search index optimized."))
+            return
+
+        with connection.cursor() as cursor:
+            for statement in fulltext.SQLITE_REVERSE + fulltext.SQLITE_FORWARD:
+                cursor.execute(statement)
+        self.stdout.write(self.style.SUCCESS("Search index rebuilt."))
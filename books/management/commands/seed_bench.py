@@ -0,0 +1,151 @@
+import random
+import time
+from datetime import date, timedelta
+
+from django.contrib.auth.hashers import make_password
+from django.contrib.auth.models import User
+from django.core.management.base import BaseCommand, CommandError
+from django.db import transaction
+
+from books import stats, user_search
+from books.models import Book, FriendRequest, Note
+
+BATCH_SIZE = 2000
+PASSWORD = "bench"
+
+WORDS = (
+    "river night garden stone winter glass empire shadow letter silent city "
+    "house ocean fire memory orchard mountain secret journey lantern harbor "
+    "machine kingdom echo forest crown paper island"
+).split()
+
+
+def _title(rng):
+    return " ".join(rng.choice(WORDS) for _ in range(rng.randint(1, 4))).title()
+
+
+def _preferential_attachment(n_users, edges_per_user, rng):
+    """Barabasi-Albert style edges: new users befriend popular ones.
+
+    Yields ``(i, j)`` pairs with ``i > j``; degrees follow a power law.
+    """
+    targets = []  # every endpoint of every edge, so picks are degree-weighted
+    for i in range(n_users):
+        if i == 0:
+            targets.append(0)
+            continue
+        picked = set()
+        for _ in range(min(edges_per_user, i)):
+            j = rng.choice(targets)
+            if j != i:
+                picked.add(j)
+        for j in picked:
+            targets.extend((i, j))
+            yield i, j
+        targets.append(i)
+
+
+class Command(BaseCommand):
+    help = (
+        "Generate synthetic users, friendships, books and notes for "
+        "benchmarking. Users are named <prefix><n> with the password "
+        f"'{PASSWORD}'. Reruns with the same --seed produce the same data."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument("--users", type=int, default=1000)
+        parser.add_argument("--books-per-user", type=int, default=100, help="Mean; sizes are skewed.")
+        parser.add_argument("--notes-per-book", type=int, default=3, help="Mean; sizes are skewed.")
+        parser.add_argument("--friends-per-user", type=int, default=5, help="Edges added per new user.")
+        parser.add_argument("--pending-ratio", type=float, default=0.1, help="Share of requests left pending.")
+        parser.add_argument("--prefix", default="bench_")
+        parser.add_argument("--seed", type=int, default=42)
+        parser.add_argument("--flush", action="store_true", help="Delete existing <prefix>* users first.")
+
+    def handle(self, *args, **options):
+        if options["users"] < 1:
+            raise CommandError("--users must be positive.")
+        prefix = options["prefix"]
+        rng = random.Random(options["seed"])
+        start = time.perf_counter()
+
+        existing = User.objects.filter(username__startswith=prefix)
+        if options["flush"]:
+            deleted = existing.delete()[1].get("auth.User", 0)
+            self.stdout.write(f"Deleted {deleted} existing {prefix}* users.")
+        elif existing.exists():
+            raise CommandError(f"{prefix}* users already exist; pass --flush to replace them.")
+
+        with transaction.atomic():
+            password = make_password(PASSWORD)
+            users = User.objects.bulk_create(
+                (User(username=f"{prefix}{i}", password=password) for i in range(options["users"])),
+                batch_size=BATCH_SIZE,
+            )
+            if not users[0].pk:
+                users = list(User.objects.filter(username__startswith=prefix).order_by("id"))
+            self.stdout.write(f"{len(users)} users")
+
+            requests = [
+                FriendRequest(
+                    from_user=users[i],
+                    to_user=users[j],
+                    accepted=rng.random() >= options["pending_ratio"],
+                )
+                for i, j in _preferential_attachment(len(users), options["friends_per_user"], rng)
+            ]
+            FriendRequest.objects.bulk_create(requests, batch_size=BATCH_SIZE)
+            self.stdout.write(f"{len(requests)} friend requests")
+
+            n_books, n_notes = self.seed_books(users, options, rng)
+            self.stdout.write(f"{n_books} books, {n_notes} notes")
+
+            stats.rebuild()
+
+        # bulk_create sends no post_save, so the username index won't have
+        # heard about the new users.
+        user_search.user_created()
+        self.stdout.write(self.style.SUCCESS(f"Seeded in {time.perf_counter() - start:.1f}s."))
+
+    def seed_books(self, users, options, rng):
+        today = date.today()
+        n_books = n_notes = 0
+        books = []
+
+        def flush():
+            nonlocal n_notes
+            created = Book.objects.bulk_create(books, batch_size=BATCH_SIZE)
+            if not created[0].pk:
+                raise CommandError("This database backend does not return ids from bulk_create.")
+            notes = [
+                Note(
+                    book=book,
+                    content=" ".join(rng.choice(WORDS) for _ in range(rng.randint(5, 60))),
+                    page_number=rng.randint(1, 400),
+                    chapter=rng.randint(1, 30),
+                )
+                for book in created
+                # Pareto-distributed: most books have a few notes, some many.
+                for _ in range(int(rng.paretovariate(1.5) * options["notes_per_book"] / 3))
+            ]
+            Note.objects.bulk_create(notes, batch_size=BATCH_SIZE)
+            n_notes += len(notes)
+            books.clear()
+
+        for user in users:
+            count = int(rng.paretovariate(1.5) * options["books_per_user"] / 3)
+            for _ in range(count):
+                finished = rng.random() < 0.6
+                books.append(Book(
+                    user=user,
+                    title=_title(rng),
+                    author=f"{rng.choice(WORDS).title()} {rng.choice(WORDS).title()}",
+                    finished=finished,
+                    finish_date=today - timedelta(days=rng.randint(0, 5 * 365)) if finished else None,
+                ))
+            n_books += count
+            if len(books) >= BATCH_SIZE:
+                flush()
+        if books:
+            flush()
+        return n_books, n_notes
@@ -0,0 +1,225 @@
+"""In-process request metrics.
+
+``MetricsMiddleware`` (in ``middleware.py``) opens a ``RequestMetrics``
+for every request and stores it in a context variable. Database time and
+query count are collected by an execute wrapper installed on every new
+connection, and Open Library time by the client in ``openlibrary.py``;
+both add to whatever request is current. The context variable follows
+the request into the threads ``sync_to_async`` runs ORM calls in and into
+tasks it starts, so async views are measured too. When the response is ready its numbers
+go into per-view histograms in ``registry``.
+
+The histograms are cumulative since the process started, as Prometheus
+expects; rates and rolling windows come from ``rate()`` on the scraper.
+Each worker process keeps its own registry.
+"""
+import bisect
+import contextvars
+import threading
+import time
+
+from django.db.backends.signals import connection_created
+
+DURATION_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+QUERY_COUNT_BUCKETS = (0, 1, 2, 5, 10, 20, 50, 100, 200)
+SIZE_BUCKETS = (1024, 4096, 16384, 65536, 262144, 1048576, 4194304)
+
+_current = contextvars.ContextVar("request_metrics", default=None)
+
+
+class Histogram:
+    def __init__(self, buckets):
+        self.buckets = tuple(buckets)
+        self._lock = threading.Lock()
+        self.reset()
+
+    def observe(self, value):
+        index = bisect.bisect_left(self.buckets, value)
+        with self._lock:
+            self.counts[index] += 1
+            self.total += value
+            self.count += 1
+
+    def snapshot(self):
+        with self._lock:
+            counts = list(self.counts)
+            total, count = self.total, self.count
+        cumulative = []
+        running = 0
+        for bound, bucket_count in zip(self.buckets + (float("inf"),), counts):
+            running += bucket_count
+            cumulative.append((bound, running))
+        return {"buckets": cumulative, "sum": total, "count": count}
+
+    def reset(self):
+        with self._lock:
+            self.counts = [0] * (len(self.buckets) + 1)
+            self.total = 0.0
+            self.count = 0
+
+
+class RequestMetrics:
+    __slots__ = ("start", "db_queries", "db_time", "openlibrary_time")
+
+    def __init__(self):
+        self.start = time.perf_counter()
+        self.db_queries = 0
+        self.db_time = 0.0
+        self.openlibrary_time = 0.0
+
+    def elapsed(self):
+        return time.perf_counter() - self.start
+
+
+# name -> (help text, buckets)
+VIEW_METRICS = {
+    "view_duration_seconds": ("Wall time spent handling the request.", DURATION_BUCKETS),
+    "view_db_queries": ("Database queries run while handling the request.", QUERY_COUNT_BUCKETS),
+    "view_db_seconds": ("Time spent in database queries.", DURATION_BUCKETS),
+    "view_openlibrary_seconds": ("Time spent in HTTP calls to Open Library.", DURATION_BUCKETS),
+    "view_response_bytes": ("Response body size.", SIZE_BUCKETS),
+}
+
+
+class Registry:
+    """Per-view histograms, keyed by ``(metric name, view name)``."""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._histograms = {}
+
+    def histogram(self, name, view):
+        key = (name, view)
+        histogram = self._histograms.get(key)
+        if histogram is None:
+            with self._lock:
+                histogram = self._histograms.setdefault(key, Histogram(VIEW_METRICS[name][1]))
+        return histogram
+
+    def record(self, view, metrics, duration, size):
+        self.histogram("view_duration_seconds", view).observe(duration)
+        self.histogram("view_db_queries", view).observe(metrics.db_queries)
+        self.histogram("view_db_seconds", view).observe(metrics.db_time)
+        self.histogram("view_openlibrary_seconds", view).observe(metrics.openlibrary_time)
+        if size is not None:
+            self.histogram("view_response_bytes", view).observe(size)
+
+    def items(self):
+        with self._lock:
+            return sorted(self._histograms.items())
+
+    def reset(self):
+        with self._lock:
+            self._histograms.clear()
+
+
+registry = Registry()
+
+
+def begin():
+    metrics = RequestMetrics()
+    return metrics, _current.set(metrics)
+
+
+def resume(metrics):
+    """Make ``metrics`` current again, e.g. while a streamed body is produced."""
+    return _current.set(metrics)
+
+
+def end(token):
+    _current.reset(token)
+
+
+def add_openlibrary_time(seconds):
+    metrics = _current.get()
+    if metrics is not None:
+        metrics.openlibrary_time += seconds
+
+
+def _execute_wrapper(execute, sql, params, many, context):
+    metrics = _current.get()
+    if metrics is None:
+        return execute(sql, params, many, context)
+    start = time.perf_counter()
+    try:
+        return execute(sql, params, many, context)
+    finally:
+        metrics.db_time += time.perf_counter() - start
+        metrics.db_queries += 1
+
+
+def install_execute_wrapper(sender, connection, **kwargs):
+    if _execute_wrapper not in connection.execute_wrappers:
+        connection.execute_wrappers.append(_execute_wrapper)
+
+
+connection_created.connect(install_execute_wrapper)
+
+
+def server_timing(metrics, duration):
+    """Value for the ``Server-Timing`` response header (durations in ms)."""
+    parts = [
+        f'db;dur={metrics.db_time * 1000:.1f};desc="{metrics.db_queries} queries"',
+        f"total;dur={duration * 1000:.1f}",
+    ]
+    if metrics.openlibrary_time:
+        parts.insert(1, f'openlibrary;dur={metrics.openlibrary_time * 1000:.1f}')
+    return ", ".join(parts)
+
+
+def _label(value):
+    return str(value).replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
+
+
+def _bound(bound):
+    return "+Inf" if bound == float("inf") else repr(float(bound))
+
+
+def _write_histogram(lines, name, labels, snapshot):
+    label_str = ",".join(f'{key}="{_label(value)}"' for key, value in labels.items())
+    sep = "," if label_str else ""
+    for bound, count in snapshot["buckets"]:
+        lines.append(f'{name}_bucket{{{label_str}{sep}le="{_bound(bound)}"}} {count}')
+    suffix_labels = f"{{{label_str}}}" if label_str else ""
+    lines.append(f"{name}_sum{suffix_labels} {snapshot['sum']}")
+    lines.append(f"{name}_count{suffix_labels} {snapshot['count']}")
+
+
+def render_prometheus(extra_histograms=(), counters=None, gauges=None, prefix="booktracker_"):
+    """Render the registry in the Prometheus text exposition format.
+
+    ``extra_histograms`` are ``(name, help, Histogram)`` tuples without
+    labels; ``counters`` and ``gauges`` map names to values, and counters
+    get a ``_total`` suffix.
+    """
+    lines = []
+    by_name = {}
+    for (name, view), histogram in registry.items():
+        by_name.setdefault(name, []).append((view, histogram))
+
+    for name, (help_text, _) in VIEW_METRICS.items():
+        if name not in by_name:
+            continue
+        full_name = prefix + name
+        lines.append(f"# HELP {full_name} {help_text}")
+        lines.append(f"# TYPE {full_name} histogram")
+        for view, histogram in by_name[name]:
+            _write_histogram(lines, full_name, {"view": view}, histogram.snapshot())
+
+    for name, help_text, histogram in extra_histograms:
+        full_name = prefix + name
+        lines.append(f"# HELP {full_name} {help_text}")
+        lines.append(f"# TYPE {full_name} histogram")
+        _write_histogram(lines, full_name, {}, histogram.snapshot())
+
+    for name, value in sorted((counters or {}).items()):
+        full_name = prefix + name.replace(".", "_") + "_total"
+        lines.append(f"# TYPE {full_name} counter")
+        lines.append(f"{full_name} {value}")
+
+    for name, value in sorted((gauges or {}).items()):
+        full_name = prefix + name
+        lines.append(f"# TYPE {full_name} gauge")
+        lines.append(f"{full_name} {value}")
+
+    return "\n".join(lines) + "\n"
@@ -0,0 +1,134 @@
+from asgiref.sync import iscoroutinefunction, markcoroutinefunction
+from django.conf import settings
+from django.http import FileResponse
+from whitenoise.middleware import WhiteNoiseMiddleware
+
+from . import metrics
+
+
+class MetricsMiddleware:
+    """Record per-view timings and add a ``Server-Timing`` header.
+
+    Views are identified by URL name (``books:list``), or by the view's
+    dotted path for unnamed routes, so the number of label values stays
+    bounded by the URLconf. It runs natively in both sync and async mode,
+    so under ASGI it does not push the async views onto a thread.
+
+    A streamed body (the export) is produced while the server sends it,
+    running queries of its own, so its numbers are recorded once it has
+    been sent; ``Server-Timing`` then only covers the time to the first
+    byte. File responses are left alone, to keep the server's sendfile.
+    """
+
+    sync_capable = True
+    async_capable = True
+
+    def __init__(self, get_response):
+        self.get_response = get_response
+        self.async_mode = iscoroutinefunction(get_response)
+        if self.async_mode:
+            markcoroutinefunction(self)
+
+    def __call__(self, request):
+        if self.async_mode:
+            return self.__acall__(request)
+        request_metrics, token = metrics.begin()
+        try:
+            response = self.get_response(request)
+        finally:
+            metrics.end(token)
+        return self.finish(request, request_metrics, response)
+
+    async def __acall__(self, request):
+        request_metrics, token = metrics.begin()
+        try:
+            response = await self.get_response(request)
+        finally:
+            metrics.end(token)
+        return self.finish(request, request_metrics, response)
+
+    def finish(self, request, request_metrics, response):
+        match = request.resolver_match
+        view = match.view_name if match else "unresolved"
+        response["Server-Timing"] = metrics.server_timing(request_metrics, request_metrics.elapsed())
+
+        if response.streaming and not isinstance(response, FileResponse):
+            if response.is_async:
+                response.streaming_content = self.ameasure(view, request_metrics, response.streaming_content)
+            else:
+                response.streaming_content = self.measure(view, request_metrics, response.streaming_content)
+            return response
+
+        if response.streaming:
+            size = response.get("Content-Length")
+            size = int(size) if size else None
+        else:
+            size = len(response.content)
+        metrics.registry.record(view, request_metrics, request_metrics.elapsed(), size)
+        return response
+
+    def measure(self, view, request_metrics, content):
+        size = 0
+        content = iter(content)
+        try:
+            while True:
+                token = metrics.resume(request_metrics)
+                try:
+                    chunk = next(content, None)
+                finally:
+                    metrics.end(token)
+                if chunk is None:
+                    break
+                size += len(chunk)
+                yield chunk
+        finally:
+            metrics.registry.record(view, request_metrics, request_metrics.elapsed(), size)
+
+    async def ameasure(self, view, request_metrics, content):
+        size = 0
+        content = aiter(content)
+        try:
+            while True:
+                token = metrics.resume(request_metrics)
+                try:
+                    chunk = await anext(content, None)
+                finally:
+                    metrics.end(token)
+                if chunk is None:
+                    break
+                size += len(chunk)
+                yield chunk
+        finally:
+            metrics.registry.record(view, request_metrics, request_metrics.elapsed(), size)
+
+
+class StaticFilesMiddleware(WhiteNoiseMiddleware):
+    """WhiteNoise, able to run as async middleware.
+
+    WhiteNoise's own middleware is sync-only, so under ASGI Django would
+    call it, and every view behind it, through a thread. Finding a static
+    file is a dict lookup (a stat with autorefresh), fine to do on the
+    event loop.
+    """
+
+    async_capable = True
+
+    def __init__(self, get_response=None, settings=settings):
+        super().__init__(get_response, settings)
+        self.async_mode = iscoroutinefunction(get_response)
+        if self.async_mode:
+            markcoroutinefunction(self)
+
+    def __call__(self, request):
+        if self.async_mode:
+            return self.__acall__(request)
+        return super().__call__(request)
+
+    async def __acall__(self, request):
+        if self.autorefresh:
+            static_file = self.find_file(request.path_info)
+        else:
+            static_file = self.files.get(request.path_info)
+        if static_file is not None:
+            return self.serve(static_file, request)
+        return await self.get_response(request)
@@ -0,0 +1,44 @@
+from django.conf import settings
+from django.db import migrations, models
+import django.db.models.deletion
+from django.db.models.functions import ExtractMonth, ExtractYear
+
+
+def backfill(apps, schema_editor):
+    Book = apps.get_model('books', 'Book')
+    ReadingStatsMonthly = apps.get_model('books', 'ReadingStatsMonthly')
+    rows = (
+        Book.objects.filter(finished=True, finish_date__isnull=False)
+        .annotate(year=ExtractYear('finish_date'), month=ExtractMonth('finish_date'))
+        .values('user_id', 'year', 'month')
+        .annotate(count=models.Count('id'))
+    )
+    ReadingStatsMonthly.objects.bulk_create(
+        [ReadingStatsMonthly(**row) for row in rows.iterator()],
+        batch_size=1000,
+    )
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('books', '0010_book_note_created_indexes'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='ReadingStatsMonthly',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('year', models.IntegerField()),
+                ('month', models.IntegerField()),
+                ('count', models.IntegerField(default=0)),
+                ('user', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='reading_stats', to=settings.AUTH_USER_MODEL)),
+            ],
+            options={
+                'constraints': [models.UniqueConstraint(fields=('user', 'year', 'month'), name='books_stats_user_year_month_uniq')],
+            },
+        ),
+        migrations.RunPython(backfill, migrations.RunPython.noop),
+    ]
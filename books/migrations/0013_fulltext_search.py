@@ -0,0 +1,73 @@
+from django.db import migrations
+
+# SQLite: FTS5 tables over books_note / books_book, kept in sync by triggers.
+SQLITE_FORWARD = [
+    "CREATE VIRTUAL TABLE books_note_fts USING fts5(content, content='books_note', content_rowid='id')",
+    """CREATE TRIGGER books_note_fts_ai AFTER INSERT ON books_note BEGIN
+        INSERT INTO books_note_fts(rowid, content) VALUES (new.id, new.content);
+    END""",
+    """CREATE TRIGGER books_note_fts_ad AFTER DELETE ON books_note BEGIN
+        INSERT INTO books_note_fts(books_note_fts, rowid, content) VALUES ('delete', old.id, old.content);
+    END""",
+    """CREATE TRIGGER books_note_fts_au AFTER UPDATE OF content ON books_note BEGIN
+        INSERT INTO books_note_fts(books_note_fts, rowid, content) VALUES ('delete', old.id, old.content);
+        INSERT INTO books_note_fts(rowid, content) VALUES (new.id, new.content);
+    END""",
+    "INSERT INTO books_note_fts(books_note_fts) VALUES ('rebuild')",
+    "CREATE VIRTUAL TABLE books_book_fts USING fts5(title, author, content='books_book', content_rowid='id')",
+    """CREATE TRIGGER books_book_fts_ai AFTER INSERT ON books_book BEGIN
+        INSERT INTO books_book_fts(rowid, title, author) VALUES (new.id, new.title, new.author);
+    END""",
+    """CREATE TRIGGER books_book_fts_ad AFTER DELETE ON books_book BEGIN
+        INSERT INTO books_book_fts(books_book_fts, rowid, title, author) VALUES ('delete', old.id, old.title, old.author);
+    END""",
+    """CREATE TRIGGER books_book_fts_au AFTER UPDATE OF title, author ON books_book BEGIN
+        INSERT INTO books_book_fts(books_book_fts, rowid, title, author) VALUES ('delete', old.id, old.title, old.author);
+        INSERT INTO books_book_fts(rowid, title, author) VALUES (new.id, new.title, new.author);
+    END""",
+    "INSERT INTO books_book_fts(books_book_fts) VALUES ('rebuild')",
+]
+
+SQLITE_REVERSE = [
+    "DROP TRIGGER IF EXISTS books_note_fts_ai",
+    "DROP TRIGGER IF EXISTS books_note_fts_ad",
+    "DROP TRIGGER IF EXISTS books_note_fts_au",
+    "DROP TABLE IF EXISTS books_note_fts",
+    "DROP TRIGGER IF EXISTS books_book_fts_ai",
+    "DROP TRIGGER IF EXISTS books_book_fts_ad",
+    "DROP TRIGGER IF EXISTS books_book_fts_au",
+    "DROP TABLE IF EXISTS books_book_fts",
+]
+
+# PostgreSQL: GIN indexes on the same tsvector expressions books/search.py
+# queries with.
+POSTGRES_FORWARD = [
+    "CREATE INDEX books_note_content_fts ON books_note USING GIN (to_tsvector('english', content))",
+    "CREATE INDEX books_book_title_author_fts ON books_book USING GIN (to_tsvector('english', title || ' ' || author))",
+]
+
+POSTGRES_REVERSE = [
+    "DROP INDEX IF EXISTS books_note_content_fts",
+    "DROP INDEX IF EXISTS books_book_title_author_fts",
+]
+
+
+def _run(statements_by_vendor):
+    def run(apps, schema_editor):
+        for statement in statements_by_vendor.get(schema_editor.connection.vendor, []):
+            schema_editor.execute(statement)
+    return run
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('books', '0012_book_status_indexes'),
+    ]
+
+    operations = [
+        migrations.RunPython(
+            _run({'sqlite': SQLITE_FORWARD, 'postgresql': POSTGRES_FORWARD}),
+            _run({'sqlite': SQLITE_REVERSE, 'postgresql': POSTGRES_REVERSE}),
+        ),
+    ]
@@ -0,0 +1,28 @@
+from django.db import migrations, models
+
+
+# Nullable without defaults, so SQLite adds the columns in place instead of
+# rebuilding books_book (which would drop the FTS triggers from 0013).
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('books', '0014_username_trigram_index'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='book',
+            name='isbn',
+            field=models.CharField(blank=True, max_length=20, null=True),
+        ),
+        migrations.AddField(
+            model_name='book',
+            name='page_count',
+            field=models.IntegerField(blank=True, null=True),
+        ),
+        migrations.AddField(
+            model_name='book',
+            name='first_publish_year',
+            field=models.IntegerField(blank=True, null=True),
+        ),
+    ]
@@ -0,0 +1,112 @@
+import importlib
+
+from django.db import migrations
+
+from books import search
+
+fulltext = importlib.import_module("books.migrations.0013_fulltext_search")
+
+# SQLite: rebuild the FTS5 tables over owner-prefixed tokens, so each user's
+# rows form their own slice of the index (see books/search.py). The tables
+# read their content through views that apply books_owned_tokens(); the
+# triggers keep them in sync as before, and also re-index a book's notes
+# when the book changes owner. Owner prefixes are 9 characters, so the 10-12
+# character prefix indexes serve searches for 1-3 letter prefixes.
+SQLITE_FORWARD = [
+    """CREATE VIEW books_note_fts_source AS
+        SELECT n.id, books_owned_tokens(b.user_id, n.content) AS content
+        FROM books_note n JOIN books_book b ON b.id = n.book_id""",
+    """CREATE VIRTUAL TABLE books_note_fts USING fts5(
+        content, content='books_note_fts_source', content_rowid='id', prefix='10 11 12'
+    )""",
+    """CREATE TRIGGER books_note_fts_ai AFTER INSERT ON books_note BEGIN
+        INSERT INTO books_note_fts(rowid, content)
+        SELECT new.id, books_owned_tokens(user_id, new.content) FROM books_book WHERE id = new.book_id;
+    END""",
+    """CREATE TRIGGER books_note_fts_ad AFTER DELETE ON books_note BEGIN
+        INSERT INTO books_note_fts(books_note_fts, rowid, content)
+        SELECT 'delete', old.id, books_owned_tokens(user_id, old.content) FROM books_book WHERE id = old.book_id;
+    END""",
+    """CREATE TRIGGER books_note_fts_au AFTER UPDATE OF content, book_id ON books_note BEGIN
+        INSERT INTO books_note_fts(books_note_fts, rowid, content)
+        SELECT 'delete', old.id, books_owned_tokens(user_id, old.content) FROM books_book WHERE id = old.book_id;
+        INSERT INTO books_note_fts(rowid, content)
+        SELECT new.id, books_owned_tokens(user_id, new.content) FROM books_book WHERE id = new.book_id;
+    END""",
+    "INSERT INTO books_note_fts(books_note_fts) VALUES ('rebuild')",
+    "INSERT INTO books_note_fts(books_note_fts) VALUES ('optimize')",
+    """CREATE VIEW books_book_fts_source AS
+        SELECT id, books_owned_tokens(user_id, title) AS title, books_owned_tokens(user_id, author) AS author
+        FROM books_book""",
+    """CREATE VIRTUAL TABLE books_book_fts USING fts5(
+        title, author, content='books_book_fts_source', content_rowid='id', prefix='10 11 12'
+    )""",
+    """CREATE TRIGGER books_book_fts_ai AFTER INSERT ON books_book BEGIN
+        INSERT INTO books_book_fts(rowid, title, author)
+        VALUES (new.id, books_owned_tokens(new.user_id, new.title), books_owned_tokens(new.user_id, new.author));
+    END""",
+    """CREATE TRIGGER books_book_fts_ad AFTER DELETE ON books_book BEGIN
+        INSERT INTO books_book_fts(books_book_fts, rowid, title, author)
+        VALUES ('delete', old.id, books_owned_tokens(old.user_id, old.title), books_owned_tokens(old.user_id, old.author));
+    END""",
+    """CREATE TRIGGER books_book_fts_au AFTER UPDATE OF title, author, user_id ON books_book BEGIN
+        INSERT INTO books_book_fts(books_book_fts, rowid, title, author)
+        VALUES ('delete', old.id, books_owned_tokens(old.user_id, old.title), books_owned_tokens(old.user_id, old.author));
+        INSERT INTO books_book_fts(rowid, title, author)
+        VALUES (new.id, books_owned_tokens(new.user_id, new.title), books_owned_tokens(new.user_id, new.author));
+    END""",
+    """CREATE TRIGGER books_book_fts_owner AFTER UPDATE OF user_id ON books_book BEGIN
+        INSERT INTO books_note_fts(books_note_fts, rowid, content)
+        SELECT 'delete', id, books_owned_tokens(old.user_id, content) FROM books_note WHERE book_id = new.id;
+        INSERT INTO books_note_fts(rowid, content)
+        SELECT id, books_owned_tokens(new.user_id, content) FROM books_note WHERE book_id = new.id;
+    END""",
+    "INSERT INTO books_book_fts(books_book_fts) VALUES ('rebuild')",
+    "INSERT INTO books_book_fts(books_book_fts) VALUES ('optimize')",
+]
+
+# Merges each index into a single segment. Writes add small segments that
+# FTS5 only partly merges, and every search reads each segment.
+SQLITE_OPTIMIZE = [
+    "INSERT INTO books_note_fts(books_note_fts) VALUES ('optimize')",
+    "INSERT INTO books_book_fts(books_book_fts) VALUES ('optimize')",
+]
+
+SQLITE_REVERSE = [
+    "DROP TRIGGER IF EXISTS books_note_fts_ai",
+    "DROP TRIGGER IF EXISTS books_note_fts_ad",
+    "DROP TRIGGER IF EXISTS books_note_fts_au",
+    "DROP TABLE IF EXISTS books_note_fts",
+    "DROP VIEW IF EXISTS books_note_fts_source",
+    "DROP TRIGGER IF EXISTS books_book_fts_ai",
+    "DROP TRIGGER IF EXISTS books_book_fts_ad",
+    "DROP TRIGGER IF EXISTS books_book_fts_au",
+    "DROP TRIGGER IF EXISTS books_book_fts_owner",
+    "DROP TABLE IF EXISTS books_book_fts",
+    "DROP VIEW IF EXISTS books_book_fts_source",
+]
+
+
+def _run(*statement_lists):
+    def run(apps, schema_editor):
+        if schema_editor.connection.vendor != "sqlite":
+            return
+        search.register_functions(schema_editor.connection)
+        for statements in statement_lists:
+            for statement in statements:
+                schema_editor.execute(statement)
+    return run
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('books', '0016_versionstamp'),
+    ]
+
+    operations = [
+        migrations.RunPython(
+            _run(fulltext.SQLITE_REVERSE, SQLITE_FORWARD),
+            _run(SQLITE_REVERSE, fulltext.SQLITE_FORWARD),
+        ),
+    ]
@@ -10,6 +10,10 @@ class FriendRequest(models.Model):
 
     class Meta:
         unique_together = ('from_user', 'to_user')
+        indexes = [
+            models.Index(fields=['from_user', 'accepted'], name='books_fr_from_accepted_idx'),
+            models.Index(fields=['to_user', 'accepted'], name='books_fr_to_accepted_idx'),
+        ]
 
     def __str__(self):
         return f"{self.from_user} -> {self.to_user} ({'accepted' if self.accepted else 'pending'})"
@@ -23,6 +27,16 @@ class Book(models.Model):
     finish_date = models.DateField(null=True, blank=True)
     created_at = models.DateTimeField(auto_now_add=True)
     cover_url = models.URLField(blank=True, null=True)
+    isbn = models.CharField(max_length=20, blank=True, null=True)
+    page_count = models.IntegerField(null=True, blank=True)
+    first_publish_year = models.IntegerField(null=True, blank=True)
+
+    class Meta:
+        indexes = [
+            models.Index(fields=['user', 'created_at', 'id'], name='books_book_user_created_idx'),
+            models.Index(fields=['user', 'finished', 'created_at'], name='books_book_user_status_idx'),
+            models.Index(fields=['user', 'finished', 'finish_date'], name='books_book_user_finish_idx'),
+        ]
 
     def __str__(self):
         return self.title
@@ -36,3 +50,44 @@ class Note(models.Model):
     page_number = models.IntegerField(null=True, blank=True)
     chapter =models.IntegerField(null=True, blank=True)
     created_at = models.DateTimeField(auto_now_add=True)
+
+    class Meta:
+        indexes = [
+            models.Index(fields=['book', 'created_at', 'id'], name='books_note_book_created_idx'),
+        ]
+
+
+class ReadingStatsMonthly(models.Model):
+    """Number of books a user finished in a given month.
+
+    Maintained by ``books.stats`` from Book signals whenever a book's
+    finished state or finish date changes; ``manage.py
+    rebuild_reading_stats`` recomputes it.
+    """
+    user = models.ForeignKey(User, related_name='reading_stats', on_delete=models.CASCADE)
+    year = models.IntegerField()
+    month = models.IntegerField()
+    count = models.IntegerField(default=0)
+
+    class Meta:
+        constraints = [
+            models.UniqueConstraint(fields=['user', 'year', 'month'], name='books_stats_user_year_month_uniq'),
+        ]
+
+    def __str__(self):
+        return f"{self.user} {self.year}-{self.month:02d}: {self.count}"
+
+
+class VersionStamp(models.Model):
+    """A change counter for one cached resource; see ``books.versions``."""
+    scope = models.CharField(max_length=32)
+    obj_id = models.BigIntegerField()
+    version = models.BigIntegerField(default=0)
+
+    class Meta:
+        constraints = [
+            models.UniqueConstraint(fields=['scope', 'obj_id'], name='books_versionstamp_scope_obj_uniq'),
+        ]
+
+    def __str__(self):
+        return f"{self.scope}:{self.obj_id} v{self.version}"
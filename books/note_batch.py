@@ -0,0 +1,168 @@
+"""Batched note changes for one book.
+
+A batch is a list of operations, applied in a single transaction or not at
+all:
+
+- ``{"op": "create", "content": ..., "page_number": ..., "chapter": ...}``
+- ``{"op": "update", "id": ..., <any of content, page_number, chapter>}``
+- ``{"op": "delete", "id": ...}``
+
+Every operation is validated before anything is written, and the notes it
+refers to must belong to the book. The writes are one ``bulk_create``, one
+``bulk_update`` and one ``DELETE``, whatever the size of the batch.
+"""
+from django.conf import settings
+from django.db import transaction
+
+from . import versions
+from .importer import INT_RANGE
+from .models import Note
+
+OPS = ("create", "update", "delete")
+FIELDS = ("content", "page_number", "chapter")
+
+
+class BatchError(ValueError):
+    """Raised with ``errors``, a list of ``{"index", "error"}`` dicts."""
+
+    def __init__(self, errors):
+        super().__init__(f"{len(errors)} invalid operations")
+        self.errors = errors
+
+
+class _OpError(ValueError):
+    pass
+
+
+def _is_int(value):
+    return type(value) is int and INT_RANGE[0] <= value <= INT_RANGE[1]
+
+
+def _int_or_none(value, field):
+    if value in (None, ""):
+        return None
+    number = value
+    if isinstance(value, float) and value.is_integer():
+        number = int(value)
+    elif isinstance(value, str):
+        try:
+            number = int(value)
+        except ValueError:
+            pass
+    if not _is_int(number):
+        raise _OpError(f"Invalid {field}: {value!r}")
+    return number
+
+
+def _clean_fields(op, required):
+    fields = {}
+    if "content" in op or required:
+        content = op.get("content")
+        if not isinstance(content, str) or not content.strip():
+            raise _OpError("Content is required")
+        fields["content"] = content
+    for field in ("page_number", "chapter"):
+        if field in op:
+            fields[field] = _int_or_none(op[field], field)
+    return fields
+
+
+def _clean(op, seen_ids):
+    if not isinstance(op, dict) or op.get("op") not in OPS:
+        raise _OpError(f"op must be one of {', '.join(OPS)}")
+    kind = op["op"]
+    if kind == "create":
+        return kind, None, _clean_fields(op, required=True)
+
+    note_id = op.get("id")
+    if not _is_int(note_id):
+        raise _OpError("id must be an integer")
+    if note_id in seen_ids:
+        raise _OpError(f"Note {note_id} appears more than once")
+    seen_ids.add(note_id)
+    if kind == "delete":
+        return kind, note_id, {}
+    fields = _clean_fields(op, required=False)
+    if not fields:
+        raise _OpError(f"Nothing to update; give any of {', '.join(FIELDS)}")
+    return kind, note_id, fields
+
+
+def validate(operations):
+    """Return ``(op, id, fields)`` tuples, or raise ``BatchError``."""
+    if not isinstance(operations, list) or not operations:
+        raise BatchError([{"index": None, "error": "operations must be a non-empty list"}])
+    limit = getattr(settings, "NOTE_BATCH_MAX_OPERATIONS", 500)
+    if len(operations) > limit:
+        raise BatchError([{"index": None, "error": f"At most {limit} operations per batch"}])
+
+    cleaned, errors, seen_ids = [], [], set()
+    for index, op in enumerate(operations):
+        try:
+            cleaned.append(_clean(op, seen_ids))
+        except _OpError as e:
+            errors.append({"index": index, "error": str(e)})
+    if errors:
+        raise BatchError(errors)
+    return cleaned
+
+
+def _serialize(note):
+    return {
+        "id": note.id,
+        "content": note.content,
+        "page_number": note.page_number,
+        "chapter": note.chapter,
+        "created_at": note.created_at,
+    }
+
+
+def apply(book, operations):
+    """Validate and apply ``operations`` to book's notes.
+
+    Returns ``{"created": [...], "updated": [...], "deleted": [ids]}``, the
+    created and updated notes as ``book_notes_api`` shows them, in the order
+    of their operations. Raises ``BatchError`` without writing anything if
+    an operation is invalid or names a note that isn't one of book's.
+    """
+    cleaned = validate(operations)
+    creates = [fields for kind, _, fields in cleaned if kind == "create"]
+    updates = {note_id: fields for kind, note_id, fields in cleaned if kind == "update"}
+    deletes = [note_id for kind, note_id, _ in cleaned if kind == "delete"]
+
+    with transaction.atomic():
+        existing = Note.objects.select_for_update().filter(book=book).in_bulk(list(updates) + deletes)
+        errors = [
+            {"index": index, "error": f"Note {note_id} not found"}
+            for index, (kind, note_id, _) in enumerate(cleaned)
+            if note_id is not None and note_id not in existing
+        ]
+        if errors:
+            raise BatchError(errors)
+
+        created = Note.objects.bulk_create([Note(book=book, **fields) for fields in creates])
+
+        updated, changed = [], set()
+        for note_id, fields in updates.items():
+            note = existing[note_id]
+            for field, value in fields.items():
+                setattr(note, field, value)
+            changed.update(fields)
+            updated.append(note)
+        if updated:
+            Note.objects.bulk_update(updated, sorted(changed))
+
+        if deletes:
+            # Notes have no delete signals or dependents, so this is a
+            # single DELETE statement.
+            Note.objects.filter(pk__in=deletes).delete()
+
+        # The bulk writes send no signals.
+        versions.bump("notes", book.pk)
+        versions.bump("user_notes", book.user_id)
+
+    return {
+        "created": [_serialize(note) for note in created],
+        "updated": [_serialize(note) for note in updated],
+        "deleted": deletes,
+    }
@@ -0,0 +1,282 @@
+"""HTTP clients for all Open Library traffic.
+
+A single ``requests.Session`` per process (and an ``httpx.AsyncClient`` per
+event loop for the async search views) keeps connections to Open Library
+alive between requests. Every call is bounded by connect/read timeouts, is
+retried a few times with jittered exponential backoff, and goes through a
+circuit breaker that fails fast while the upstream keeps erroring. Sync and
+async calls share the breaker; each attempt is recorded in a latency
+histogram and its time is added to the current request's metrics.
+"""
+import asyncio
+import random
+import threading
+import time
+import weakref
+
+import httpx
+import requests
+from django.conf import settings
+from requests.adapters import HTTPAdapter
+
+from . import metrics
+from .metrics import Histogram
+
+BASE_URL = "https://openlibrary.org"
+HEADERS = {"User-Agent": "Mozilla/5.0"}
+
+RETRY_STATUSES = {429, 500, 502, 503, 504}
+
+# Upper bounds (seconds) of the latency histogram buckets.
+LATENCY_BUCKETS = (0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+
+
+class OpenLibraryError(requests.RequestException):
+    pass
+
+
+class CircuitOpenError(OpenLibraryError):
+    pass
+
+
+def _setting(name, default):
+    return getattr(settings, name, default)
+
+
+class CircuitBreaker:
+    """Opens after ``threshold`` consecutive failures for ``cooldown`` seconds.
+
+    Once the cooldown has passed a single trial call is let through and the
+    cooldown restarts; success closes the circuit again.
+    """
+
+    def __init__(self, threshold, cooldown):
+        self.threshold = threshold
+        self.cooldown = cooldown
+        self._lock = threading.Lock()
+        self._failures = 0
+        self._opened_at = None
+
+    def allow(self):
+        with self._lock:
+            if self._opened_at is None:
+                return True
+            now = time.monotonic()
+            if now - self._opened_at < self.cooldown:
+                return False
+            self._opened_at = now
+            return True
+
+    def record_success(self):
+        with self._lock:
+            self._failures = 0
+            self._opened_at = None
+
+    def record_failure(self):
+        with self._lock:
+            self._failures += 1
+            if self._failures >= self.threshold:
+                self._opened_at = time.monotonic()
+
+    @property
+    def is_open(self):
+        with self._lock:
+            return self._opened_at is not None
+
+
+class OpenLibraryClient:
+    def __init__(self, base_url=None):
+        self.base_url = (base_url or _setting("OPEN_LIBRARY_URL", BASE_URL)).rstrip("/")
+        self.timeout = (
+            _setting("OPEN_LIBRARY_CONNECT_TIMEOUT", 3.05),
+            _setting("OPEN_LIBRARY_READ_TIMEOUT", 10),
+        )
+        self.max_retries = _setting("OPEN_LIBRARY_MAX_RETRIES", 2)
+        self.backoff = _setting("OPEN_LIBRARY_BACKOFF", 0.2)
+        self.breaker = get_breaker()
+        self.latency = latency
+
+        pool_size = _setting("OPEN_LIBRARY_POOL_SIZE", 10)
+        adapter = HTTPAdapter(pool_connections=2, pool_maxsize=pool_size)
+        self.session = requests.Session()
+        self.session.headers.update(HEADERS)
+        self.session.mount("http://", adapter)
+        self.session.mount("https://", adapter)
+
+    def get(self, url, params=None):
+        """GET ``url`` (absolute, or a path on the Open Library host).
+
+        Raises ``CircuitOpenError`` without touching the network while the
+        breaker is open, and ``requests.RequestException`` once retries are
+        exhausted.
+        """
+        if not url.startswith(("http://", "https://")):
+            url = self.base_url + url
+
+        if not self.breaker.allow():
+            raise CircuitOpenError("Open Library circuit is open")
+
+        attempt = 0
+        while True:
+            start = time.perf_counter()
+            try:
+                response = self.session.get(url, params=params, timeout=self.timeout)
+                if response.status_code in RETRY_STATUSES:
+                    response.raise_for_status()
+            except requests.RequestException:
+                _observe(self.latency, start)
+                if attempt >= self.max_retries:
+                    self.breaker.record_failure()
+                    raise
+                attempt += 1
+                time.sleep(_backoff_delay(self.backoff, attempt))
+                continue
+
+            _observe(self.latency, start)
+            self.breaker.record_success()
+            return response
+
+    def get_json(self, path, params=None):
+        response = self.get(path, params=params)
+        response.raise_for_status()
+        return response.json()
+
+
+class AsyncOpenLibraryClient:
+    """Async counterpart of ``OpenLibraryClient`` built on ``httpx``.
+
+    Cancelling the awaiting task (e.g. when the browser disconnects) aborts
+    the in-flight request and releases its pooled connection.
+    """
+
+    def __init__(self, base_url=None):
+        self.base_url = (base_url or _setting("OPEN_LIBRARY_URL", BASE_URL)).rstrip("/")
+        self.max_retries = _setting("OPEN_LIBRARY_MAX_RETRIES", 2)
+        self.backoff = _setting("OPEN_LIBRARY_BACKOFF", 0.2)
+        self.breaker = get_breaker()
+        self.latency = latency
+
+        self.client = httpx.AsyncClient(
+            headers=HEADERS,
+            timeout=httpx.Timeout(
+                _setting("OPEN_LIBRARY_READ_TIMEOUT", 10),
+                connect=_setting("OPEN_LIBRARY_CONNECT_TIMEOUT", 3.05),
+            ),
+            limits=httpx.Limits(
+                max_connections=_setting("OPEN_LIBRARY_ASYNC_POOL_SIZE", 100),
+                max_keepalive_connections=_setting("OPEN_LIBRARY_POOL_SIZE", 10),
+            ),
+        )
+
+    async def get(self, url, params=None):
+        """Async ``OpenLibraryClient.get``; failures raise ``OpenLibraryError``."""
+        if not url.startswith(("http://", "https://")):
+            url = self.base_url + url
+
+        if not self.breaker.allow():
+            raise CircuitOpenError("Open Library circuit is open")
+
+        attempt = 0
+        while True:
+            start = time.perf_counter()
+            try:
+                response = await self.client.get(url, params=params)
+                if response.status_code in RETRY_STATUSES:
+                    response.raise_for_status()
+            except httpx.HTTPError as exc:
+                _observe(self.latency, start)
+                if attempt >= self.max_retries:
+                    self.breaker.record_failure()
+                    raise OpenLibraryError(str(exc)) from exc
+                attempt += 1
+                await asyncio.sleep(_backoff_delay(self.backoff, attempt))
+                continue
+
+            _observe(self.latency, start)
+            self.breaker.record_success()
+            return response
+
+    async def get_json(self, path, params=None):
+        response = await self.get(path, params=params)
+        try:
+            response.raise_for_status()
+        except httpx.HTTPStatusError as exc:
+            raise OpenLibraryError(str(exc)) from exc
+        return response.json()
+
+
+def _observe(histogram, start):
+    elapsed = time.perf_counter() - start
+    histogram.observe(elapsed)
+    metrics.add_openlibrary_time(elapsed)
+
+
+def _backoff_delay(base, attempt):
+    return random.uniform(0, base * 2 ** attempt)
+
+
+latency = Histogram(LATENCY_BUCKETS)
+
+_breaker = None
+_client = None
+_async_clients = weakref.WeakKeyDictionary()
+# Separate locks: building the client takes the breaker, so one lock for
+# both would deadlock.
+_breaker_lock = threading.Lock()
+_client_lock = threading.Lock()
+
+
+def get_breaker():
+    global _breaker
+    if _breaker is None:
+        with _breaker_lock:
+            if _breaker is None:
+                _breaker = CircuitBreaker(
+                    _setting("OPEN_LIBRARY_BREAKER_THRESHOLD", 5),
+                    _setting("OPEN_LIBRARY_BREAKER_COOLDOWN", 30),
+                )
+    return _breaker
+
+
+def get_client():
+    global _client
+    if _client is None:
+        with _client_lock:
+            if _client is None:
+                _client = OpenLibraryClient()
+    return _client
+
+
+def get_async_client():
+    """Return the async client bound to the running event loop.
+
+    httpx connections cannot be shared between event loops, and a WSGI
+    server runs each async view in a fresh loop, so clients are kept per
+    loop and dropped along with it. Under ASGI there is one loop per worker.
+    """
+    loop = asyncio.get_running_loop()
+    client = _async_clients.get(loop)
+    if client is None:
+        client = _async_clients[loop] = AsyncOpenLibraryClient()
+    return client
+
+
+def get(url, params=None):
+    return get_client().get(url, params=params)
+
+
+def get_json(path, params=None):
+    return get_client().get_json(path, params=params)
+
+
+async def aget(url, params=None):
+    return await get_async_client().get(url, params=params)
+
+
+async def aget_json(path, params=None):
+    return await get_async_client().get_json(path, params=params)
+
+
+async def asearch(query, page=1):
+    return await aget_json("/search.json", params={"q": query, "page": page})
+
@@ -0,0 +1,68 @@
+"""Keyset pagination for the JSON endpoints.
+
+Pages are ordered newest first on ``(created_at, id)`` and continued with an
+opaque cursor that encodes the last row returned, so every page is an index
+range scan no matter how deep the client has scrolled.
+"""
+import base64
+from datetime import datetime
+
+from django.conf import settings
+from django.db.models import Q
+
+
+class InvalidCursor(ValueError):
+    pass
+
+
+def encode_cursor(created_at, pk):
+    raw = f"{created_at.isoformat()}|{pk}"
+    return base64.urlsafe_b64encode(raw.encode()).decode().rstrip("=")
+
+
+def decode_cursor(cursor):
+    try:
+        raw = base64.urlsafe_b64decode(cursor + "=" * (-len(cursor) % 4)).decode()
+        created_at, pk = raw.split("|")
+        return datetime.fromisoformat(created_at), int(pk)
+    except (ValueError, UnicodeDecodeError) as exc:
+        raise InvalidCursor("Invalid cursor") from exc
+
+
+def page_size(request):
+    """Page size from ``?page_size=``, capped at ``API_MAX_PAGE_SIZE``."""
+    default = getattr(settings, "API_PAGE_SIZE", 50)
+    maximum = getattr(settings, "API_MAX_PAGE_SIZE", 200)
+    try:
+        size = int(request.GET.get("page_size", default))
+    except ValueError:
+        size = default
+    return max(1, min(size, maximum))
+
+
+def paginate(queryset, request):
+    """Return ``(rows, next_cursor)`` for the page requested by ``request``.
+
+    ``queryset`` may be a model or ``.values()`` queryset; values querysets
+    must include ``id`` and ``created_at``. Raises ``InvalidCursor`` for a
+    malformed ``?cursor=``.
+    """
+    size = page_size(request)
+    queryset = queryset.order_by("-created_at", "-id")
+
+    cursor = request.GET.get("cursor")
+    if cursor:
+        created_at, pk = decode_cursor(cursor)
+        queryset = queryset.filter(
+            Q(created_at__lt=created_at) | Q(created_at=created_at, id__lt=pk)
+        )
+
+    rows = list(queryset[:size + 1])
+    if len(rows) <= size:
+        return rows, None
+
+    rows = rows[:size]
+    last = rows[-1]
+    if isinstance(last, dict):
+        return rows, encode_cursor(last["created_at"], last["id"])
+    return rows, encode_cursor(last.created_at, last.pk)
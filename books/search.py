@@ -0,0 +1,156 @@
+"""Full-text search over notes and books.
+
+On PostgreSQL queries run against GIN indexes on ``to_tsvector('english',
+...)`` expressions (migration 0013); elsewhere (SQLite) against FTS5 tables
+that triggers keep in sync with ``books_note`` and ``books_book``
+(migration 0017). SQLite drops the triggers if a later migration rebuilds
+either table; ``manage.py rebuild_search_index`` reinstalls them.
+
+The FTS5 tables index every word under its owner, as ``u<user id>word``
+with the id in 8 hex digits (see ``owned_tokens``), so each user's rows
+have their own posting lists and a search only reads the lists of the
+users it covers, however large the table grows. The triggers call
+``owned_tokens`` as the SQL function ``books_owned_tokens``, which is
+registered on every SQLite connection Django opens; writing notes or
+books from a plain ``sqlite3`` shell fails for want of it.
+
+Results are ranked by relevance (BM25 on SQLite, ``ts_rank`` on
+PostgreSQL). BM25 costs a few microseconds per matching row, so on SQLite
+a word in most of a user's notes would take hundreds of milliseconds to
+rank; only the newest ``SEARCH_RANK_WINDOW`` matches are ranked instead.
+"""
+import re
+
+from django.conf import settings
+from django.db import connection
+from django.db.backends.signals import connection_created
+from django.dispatch import receiver
+
+WORD = re.compile(r"[^\W_]+")
+
+DEFAULT_LIMIT = 20
+
+# FTS5 ranks and limits on its own table, so only the top rows are joined.
+# The user filter is already in the MATCH; the outer one is a safeguard.
+# Rows are ranked from the rowid of the newest window'th match on (rowids
+# grow with creation), or all of them when there are fewer.
+_SQLITE_NOTES = """
+    SELECT n.id, n.book_id, b.title, u.username, n.content, n.page_number, n.chapter, m.rank
+    FROM (
+        SELECT rowid, rank FROM books_note_fts
+        WHERE books_note_fts MATCH %s AND rowid >= coalesce((
+            SELECT rowid FROM books_note_fts WHERE books_note_fts MATCH %s
+            ORDER BY rowid DESC LIMIT 1 OFFSET %s
+        ), 0)
+        ORDER BY rank LIMIT %s
+    ) m
+    JOIN books_note n ON n.id = m.rowid
+    JOIN books_book b ON b.id = n.book_id
+    JOIN auth_user u ON u.id = b.user_id
+    WHERE b.user_id IN ({user_ids})
+    ORDER BY m.rank
+"""
+
+_SQLITE_BOOKS = """
+    SELECT b.id, b.title, b.author, u.username, m.rank
+    FROM (
+        SELECT rowid, rank FROM books_book_fts
+        WHERE books_book_fts MATCH %s AND rowid >= coalesce((
+            SELECT rowid FROM books_book_fts WHERE books_book_fts MATCH %s
+            ORDER BY rowid DESC LIMIT 1 OFFSET %s
+        ), 0)
+        ORDER BY rank LIMIT %s
+    ) m
+    JOIN books_book b ON b.id = m.rowid
+    JOIN auth_user u ON u.id = b.user_id
+    WHERE b.user_id IN ({user_ids})
+    ORDER BY m.rank
+"""
+
+_POSTGRES_NOTES = """
+    SELECT n.id, n.book_id, b.title, u.username, n.content, n.page_number, n.chapter,
+           ts_rank(to_tsvector('english', n.content), query) AS rank
+    FROM books_note n
+    JOIN books_book b ON b.id = n.book_id
+    JOIN auth_user u ON u.id = b.user_id,
+         websearch_to_tsquery('english', %s) query
+    WHERE to_tsvector('english', n.content) @@ query AND b.user_id = ANY(%s)
+    ORDER BY rank DESC
+    LIMIT %s
+"""
+
+_POSTGRES_BOOKS = """
+    SELECT b.id, b.title, b.author, u.username,
+           ts_rank(to_tsvector('english', b.title || ' ' || b.author), query) AS rank
+    FROM books_book b
+    JOIN auth_user u ON u.id = b.user_id,
+         websearch_to_tsquery('english', %s) query
+    WHERE to_tsvector('english', b.title || ' ' || b.author) @@ query AND b.user_id = ANY(%s)
+    ORDER BY rank DESC
+    LIMIT %s
+"""
+
+NOTE_COLUMNS = ("id", "book_id", "book_title", "username", "content", "page_number", "chapter", "rank")
+BOOK_COLUMNS = ("id", "title", "author", "username", "rank")
+
+
+def owned_tokens(user_id, text):
+    """Prefix every word of ``text`` with its owner, ``u<8 hex digit id>``."""
+    if text is None:
+        return None
+    return " ".join(f"u{user_id:08x}{word}" for word in WORD.findall(text.lower()))
+
+
+def register_functions(connection):
+    """Make ``owned_tokens`` available to SQL on a SQLite connection."""
+    connection.ensure_connection()
+    connection.connection.create_function("books_owned_tokens", 2, owned_tokens, deterministic=True)
+
+
+@receiver(connection_created)
+def _register_on_connect(sender, connection, **kwargs):
+    if connection.vendor == "sqlite":
+        register_functions(connection)
+
+
+def fts5_query(text, user_ids):
+    """Turn free text into an FTS5 query over rows owned by ``user_ids``.
+
+    Every word must match, as a prefix, in one of the users' slices of
+    the index. Quoting each token keeps FTS5 operators and punctuation in
+    user input from being parsed as query syntax.
+    """
+    return " AND ".join(
+        "(" + " OR ".join(f'"u{int(user_id):08x}{word}"*' for user_id in user_ids) + ")"
+        for word in WORD.findall(text.lower())
+    )
+
+
+def _fetch(sql, params, columns):
+    with connection.cursor() as cursor:
+        cursor.execute(sql, params)
+        return [dict(zip(columns, row)) for row in cursor.fetchall()]
+
+
+def search(text, user_ids, limit=DEFAULT_LIMIT):
+    """Return ``{"books": [...], "notes": [...]}`` matching ``text``."""
+    user_ids = list(user_ids)
+    if not text.strip() or not user_ids:
+        return {"books": [], "notes": []}
+
+    if connection.vendor == "postgresql":
+        return {
+            "books": _fetch(_POSTGRES_BOOKS, [text, user_ids, limit], BOOK_COLUMNS),
+            "notes": _fetch(_POSTGRES_NOTES, [text, user_ids, limit], NOTE_COLUMNS),
+        }
+
+    query = fts5_query(text, user_ids)
+    if not query:
+        return {"books": [], "notes": []}
+    placeholders = ", ".join(["%s"] * len(user_ids))
+    window = getattr(settings, "SEARCH_RANK_WINDOW", 2000)
+    params = [query, query, window - 1, limit, *user_ids]
+    return {
+        "books": _fetch(_SQLITE_BOOKS.format(user_ids=placeholders), params, BOOK_COLUMNS),
+        "notes": _fetch(_SQLITE_NOTES.format(user_ids=placeholders), params, NOTE_COLUMNS),
+    }
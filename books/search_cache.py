@@ -0,0 +1,134 @@
+"""Shared cache for Open Library search results.
+
+Results are keyed by the normalized query plus page and stored in the
+``search`` cache alias, so the backend (per-process LRU, file based or a
+shared server) is picked in settings. Entries older than
+``SEARCH_CACHE_TTL`` are still served for ``SEARCH_CACHE_STALE_TTL`` more
+seconds while a background task refreshes them, and concurrent misses for
+the same key on one event loop (one ASGI worker) share a single upstream
+request.
+
+Lookups go through the async cache API and the async Open Library client,
+so a view awaiting a miss does not hold a thread.
+"""
+import asyncio
+import hashlib
+import time
+import weakref
+
+from django.conf import settings
+from django.core.cache import caches
+
+from . import counters, openlibrary
+
+# Only the fields the search views render are kept in the cache.
+DOC_FIELDS = ("title", "author_name", "cover_i", "first_publish_year")
+
+COUNTERS = ("search_cache.hit", "search_cache.stale", "search_cache.miss", "search_cache.coalesced")
+
+# event loop -> {cache key: asyncio.Task}
+_inflight = weakref.WeakKeyDictionary()
+
+
+def _cache():
+    return caches[getattr(settings, "SEARCH_CACHE_ALIAS", "search")]
+
+
+def _ttl():
+    return getattr(settings, "SEARCH_CACHE_TTL", 600)
+
+
+def _stale_ttl():
+    return getattr(settings, "SEARCH_CACHE_STALE_TTL", 3600)
+
+
+def normalize_query(query):
+    return " ".join(query.lower().split())
+
+
+def cache_key(query, page):
+    digest = hashlib.sha1(normalize_query(query).encode("utf-8")).hexdigest()
+    return f"olsearch:{digest}:{page}"
+
+
+async def asearch(query, page=1):
+    """Return ``{"numFound": int, "docs": [...]}`` for an Open Library search.
+
+    Raises ``requests.RequestException`` or ``ValueError`` if the upstream
+    call fails and nothing usable is cached.
+    """
+    page = int(page)
+    key = cache_key(query, page)
+    entry = await _cache().aget(key)
+
+    if entry is not None:
+        if time.time() - entry["fetched_at"] < _ttl():
+            await counters.aincr("search_cache.hit")
+        else:
+            await counters.aincr("search_cache.stale")
+            # The stale copy keeps being served until a refresh succeeds.
+            await _fetch_task(key, query, page)
+        return entry["data"]
+
+    await counters.aincr("search_cache.miss")
+    # Shielded so that one cancelled request does not abort the fetch that
+    # other requests for the same key are waiting on.
+    return await asyncio.shield(await _fetch_task(key, query, page))
+
+
+def stats():
+    values = counters.get_many(COUNTERS)
+    hits = values["search_cache.hit"] + values["search_cache.stale"]
+    lookups = hits + values["search_cache.miss"]
+    return {
+        "hits": values["search_cache.hit"],
+        "stale_hits": values["search_cache.stale"],
+        "misses": values["search_cache.miss"],
+        "coalesced": values["search_cache.coalesced"],
+        "hit_rate": hits / lookups if lookups else 0.0,
+    }
+
+
+def reset_stats():
+    counters.reset(COUNTERS)
+
+
+async def _fetch_task(key, query, page):
+    """Return the task fetching ``key`` on this loop, starting one if needed."""
+    flights = _inflight.setdefault(asyncio.get_running_loop(), {})
+    task = flights.get(key)
+    if task is not None:
+        await counters.aincr("search_cache.coalesced")
+        return task
+
+    task = asyncio.ensure_future(_fetch_and_store(key, query, page))
+    flights[key] = task
+
+    def done(task):
+        flights.pop(key, None)
+        if not task.cancelled():
+            # Mark the exception as retrieved; waiters (if any) re-raise it.
+            task.exception()
+
+    task.add_done_callback(done)
+    return task
+
+
+async def _fetch_and_store(key, query, page):
+    data = _trim(await openlibrary.asearch(query, page))
+    await _cache().aset(
+        key,
+        {"data": data, "fetched_at": time.time()},
+        _ttl() + _stale_ttl(),
+    )
+    return data
+
+
+def _trim(payload):
+    return {
+        "numFound": payload.get("numFound", 0),
+        "docs": [
+            {field: doc[field] for field in DOC_FIELDS if field in doc}
+            for doc in payload.get("docs", [])
+        ],
+    }
@@ -0,0 +1,68 @@
+from django.contrib.auth.models import User
+from django.db.models.signals import post_delete, post_save, pre_save
+from django.dispatch import receiver
+
+from . import stats, user_search, versions
+from .models import Book, FriendRequest, Note
+
+
+@receiver(post_save, sender=FriendRequest)
+def friend_request_saved(sender, instance, created, **kwargs):
+    # New pending requests don't change anyone's friend set; any edit might
+    # (e.g. un-accepting a request in the admin).
+    if instance.accepted or not created:
+        versions.bump("friends", instance.from_user_id, instance.to_user_id)
+    versions.bump("friend_requests", instance.to_user_id)
+
+
+@receiver(post_delete, sender=FriendRequest)
+def friend_request_deleted(sender, instance, **kwargs):
+    if instance.accepted:
+        versions.bump("friends", instance.from_user_id, instance.to_user_id)
+    else:
+        versions.bump("friend_requests", instance.to_user_id)
+
+
+@receiver(post_save, sender=Book)
+@receiver(post_delete, sender=Book)
+def book_changed(sender, instance, **kwargs):
+    versions.bump("books", instance.user_id)
+    versions.bump("book", instance.pk)
+    versions.bump("notes", instance.pk)
+
+
+# Saves that leave both fields alone can't move the book between months.
+STATS_FIELDS = {"finished", "finish_date"}
+
+
+@receiver(pre_save, sender=Book)
+def book_saving(sender, instance, update_fields=None, **kwargs):
+    if update_fields is None or STATS_FIELDS.intersection(update_fields):
+        instance._stored_finish_month = stats.stored_finish_month(instance)
+
+
+@receiver(post_save, sender=Book)
+def book_saved(sender, instance, **kwargs):
+    if "_stored_finish_month" in instance.__dict__:
+        old = instance.__dict__.pop("_stored_finish_month")
+        stats.record_change(instance.user_id, old, stats.finish_month(instance))
+
+
+@receiver(post_delete, sender=Book)
+def book_deleted(sender, instance, **kwargs):
+    stats.record_change(instance.user_id, stats.finish_month(instance), None)
+
+
+# No post_delete receiver for Note: it would stop Django from fast-deleting a
+# book's notes in one statement. Deleting a book bumps its notes stamp above;
+# code deleting individual notes bumps it itself.
+@receiver(post_save, sender=Note)
+def note_saved(sender, instance, **kwargs):
+    versions.bump("notes", instance.book_id)
+    versions.bump("user_notes", instance.book.user_id)
+
+
+@receiver(post_save, sender=User)
+def user_saved(sender, instance, created, **kwargs):
+    if created:
+        user_search.user_created()
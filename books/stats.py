@@ -0,0 +1,96 @@
+"""Maintenance of the ``ReadingStatsMonthly`` rollup.
+
+Book signals (``books.signals``) record every save or delete that changes
+whether or when a book was finished, so the reading stats page can read a
+handful of rollup rows instead of aggregating books. Writes that send no
+signals (``bulk_create``, ``QuerySet.update``) must call ``apply_counts``
+themselves, as the importer does, or be followed by ``rebuild``.
+"""
+from collections import Counter
+
+from django.db import IntegrityError, transaction
+from django.db.models import Count, F
+from django.db.models.functions import ExtractMonth, ExtractYear
+
+from .models import Book, ReadingStatsMonthly
+
+_finish_date_field = Book._meta.get_field("finish_date")
+
+
+def finish_month(book):
+    """Return ``(year, month)`` the book counts towards, or None."""
+    if not book.finished or not book.finish_date:
+        return None
+    finish_date = _finish_date_field.to_python(book.finish_date)
+    return finish_date.year, finish_date.month
+
+
+def stored_finish_month(book):
+    """Return the (year, month) ``book``'s database row counts towards.
+
+    Inside a transaction the row is locked until it ends, so a concurrent
+    change to the same book waits instead of moving its count from a month
+    this one is moving it out of.
+    """
+    if book._state.adding or book.pk is None:
+        return None
+    rows = Book.objects.filter(pk=book.pk)
+    if not transaction.get_autocommit():
+        rows = rows.select_for_update()
+    row = rows.values_list("finished", "finish_date").first()
+    if row is None or not row[0] or not row[1]:
+        return None
+    return row[1].year, row[1].month
+
+
+def record_change(user_id, old, new):
+    """Move one book from the ``old`` to the ``new`` (year, month) bucket."""
+    if old == new:
+        return
+    counts = Counter()
+    if old:
+        counts[old] -= 1
+    if new:
+        counts[new] += 1
+    apply_counts(user_id, counts)
+
+
+def apply_counts(user_id, counts):
+    """Add ``counts`` ({(year, month): delta}) to the user's rollup rows."""
+    for (year, month), delta in counts.items():
+        if not delta:
+            continue
+        rows = ReadingStatsMonthly.objects.filter(user_id=user_id, year=year, month=month)
+        # Decrements never create rows: a missing row has nothing to take
+        # away from, e.g. when deleting a user removed it before the books.
+        if rows.update(count=F("count") + delta) or delta < 0:
+            continue
+        try:
+            with transaction.atomic():
+                ReadingStatsMonthly.objects.create(user_id=user_id, year=year, month=month, count=delta)
+        except IntegrityError:
+            # Created concurrently by another request.
+            rows.update(count=F("count") + delta)
+
+
+def rebuild(user=None):
+    """Recompute the rollup from the books table, for one user or everyone."""
+    books = Book.objects.filter(finished=True, finish_date__isnull=False)
+    existing = ReadingStatsMonthly.objects.all()
+    if user is not None:
+        books = books.filter(user=user)
+        existing = existing.filter(user=user)
+
+    rows = (
+        books.annotate(year=ExtractYear("finish_date"), month=ExtractMonth("finish_date"))
+        .values("user_id", "year", "month")
+        .annotate(count=Count("id"))
+        .order_by()
+    )
+    with transaction.atomic():
+        existing.delete()
+        created = ReadingStatsMonthly.objects.bulk_create(
+            [ReadingStatsMonthly(**row) for row in rows.iterator()],
+            batch_size=1000,
+        )
+    return len(created)
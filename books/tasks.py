@@ -0,0 +1,52 @@
+"""Background jobs for the books app, run by ``manage.py run_workers``."""
+from jobs.queue import enqueue, task
+
+from . import covers, openlibrary, versions
+from .models import Book
+
+ENRICH_FIELDS = "isbn,number_of_pages_median,first_publish_year,cover_i"
+
+
+@task("books.enrich_book")
+def enrich_book(book_id):
+    """Fill in missing ISBN, page count, first publish year and cover."""
+    book = Book.objects.filter(pk=book_id).first()
+    if book is None:
+        return
+
+    data = openlibrary.get_json("/search.json", params={
+        "title": book.title,
+        "author": book.author,
+        "limit": 1,
+        "fields": ENRICH_FIELDS,
+    })
+    docs = data.get("docs") or []
+    if not docs:
+        return
+    doc = docs[0]
+
+    updates = {}
+    if not book.isbn and doc.get("isbn"):
+        updates["isbn"] = doc["isbn"][0][:20]
+    if book.page_count is None and doc.get("number_of_pages_median"):
+        updates["page_count"] = doc["number_of_pages_median"]
+    if book.first_publish_year is None and doc.get("first_publish_year"):
+        updates["first_publish_year"] = doc["first_publish_year"]
+    if not book.cover_url and doc.get("cover_i"):
+        updates["cover_url"] = f"https://covers.openlibrary.org/b/id/{doc['cover_i']}-M.jpg"
+
+    if updates:
+        # Only the enriched columns, so a concurrent edit to the book wins.
+        Book.objects.filter(pk=book.pk).update(**updates)
+        versions.bump("books", book.user_id)
+        versions.bump("book", book.pk)
+
+    cover_url = updates.get("cover_url") or book.cover_url
+    if covers.is_proxied(cover_url):
+        enqueue("books.prefetch_cover", {"url": cover_url})
+
+
+@task("books.prefetch_cover")
+def prefetch_cover(url, size="M"):
+    """Warm the cover proxy's disk cache."""
+    covers.get(url, size)
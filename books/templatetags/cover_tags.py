@@ -0,0 +1,16 @@
+from urllib.parse import urlencode
+
+from django import template
+from django.urls import reverse
+
+from books import covers
+
+register = template.Library()
+
+
+@register.filter
+def cover_proxy(url, size="M"):
+    """Rewrite an Open Library cover URL to go through the cover proxy."""
+    if not covers.is_proxied(url):
+        return url
+    return reverse("books:cover") + "?" + urlencode({"src": url, "size": size})
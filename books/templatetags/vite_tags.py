@@ -0,0 +1,21 @@
+from django import template
+from django.utils.html import format_html, format_html_join
+
+from books import vite
+
+register = template.Library()
+
+
+@register.simple_tag
+def vite_preload(entry):
+    """``<link rel="modulepreload">`` for an entry and its chunks; put in <head>."""
+    script, _, preloads = vite.assets(entry)
+    return format_html_join("\n", '<link rel="modulepreload" href="{}">', ((url,) for url in [script, *preloads]))
+
+
+@register.simple_tag
+def vite_entry(entry):
+    """The stylesheets and ``<script type="module">`` for an entry."""
+    script, css, _ = vite.assets(entry)
+    links = format_html_join("", '<link rel="stylesheet" href="{}">\n', ((url,) for url in css))
+    return format_html('{}<script type="module" src="{}"></script>', links, script)
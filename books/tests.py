@@ -1,3 +1,1140 @@
-from django.test import TestCase
+import asyncio
+import io
+import json
+import os
+import tempfile
+import threading
+import time
+from datetime import date, datetime, timezone as dt_timezone
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+from unittest import mock, skipUnless
 
-# Create your tests here.
+import numpy as np
+import requests
+from django.contrib.auth.models import User
+from django.conf import settings
+from django.core.management import CommandError, call_command
+from django.core.cache import caches
+from django.db import connection
+from django.http import FileResponse, StreamingHttpResponse
+from django.test import RequestFactory, TestCase, TransactionTestCase, override_settings
+from django.test.utils import CaptureQueriesContext
+from django.urls import reverse
+from django.utils import timezone
+
+from . import analytics, counters, covers, feed, importer, metrics, openlibrary, search, search_cache, tasks, user_search, versions
+from .friends import are_friends, friend_ids, get_friends
+from .management.commands.audit_query_plans import FULL_SCAN_PATTERNS, hot_queries
+from .middleware import MetricsMiddleware
+from .models import Book, FriendRequest, Note, ReadingStatsMonthly
+
+
+class BooksTestCase(TestCase):
+    """Starts every test with empty caches and no username index.
+
+    Object ids and version stamps roll back with each test, so entries
+    cached by one test could otherwise turn up under the next one's keys.
+    """
+
+    def setUp(self):
+        for cache in caches.all():
+            cache.clear()
+        user_search._index = None
+
+
+class ConditionalGetTests(BooksTestCase):
+    @classmethod
+    def setUpTestData(cls):
+        cls.user = User.objects.create_user(username="reader")
+        cls.friend = User.objects.create_user(username="friend")
+        FriendRequest.objects.create(from_user=cls.user, to_user=cls.friend, accepted=True)
+        cls.book = Book.objects.create(user=cls.friend, title="Dune", author="Herbert")
+        cls.note = Note.objects.create(book=cls.book, content="Spice")
+
+    def setUp(self):
+        super().setUp()
+        self.client.force_login(self.user)
+
+    def get(self, url, etag=None):
+        headers = {"If-None-Match": etag} if etag else {}
+        return self.client.get(url, headers=headers)
+
+    def assertChangedBy(self, url, write):
+        response = self.get(url)
+        self.assertEqual(response.status_code, 200)
+        etag = response["ETag"]
+        self.assertEqual(self.get(url, etag).status_code, 304)
+        write()
+        response = self.get(url, etag)
+        self.assertEqual(response.status_code, 200)
+        self.assertNotEqual(response["ETag"], etag)
+
+    def test_unchanged_resource_is_not_modified(self):
+        url = reverse("books:friend_books", args=[self.friend.username])
+        etag = self.get(url)["ETag"]
+        response = self.get(url, etag)
+        self.assertEqual(response.status_code, 304)
+        self.assertEqual(response.content, b"")
+
+    def test_book_write_changes_friend_books(self):
+        url = reverse("books:friend_books", args=[self.friend.username])
+        self.assertChangedBy(url, lambda: Book.objects.create(user=self.friend, title="Emma", author="Austen"))
+
+        def rename():
+            self.book.title = "Dune Messiah"
+            self.book.save()
+        self.assertChangedBy(url, rename)
+        self.assertChangedBy(url, self.book.delete)
+
+    def test_note_write_changes_friend_book_notes(self):
+        url = reverse("books:friend_book_notes", args=[self.friend.username, self.book.pk])
+        self.assertChangedBy(url, lambda: Note.objects.create(book=self.book, content="Sandworms"))
+
+        def edit():
+            self.note.content = "Melange"
+            self.note.save()
+        self.assertChangedBy(url, edit)
+
+    def test_note_delete_changes_book_notes(self):
+        own = Book.objects.create(user=self.user, title="Emma", author="Austen")
+        note = Note.objects.create(book=own, content="Box Hill")
+        self.assertChangedBy(
+            reverse("books:book_notes_api", args=[own.pk]),
+            lambda: self.client.post(f"/books/api/notes/{note.pk}/delete/"),
+        )
+
+    def test_friend_request_writes_change_friend_lists(self):
+        other = User.objects.create_user(username="other")
+        self.client.force_login(other)
+        request = FriendRequest.objects.create(from_user=self.user, to_user=other)
+        self.assertChangedBy(reverse("books:list_friend_requests"), request.delete)
+
+        request = FriendRequest.objects.create(from_user=self.user, to_user=other)
+
+        def accept():
+            request.accepted = True
+            request.save()
+        self.assertChangedBy(reverse("books:list_friends"), accept)
+        self.assertChangedBy(reverse("books:list_friends"), request.delete)
+
+    def test_bump_is_visible_to_other_readers(self):
+        # Stamps are rows, not per-process cache entries.
+        before = versions.get("books", self.friend.pk)
+        versions.bump("books", self.friend.pk, self.friend.pk)
+        self.assertEqual(versions.get("books", self.friend.pk), before + 1)
+        self.assertEqual(versions.get_many(("books", self.friend.pk), ("books", 0)), [before + 1, 0])
+
+    def test_not_modified_queries(self):
+        url = reverse("books:friend_books", args=[self.friend.username])
+        etag = self.get(url)["ETag"]
+        # Session, user, the friend's id, the friendship check and the stamps.
+        with self.assertNumQueries(5):
+            self.assertEqual(self.get(url, etag).status_code, 304)
+
+
+class FriendshipTests(BooksTestCase):
+    @classmethod
+    def setUpTestData(cls):
+        cls.user = User.objects.create_user(username="reader")
+        cls.friend = User.objects.create_user(username="friend")
+        cls.request = FriendRequest.objects.create(from_user=cls.friend, to_user=cls.user, accepted=True)
+        cls.book = Book.objects.create(user=cls.friend, title="Dune", author="Herbert")
+
+    def test_removed_friend_loses_access(self):
+        self.client.force_login(self.user)
+        url = reverse("books:friend_book_notes", args=[self.friend.username, self.book.pk])
+        self.assertEqual(self.client.get(url).status_code, 200)
+        self.request.delete()
+        self.assertEqual(self.client.get(url).status_code, 403)
+
+
+class FriendQueryTests(BooksTestCase):
+    def befriend(self, user, n):
+        friends = User.objects.bulk_create(User(username=f"friend_{i}") for i in range(n))
+        FriendRequest.objects.bulk_create(
+            FriendRequest(from_user=user, to_user=friend, accepted=True) if i % 2
+            else FriendRequest(from_user=friend, to_user=user, accepted=True)
+            for i, friend in enumerate(friends)
+        )
+        versions.bump("friends", user.pk)
+        return {friend.pk for friend in friends}
+
+    def test_friend_set_is_one_query(self):
+        user = User.objects.create_user(username="reader")
+        ids = self.befriend(user, 50)
+        # The friends stamp, then one UNION over both directions.
+        with self.assertNumQueries(2):
+            self.assertEqual(friend_ids(user), ids)
+        with self.assertNumQueries(1):
+            self.assertEqual(friend_ids(user), ids)
+        with self.assertNumQueries(2):
+            self.assertEqual({friend.pk for friend in get_friends(user)}, ids)
+
+    def test_are_friends_uses_the_cached_set(self):
+        user = User.objects.create_user(username="reader")
+        friend = min(self.befriend(user, 3))
+        self.assertTrue(are_friends(user, friend))
+        # Only the friends stamp once the set is cached.
+        with self.assertNumQueries(1):
+            self.assertTrue(are_friends(user, friend))
+        self.assertFalse(are_friends(user, user.pk))
+
+    def test_many_friends_stay_fast(self):
+        user = User.objects.create_user(username="reader")
+        ids = self.befriend(user, 2000)
+        start = time.perf_counter()
+        with self.assertNumQueries(2):
+            self.assertEqual(friend_ids(user), ids)
+        self.assertLess(time.perf_counter() - start, 1.0)
+
+
+class QueryPlanTests(BooksTestCase):
+    """EXPLAIN every hot query and require an index for each."""
+
+    @classmethod
+    def setUpTestData(cls):
+        cls.user = User.objects.create_user(username="reader")
+        friend = User.objects.create_user(username="friend")
+        FriendRequest.objects.create(from_user=cls.user, to_user=friend, accepted=True)
+        books = Book.objects.bulk_create(
+            Book(user=user, title=f"Book {i}", author="Author", finished=i % 2 == 0)
+            for user in (cls.user, friend) for i in range(20)
+        )
+        Note.objects.bulk_create(Note(book=book, content="note") for book in books for _ in range(3))
+
+    def test_hot_queries_use_indexes(self):
+        pattern = FULL_SCAN_PATTERNS[connection.vendor]
+        queries = hot_queries(self.user)
+        for name, queryset in queries.items():
+            with self.subTest(name):
+                plan = queryset.explain()
+                scans = [line for line in plan.splitlines() if pattern.search(line.strip())]
+                self.assertEqual(scans, [], plan)
+
+    def test_audit_command_passes(self):
+        out = io.StringIO()
+        call_command("audit_query_plans", user=self.user.username, stdout=out)
+        self.assertIn("All hot queries use indexes", out.getvalue())
+
+
+@override_settings(STORAGES={
+    "default": {"BACKEND": "django.core.files.storage.FileSystemStorage"},
+    "staticfiles": {"BACKEND": "django.contrib.staticfiles.storage.StaticFilesStorage"},
+}, DEBUG=True)
+class FragmentCacheTests(BooksTestCase):
+    @classmethod
+    def setUpTestData(cls):
+        cls.user = User.objects.create_user(username="reader")
+        cls.book = Book.objects.create(user=cls.user, title="Dune", author="Herbert")
+
+    def setUp(self):
+        super().setUp()
+        self.client.force_login(self.user)
+
+    def test_import_shows_on_cached_list(self):
+        url = reverse("books:list")
+        self.assertNotContains(self.client.get(url), "Emma")
+        importer.import_library(self.user, io.StringIO("title,author\nEmma,Austen\n"))
+        self.assertContains(self.client.get(url), "Emma")
+
+    def test_enrichment_shows_on_cached_pages(self):
+        cover = "https://covers.openlibrary.org/b/id/42-M.jpg"
+        self.assertNotContains(self.client.get(reverse("books:list")), "42-M.jpg")
+        self.assertNotContains(self.client.get(reverse("books:detail", args=[self.book.pk])), "42-M.jpg")
+
+        docs = {"docs": [{"cover_i": 42, "first_publish_year": 1965}]}
+        with mock.patch("books.tasks.openlibrary.get_json", return_value=docs):
+            tasks.enrich_book(self.book.pk)
+        self.book.refresh_from_db()
+        self.assertEqual(self.book.cover_url, cover)
+        self.assertContains(self.client.get(reverse("books:list")), "42-M.jpg")
+        self.assertContains(self.client.get(reverse("books:detail", args=[self.book.pk])), "42-M.jpg")
+
+
+@override_settings(STORAGES={
+    "default": {"BACKEND": "django.core.files.storage.FileSystemStorage"},
+    "staticfiles": {"BACKEND": "django.contrib.staticfiles.storage.StaticFilesStorage"},
+}, DEBUG=True)
+class BooksListTests(BooksTestCase):
+    def setUp(self):
+        super().setUp()
+        self.user = User.objects.create_user(username="reader")
+        Book.objects.bulk_create(
+            Book(user=self.user, title=f"Book {i}", author="Author", finished=i % 3 == 0) for i in range(30)
+        )
+        self.client.force_login(self.user)
+        self.url = reverse("books:list")
+
+    def titles(self, response):
+        return [book.title for book in response.context["books"]]
+
+    def test_status_tabs_filter_and_count(self):
+        response = self.client.get(self.url, {"status": "finished"})
+        self.assertEqual(len(self.titles(response)), 10)
+        self.assertEqual(response.context["counts"], {"all": 30, "finished": 10, "reading": 20})
+        self.assertContains(response, "Finished (10)")
+        self.assertEqual(len(self.titles(self.client.get(self.url, {"status": "reading"}))), 20)
+
+    @override_settings(API_PAGE_SIZE=12)
+    def test_cursor_pages_cover_the_library_once(self):
+        titles, params = [], {"status": "reading"}
+        while True:
+            response = self.client.get(self.url, params)
+            titles += self.titles(response)
+            if not response.context["next_cursor"]:
+                break
+            params = {"status": "reading", "cursor": response.context["next_cursor"]}
+        self.assertEqual(sorted(titles), sorted(f"Book {i}" for i in range(30) if i % 3))
+        self.assertEqual(self.client.get(self.url, {"cursor": "bogus"}).status_code, 400)
+
+    def test_counts_take_one_aggregate_and_cached_pages_skip_the_queries(self):
+        with CaptureQueriesContext(connection) as queries:
+            self.client.get(self.url)
+        self.assertEqual(sum('COUNT("books_book"."id")' in q["sql"] for q in queries), 1)
+
+        with CaptureQueriesContext(connection) as cached:
+            response = self.client.get(self.url)
+        self.assertNotIn("books_book", " ".join(q["sql"] for q in cached))
+        self.assertContains(response, "All (30)")
+
+        Book.objects.create(user=self.user, title="Emma", author="Austen")
+        self.assertContains(self.client.get(self.url), "All (31)")
+
+
+class SearchCacheTests(BooksTestCase):
+    PAYLOAD = {"numFound": 1, "docs": [{"title": "Dune", "author_name": ["Herbert"], "key": "/works/1"}]}
+
+    async def test_concurrent_misses_share_one_fetch(self):
+        release = asyncio.Event()
+        calls = []
+
+        async def fetch(query, page):
+            calls.append(query)
+            await release.wait()
+            return self.PAYLOAD
+
+        with mock.patch("books.search_cache.openlibrary.asearch", side_effect=fetch):
+            lookups = asyncio.gather(*(search_cache.asearch("Dune") for _ in range(4)))
+            while search_cache.stats()["coalesced"] < 3:
+                await asyncio.sleep(0.01)
+            release.set()
+            results = await lookups
+
+        self.assertEqual(len(calls), 1)
+        self.assertEqual(results, [{"numFound": 1, "docs": [{"title": "Dune", "author_name": ["Herbert"]}]}] * 4)
+
+    async def test_concurrent_counter_increments_are_not_lost(self):
+        await asyncio.gather(*(counters.aincr("search_cache.hit") for _ in range(20)))
+        self.assertEqual(search_cache.stats()["hits"], 20)
+
+    async def test_cancelled_waiter_does_not_abort_the_fetch(self):
+        release = asyncio.Event()
+
+        async def fetch(query, page):
+            await release.wait()
+            return self.PAYLOAD
+
+        with mock.patch("books.search_cache.openlibrary.asearch", side_effect=fetch):
+            first = asyncio.ensure_future(search_cache.asearch("Dune"))
+            second = asyncio.ensure_future(search_cache.asearch("Dune"))
+            while search_cache.stats()["coalesced"] < 1:
+                await asyncio.sleep(0.01)
+            first.cancel()
+            release.set()
+            self.assertEqual((await second)["numFound"], 1)
+        self.assertTrue(first.cancelled())
+
+    async def test_stale_entry_is_served_and_refreshed(self):
+        key = search_cache.cache_key("dune", 1)
+        stale = {"numFound": 0, "docs": []}
+        await search_cache._cache().aset(key, {"data": stale, "fetched_at": time.time() - 10 ** 6}, None)
+
+        with mock.patch("books.search_cache.openlibrary.asearch", return_value=self.PAYLOAD):
+            self.assertEqual(await search_cache.asearch("Dune"), stale)
+            await search_cache._inflight[asyncio.get_running_loop()][key]
+        self.assertEqual((await search_cache.asearch("Dune"))["numFound"], 1)
+
+    def test_open_library_search_view(self):
+        self.client.force_login(User.objects.create_user(username="reader"))
+        with mock.patch("books.search_cache.openlibrary.asearch", return_value=self.PAYLOAD):
+            response = self.client.get("/books/api/open-library-search/", {"q": "Dune"})
+        self.assertEqual(response.json(), {"results": [{"title": "Dune", "author": "Herbert", "first_publish_year": None}]})
+
+    @override_settings(
+        STORAGES={
+            "default": {"BACKEND": "django.core.files.storage.FileSystemStorage"},
+            "staticfiles": {"BACKEND": "django.contrib.staticfiles.storage.StaticFilesStorage"},
+        },
+        DEBUG=True,
+    )
+    async def test_book_search_view_under_asgi(self):
+        with mock.patch("books.search_cache.openlibrary.asearch", return_value=self.PAYLOAD):
+            response = await self.async_client.get(reverse("books:book_search"), {"q": "Dune"})
+        self.assertEqual(response.status_code, 200)
+        self.assertContains(response, "Herbert")
+        self.assertIn("total;dur=", response["Server-Timing"])
+
+
+class MetricsMiddlewareTests(BooksTestCase):
+    def setUp(self):
+        super().setUp()
+        metrics.registry.reset()
+        user = User.objects.create_user(username="reader")
+        for i in range(3):
+            book = Book.objects.create(user=user, title=f"Book {i}", author="Author")
+            Note.objects.create(book=book, content="note")
+        self.client.force_login(user)
+
+    def recorded(self, name, view):
+        return metrics.registry.histogram(name, view).snapshot()
+
+    def test_streamed_bodies_are_measured_once_sent(self):
+        with CaptureQueriesContext(connection) as queries:
+            response = self.client.get(reverse("books:export_library"))
+            self.assertEqual(self.recorded("view_duration_seconds", "books:export_library")["count"], 0)
+            body = b"".join(response.streaming_content)
+        self.assertEqual(len(body.splitlines()), 3)
+        self.assertEqual(self.recorded("view_response_bytes", "books:export_library")["sum"], len(body))
+        self.assertEqual(self.recorded("view_db_queries", "books:export_library")["sum"], len(queries))
+
+    async def test_async_streamed_bodies_are_measured(self):
+        async def content():
+            yield b"a"
+            yield b"bc"
+
+        middleware = MetricsMiddleware(mock.AsyncMock(return_value=StreamingHttpResponse(content())))
+        request = RequestFactory().get("/")
+        request.resolver_match = None
+        response = await middleware(request)
+        self.assertEqual(b"".join([chunk async for chunk in response.streaming_content]), b"abc")
+        self.assertEqual(self.recorded("view_response_bytes", "unresolved")["sum"], 3)
+
+    def test_file_responses_keep_their_file(self):
+        middleware = MetricsMiddleware(lambda request: FileResponse(io.BytesIO(b"abc")))
+        request = RequestFactory().get("/")
+        request.resolver_match = None
+        self.assertIsNotNone(middleware(request).file_to_stream)
+
+
+class FullTextSearchTests(BooksTestCase):
+    @classmethod
+    def setUpTestData(cls):
+        cls.user = User.objects.create_user(username="reader")
+        cls.friend = User.objects.create_user(username="friend")
+        cls.stranger = User.objects.create_user(username="stranger")
+        FriendRequest.objects.create(from_user=cls.user, to_user=cls.friend, accepted=True)
+        cls.book = Book.objects.create(user=cls.user, title="River Song", author="Herbert")
+        cls.friend_book = Book.objects.create(user=cls.friend, title="Mountains", author="Le Guin")
+        stranger_book = Book.objects.create(user=cls.stranger, title="River Town", author="Hessler")
+        cls.strong = Note.objects.create(book=cls.book, content="river river river")
+        cls.weak = Note.objects.create(
+            book=cls.book, content="a long note that mentions the river once among many other words",
+        )
+        cls.friend_note = Note.objects.create(book=cls.friend_book, content="crossing the river")
+        Note.objects.create(book=stranger_book, content="river boats")
+
+    def note_ids(self, text, user_ids):
+        return [note["id"] for note in search.search(text, user_ids)["notes"]]
+
+    def test_notes_are_ranked_by_relevance(self):
+        self.assertEqual(self.note_ids("river", [self.user.pk]), [self.strong.pk, self.weak.pk])
+
+    def test_words_are_prefixes_and_all_required(self):
+        self.assertEqual(self.note_ids("riv men", [self.user.pk]), [self.weak.pk])
+        self.assertEqual(self.note_ids("river zebra", [self.user.pk]), [])
+
+    def test_results_are_limited_to_the_given_users(self):
+        self.assertCountEqual(
+            self.note_ids("river", [self.user.pk, self.friend.pk]),
+            [self.strong.pk, self.weak.pk, self.friend_note.pk],
+        )
+        books = search.search("river", [self.user.pk])["books"]
+        self.assertEqual([book["id"] for book in books], [self.book.pk])
+
+    def test_owner_prefixes_in_text_do_not_cross_users(self):
+        forged_text = search.owned_tokens(self.user.pk, "river")
+        forged = Note.objects.create(book=Book.objects.get(user=self.stranger), content=forged_text)
+        self.assertEqual(self.note_ids("river", [self.user.pk]), [self.strong.pk, self.weak.pk])
+        self.assertEqual(self.note_ids(forged_text, [self.user.pk]), [])
+        self.assertEqual(self.note_ids(forged_text, [self.stranger.pk]), [forged.pk])
+
+    @override_settings(SEARCH_RANK_WINDOW=1)
+    def test_only_the_newest_matches_are_ranked(self):
+        self.assertEqual(self.note_ids("river", [self.user.pk]), [self.weak.pk])
+        self.assertEqual(self.note_ids("zebra", [self.user.pk]), [])
+
+    def test_index_follows_edits_and_owner_changes(self):
+        self.weak.content = "nothing about water"
+        self.weak.save()
+        self.strong.delete()
+        self.assertEqual(self.note_ids("river", [self.user.pk]), [])
+
+        Book.objects.filter(pk=self.friend_book.pk).update(user=self.user)
+        self.assertEqual(self.note_ids("crossing", [self.user.pk]), [self.friend_note.pk])
+        self.assertEqual(self.note_ids("crossing", [self.friend.pk]), [])
+
+    def test_search_library_scope(self):
+        self.client.force_login(self.user)
+        url = reverse("books:search_library")
+        mine = self.client.get(url, {"q": "river"}).json()
+        self.assertEqual({note["username"] for note in mine["notes"]}, {"reader"})
+        friends = self.client.get(url, {"q": "river", "scope": "friends"}).json()
+        self.assertEqual({note["username"] for note in friends["notes"]}, {"reader", "friend"})
+
+    @skipUnless(connection.vendor == "postgresql", "PostgreSQL full-text search")
+    def test_postgres_web_search_syntax(self):
+        self.assertEqual(self.note_ids('river -"once"', [self.user.pk]), [self.strong.pk])
+        self.assertEqual(self.note_ids('"crossing the river"', [self.friend.pk]), [self.friend_note.pk])
+
+
+class RebuildSearchIndexTests(TransactionTestCase):
+    """Not in a test transaction: rolling back the FTS5 tables' DROP and
+    CREATE to a savepoint leaves SQLite's FTS5 state inconsistent."""
+
+    def test_rebuild_search_index(self):
+        user = User.objects.create_user(username="reader")
+        note = Note.objects.create(book=Book.objects.create(user=user, title="T", author="A"), content="river")
+        call_command("rebuild_search_index", stdout=io.StringIO())
+        self.assertEqual([n["id"] for n in search.search("river", [user.pk])["notes"]], [note.pk])
+        Note.objects.create(book=note.book, content="river river")
+        self.assertEqual(len(search.search("river", [user.pk])["notes"]), 2)
+        call_command("rebuild_search_index", optimize=True, stdout=io.StringIO())
+        self.assertEqual(len(search.search("river", [user.pk])["notes"]), 2)
+
+
+class ImporterTests(BooksTestCase):
+    def test_rows_with_wrong_types_are_reported(self):
+        user = User.objects.create_user(username="reader")
+        rows = [
+            {"title": 123, "author": "Herbert"},
+            {"title": "Dune", "author": ["Herbert"]},
+            {"title": "Dune", "author": "Herbert", "finish_date": 2023},
+            {"title": "Dune", "author": "Herbert", "cover_url": {"src": "x"}},
+            {"title": "Dune", "author": "Herbert", "notes": [{"content": 5}]},
+            {"title": "Dune", "author": "Herbert", "notes": [{"content": "ok", "page_number": 1e999}]},
+            {"title": "Dune", "author": "Herbert", "notes": [{"content": "ok", "chapter": True}]},
+            {"title": "Emma", "author": "Austen", "finish_date": "2023-05-01", "notes": [{"content": "ok"}]},
+        ]
+        stream = io.StringIO("".join(json.dumps(row) + "\n" for row in rows))
+        summary = importer.import_library(user, stream, format="ndjson")
+        self.assertEqual(summary["created"], 1)
+        self.assertEqual(summary["notes_created"], 1)
+        self.assertEqual([error["row"] for error in summary["errors"]], list(range(1, 8)))
+
+    def test_page_numbers_must_be_whole_and_in_range(self):
+        user = User.objects.create_user(username="reader")
+        notes = [{"content": "ok", "page_number": value} for value in (2.7, "2.7", 2 ** 31, 12.0, "12")]
+        stream = io.StringIO("".join(
+            json.dumps({"title": f"Book {i}", "author": "A", "notes": [note]}) + "\n"
+            for i, note in enumerate(notes)
+        ))
+        summary = importer.import_library(user, stream, format="ndjson")
+        self.assertEqual([error["row"] for error in summary["errors"]], [1, 2, 3])
+        self.assertEqual(list(Note.objects.values_list("page_number", flat=True)), [12, 12])
+
+    def test_bad_utf8_after_a_committed_batch_keeps_what_was_read(self):
+        user = User.objects.create_user(username="reader")
+        self.client.force_login(user)
+        # Enough rows that the first ones are decoded before the bad bytes.
+        good = "".join(f"Book {i},Author\n" for i in range(2000)).encode()
+        upload = io.BytesIO(b"title,author\n" + good + b"Caf\xe9,Author\n")
+        upload.name = "library.csv"
+        response = self.client.post(reverse("books:import_library"), {"file": upload})
+        self.assertEqual(response.status_code, 201)
+        summary = response.json()
+        self.assertEqual(Book.objects.filter(user=user).count(), summary["created"])
+        self.assertGreater(summary["created"], importer.BATCH_SIZE)
+        self.assertEqual(summary["error_count"], 1)
+        self.assertIn("not valid UTF-8", summary["errors"][0]["error"])
+
+    def test_bad_utf8_before_any_row_is_rejected(self):
+        self.client.force_login(User.objects.create_user(username="reader"))
+        upload = io.BytesIO(b"title,author\nCaf\xe9,Author\n")
+        upload.name = "library.csv"
+        response = self.client.post(reverse("books:import_library"), {"file": upload})
+        self.assertEqual(response.status_code, 400)
+        self.assertFalse(Book.objects.exists())
+
+    def test_bench_import(self):
+        out = io.StringIO()
+        call_command("bench_import", rows=50, batch_sizes=[10, 50], stdout=out)
+        self.assertEqual(out.getvalue().count("rows/s"), 2)
+        self.assertFalse(Book.objects.exists())
+
+    def test_import_view_rejects_bad_types_without_500(self):
+        user = User.objects.create_user(username="reader")
+        self.client.force_login(user)
+        upload = io.BytesIO(b'{"title": 123, "author": "Herbert"}\n')
+        upload.name = "library.ndjson"
+        response = self.client.post(reverse("books:import_library"), {"file": upload, "format": "ndjson"})
+        self.assertLess(response.status_code, 500)
+
+
+class ReadingStatsTests(BooksTestCase):
+    def setUp(self):
+        super().setUp()
+        self.user = User.objects.create_user(username="reader")
+        self.client.force_login(self.user)
+        self.book = Book.objects.create(user=self.user, title="Emma", author="Austen")
+
+    def rollup(self):
+        return {
+            (row.year, row.month): row.count
+            for row in ReadingStatsMonthly.objects.filter(user=self.user, count__gt=0)
+        }
+
+    def test_finish_change_date_and_delete(self):
+        self.client.post(reverse("books:finish_book", args=[self.book.pk]))
+        today = date.today()
+        self.assertEqual(self.rollup(), {(today.year, today.month): 1})
+
+        self.client.post(reverse("books:update_finish_date", args=[self.book.pk]), {"finish_date": "2021-03-04"})
+        self.assertEqual(self.rollup(), {(2021, 3): 1})
+
+        self.client.post(reverse("books:delete", args=[self.book.pk]))
+        self.assertEqual(self.rollup(), {})
+
+    def test_saves_outside_the_views_are_counted(self):
+        # As the admin or a shell would: no view code involved.
+        Book.objects.create(user=self.user, title="Dune", author="Herbert", finished=True, finish_date=date(2022, 1, 5))
+        self.book.finished, self.book.finish_date = True, date(2022, 1, 20)
+        self.book.save()
+        self.assertEqual(self.rollup(), {(2022, 1): 2})
+
+        # A stale copy still moves the count out of the stored month.
+        stale = Book.objects.get(pk=self.book.pk)
+        self.book.finish_date = date(2022, 2, 1)
+        self.book.save()
+        stale.finish_date = date(2023, 6, 1)
+        stale.save()
+        self.assertEqual(self.rollup(), {(2022, 1): 1, (2023, 6): 1})
+
+    def test_saves_of_other_fields_skip_the_lookup(self):
+        with self.assertNumQueries(4):  # the UPDATE and three stamp bumps
+            self.book.title = "Persuasion"
+            self.book.save(update_fields=["title"])
+
+    def test_deleting_the_user_with_finished_books(self):
+        Book.objects.filter(pk=self.book.pk).update(finished=True, finish_date=date(2022, 1, 5))
+        call_command("rebuild_reading_stats", stdout=io.StringIO())
+        self.user.delete()
+        self.assertFalse(ReadingStatsMonthly.objects.exists())
+
+    def test_rebuild_reading_stats(self):
+        Book.objects.filter(pk=self.book.pk).update(finished=True, finish_date=date(2022, 1, 5))
+        other = User.objects.create_user(username="other")
+        ReadingStatsMonthly.objects.create(user=other, year=2020, month=1, count=7)
+        self.assertEqual(self.rollup(), {})
+
+        out = io.StringIO()
+        call_command("rebuild_reading_stats", user="reader", stdout=out)
+        self.assertIn("Wrote 1 rollup rows", out.getvalue())
+        self.assertEqual(self.rollup(), {(2022, 1): 1})
+        self.assertTrue(ReadingStatsMonthly.objects.filter(user=other).exists())
+
+        call_command("rebuild_reading_stats", stdout=io.StringIO())
+        self.assertFalse(ReadingStatsMonthly.objects.filter(user=other).exists())
+        with self.assertRaises(CommandError):
+            call_command("rebuild_reading_stats", user="nobody")
+
+
+def days(*values):
+    return np.array(values, dtype="datetime64[D]")
+
+
+class AnalyticsTests(BooksTestCase):
+    def test_heatmap_splits_days_by_year(self):
+        result = analytics.heatmap(days("2023-12-31", "2024-01-01", "2024-01-01"))
+        self.assertEqual(list(result), ["2023", "2024"])
+        self.assertEqual(result["2024"]["start"], "2024-01-01")
+        self.assertEqual((len(result["2023"]["counts"]), len(result["2024"]["counts"])), (365, 366))
+        self.assertEqual((result["2023"]["counts"][-1], result["2024"]["counts"][0]), (1, 2))
+        self.assertEqual(sum(result["2024"]["counts"]), 2)
+        self.assertEqual(analytics.heatmap(days()), {})
+
+    def test_current_streak_lasts_until_a_day_is_missed(self):
+        active = days("2024-01-01", "2024-01-02", "2024-01-03", "2024-01-10", "2024-01-11", "2024-01-11")
+        for today, current in ((date(2024, 1, 11), 2), (date(2024, 1, 12), 2), (date(2024, 1, 13), 0)):
+            result = analytics.streaks(active, today)
+            self.assertEqual(result["current"]["days"], current, today)
+            self.assertEqual(result["longest"], {"days": 3, "start": "2024-01-01", "end": "2024-01-03"})
+        self.assertEqual(analytics.streaks(days(), date(2024, 1, 1))["longest"]["days"], 0)
+
+    def test_monthly_rolling_window_and_trend(self):
+        # i books in the i-th month of 2023.
+        finished = days(*(f"2023-{i + 1:02d}-15" for i in range(12) for _ in range(i)))
+        result = analytics.monthly(finished, date(2023, 12, 31))
+        self.assertEqual(result["months"][0], "2023-02")
+        self.assertEqual(result["counts"], list(range(1, 12)))
+        self.assertEqual(result["rolling_12"][:3], [1.0, 1.5, 2.0])
+        self.assertEqual(result["trend_per_month"], 1.0)
+
+        # Months with nothing finished run up to today and count in the window.
+        result = analytics.monthly(finished, date(2025, 1, 1))
+        self.assertEqual((result["months"][-1], result["counts"][-1]), ("2025-01", 0))
+        self.assertEqual(result["rolling_12"][-1], 0.0)
+        self.assertEqual(result["rolling_12"][12], round(sum(range(2, 12)) / 12, 2))
+        self.assertEqual(result["trend_per_month"], 0.0)
+
+    def test_pace(self):
+        day = analytics.SECONDS_PER_DAY
+        result = analytics.pace(
+            np.array([1, 1, 2, 3, 3, 4, 4]),
+            np.array([0, 2 * day, 0, 0, day, 0, 3600], dtype=np.float64),
+            np.array([10, 110, -1, 5, 5, 0, 30]),
+        )
+        # Book 2 has no page, book 3 didn't move; book 4's hour counts as a day.
+        self.assertEqual(result, {
+            "books_measured": 2, "pages_tracked": 130, "median_pages_per_day": 40.0, "pages_per_day": 43.33,
+        })
+        self.assertEqual(analytics.pace(np.array([1]), np.array([0.0]), np.array([-1]))["books_measured"], 0)
+
+    @override_settings(TIME_ZONE="America/New_York")
+    def test_notes_count_on_their_local_day(self):
+        user = User.objects.create_user(username="reader")
+        book = Book.objects.create(user=user, title="Emma", author="Austen", finished=True, finish_date=date(2023, 12, 31))
+        note = Note.objects.create(book=book, content="late night")
+        # 22:00 on January 1st in New York.
+        Note.objects.filter(pk=note.pk).update(created_at=datetime(2024, 1, 2, 3, tzinfo=dt_timezone.utc))
+        current = analytics.compute(user, today=date(2024, 1, 2))["streaks"]["current"]
+        self.assertEqual(current, {"days": 2, "start": "2023-12-31", "end": "2024-01-01"})
+
+    @override_settings(TIME_ZONE="America/New_York")
+    def test_local_days_across_daylight_saving_changes(self):
+        start = datetime(2024, 3, 9, tzinfo=dt_timezone.utc).timestamp()
+        end = datetime(2024, 11, 5, tzinfo=dt_timezone.utc).timestamp()
+        times = np.arange(start, end, 1800.0)
+        expected = [str(timezone.localtime(datetime.fromtimestamp(t, dt_timezone.utc)).date()) for t in times]
+        self.assertEqual([str(day) for day in analytics._local_days(times)], expected)
+
+    def test_endpoint_is_cached_until_books_or_notes_change(self):
+        user = User.objects.create_user(username="reader")
+        self.client.force_login(user)
+        url = reverse("books:reading_analytics")
+        book = Book.objects.create(user=user, title="Emma", author="Austen")
+        self.assertEqual(self.client.get(url).json()["total_finished"], 0)
+
+        # Writes that skip the signals don't bump the stamps: still cached.
+        Book.objects.filter(pk=book.pk).update(finished=True, finish_date=date(2024, 1, 1))
+        self.assertEqual(self.client.get(url).json()["total_finished"], 0)
+        Book.objects.create(user=user, title="Dune", author="Herbert")
+        self.assertEqual(self.client.get(url).json()["total_finished"], 1)
+
+        Note.objects.bulk_create([Note(book=book, content="a", page_number=1), Note(book=book, content="b", page_number=51)])
+        self.assertEqual(self.client.get(url).json()["pace"]["books_measured"], 0)
+        versions.bump("user_notes", user.pk)
+        self.assertEqual(self.client.get(url).json()["pace"]["books_measured"], 1)
+
+
+class UsernameIndexTests(BooksTestCase):
+    def search(self, q, limit=10):
+        return [User.objects.get(pk=pk).username for pk in user_search.get_index().search(q, limit)]
+
+    def test_prefix_matches_rank_shortest_first(self):
+        for name in ["ann_b", "ann_c", "ann_d", "anna", "ann", "joanna", "bo"]:
+            User.objects.create_user(username=name)
+        # Postgres order: prefix matches, then shorter, then alphabetical.
+        self.assertEqual(self.search("ann", limit=2), ["ann", "anna"])
+        self.assertEqual(self.search("ann"), ["ann", "anna", "ann_b", "ann_c", "ann_d", "joanna"])
+
+    def test_new_users_go_into_a_new_index(self):
+        User.objects.create_user(username="ann")
+        index = user_search.get_index()
+        User.objects.create_user(username="anna")
+        updated = user_search.get_index()
+        self.assertIsNot(updated, index)
+        self.assertEqual(len(index.search("ann", 10)), 1)
+        self.assertEqual(len(updated.search("ann", 10)), 2)
+
+    def test_short_queries_rank_prefixes_then_shorter_substrings(self):
+        for name in ["oz_long", "azz", "zed", "bz", "ann"]:
+            User.objects.create_user(username=name)
+        user_search.get_index()
+        User.objects.create_user(username="kaz")  # found through ``recent``
+        self.assertEqual(self.search("z"), ["zed", "bz", "azz", "kaz", "oz_long"])
+        self.assertEqual(self.search("z", limit=2), ["zed", "bz"])
+        self.assertEqual(self.search("az"), ["azz", "kaz"])
+        self.assertEqual(self.search("q"), [])
+
+    @override_settings(USER_SEARCH_INDEX_MAX_AGE=0)
+    def test_stale_index_is_rebuilt_in_the_background(self):
+        user = User.objects.create_user(username="ann")
+        index = user_search.get_index()
+        User.objects.filter(pk=user.pk).update(username="bob")
+        with mock.patch.object(user_search.threading, "Thread") as thread:
+            # Searches keep the old index until the rebuild is installed.
+            self.assertIs(user_search.get_index(), index)
+            self.assertIs(user_search.get_index(), index)
+        thread.assert_called_once()
+        with mock.patch.object(user_search.connection, "close"):
+            thread.call_args.kwargs["target"]()
+        self.assertEqual(self.search("bo"), ["bob"])
+        self.assertEqual(self.search("ann"), [])
+
+
+class SearchUsersTests(BooksTestCase):
+    def test_status_comes_with_the_users_in_one_query(self):
+        user = User.objects.create_user(username="reader")
+        others = [User.objects.create_user(username=f"reader_{i}") for i in range(8)]
+        FriendRequest.objects.create(from_user=user, to_user=others[0], accepted=True)
+        FriendRequest.objects.create(from_user=others[1], to_user=user, accepted=True)
+        FriendRequest.objects.create(from_user=user, to_user=others[2])
+        FriendRequest.objects.create(from_user=others[3], to_user=user)
+        self.client.force_login(user)
+        url = reverse("books:search_users")
+        self.client.get(url, {"q": "reader"})  # builds the username index
+
+        # Session, user, the index's version stamp and the annotated users.
+        with self.assertNumQueries(4):
+            response = self.client.get(url, {"q": "reader"})
+        statuses = {r["username"]: r["status"] for r in response.json()["results"]}
+        self.assertEqual(len(statuses), 8)
+        self.assertEqual(
+            [statuses[f"reader_{i}"] for i in range(5)],
+            ["friend", "friend", "pending_sent", "pending_received", "none"],
+        )
+
+
+class StubHandler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"  # keep-alive
+
+    def do_GET(self):
+        server = self.server
+        server.ports.append(self.client_address[1])
+        status, delay = server.responses.pop(0) if server.responses else (200, 0)
+        time.sleep(delay)
+        content_type, body = getattr(server, "content", ("application/json", b'{"numFound": 0, "docs": []}'))
+        self.send_response(status)
+        self.send_header("Content-Type", content_type)
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        try:
+            self.wfile.write(body)
+        except (BrokenPipeError, ConnectionResetError):
+            pass  # the client timed out first
+
+    def log_message(self, *args):
+        pass
+
+
+@override_settings(
+    OPEN_LIBRARY_CONNECT_TIMEOUT=1,
+    OPEN_LIBRARY_READ_TIMEOUT=0.2,
+    OPEN_LIBRARY_MAX_RETRIES=2,
+    OPEN_LIBRARY_BACKOFF=0,
+)
+class OpenLibraryClientTests(BooksTestCase):
+    """The client against a local stub server."""
+
+    def setUp(self):
+        super().setUp()
+        self.server = ThreadingHTTPServer(("127.0.0.1", 0), StubHandler)
+        self.server.ports, self.server.responses = [], []
+        threading.Thread(target=self.server.serve_forever, daemon=True).start()
+        self.addCleanup(self.server.server_close)
+        self.addCleanup(self.server.shutdown)
+        self.client_ = openlibrary.OpenLibraryClient(f"http://127.0.0.1:{self.server.server_port}")
+        self.client_.breaker = openlibrary.CircuitBreaker(threshold=2, cooldown=60)
+
+    def test_connection_is_reused(self):
+        for _ in range(3):
+            self.assertEqual(self.client_.get_json("/search.json"), {"numFound": 0, "docs": []})
+        self.assertEqual(len(set(self.server.ports)), 1)
+
+    def test_retries_errors_and_timeouts(self):
+        self.server.responses = [(503, 0), (200, 1)]
+        self.assertEqual(self.client_.get("/search.json").status_code, 200)
+        self.assertEqual(len(self.server.ports), 3)
+
+    def test_breaker_opens_and_fails_fast(self):
+        self.server.responses = [(500, 0)] * 6
+        for _ in range(2):
+            with self.assertRaises(requests.RequestException):
+                self.client_.get("/search.json")
+        self.assertTrue(self.client_.breaker.is_open)
+        calls = len(self.server.ports)
+        with self.assertRaises(openlibrary.CircuitOpenError):
+            self.client_.get("/search.json")
+        self.assertEqual(len(self.server.ports), calls)
+
+    async def test_async_client_retries_and_reuses_connections(self):
+        client = openlibrary.AsyncOpenLibraryClient(f"http://127.0.0.1:{self.server.server_port}")
+        client.breaker = self.client_.breaker
+        self.server.responses = [(503, 0), (200, 1)]
+        try:
+            self.assertEqual(await client.get_json("/search.json"), {"numFound": 0, "docs": []})
+            self.assertEqual(len(self.server.ports), 3)
+            for _ in range(2):
+                await client.get_json("/search.json")
+        finally:
+            await client.client.aclose()
+        # The timed-out attempt's connection is dropped; later ones reuse one.
+        self.assertEqual(len(set(self.server.ports[2:])), 1)
+
+
+class CoverProxyTests(BooksTestCase):
+    """The cover proxy against a fake cover server."""
+
+    def setUp(self):
+        super().setUp()
+        self.server = ThreadingHTTPServer(("127.0.0.1", 0), StubHandler)
+        self.server.ports, self.server.responses = [], []
+        self.server.content = ("image/jpeg", b"\xff\xd8" + b"x" * 1000)
+        threading.Thread(target=self.server.serve_forever, daemon=True).start()
+        self.addCleanup(self.server.server_close)
+        self.addCleanup(self.server.shutdown)
+        cache_dir = tempfile.TemporaryDirectory()
+        self.addCleanup(cache_dir.cleanup)
+        overrides = override_settings(COVER_CACHE_DIR=cache_dir.name, COVER_PROXY_HOSTS=("127.0.0.1",))
+        overrides.enable()
+        self.addCleanup(overrides.disable)
+        self.src = f"http://127.0.0.1:{self.server.server_port}/b/id/1-M.jpg"
+        covers._usage = None
+        self.client.force_login(User.objects.create_user(username="reader"))
+
+    def get(self, src=None, **headers):
+        response = self.client.get(reverse("books:cover"), {"src": src or self.src}, headers=headers)
+        response.body = b"".join(response.streaming_content) if response.streaming else response.content
+        return response
+
+    def test_cover_is_fetched_once_and_revalidated(self):
+        response = self.get()
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.body, self.server.content[1])
+        self.assertEqual(response["Content-Type"], "image/jpeg")
+        self.assertEqual(self.get().status_code, 200)
+        self.assertEqual(len(self.server.ports), 1)
+        self.assertEqual(self.get(**{"If-None-Match": response["ETag"]}).status_code, 304)
+
+    def test_if_none_match_is_parsed(self):
+        etag = self.get()["ETag"]
+        for header in (f'"other", {etag}', f"W/{etag}", "*"):
+            self.assertEqual(self.get(**{"If-None-Match": header}).status_code, 304, header)
+        # Not a substring match.
+        response = self.get(**{"If-None-Match": f'"x{etag[1:-1]}x"'})
+        self.assertEqual(response.status_code, 200)
+
+    def test_sign_in_required(self):
+        self.client.logout()
+        self.assertEqual(self.get().status_code, 302)
+        self.assertEqual(self.server.ports, [])
+
+    def test_non_images_are_refused(self):
+        for content_type in ("text/html", "image/svg+xml", "application/octet-stream; x=image/png"):
+            self.server.content = (content_type, b"<svg onload=alert(1)>")
+            self.assertEqual(self.get().status_code, 502, content_type)
+        self.assertFalse(list((Path(settings.COVER_CACHE_DIR) / "objects").glob("*/*")))
+
+        self.server.content = ("image/png; charset=binary", b"\x89PNG")
+        self.assertEqual(self.get().status_code, 200)
+
+    def test_other_hosts_are_refused(self):
+        self.assertEqual(self.get("https://example.com/b/id/1-M.jpg").status_code, 400)
+        self.assertEqual(self.server.ports, [])
+
+    def test_upstream_error_is_bad_gateway(self):
+        self.server.responses = [(404, 0)]
+        self.assertEqual(self.get().status_code, 502)
+
+    def test_cover_evicted_before_open_is_refetched(self):
+        self.get()
+        real_get = covers.get
+
+        def get_then_evict(url, size):
+            result = real_get(url, size)
+            if len(self.server.ports) == 1:
+                covers.evict(max_bytes=0)
+            return result
+
+        with mock.patch("books.covers.get", side_effect=get_then_evict):
+            response = self.get()
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.body, self.server.content[1])
+        self.assertEqual(len(self.server.ports), 2)
+
+    def test_least_recently_used_covers_are_evicted(self):
+        paths = []
+        for i in range(3):
+            self.server.content = ("image/jpeg", bytes([i]) * 1000)
+            paths.append(covers.get(self.src.replace("1-M", f"{i}-M"))[0])
+        os.utime(paths[0], (0, 0))
+        covers.evict(max_bytes=2500)
+        self.assertEqual([path.exists() for path in paths], [False, True, True])
+
+    def test_cache_size_is_tracked_without_a_scan_per_write(self):
+        def fetch(i):
+            self.server.content = ("image/jpeg", bytes([i]) * 1000)
+            return covers.get(self.src.replace("1-M", f"{i}-M"))[0]
+
+        with override_settings(COVER_CACHE_MAX_BYTES=3500), \
+                mock.patch.object(covers, "evict", wraps=covers.evict) as evict:
+            paths = [fetch(i) for i in range(3)]
+            self.assertEqual(evict.call_count, 1)  # the first write's scan
+            os.utime(paths[0], (0, 0))
+            fetch(3)  # 4000 bytes: over the limit
+            self.assertEqual(evict.call_count, 2)
+        self.assertEqual([path.exists() for path in paths], [False, True, True])
+        self.assertEqual(covers._usage, 3000)
+
+
+class BookNotesApiTests(BooksTestCase):
+    def setUp(self):
+        super().setUp()
+        self.user = User.objects.create_user(username="reader")
+        self.book = Book.objects.create(user=self.user, title="Dune", author="Herbert")
+        Note.objects.bulk_create(Note(book=self.book, content=f"note {i}") for i in range(60))
+        self.client.force_login(self.user)
+        self.url = reverse("books:book_notes_api", args=[self.book.pk])
+
+    def test_unpaged_request_gets_the_first_page(self):
+        response = self.client.get(self.url)
+        self.assertEqual(len(response.json()), 50)
+        self.assertIn("X-Next-Cursor", response)
+
+    def test_paged_requests_follow_the_cursor(self):
+        response = self.client.get(self.url, {"page_size": 50})
+        first = response.json()
+        self.assertEqual(len(first), 50)
+        response = self.client.get(self.url, {"page_size": 50, "cursor": response["X-Next-Cursor"]})
+        rest = response.json()
+        self.assertEqual(len(rest), 10)
+        self.assertNotIn("X-Next-Cursor", response)
+        self.assertEqual({n["id"] for n in first + rest}, set(self.book.notes.values_list("id", flat=True)))
+
+    def test_bad_cursor_is_rejected(self):
+        self.assertEqual(self.client.get(self.url, {"cursor": "not a cursor"}).status_code, 400)
+
+    def test_friend_books_follow_the_cursor(self):
+        friend = User.objects.create_user(username="friend")
+        FriendRequest.objects.create(from_user=self.user, to_user=friend, accepted=True)
+        Book.objects.bulk_create(Book(user=friend, title=f"Book {i}", author="Author") for i in range(5))
+        url = reverse("books:friend_books", args=[friend.username])
+
+        titles, cursor = [], None
+        while True:
+            data = self.client.get(url, {"page_size": 2, **({"cursor": cursor} if cursor else {})}).json()
+            self.assertLessEqual(len(data["books"]), 2)
+            titles += [book["title"] for book in data["books"]]
+            cursor = data["next_cursor"]
+            if not cursor:
+                break
+        self.assertEqual(sorted(titles), [f"Book {i}" for i in range(5)])
+        self.assertEqual(len(self.client.get(url).json()["books"]), 5)
+
+
+class NoteBatchTests(BooksTestCase):
+    def setUp(self):
+        super().setUp()
+        self.user = User.objects.create_user(username="reader")
+        self.book = Book.objects.create(user=self.user, title="Dune", author="Herbert")
+        self.note = Note.objects.create(book=self.book, content="spice", page_number=3)
+        self.client.force_login(self.user)
+        self.url = reverse("books:batch_notes_api", args=[self.book.pk])
+
+    def post(self, operations):
+        return self.client.post(self.url, {"operations": operations}, content_type="application/json")
+
+    def stamps(self):
+        return versions.get_many(("notes", self.book.pk), ("user_notes", self.user.pk))
+
+    def test_applies_every_operation_and_bumps_the_stamps(self):
+        doomed = Note.objects.create(book=self.book, content="gone")
+        before = self.stamps()
+        response = self.post([
+            {"op": "create", "content": "new", "page_number": "12", "chapter": 2.0},
+            {"op": "update", "id": self.note.pk, "page_number": None},
+            {"op": "delete", "id": doomed.pk},
+        ])
+        self.assertEqual(response.status_code, 200)
+        data = response.json()
+        self.assertEqual((data["created"][0]["page_number"], data["created"][0]["chapter"]), (12, 2))
+        self.assertEqual(data["deleted"], [doomed.pk])
+        self.note.refresh_from_db()
+        self.assertEqual((self.note.content, self.note.page_number), ("spice", None))
+        self.assertEqual(sorted(self.book.notes.values_list("content", flat=True)), ["new", "spice"])
+        self.assertTrue(all(new > old for new, old in zip(self.stamps(), before)))
+
+    def test_another_books_note_rolls_back_the_batch(self):
+        other = Book.objects.create(user=self.user, title="Emma", author="Austen")
+        foreign = Note.objects.create(book=other, content="not here")
+        before = self.stamps()
+        for missing in (foreign.pk, foreign.pk + 1000):
+            response = self.post([
+                {"op": "create", "content": "new"},
+                {"op": "update", "id": self.note.pk, "content": "changed"},
+                {"op": "delete", "id": missing},
+            ])
+            self.assertEqual(response.status_code, 400)
+            self.assertEqual(response.json()["errors"], [{"index": 2, "error": f"Note {missing} not found"}])
+        self.assertEqual(list(self.book.notes.values_list("content", flat=True)), ["spice"])
+        self.assertTrue(Note.objects.filter(pk=foreign.pk).exists())
+        self.assertEqual(self.stamps(), before)
+
+    def test_invalid_operations_are_all_reported(self):
+        response = self.post([
+            {"op": "update", "id": self.note.pk, "content": "a"},
+            {"op": "delete", "id": self.note.pk},
+            {"op": "create", "content": "b", "page_number": 2.7},
+            {"op": "create", "content": "c", "chapter": 2 ** 31},
+            {"op": "delete", "id": 2 ** 63},
+            {"op": "update", "id": self.note.pk + 1},
+        ])
+        self.assertEqual(response.status_code, 400)
+        self.assertEqual([error["index"] for error in response.json()["errors"]], [1, 2, 3, 4, 5])
+        self.assertIn("more than once", response.json()["errors"][0]["error"])
+
+    @override_settings(NOTE_BATCH_MAX_OPERATIONS=2)
+    def test_size_limit(self):
+        response = self.post([{"op": "create", "content": "x"}] * 3)
+        self.assertEqual(response.status_code, 400)
+        self.assertIn("At most 2 operations", response.json()["errors"][0]["error"])
+        self.assertEqual(self.post([{"op": "create", "content": "x"}] * 2).status_code, 200)
+
+    def test_bad_bodies_are_rejected(self):
+        for body in (b"{", b'{"operations": "\xff"}', b"[]"):
+            response = self.client.post(self.url, body, content_type="application/json")
+            self.assertEqual(response.status_code, 400, body)
+
+
+class CacheStatsTests(BooksTestCase):
+    def test_warns_about_per_process_counters(self):
+        counters.incr("friends_cache.hit")
+        out, err = io.StringIO(), io.StringIO()
+        call_command("cache_stats", stdout=out, stderr=err)
+        self.assertIn("per-process", err.getvalue())
+        self.assertIn("hit rate:   100.0%", out.getvalue())
+
+    def test_reads_counters_from_a_shared_cache(self):
+        cache_dir = tempfile.TemporaryDirectory()
+        self.addCleanup(cache_dir.cleanup)
+        shared = {"BACKEND": "django.core.cache.backends.filebased.FileBasedCache", "LOCATION": cache_dir.name}
+        with override_settings(CACHES={**settings.CACHES, "default": shared}):
+            counters.incr("friends_cache.hit", 3)
+            counters.incr("friends_cache.miss")
+            out = io.StringIO()
+            call_command("cache_stats", stdout=out)
+        self.assertIn("hit rate:   75.0%", out.getvalue())
+
+
+@override_settings(FEED_CACHE_SIZE=10)
+class FeedWindowTests(BooksTestCase):
+    def test_pages_inside_the_window_come_from_cache(self):
+        user = User.objects.create_user(username="reader")
+        friend = User.objects.create_user(username="friend")
+        FriendRequest.objects.create(from_user=user, to_user=friend, accepted=True)
+        Book.objects.bulk_create(Book(user=friend, title=f"Book {i}", author="Author") for i in range(30))
+
+        seen = []
+        events, cursor = feed.feed(user, 5)
+        seen += events
+        # The rest of the window costs only the friends stamp read.
+        with self.assertNumQueries(1):
+            events, cursor = feed.feed(user, 5, cursor)
+        seen += events
+        self.assertIsNotNone(cursor)
+        while cursor:
+            events, cursor = feed.feed(user, 5, cursor)
+            seen += events
+        self.assertEqual(len(seen), 30)
+        self.assertEqual(len({event["id"] for event in seen}), 30)
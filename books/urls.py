@@ -11,6 +11,7 @@ urlpatterns = [
     path("api/friends/request/send/", api_views.send_friend_request, name="send_friend_request"),
     path("api/friends/request/<int:request_id>/respond/", api_views.respond_friend_request, name="respond_friend_request"),
     path("api/friends/remove/", api_views.remove_friend, name="remove_friend"),
+    path("api/friends/feed/", api_views.friend_feed, name="friend_feed"),
     path("api/friends/<str:username>/books/", api_views.friend_books, name="friend_books"),
     path("api/friends/<str:username>/books/<int:book_id>/notes/", api_views.friend_book_notes, name="friend_book_notes"),
     path('add/', api_views.add_book, name='add'),
@@ -18,12 +19,19 @@ urlpatterns = [
     path('<int:pk>/delete/', views.delete_book, name='delete'),
     path("api/books/<int:pk>/notes/", api_views.book_notes_api, name="book_notes_api"),
     path("api/books/<int:pk>/notes/add/", api_views.add_note_api, name="add_note_api"),
+    path("api/books/<int:pk>/notes/batch/", api_views.batch_notes_api, name="batch_notes_api"),
     path("api/notes/<int:pk>/delete/", api_views.delete_note_api),
     path("api/notes/<int:pk>/edit/", api_views.edit_note_api),
     path("api/open-library-search/", api_views.open_library_search),
+    path("api/export/", api_views.export_library, name="export_library"),
+    path("api/import/", api_views.import_library, name="import_library"),
+    path("api/search/", api_views.search_library, name="search_library"),
     path("search/", views.book_search, name="book_search"),
+    path("covers/", views.cover_proxy, name="cover"),
     path("add-from-search/", views.add_book_from_search, name="add_book_from_search"),
     path("<int:id>/finish/", views.finish_book, name="finish_book"),
     path('reading_stats/', views.reading_stats, name='reading_stats'),
+    path("api/stats/", api_views.reading_analytics, name="reading_analytics"),
     path("<int:id>/update-date/", views.update_finish_date, name="update_finish_date"),
+    path("metrics/", views.prometheus_metrics, name="metrics"),
 ]
\ No newline at end of file
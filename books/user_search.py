@@ -0,0 +1,226 @@
+"""Username search for the friends page.
+
+On PostgreSQL ``username__icontains`` is served by a pg_trgm GIN index
+(migration 0014). Other backends cannot index a leading-wildcard LIKE, so
+each process keeps an in-memory index instead (see ``UsernameIndex``).
+
+Users created after the index was built are found through its ``recent``
+list: a ``post_save`` handler bumps the ``users`` version stamp, and each
+process that sees a new stamp loads just the new rows into a copy that
+shares everything else. The whole index is rebuilt in a background thread
+every ``USER_SEARCH_INDEX_MAX_AGE`` seconds (to pick up renames) or once
+``recent`` grows past ``RECENT_LIMIT``, while searches keep using the old
+one. Only the very first search in a process waits for a build.
+
+Either way results are ranked prefix matches first, then shorter names.
+"""
+import copy
+import heapq
+import threading
+import time
+from array import array
+
+from django.conf import settings
+from django.contrib.auth.models import User
+from django.db import connection
+from django.db.models import Case, IntegerField, Value, When
+from django.db.models.functions import Length
+
+from . import versions
+
+# Users added since the last build before a rebuild is started.
+RECENT_LIMIT = 10_000
+
+
+def _grams(text, sizes=(1, 2, 3)):
+    """The distinct substrings of ``text`` of each length in ``sizes``."""
+    return {text[i:i + n] for n in sizes for i in range(len(text) - n + 1)}
+
+
+class UsernameIndex:
+    """Lower-cased usernames in rank order, with n-gram posting lists.
+
+    Rank order is (length, name), the order results are returned in, and
+    every posting list holds positions in that order. A search walks one
+    list from the front, checks each name and stops after ``limit``
+    matches, so even one-character queries matching most users cost about
+    ``limit`` steps. ``starts`` maps each 1-3 character prefix to the names
+    that begin with it; ``grams`` maps every 1, 2 and 3 character substring
+    to the names that contain it, and a search walks the shortest list among
+    its query's grams.
+    """
+
+    def __init__(self):
+        self.names = []  # lower-cased usernames, in rank order
+        self.ids = array("q")  # user ids, parallel to names
+        self.starts = {}  # prefix of 1-3 chars -> array of positions
+        self.grams = {}  # 1-3 char substring -> array of positions
+        self.recent = ()  # (len, name, id) of users added since the build
+        self.max_id = 0
+        self.built_at = time.monotonic()
+        self.version = None
+
+    @classmethod
+    def build(cls, version):
+        index = cls()
+        index.version = version
+        rows = User.objects.order_by("id").values_list("id", "username")
+        entries = sorted(
+            (len(name), name, user_id)
+            for user_id, name in ((user_id, username.lower()) for user_id, username in rows.iterator(chunk_size=10000))
+        )
+        index.names = [name for _, name, _ in entries]
+        index.ids = array("q", [user_id for _, _, user_id in entries])
+        index.max_id = max(index.ids, default=0)
+        del entries
+
+        # Most of the build, which takes about 25 seconds for a million users.
+        starts, grams = index.starts, index.grams
+        for position, name in enumerate(index.names):
+            for prefix in {name[:1], name[:2], name[:3]}:
+                try:
+                    starts[prefix].append(position)
+                except KeyError:
+                    starts[prefix] = array("i", [position])
+            for gram in _grams(name):
+                try:
+                    grams[gram].append(position)
+                except KeyError:
+                    grams[gram] = array("i", [position])
+        return index
+
+    def extend(self, version):
+        """Return a copy that also finds users created since this one."""
+        index = copy.copy(self)
+        rows = User.objects.filter(id__gt=self.max_id).order_by("id").values_list("id", "username")
+        added = [(len(username), username.lower(), user_id) for user_id, username in rows]
+        index.recent = self.recent + tuple(added)
+        index.max_id = max([self.max_id] + [user_id for _, _, user_id in added])
+        index.version = version
+        return index
+
+    def is_stale(self):
+        max_age = getattr(settings, "USER_SEARCH_INDEX_MAX_AGE", 3600)
+        return time.monotonic() - self.built_at > max_age or len(self.recent) > RECENT_LIMIT
+
+    def _walk(self, positions, match, limit, exclude_id):
+        found = []
+        for position in positions:
+            name, user_id = self.names[position], self.ids[position]
+            if user_id != exclude_id and match(name):
+                found.append((len(name), name, user_id))
+                if len(found) == limit:
+                    break
+        return found
+
+    def search(self, q, limit, exclude_id=None):
+        """Return up to ``limit`` matching user ids, best first."""
+        q = q.lower()
+        recent = [entry for entry in self.recent if entry[2] != exclude_id and q in entry[1]]
+
+        if q:
+            positions = self.starts.get(q[:3], ())
+        else:
+            positions = range(len(self.names))
+        prefix = heapq.nsmallest(limit, [
+            *self._walk(positions, lambda name: name.startswith(q), limit, exclude_id),
+            *(entry for entry in recent if entry[1].startswith(q)),
+        ])
+        results = [user_id for _, _, user_id in prefix]
+        if len(results) >= limit:
+            return results
+
+        # The remaining substring matches (prefix matches are all in already).
+        n = min(3, len(q))
+        postings = [self.grams.get(gram, ()) for gram in _grams(q, (n,))]
+        substring = heapq.nsmallest(limit - len(results), [
+            *self._walk(
+                min(postings, key=len), lambda name: q in name and not name.startswith(q),
+                limit - len(results), exclude_id,
+            ),
+            *(entry for entry in recent if not entry[1].startswith(q)),
+        ])
+        results.extend(user_id for _, _, user_id in substring)
+        return results
+
+
+_index = None
+_lock = threading.Lock()  # guards _index and _rebuilding
+_build_lock = threading.Lock()  # only one first build per process
+_rebuilding = False
+
+
+def _current_version():
+    return versions.get("users", 0)
+
+
+def _install(index):
+    """Make ``index`` current unless a newer one got there first."""
+    global _index
+    with _lock:
+        if _index is None or (index.built_at, index.max_id) >= (_index.built_at, _index.max_id):
+            _index = index
+        return _index
+
+
+def _rebuild_in_background():
+    global _rebuilding
+    with _lock:
+        if _rebuilding:
+            return
+        _rebuilding = True
+
+    def rebuild():
+        global _rebuilding
+        try:
+            _install(UsernameIndex.build(_current_version()))
+        finally:
+            connection.close()
+            with _lock:
+                _rebuilding = False
+
+    threading.Thread(target=rebuild, daemon=True).start()
+
+
+def get_index():
+    version = _current_version()
+    index = _index
+    if index is None:
+        with _build_lock:
+            index = _index or _install(UsernameIndex.build(version))
+    elif index.is_stale():
+        _rebuild_in_background()
+    if index.version != version:
+        index = _install(index.extend(version))
+    return index
+
+
+def user_created():
+    """Tell every process's index that new users exist."""
+    versions.bump("users", 0)
+
+
+def search(q, exclude_id=None, limit=10, queryset=None):
+    """Return up to ``limit`` users whose username contains ``q``.
+
+    ``queryset`` (default ``User.objects.all()``) lets callers add
+    annotations; the matching users are fetched from it in one query.
+    """
+    if queryset is None:
+        queryset = User.objects.all()
+
+    if connection.vendor == "postgresql":
+        return list(
+            queryset.filter(username__icontains=q)
+            .exclude(id=exclude_id)
+            .annotate(is_prefix=Case(
+                When(username__istartswith=q, then=Value(0)),
+                default=Value(1),
+                output_field=IntegerField(),
+            ))
+            .order_by("is_prefix", Length("username"), "username")[:limit]
+        )
+
+    ids = get_index().search(q, limit, exclude_id)
+    users = queryset.in_bulk(ids)
+    return [users[user_id] for user_id in ids if user_id in users]
@@ -0,0 +1,101 @@
+"""Version stamps for conditional GETs and cache keys.
+
+Each stamp is a counter in the ``VersionStamp`` table identified by a scope
+and an id:
+
+- ``books:<user_id>``: the user's books
+- ``book:<book_id>``: one book's own fields
+- ``notes:<book_id>``: a book's notes (and its title, shown alongside them)
+- ``user_notes:<user_id>``: all notes on the user's books
+- ``friends:<user_id>``: the user's accepted friends
+- ``friend_requests:<user_id>``: the user's incoming pending requests
+- ``users:0``: the set of users (for the username search index)
+
+The signal handlers in ``signals.py`` bump them on every save and delete.
+Bulk writes (``bulk_create``, ``QuerySet.update``) send no signals, so code
+that uses them must call ``bump`` itself.
+
+Stamps live in the database rather than the cache so that every process
+sees a bump: a per-process cache would leave other workers serving the old
+version. A bump is part of the write's transaction, so it becomes visible
+exactly when the data does (and is rolled back with it).
+
+``conditional`` turns the stamps a view depends on into an ETag, so an
+unchanged resource is answered with 304 Not Modified before the view runs.
+Templates put them in ``{% cache %}`` fragment keys the same way.
+"""
+import hashlib
+from collections import defaultdict
+
+from django.db import connection
+from django.db.models import Q
+from django.views.decorators.cache import cache_control
+from django.views.decorators.http import condition
+
+from .models import VersionStamp
+
+
+def get(scope, obj_id):
+    return get_many((scope, obj_id))[0]
+
+
+def get_many(*stamps):
+    """Return the versions of several ``(scope, id)`` pairs in one query.
+
+    A stamp that has never been bumped is 0.
+    """
+    if not stamps:
+        # An empty Q() would match every stamp.
+        return []
+    by_scope = defaultdict(set)
+    for scope, obj_id in stamps:
+        by_scope[scope].add(obj_id)
+    query = Q()
+    for scope, obj_ids in by_scope.items():
+        query |= Q(scope=scope, obj_id__in=obj_ids)
+    found = {
+        (scope, obj_id): version
+        for scope, obj_id, version in VersionStamp.objects.filter(query).values_list("scope", "obj_id", "version")
+    }
+    return [found.get((scope, obj_id), 0) for scope, obj_id in stamps]
+
+
+def bump(scope, *obj_ids):
+    """Advance the given stamps in the current transaction."""
+    # Sorted, so two transactions bumping the same stamps lock their rows in
+    # the same order.
+    obj_ids = sorted(set(obj_ids))
+    if not obj_ids:
+        return
+    table = connection.ops.quote_name(VersionStamp._meta.db_table)
+    with connection.cursor() as cursor:
+        cursor.execute(
+            f"INSERT INTO {table} (scope, obj_id, version) "
+            f"VALUES {', '.join(['(%s, %s, 1)'] * len(obj_ids))} "
+            f"ON CONFLICT (scope, obj_id) DO UPDATE SET version = {table}.version + 1",
+            [param for obj_id in obj_ids for param in (scope, obj_id)],
+        )
+
+
+def etag(*parts):
+    return '"%s"' % hashlib.sha1(":".join(map(str, parts)).encode()).hexdigest()[:32]
+
+
+def conditional(stamps_func):
+    """Answer GET/HEAD with 304 when the resource's stamps are unchanged.
+
+    ``stamps_func(request, *args, **kwargs)`` returns the ``(scope, id)``
+    pairs the response depends on, or ``None`` to skip the check (e.g. when
+    the view is going to answer 403 or 404). The ETag also covers the user
+    and the full URL, since one resource may be paged or filtered. Responses
+    are marked ``private, no-cache`` so browsers revalidate every time.
+    """
+    def etag_func(request, *args, **kwargs):
+        stamps = stamps_func(request, *args, **kwargs)
+        if stamps is None:
+            return None
+        return etag(request.user.pk, request.get_full_path(), *get_many(*stamps))
+
+    def decorator(view):
+        return cache_control(private=True, no_cache=True)(condition(etag_func=etag_func)(view))
+    return decorator
@@ -1,11 +1,22 @@
+from django.conf import settings
+from django.core.cache import caches
+from django.core.cache.utils import make_template_fragment_key
+from django.contrib.admin.views.decorators import staff_member_required
 from django.contrib.auth.decorators import login_required
 from django.shortcuts import render, redirect, get_object_or_404
-from django.views.decorators.http import require_POST
+from django.http import FileResponse, HttpResponse, HttpResponseBadRequest
+from django.utils.cache import get_conditional_response
+from django.views.decorators.http import require_GET, require_POST
 from django.utils import timezone
-from django.db.models.functions import ExtractMonth
+from django.utils.safestring import mark_safe
+from django.db import transaction
+from django.db.models import Count, Q, Sum
 from datetime import datetime
-from .models import Book
-from django.db.models import Count
+from .models import Book, ReadingStatsMonthly
+from . import counters, covers, friends, metrics, openlibrary, search_cache, versions
+from .pagination import InvalidCursor, paginate
+from jobs import queue
+from jobs.queue import enqueue
 import requests
 
 
@@ -20,7 +31,28 @@ def friends_page(request):
 def books_list(request):
     status = request.GET.get("status", "all")
 
+    # The list fragment is keyed on the library's version stamp alone, so it
+    # can be looked up before anything else: a hit skips the counts, the page
+    # query and the per-card stamps. The stamp is read before the books, so a
+    # concurrent write can only leave newer data under an older key.
+    books_version = versions.get("books", request.user.pk)
+    fragment_key = make_template_fragment_key(
+        "books_list", [request.user.pk, books_version, request.get_full_path()]
+    )
+    cached_list = caches["template_fragments"].get(fragment_key)
+    if cached_list is not None:
+        return render(request, "books/books_list.html", {
+            "cached_list": mark_safe(cached_list),
+            "books_version": books_version,
+            "fragment_ttl": settings.FRAGMENT_CACHE_TTL,
+        })
+
     books = Book.objects.filter(user=request.user)
+    counts = books.aggregate(
+        all=Count("id"),
+        finished=Count("id", filter=Q(finished=True)),
+    )
+    counts["reading"] = counts["all"] - counts["finished"]
 
     if status == "finished":
         books = books.filter(finished=True)
@@ -28,16 +60,38 @@ def books_list(request):
     elif status == "reading":
         books = books.filter(finished=False)
 
+    try:
+        books, next_cursor = paginate(
+            books.only("id", "title", "author", "cover_url", "created_at"),
+            request,
+        )
+    except InvalidCursor:
+        return HttpResponseBadRequest("Invalid cursor")
+
+    # Each card's fragment depends only on its own book.
+    book_versions = versions.get_many(*(("book", book.pk) for book in books))
+    for book, version in zip(books, book_versions):
+        book.version = version
+
     context = {
         "books": books,
+        "books_version": books_version,
+        "fragment_ttl": settings.FRAGMENT_CACHE_TTL,
         "status": status,
+        "counts": counts,
+        "next_cursor": next_cursor,
+        "is_first_page": "cursor" not in request.GET,
     }
 
     return render(request, "books/books_list.html", context)
 
 def book_detail(request, pk):
     book = get_object_or_404(Book, pk=pk, user=request.user)
-    return render(request, 'books/book_detail.html', {'book': book})
+    return render(request, 'books/book_detail.html', {
+        'book': book,
+        'book_version': versions.get('book', book.pk),
+        'fragment_ttl': settings.FRAGMENT_CACHE_TTL,
+    })
 
 def finish_book(request, id):
     book = get_object_or_404(Book, id=id, user=request.user)
@@ -45,7 +99,9 @@ def finish_book(request, id):
     if request.method == "POST":
         book.finished = True
         book.finish_date = timezone.now().date()
-        book.save()
+        # One transaction for the book and its reading stats (see books.stats).
+        with transaction.atomic():
+            book.save()
 
     return redirect("books:detail", pk=book.id)
 
@@ -57,17 +113,20 @@ def update_finish_date(request, id):
 
         if new_date:
             book.finish_date = new_date
-            book.save()
+            with transaction.atomic():
+                book.save()
 
     return redirect("books:detail", pk=book.id)
 
 @require_POST
 def delete_book(request, pk):
-    book = get_object_or_404(Book, pk=pk, user=request.user)
-    book.delete()
+    with transaction.atomic():
+        # Locked, so the stats come off the month the book is in when it goes.
+        book = get_object_or_404(Book.objects.select_for_update(), pk=pk, user=request.user)
+        book.delete()
     return redirect('books:list')
 
-def book_search(request):
+async def book_search(request):
     query = request.GET.get("q")
     page = request.GET.get("page", 1)
 
@@ -75,25 +134,10 @@ def book_search(request):
     num_found = 0
 
     if query:
-        url = "https://openlibrary.org/search.json"
-        headers = {
-            "User-Agent": "Mozilla/5.0"
-        }
-
-        response = requests.get(
-            url,
-            params={
-                "q": query,
-                "page": page
-            },
-            headers=headers
-        )
-
         try:
-            data = response.json()
-        except ValueError:
+            data = await search_cache.asearch(query, page)
+        except (requests.RequestException, ValueError):
             data = {}
-        results = []
         num_found = data.get("numFound", 0)
 
         for book in data.get("docs", []):
@@ -109,6 +153,10 @@ def book_search(request):
                 "cover_url": cover_url,
             })
 
+    # Resolve the user up front: the template's auth context would otherwise
+    # load it lazily through the sync ORM.
+    request.user = await request.auser()
+
     return render(request, "books/search_results.html", {
         "results": results,
         "query": query,
@@ -116,6 +164,33 @@ def book_search(request):
         "num_found": num_found,
     })
 
+@login_required
+@require_GET
+def cover_proxy(request):
+    try:
+        cover, digest, content_type = covers.open_cover(
+            request.GET.get("src", ""),
+            request.GET.get("size", "M"),
+        )
+    except covers.CoverUnavailable:
+        return HttpResponse("Cover unavailable", status=502)
+    except covers.CoverError as e:
+        return HttpResponseBadRequest(str(e))
+    except (requests.RequestException, FileNotFoundError):
+        # FileNotFoundError: evicted again right after the refetch.
+        return HttpResponse("Cover unavailable", status=502)
+
+    # A given src/size always maps to the same bytes, so the response can be
+    # cached forever and revalidated by content hash; privately, since only
+    # signed-in users may use the proxy.
+    response = FileResponse(cover, content_type=content_type)
+    response["ETag"] = f'"{digest}"'
+    response["Cache-Control"] = "private, max-age=31536000, immutable"
+    conditional = get_conditional_response(request, etag=response["ETag"], response=response)
+    if conditional is not response:
+        response.close()
+    return conditional
+
 @login_required
 def add_book_from_search(request):
     if request.method == "POST":
@@ -123,12 +198,14 @@ def add_book_from_search(request):
         author = request.POST.get("author")
         cover_url = request.POST.get("cover_url")
 
-        Book.objects.create(
+        book = Book.objects.create(
             user=request.user,
             title=title,
             author=author,
             cover_url=cover_url or None
         )
+        # ISBN, page count etc. are looked up by a background worker.
+        enqueue("books.enrich_book", {"book_id": book.id})
 
     return redirect("books:list")
 
@@ -143,26 +220,24 @@ def reading_stats(request):
     else:
         selected_year = current_year
 
-    books = Book.objects.filter(
+    monthly_data = ReadingStatsMonthly.objects.filter(
         user=request.user,
-        finished=True,
-        finish_date__year=selected_year
-    )
+        year=selected_year,
+    ).values_list("month", "count")
 
-    total_books = books.count()
+    monthly_counts = [0] * 12
 
-    monthly_data = (
-        books
-        .annotate(month=ExtractMonth("finish_date"))
-        .values("month")
-        .annotate(count=Count("id"))
-        .order_by("month")
-    )
+    for month, count in monthly_data:
+        monthly_counts[month - 1] = count
 
-    monthly_counts = [0] * 12
+    total_books = sum(monthly_counts)
 
-    for item in monthly_data:
-        monthly_counts[item["month"] - 1] = item["count"]
+    yearly_totals = (
+        ReadingStatsMonthly.objects.filter(user=request.user, count__gt=0)
+        .values("year")
+        .annotate(total=Sum("count"))
+        .order_by("-year")
+    )
 
     years = range(current_year, current_year - 50, -1)
 
@@ -171,6 +246,23 @@ def reading_stats(request):
         "years": years,
         "total_books": total_books,
         "monthly_counts": monthly_counts,
+        "yearly_totals": yearly_totals,
     }
 
-    return render(request, "books/reading_stats.html", context)
\ No newline at end of file
+    return render(request, "books/reading_stats.html", context)
+
+@staff_member_required
+@require_GET
+def prometheus_metrics(request):
+    body = metrics.render_prometheus(
+        extra_histograms=[
+            ("openlibrary_request_seconds", "Latency of each HTTP attempt to Open Library.", openlibrary.latency),
+        ],
+        counters=counters.get_many(search_cache.COUNTERS + friends.COUNTERS),
+        gauges={
+            "openlibrary_circuit_open": int(openlibrary.get_breaker().is_open),
+            **{f"jobs_{status}": count for status, count in queue.depth().items()},
+            "jobs_lag_seconds": queue.lag(),
+        },
+    )
+    return HttpResponse(body, content_type="text/plain; version=0.0.4; charset=utf-8")
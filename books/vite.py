@@ -0,0 +1,85 @@
+"""Resolve Vite entry points through the build manifest.
+
+``npm run build`` in ``frontend/`` writes hashed bundles to
+``static/dist/assets/`` and a ``manifest.json`` mapping each entry source
+(e.g. ``src/main.jsx``) to its output file, its CSS and the shared chunks
+it imports. Templates use the ``vite_tags`` library instead of hardcoding
+bundle names, so a new build needs no template edits.
+
+The manifest is read once per process, or again whenever it changes on
+disk when ``DEBUG`` is on.
+"""
+import json
+import threading
+from pathlib import Path
+
+from django.conf import settings
+from django.contrib.staticfiles import finders
+from django.contrib.staticfiles.storage import staticfiles_storage
+from django.core.exceptions import ImproperlyConfigured
+from django.templatetags.static import static
+
+DEFAULT_MANIFEST = "dist/manifest.json"
+
+_lock = threading.Lock()
+_cached = {"mtime": None, "manifest": None}
+
+
+def _manifest_name():
+    return getattr(settings, "VITE_MANIFEST_PATH", DEFAULT_MANIFEST)
+
+
+def _manifest_file():
+    name = _manifest_name()
+    path = finders.find(name) if settings.DEBUG else None
+    if path is None and staticfiles_storage.exists(name):
+        path = staticfiles_storage.path(name)
+    if path is None:
+        raise ImproperlyConfigured(f"Vite manifest {name} not found; run `npm run build` in frontend/.")
+    return path
+
+
+def manifest():
+    with _lock:
+        if _cached["manifest"] is not None and not settings.DEBUG:
+            return _cached["manifest"]
+        path = Path(_manifest_file())
+        mtime = path.stat().st_mtime
+        if _cached["manifest"] is None or mtime != _cached["mtime"]:
+            _cached["manifest"] = json.loads(path.read_text())
+            _cached["mtime"] = mtime
+        return _cached["manifest"]
+
+
+def _url(file):
+    base = _manifest_name().rsplit("/", 1)[0]
+    return static(f"{base}/{file}" if base else file)
+
+
+def assets(entry):
+    """Return ``(script, css, preloads)`` URLs for a manifest entry.
+
+    ``preloads`` are the chunks the entry imports, directly or through
+    other chunks, in the order Vite would hint them.
+    """
+    chunks = manifest()
+    if entry not in chunks:
+        raise ImproperlyConfigured(f"{entry} is not an entry in the Vite manifest.")
+
+    css, preloads, seen = [], [], set()
+
+    def walk(key):
+        if key in seen:
+            return
+        seen.add(key)
+        chunk = chunks[key]
+        for imported in chunk.get("imports", ()):
+            walk(imported)
+            if chunks[imported]["file"] not in preloads:
+                preloads.append(chunks[imported]["file"])
+        for file in chunk.get("css", ()):
+            if file not in css:
+                css.append(file)
+
+    walk(entry)
+    return _url(chunks[entry]["file"]), [_url(f) for f in css], [_url(f) for f in preloads]
@@ -2,6 +2,9 @@
 ASGI config for config project.
 
 It exposes the ASGI callable as a module-level variable named ``application``.
+This is how the site is deployed:
+
+    uvicorn config.asgi:application --workers 4
 
 For more information on this file, see
 https://docs.djangoproject.com/en/6.0/howto/deployment/asgi/
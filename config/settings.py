@@ -49,6 +49,7 @@ LOGOUT_REDIRECT_URL = '/accounts/login/'
 INSTALLED_APPS = [
     'books',
     'users',
+    'jobs',
     'django.contrib.admin',
     'django.contrib.auth',
     'django.contrib.contenttypes',
@@ -58,6 +59,7 @@ INSTALLED_APPS = [
 ]
 
 MIDDLEWARE = [
+    'books.middleware.MetricsMiddleware',
     'django.middleware.security.SecurityMiddleware',
     'django.contrib.sessions.middleware.SessionMiddleware',
     'django.middleware.common.CommonMiddleware',
@@ -65,7 +67,8 @@ MIDDLEWARE = [
     'django.contrib.auth.middleware.AuthenticationMiddleware',
     'django.contrib.messages.middleware.MessageMiddleware',
     'django.middleware.clickjacking.XFrameOptionsMiddleware',
-    "whitenoise.middleware.WhiteNoiseMiddleware",
+    # WhiteNoise, usable by the async views without a thread hop.
+    "books.middleware.StaticFilesMiddleware",
 ]
 
 ROOT_URLCONF = 'config.urls'
@@ -93,10 +96,50 @@ WSGI_APPLICATION = 'config.wsgi.application'
 
 DATABASE_URL = os.environ.get("DATABASE_URL")
 
+# The site is served under ASGI (uvicorn, see config/asgi.py). Connection
+# reuse, all from the environment:
+# - DB_CONN_MAX_AGE: seconds a connection is kept between requests (0, the
+#   default, closes it after every request; "none" keeps it forever). Under
+#   ASGI each request runs its ORM calls in a thread of its own, whose
+#   connection a later request never reuses, so keep 0 there and use
+#   DB_POOL instead. Raise it only for WSGI workers (runserver, gunicorn).
+# - DB_CONN_HEALTH_CHECKS: ping a reused connection before the first query
+#   of each request, so one the server dropped is replaced, not an error.
+# - DB_POOL: use a psycopg connection pool per process (PostgreSQL with
+#   psycopg 3 only). Persistent connections are then turned off, as Django
+#   requires; the pool itself keeps connections open and checks them.
+# Empty variables count as unset.
+DB_CONN_MAX_AGE = os.environ.get("DB_CONN_MAX_AGE") or "0"
+DB_CONN_MAX_AGE = None if DB_CONN_MAX_AGE.lower() == "none" else int(DB_CONN_MAX_AGE)
+DB_CONN_HEALTH_CHECKS = (os.environ.get("DB_CONN_HEALTH_CHECKS") or "true").lower() in ("1", "true", "yes")
+DB_POOL = os.environ.get("DB_POOL", "false").lower() in ("1", "true", "yes")
+
+# Sizing: every ASGI worker process holds its own pool, and every thread of
+# run_workers (JOBS_WORKER_THREADS) its own connection. Requests of one
+# worker share its pool, so DB_POOL_MAX_SIZE bounds how many of them query
+# at once. Keep
+#   web workers * DB_POOL_MAX_SIZE + job worker threads
+# comfortably below PostgreSQL's max_connections, leaving room for
+# migrations, shells and the admin.
+DB_POOL_MIN_SIZE = int(os.environ.get("DB_POOL_MIN_SIZE") or 2)
+DB_POOL_MAX_SIZE = int(os.environ.get("DB_POOL_MAX_SIZE") or 4)
+# Seconds a request waits for a free pooled connection before failing.
+DB_POOL_TIMEOUT = float(os.environ.get("DB_POOL_TIMEOUT") or 10)
+
 if DATABASE_URL:
     DATABASES = {
-        "default": dj_database_url.parse(DATABASE_URL)
+        "default": dj_database_url.parse(
+            DATABASE_URL,
+            conn_max_age=0 if DB_POOL else DB_CONN_MAX_AGE,
+            conn_health_checks=DB_CONN_HEALTH_CHECKS and not DB_POOL,
+        )
     }
+    if DB_POOL:
+        DATABASES["default"].setdefault("OPTIONS", {})["pool"] = {
+            "min_size": DB_POOL_MIN_SIZE,
+            "max_size": DB_POOL_MAX_SIZE,
+            "timeout": DB_POOL_TIMEOUT,
+        }
 else:
     DATABASES = {
         "default": {
@@ -146,4 +189,111 @@ STATICFILES_DIRS = [
     BASE_DIR / "static"
 ]
 
-STATIC_ROOT = BASE_DIR / "staticfiles"
\ No newline at end of file
+STATIC_ROOT = BASE_DIR / "staticfiles"
+
+# collectstatic gives every file a content hash in its name and writes gzip
+# and Brotli variants next to it; WhiteNoise serves the hashed names with
+# far-future cache headers. Vite's bundles are resolved through
+# static/dist/manifest.json (see books/vite.py).
+STORAGES = {
+    "default": {
+        "BACKEND": "django.core.files.storage.FileSystemStorage",
+    },
+    "staticfiles": {
+        "BACKEND": "whitenoise.storage.CompressedManifestStaticFilesStorage",
+    },
+}
+
+VITE_MANIFEST_PATH = "dist/manifest.json"
+
+# Caches
+# https://docs.djangoproject.com/en/6.0/topics/cache/
+#
+# All aliases default to per-process LRU memory caches. Point them at a
+# shared backend (file based, Redis, Memcached) through the environment so
+# every worker sees the same entries. The cache hit/miss counters live in
+# "default"; with LocMem, manage.py cache_stats sees only its own counts (and
+# says so) and /books/metrics/ only those of the worker that answered.
+
+CACHES = {
+    "default": {
+        "BACKEND": os.environ.get("CACHE_BACKEND", "django.core.cache.backends.locmem.LocMemCache"),
+        "LOCATION": os.environ.get("CACHE_LOCATION", "default"),
+    },
+    "search": {
+        "BACKEND": os.environ.get("SEARCH_CACHE_BACKEND", "django.core.cache.backends.locmem.LocMemCache"),
+        "LOCATION": os.environ.get("SEARCH_CACHE_LOCATION", "search"),
+        "TIMEOUT": None,
+        "OPTIONS": {
+            "MAX_ENTRIES": int(os.environ.get("SEARCH_CACHE_MAX_ENTRIES", 2000)),
+        },
+    },
+    # {% cache %} fragments. Their keys carry the database version stamps, so
+    # a write makes every worker render afresh; FRAGMENT_CACHE_TTL bounds how
+    # long a fragment can outlive a write that didn't bump its stamp.
+    "template_fragments": {
+        "BACKEND": os.environ.get("FRAGMENT_CACHE_BACKEND", "django.core.cache.backends.locmem.LocMemCache"),
+        "LOCATION": os.environ.get("FRAGMENT_CACHE_LOCATION", "template_fragments"),
+        "OPTIONS": {
+            "MAX_ENTRIES": int(os.environ.get("FRAGMENT_CACHE_MAX_ENTRIES", 20000)),
+        },
+    },
+}
+
+# Seconds a {% cache %} fragment is kept (passed to the tag as fragment_ttl).
+FRAGMENT_CACHE_TTL = int(os.environ.get("FRAGMENT_CACHE_TTL", 600))
+
+# Open Library search results are fresh for SEARCH_CACHE_TTL seconds and then
+# served stale for up to SEARCH_CACHE_STALE_TTL more while being refreshed.
+SEARCH_CACHE_TTL = int(os.environ.get("SEARCH_CACHE_TTL", 600))
+SEARCH_CACHE_STALE_TTL = int(os.environ.get("SEARCH_CACHE_STALE_TTL", 3600))
+
+
+# Open Library client (see books/openlibrary.py)
+
+OPEN_LIBRARY_URL = os.environ.get("OPEN_LIBRARY_URL", "https://openlibrary.org")
+OPEN_LIBRARY_CONNECT_TIMEOUT = float(os.environ.get("OPEN_LIBRARY_CONNECT_TIMEOUT", 3.05))
+OPEN_LIBRARY_READ_TIMEOUT = float(os.environ.get("OPEN_LIBRARY_READ_TIMEOUT", 10))
+OPEN_LIBRARY_MAX_RETRIES = int(os.environ.get("OPEN_LIBRARY_MAX_RETRIES", 2))
+OPEN_LIBRARY_POOL_SIZE = int(os.environ.get("OPEN_LIBRARY_POOL_SIZE", 10))
+
+# Seconds a user's cached friend-id set may live; writes invalidate it early.
+FRIENDS_CACHE_TTL = int(os.environ.get("FRIENDS_CACHE_TTL", 3600))
+
+# Friend activity feed: how many of the newest events are cached per user,
+# and for how many seconds.
+FEED_CACHE_SIZE = int(os.environ.get("FEED_CACHE_SIZE", 100))
+FEED_CACHE_TTL = int(os.environ.get("FEED_CACHE_TTL", 30))
+
+# Cursor pagination for the JSON endpoints: default and maximum page sizes.
+API_PAGE_SIZE = int(os.environ.get("API_PAGE_SIZE", 50))
+API_MAX_PAGE_SIZE = int(os.environ.get("API_MAX_PAGE_SIZE", 200))
+
+# Seconds between full rebuilds of the in-process username search index
+# (used when the database is not PostgreSQL).
+USER_SEARCH_INDEX_MAX_AGE = int(os.environ.get("USER_SEARCH_INDEX_MAX_AGE", 3600))
+
+# Full-text search on SQLite ranks at most this many of the newest matches
+# (see books/search.py).
+SEARCH_RANK_WINDOW = int(os.environ.get("SEARCH_RANK_WINDOW", 2000))
+
+# Cover image proxy: on-disk cache location and size bound, and the hosts
+# whose images it will fetch.
+COVER_CACHE_DIR = Path(os.environ.get("COVER_CACHE_DIR", BASE_DIR / "cover_cache"))
+COVER_CACHE_MAX_BYTES = int(os.environ.get("COVER_CACHE_MAX_BYTES", 200 * 1024 * 1024))
+COVER_PROXY_HOSTS = ("covers.openlibrary.org",)
+
+# Background job queue (see jobs/queue.py): worker threads, seconds between
+# polls when idle, seconds before a running job is presumed abandoned, and
+# the base delay of the exponential retry backoff.
+JOBS_WORKER_THREADS = int(os.environ.get("JOBS_WORKER_THREADS", 4))
+JOBS_POLL_INTERVAL = float(os.environ.get("JOBS_POLL_INTERVAL", 1))
+JOBS_LOCK_TIMEOUT = int(os.environ.get("JOBS_LOCK_TIMEOUT", 600))
+JOBS_RETRY_BACKOFF = int(os.environ.get("JOBS_RETRY_BACKOFF", 10))
+
+# Seconds the reading analytics for a user stay cached; writes to the user's
+# books or notes replace them sooner.
+ANALYTICS_CACHE_TTL = int(os.environ.get("ANALYTICS_CACHE_TTL", 86400))
+
+# Largest number of operations accepted by the batch note endpoint.
+NOTE_BATCH_MAX_OPERATIONS = int(os.environ.get("NOTE_BATCH_MAX_OPERATIONS", 500))
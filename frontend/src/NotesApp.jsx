@@ -2,8 +2,12 @@ import { useEffect, useState } from "react"
 import AddNoteModal from "./AddNoteModal"
 import EditNoteModal from "./EditNoteModal"
 
+// Matches the notes API's default page size (API_PAGE_SIZE).
+const PAGE_SIZE = 50
+
 export default function NotesApp({ bookId }) {
   const [notes, setNotes] = useState([])
+  const [nextCursor, setNextCursor] = useState(null)
   const [editingNote, setEditingNote] = useState(null)
 
   const handleDelete = async (noteId) => {
@@ -35,12 +39,28 @@ export default function NotesApp({ bookId }) {
     }
 
 
+  const fetchNotes = async (cursor) => {
+    const url = cursor
+      ? `/books/api/books/${bookId}/notes/?page_size=${PAGE_SIZE}&cursor=${encodeURIComponent(cursor)}`
+      : `/books/api/books/${bookId}/notes/?page_size=${PAGE_SIZE}`
+    const res = await fetch(url)
+    const data = await res.json()
+    return { notes: data, nextCursor: res.headers.get("X-Next-Cursor") }
+  }
+
   useEffect(() => {
-    fetch(`/books/api/books/${bookId}/notes/`)
-      .then(res => res.json())
-      .then(data => setNotes(data))
+    fetchNotes(null).then(page => {
+      setNotes(page.notes)
+      setNextCursor(page.nextCursor)
+    })
   }, [bookId])
 
+  const handleLoadMore = async () => {
+    const page = await fetchNotes(nextCursor)
+    setNotes(prev => [...prev, ...page.notes])
+    setNextCursor(page.nextCursor)
+  }
+
   const handleNoteAdded = (newNote) => {
     setNotes(prev => [newNote, ...prev])
   }
@@ -65,6 +85,12 @@ export default function NotesApp({ bookId }) {
         </div>
       ))}
 
+      {nextCursor && (
+        <button onClick={handleLoadMore}>
+          Load more
+        </button>
+      )}
+
       {editingNote && (
   <EditNoteModal
     note={editingNote}
@@ -2,13 +2,19 @@ import { defineConfig } from 'vite'
 import react from '@vitejs/plugin-react'
 
 // https://vite.dev/config/
+//
+// Bundles go straight into Django's static/dist/ with hashed names, and
+// manifest.json maps entry sources to them for the vite_tags template tags.
+// Django's static storage serves them under /static/dist/.
 export default defineConfig({
   plugins: [react()],
+  base: '/static/dist/',
   build: {
+    outDir: '../static/dist',
+    emptyOutDir: true,
+    manifest: 'manifest.json',
     rollupOptions: {
-      output: {
-        entryFileNames: 'index.js',
-      }
+      input: 'src/main.jsx',
     }
   }
-})
\ No newline at end of file
+})
@@ -0,0 +1,19 @@
+from django.contrib import admin
+
+from . import queue
+from .models import Job
+
+
+@admin.register(Job)
+class JobAdmin(admin.ModelAdmin):
+    list_display = ("id", "name", "status", "attempts", "max_attempts", "run_after", "locked_by", "finished_at")
+    list_filter = ("status", "name")
+    search_fields = ("name", "locked_by")
+    ordering = ("-id",)
+    readonly_fields = ("created_at", "finished_at", "locked_by", "locked_at", "last_error")
+    actions = ["retry"]
+
+    @admin.action(description="Retry selected dead jobs")
+    def retry(self, request, queryset):
+        count = queue.retry_dead(jobs=queryset)
+        self.message_user(request, f"{count} job(s) requeued.")
@@ -0,0 +1,98 @@
+import signal
+import socket
+import threading
+import time
+import uuid
+from concurrent.futures import ThreadPoolExecutor
+
+from django.conf import settings
+from django.core.management.base import BaseCommand
+from django.db import close_old_connections
+from django.utils.module_loading import autodiscover_modules
+
+from jobs import queue
+
+
+class Command(BaseCommand):
+    help = (
+        "Run background jobs on a thread pool until interrupted. Handlers are "
+        "loaded from each installed app's tasks module."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--threads", type=int, default=getattr(settings, "JOBS_WORKER_THREADS", 4),
+            help="Number of worker threads.",
+        )
+        parser.add_argument(
+            "--poll-interval", type=float, default=getattr(settings, "JOBS_POLL_INTERVAL", 1),
+            help="Seconds to wait between polls when the queue is empty.",
+        )
+        parser.add_argument(
+            "--stats-interval", type=float, default=60,
+            help="Seconds between throughput / queue depth log lines.",
+        )
+        parser.add_argument("--once", action="store_true", help="Drain the due jobs, then exit.")
+
+    def handle(self, *args, **options):
+        autodiscover_modules("tasks")
+
+        threads = options["threads"]
+        stop = threading.Event()
+        signal.signal(signal.SIGTERM, lambda *_: stop.set())
+        worker_prefix = f"{socket.gethostname()}:{uuid.uuid4().hex[:8]}"
+
+        counts = {"done": 0, "failed": 0}
+        counts_lock = threading.Lock()
+
+        def work(job):
+            try:
+                ok = queue.run(job)
+            finally:
+                close_old_connections()
+            with counts_lock:
+                counts["done" if ok else "failed"] += 1
+
+        self.stdout.write(f"Running jobs on {threads} threads ({worker_prefix}). Ctrl-C to stop.")
+        started = last_report = time.monotonic()
+        reported = 0
+        in_flight = set()
+
+        with ThreadPoolExecutor(max_workers=threads) as pool:
+            try:
+                while not stop.is_set():
+                    in_flight = {f for f in in_flight if not f.done()}
+                    free = threads - len(in_flight)
+                    jobs = queue.claim(limit=free, worker_id=worker_prefix) if free else []
+                    close_old_connections()
+                    for job in jobs:
+                        in_flight.add(pool.submit(work, job))
+
+                    now = time.monotonic()
+                    if now - last_report >= options["stats_interval"]:
+                        reported = self.report(counts, reported, now - last_report)
+                        last_report = now
+
+                    if not jobs:
+                        if options["once"] and not in_flight:
+                            break
+                        stop.wait(options["poll_interval"])
+            except KeyboardInterrupt:
+                pass
+            self.stdout.write("Waiting for running jobs to finish...")
+
+        self.report(counts, reported, time.monotonic() - last_report)
+        self.stdout.write(self.style.SUCCESS(
+            f"Stopped after {time.monotonic() - started:.0f}s: "
+            f"{counts['done']} done, {counts['failed']} failed."
+        ))
+
+    def report(self, counts, reported, elapsed):
+        finished = counts["done"] + counts["failed"]
+        rate = (finished - reported) / elapsed if elapsed else 0
+        depth = queue.depth()
+        self.stdout.write(
+            f"{rate:.1f} jobs/s, {counts['done']} done, {counts['failed']} failed; "
+            f"queued {depth['queued']}, running {depth['running']}, dead {depth['dead']}"
+        )
+        return finished
@@ -0,0 +1,155 @@
+"""A small database-backed job queue.
+
+Code registers handlers with ``@task("name")`` (in a ``tasks`` module of any
+installed app) and queues work with ``enqueue("name", {...})``; handlers are
+called with the payload as keyword arguments. ``manage.py run_workers``
+claims due jobs and runs them on a thread pool.
+
+Claiming uses ``SELECT ... FOR UPDATE SKIP LOCKED`` where the database
+supports it (PostgreSQL) so workers never wait on each other. Elsewhere
+(SQLite) a process-wide lock serializes claims, and the claim itself is a
+conditional UPDATE, so two processes can never take the same job.
+
+A failing job is retried with exponential backoff until ``max_attempts``,
+then left in the ``dead`` state with its last error for inspection.
+
+A job still running after ``JOBS_LOCK_TIMEOUT`` is assumed lost with its
+worker and is claimed again. Each claim stamps the job with the worker id
+and the claim time, and a run only records its outcome while both still
+match, so a slow first run that finishes late cannot overwrite the state
+written by the run that took the job over.
+"""
+import logging
+import threading
+import traceback
+import uuid
+from datetime import timedelta
+
+from django.conf import settings
+from django.db import connection, transaction
+from django.db.models import Count
+from django.utils import timezone
+
+from .models import Job
+
+logger = logging.getLogger(__name__)
+
+_registry = {}
+_claim_lock = threading.Lock()
+
+
+def task(name):
+    """Register the decorated function as the handler for ``name``."""
+    def decorator(func):
+        _registry[name] = func
+        return func
+    return decorator
+
+
+def get_handler(name):
+    return _registry.get(name)
+
+
+def enqueue(name, payload=None, delay=0, max_attempts=None):
+    job = Job(name=name, payload=payload or {}, run_after=timezone.now() + timedelta(seconds=delay))
+    if max_attempts is not None:
+        job.max_attempts = max_attempts
+    job.save()
+    return job
+
+
+def claim(limit=1, worker_id=None):
+    """Mark up to ``limit`` due jobs as running and return them."""
+    worker_id = worker_id or uuid.uuid4().hex
+    now = timezone.now()
+    lock_timeout = timedelta(seconds=getattr(settings, "JOBS_LOCK_TIMEOUT", 600))
+
+    # Jobs left running by a worker that died are claimable again.
+    Job.objects.filter(status=Job.RUNNING, locked_at__lt=now - lock_timeout).update(
+        status=Job.QUEUED, locked_by="", locked_at=None,
+    )
+
+    due = Job.objects.filter(status=Job.QUEUED, run_after__lte=now).order_by("run_after", "id")
+
+    if connection.features.has_select_for_update_skip_locked:
+        with transaction.atomic():
+            ids = list(due.select_for_update(skip_locked=True).values_list("id", flat=True)[:limit])
+            _mark_running(ids, worker_id, now)
+    else:
+        with _claim_lock:
+            ids = list(due.values_list("id", flat=True)[:limit])
+            _mark_running(ids, worker_id, now)
+
+    return list(Job.objects.filter(id__in=ids, status=Job.RUNNING, locked_by=worker_id))
+
+
+def _mark_running(ids, worker_id, now):
+    if ids:
+        Job.objects.filter(id__in=ids, status=Job.QUEUED).update(
+            status=Job.RUNNING, locked_by=worker_id, locked_at=now
+        )
+
+
+def run(job):
+    """Run a claimed job and record the outcome. Returns True on success."""
+    handler = get_handler(job.name)
+    attempts = job.attempts + 1
+    try:
+        if handler is None:
+            raise LookupError(f"No handler registered for {job.name!r}")
+        handler(**job.payload)
+    except Exception:
+        if attempts >= job.max_attempts or handler is None:
+            outcome = {"status": Job.DEAD, "finished_at": timezone.now()}
+            logger.error("Job %s dead after %s attempts", job, attempts)
+        else:
+            outcome = {
+                "status": Job.QUEUED,
+                "run_after": timezone.now() + timedelta(seconds=_backoff(attempts)),
+            }
+        _record(job, attempts=attempts, last_error=traceback.format_exc(), **outcome)
+        return False
+
+    _record(job, attempts=attempts, status=Job.DONE, finished_at=timezone.now())
+    return True
+
+
+def _record(job, **fields):
+    """Write a run's outcome unless the job has been claimed again since."""
+    fields.update(locked_by="", locked_at=None)
+    updated = Job.objects.filter(
+        id=job.id, status=Job.RUNNING, locked_by=job.locked_by, locked_at=job.locked_at,
+    ).update(**fields)
+    if not updated:
+        logger.warning("Job %s was reclaimed while running; not recording this run", job)
+        return
+    for name, value in fields.items():
+        setattr(job, name, value)
+
+
+def _backoff(attempts):
+    base = getattr(settings, "JOBS_RETRY_BACKOFF", 10)
+    return base * 2 ** (attempts - 1)
+
+
+def depth():
+    """Return ``{status: count}`` for every job state."""
+    counts = dict(Job.objects.values_list("status").annotate(n=Count("id")).order_by())
+    return {status: counts.get(status, 0) for status, _ in Job.STATUS_CHOICES}
+
+
+def lag():
+    """Seconds the oldest due, queued job has been waiting (0 if none)."""
+    oldest = (
+        Job.objects.filter(status=Job.QUEUED, run_after__lte=timezone.now())
+        .order_by("run_after").values_list("run_after", flat=True).first()
+    )
+    return (timezone.now() - oldest).total_seconds() if oldest else 0
+
+
+def retry_dead(name=None, jobs=None):
+    """Requeue dead jobs (optionally only those named ``name``, or in ``jobs``)."""
+    jobs = (Job.objects.all() if jobs is None else jobs).filter(status=Job.DEAD)
+    if name:
+        jobs = jobs.filter(name=name)
+    return jobs.update(status=Job.QUEUED, attempts=0, run_after=timezone.now(), finished_at=None)
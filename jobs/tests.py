@@ -0,0 +1,162 @@
+from datetime import timedelta
+from unittest import mock
+
+from django.contrib.auth.models import User
+from django.db import connection
+from django.test import TestCase, override_settings
+from django.urls import reverse
+from django.utils import timezone
+
+from . import queue
+from .models import Job
+
+calls = []
+
+
+@queue.task("tests.record")
+def record(**payload):
+    calls.append(payload)
+
+
+@queue.task("tests.fail")
+def fail(**payload):
+    raise RuntimeError("boom")
+
+
+class QueueTestCase(TestCase):
+    def setUp(self):
+        calls.clear()
+
+
+class EnqueueTests(QueueTestCase):
+    def test_enqueue_stores_payload_delay_and_attempts(self):
+        before = timezone.now()
+        job = queue.enqueue("tests.record", {"n": 1}, delay=30, max_attempts=2)
+        job.refresh_from_db()
+        self.assertEqual((job.status, job.payload, job.max_attempts), (Job.QUEUED, {"n": 1}, 2))
+        self.assertGreaterEqual(job.run_after, before + timedelta(seconds=30))
+
+    def test_delayed_jobs_are_not_due(self):
+        queue.enqueue("tests.record", delay=60)
+        self.assertEqual(queue.claim(limit=5), [])
+
+
+class ClaimTests(QueueTestCase):
+    def test_claim_takes_due_jobs_in_order(self):
+        first = queue.enqueue("tests.record")
+        second = queue.enqueue("tests.record")
+        queue.enqueue("tests.record")
+        jobs = queue.claim(limit=2, worker_id="w1")
+        self.assertEqual([job.pk for job in jobs], [first.pk, second.pk])
+        self.assertTrue(all(job.status == Job.RUNNING and job.locked_by == "w1" for job in jobs))
+        self.assertEqual(len(queue.claim(limit=5, worker_id="w2")), 1)
+
+    def test_claimed_jobs_are_not_claimed_twice(self):
+        queue.enqueue("tests.record")
+        self.assertEqual(len(queue.claim(worker_id="w1")), 1)
+        self.assertEqual(queue.claim(worker_id="w2"), [])
+
+    def test_conditional_update_skips_jobs_taken_in_between(self):
+        job = queue.enqueue("tests.record")
+        # Another worker takes the job between our SELECT and UPDATE.
+        Job.objects.filter(pk=job.pk).update(status=Job.RUNNING, locked_by="w1", locked_at=timezone.now())
+        queue._mark_running([job.pk], "w2", timezone.now())
+        self.assertEqual(Job.objects.get(pk=job.pk).locked_by, "w1")
+
+    def test_skip_locked_path(self):
+        # SQLite ignores FOR UPDATE, so this runs the PostgreSQL branch's
+        # code without its row locks.
+        queue.enqueue("tests.record")
+        with mock.patch.object(connection.features, "has_select_for_update_skip_locked", True):
+            self.assertEqual(len(queue.claim(worker_id="w1")), 1)
+            self.assertEqual(queue.claim(worker_id="w2"), [])
+
+    @override_settings(JOBS_LOCK_TIMEOUT=60)
+    def test_stale_running_jobs_are_reclaimed(self):
+        queue.enqueue("tests.record")
+        [job] = queue.claim(worker_id="w1")
+        self.assertEqual(queue.claim(worker_id="w2"), [])
+        Job.objects.filter(pk=job.pk).update(locked_at=timezone.now() - timedelta(seconds=61))
+        self.assertEqual([j.pk for j in queue.claim(worker_id="w2")], [job.pk])
+
+
+class RunTests(QueueTestCase):
+    def claim_one(self, name, **kwargs):
+        queue.enqueue(name, {"n": 1}, **kwargs)
+        [job] = queue.claim(worker_id="w1")
+        return job
+
+    def test_success(self):
+        job = self.claim_one("tests.record")
+        self.assertTrue(queue.run(job))
+        job.refresh_from_db()
+        self.assertEqual((job.status, job.attempts, job.locked_by), (Job.DONE, 1, ""))
+        self.assertIsNotNone(job.finished_at)
+        self.assertEqual(calls, [{"n": 1}])
+
+    @override_settings(JOBS_RETRY_BACKOFF=10)
+    def test_failures_back_off_exponentially(self):
+        job = self.claim_one("tests.fail", max_attempts=5)
+        for attempt, delay in ((1, 10), (2, 20), (3, 40)):
+            before = timezone.now()
+            self.assertFalse(queue.run(job))
+            job.refresh_from_db()
+            self.assertEqual((job.status, job.attempts), (Job.QUEUED, attempt))
+            self.assertIn("RuntimeError: boom", job.last_error)
+            self.assertGreaterEqual(job.run_after, before + timedelta(seconds=delay))
+            self.assertLess(job.run_after, before + timedelta(seconds=delay + 5))
+            Job.objects.filter(pk=job.pk).update(run_after=timezone.now())
+            [job] = queue.claim(worker_id="w1")
+
+    def test_dead_after_max_attempts(self):
+        job = self.claim_one("tests.fail", max_attempts=2)
+        queue.run(job)
+        Job.objects.filter(pk=job.pk).update(run_after=timezone.now())
+        [job] = queue.claim(worker_id="w1")
+        with self.assertLogs("jobs.queue", "ERROR"):
+            self.assertFalse(queue.run(job))
+        job.refresh_from_db()
+        self.assertEqual((job.status, job.attempts), (Job.DEAD, 2))
+        self.assertIsNotNone(job.finished_at)
+
+        self.assertEqual(queue.retry_dead("tests.fail"), 1)
+        job.refresh_from_db()
+        self.assertEqual((job.status, job.attempts), (Job.QUEUED, 0))
+
+    def test_unknown_task_is_dead_at_once(self):
+        job = self.claim_one("tests.missing")
+        with self.assertLogs("jobs.queue", "ERROR"):
+            self.assertFalse(queue.run(job))
+        job.refresh_from_db()
+        self.assertEqual(job.status, Job.DEAD)
+        self.assertIn("No handler registered", job.last_error)
+
+    @override_settings(JOBS_LOCK_TIMEOUT=60)
+    def test_late_finish_of_a_reclaimed_job_is_not_recorded(self):
+        slow = self.claim_one("tests.record")
+        slow.locked_at -= timedelta(seconds=61)
+        Job.objects.filter(pk=slow.pk).update(locked_at=slow.locked_at)
+        # Same worker id, as two threads of one worker process would have.
+        [retry] = queue.claim(worker_id="w1")
+        Job.objects.filter(pk=retry.pk).update(last_error="second run in progress")
+
+        with self.assertLogs("jobs.queue", "WARNING"):
+            queue.run(slow)
+        job = Job.objects.get(pk=slow.pk)
+        self.assertEqual((job.status, job.last_error), (Job.RUNNING, "second run in progress"))
+
+        self.assertTrue(queue.run(retry))
+        self.assertEqual(Job.objects.get(pk=slow.pk).status, Job.DONE)
+
+
+class MetricsTests(QueueTestCase):
+    def test_queue_depth_and_lag_are_exported(self):
+        queue.enqueue("tests.record")
+        Job.objects.update(run_after=timezone.now() - timedelta(seconds=90))
+        queue.enqueue("tests.record", delay=60)
+        self.client.force_login(User.objects.create_user(username="ops", is_staff=True))
+        body = self.client.get(reverse("books:metrics")).content.decode()
+        self.assertIn("booktracker_jobs_queued 2\n", body)
+        self.assertIn("booktracker_jobs_dead 0\n", body)
+        lag = float(body.split("\nbooktracker_jobs_lag_seconds ")[1].split()[0])
+        self.assertGreaterEqual(lag, 90)
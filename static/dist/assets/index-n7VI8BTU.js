@@ -6,4 +6,4 @@
 `+i[a].replace(" at new "," at ");return l.displayName&&S.includes("<anonymous>")&&(S=S.replace("<anonymous>",l.displayName)),S}while(1<=a&&0<=e);break}}}finally{Qn=!1,Error.prepareStackTrace=u}return(u=l?l.displayName||l.name:"")?Eu(u):""}function Uo(l,t){switch(l.tag){case 26:case 27:case 5:return Eu(l.type);case 16:return Eu("Lazy");case 13:return l.child!==t&&t!==null?Eu("Suspense Fallback"):Eu("Suspense");case 19:return Eu("SuspenseList");case 0:case 15:return Zn(l.type,!1);case 11:return Zn(l.type.render,!1);case 1:return Zn(l.type,!0);case 31:return Eu("Activity");default:return""}}function mi(l){try{var t="",u=null;do t+=Uo(l,u),u=l,l=l.return;while(l);return t}catch(a){return`
 Error generating stack: `+a.message+`
 `+a.stack}}var Vn=Object.prototype.hasOwnProperty,Ln=_.unstable_scheduleCallback,Kn=_.unstable_cancelCallback,No=_.unstable_shouldYield,Co=_.unstable_requestPaint,Il=_.unstable_now,Ho=_.unstable_getCurrentPriorityLevel,hi=_.unstable_ImmediatePriority,gi=_.unstable_UserBlockingPriority,Ee=_.unstable_NormalPriority,Ro=_.unstable_LowPriority,Si=_.unstable_IdlePriority,jo=_.log,qo=_.unstable_setDisableYieldValue,Ma=null,Pl=null;function kt(l){if(typeof jo=="function"&&qo(l),Pl&&typeof Pl.setStrictMode=="function")try{Pl.setStrictMode(Ma,l)}catch{}}var lt=Math.clz32?Math.clz32:xo,Bo=Math.log,Yo=Math.LN2;function xo(l){return l>>>=0,l===0?32:31-(Bo(l)/Yo|0)|0}var Ae=256,_e=262144,Oe=4194304;function Au(l){var t=l&42;if(t!==0)return t;switch(l&-l){case 1:return 1;case 2:return 2;case 4:return 4;case 8:return 8;case 16:return 16;case 32:return 32;case 64:return 64;case 128:return 128;case 256:case 512:case 1024:case 2048:case 4096:case 8192:case 16384:case 32768:case 65536:case 131072:return l&261888;case 262144:case 524288:case 1048576:case 2097152:return l&3932160;case 4194304:case 8388608:case 16777216:case 33554432:return l&62914560;case 67108864:return 67108864;case 134217728:return 134217728;case 268435456:return 268435456;case 536870912:return 536870912;case 1073741824:return 0;default:return l}}function pe(l,t,u){var a=l.pendingLanes;if(a===0)return 0;var e=0,n=l.suspendedLanes,f=l.pingedLanes;l=l.warmLanes;var c=a&134217727;return c!==0?(a=c&~n,a!==0?e=Au(a):(f&=c,f!==0?e=Au(f):u||(u=c&~l,u!==0&&(e=Au(u))))):(c=a&~n,c!==0?e=Au(c):f!==0?e=Au(f):u||(u=a&~l,u!==0&&(e=Au(u)))),e===0?0:t!==0&&t!==e&&(t&n)===0&&(n=e&-e,u=t&-t,n>=u||n===32&&(u&4194048)!==0)?t:e}function Da(l,t){return(l.pendingLanes&~(l.suspendedLanes&~l.pingedLanes)&t)===0}function Go(l,t){switch(l){case 1:case 2:case 4:case 8:case 64:return t+250;case 16:case 32:case 128:case 256:case 512:case 1024:case 2048:case 4096:case 8192:case 16384:case 32768:case 65536:case 131072:case 262144:case 524288:case 1048576:case 2097152:return t+5e3;case 4194304:case 8388608:case 16777216:case 33554432:return-1;case 67108864:case 134217728:case 268435456:case 536870912:case 1073741824:return-1;default:return-1}}function bi(){var l=Oe;return Oe<<=1,(Oe&62914560)===0&&(Oe=4194304),l}function Jn(l){for(var t=[],u=0;31>u;u++)t.push(l);return t}function Ua(l,t){l.pendingLanes|=t,t!==268435456&&(l.suspendedLanes=0,l.pingedLanes=0,l.warmLanes=0)}function Xo(l,t,u,a,e,n){var f=l.pendingLanes;l.pendingLanes=u,l.suspendedLanes=0,l.pingedLanes=0,l.warmLanes=0,l.expiredLanes&=u,l.entangledLanes&=u,l.errorRecoveryDisabledLanes&=u,l.shellSuspendCounter=0;var c=l.entanglements,i=l.expirationTimes,m=l.hiddenUpdates;for(u=f&~u;0<u;){var S=31-lt(u),T=1<<S;c[S]=0,i[S]=-1;var h=m[S];if(h!==null)for(m[S]=null,S=0;S<h.length;S++){var g=h[S];g!==null&&(g.lane&=-536870913)}u&=~T}a!==0&&ri(l,a,0),n!==0&&e===0&&l.tag!==0&&(l.suspendedLanes|=n&~(f&~t))}function ri(l,t,u){l.pendingLanes|=t,l.suspendedLanes&=~t;var a=31-lt(t);l.entangledLanes|=t,l.entanglements[a]=l.entanglements[a]|1073741824|u&261930}function zi(l,t){var u=l.entangledLanes|=t;for(l=l.entanglements;u;){var a=31-lt(u),e=1<<a;e&t|l[a]&t&&(l[a]|=t),u&=~e}}function Ti(l,t){var u=t&-t;return u=(u&42)!==0?1:wn(u),(u&(l.suspendedLanes|t))!==0?0:u}function wn(l){switch(l){case 2:l=1;break;case 8:l=4;break;case 32:l=16;break;case 256:case 512:case 1024:case 2048:case 4096:case 8192:case 16384:case 32768:case 65536:case 131072:case 262144:case 524288:case 1048576:case 2097152:case 4194304:case 8388608:case 16777216:case 33554432:l=128;break;case 268435456:l=134217728;break;default:l=0}return l}function Wn(l){return l&=-l,2<l?8<l?(l&134217727)!==0?32:268435456:8:2}function Ei(){var l=O.p;return l!==0?l:(l=window.event,l===void 0?32:co(l.type))}function Ai(l,t){var u=O.p;try{return O.p=l,t()}finally{O.p=u}}var Ft=Math.random().toString(36).slice(2),Nl="__reactFiber$"+Ft,Vl="__reactProps$"+Ft,Zu="__reactContainer$"+Ft,$n="__reactEvents$"+Ft,Qo="__reactListeners$"+Ft,Zo="__reactHandles$"+Ft,_i="__reactResources$"+Ft,Na="__reactMarker$"+Ft;function kn(l){delete l[Nl],delete l[Vl],delete l[$n],delete l[Qo],delete l[Zo]}function Vu(l){var t=l[Nl];if(t)return t;for(var u=l.parentNode;u;){if(t=u[Zu]||u[Nl]){if(u=t.alternate,t.child!==null||u!==null&&u.child!==null)for(l=Kd(l);l!==null;){if(u=l[Nl])return u;l=Kd(l)}return t}l=u,u=l.parentNode}return null}function Lu(l){if(l=l[Nl]||l[Zu]){var t=l.tag;if(t===5||t===6||t===13||t===31||t===26||t===27||t===3)return l}return null}function Ca(l){var t=l.tag;if(t===5||t===26||t===27||t===6)return l.stateNode;throw Error(y(33))}function Ku(l){var t=l[_i];return t||(t=l[_i]={hoistableStyles:new Map,hoistableScripts:new Map}),t}function Dl(l){l[Na]=!0}var Oi=new Set,pi={};function _u(l,t){Ju(l,t),Ju(l+"Capture",t)}function Ju(l,t){for(pi[l]=t,l=0;l<t.length;l++)Oi.add(t[l])}var Vo=RegExp("^[:A-Z_a-z\\u00C0-\\u00D6\\u00D8-\\u00F6\\u00F8-\\u02FF\\u0370-\\u037D\\u037F-\\u1FFF\\u200C-\\u200D\\u2070-\\u218F\\u2C00-\\u2FEF\\u3001-\\uD7FF\\uF900-\\uFDCF\\uFDF0-\\uFFFD][:A-Z_a-z\\u00C0-\\u00D6\\u00D8-\\u00F6\\u00F8-\\u02FF\\u0370-\\u037D\\u037F-\\u1FFF\\u200C-\\u200D\\u2070-\\u218F\\u2C00-\\u2FEF\\u3001-\\uD7FF\\uF900-\\uFDCF\\uFDF0-\\uFFFD\\-.0-9\\u00B7\\u0300-\\u036F\\u203F-\\u2040]*$"),Mi={},Di={};function Lo(l){return Vn.call(Di,l)?!0:Vn.call(Mi,l)?!1:Vo.test(l)?Di[l]=!0:(Mi[l]=!0,!1)}function Me(l,t,u){if(Lo(t))if(u===null)l.removeAttribute(t);else{switch(typeof u){case"undefined":case"function":case"symbol":l.removeAttribute(t);return;case"boolean":var a=t.toLowerCase().slice(0,5);if(a!=="data-"&&a!=="aria-"){l.removeAttribute(t);return}}l.setAttribute(t,""+u)}}function De(l,t,u){if(u===null)l.removeAttribute(t);else{switch(typeof u){case"undefined":case"function":case"symbol":case"boolean":l.removeAttribute(t);return}l.setAttribute(t,""+u)}}function Ct(l,t,u,a){if(a===null)l.removeAttribute(u);else{switch(typeof a){case"undefined":case"function":case"symbol":case"boolean":l.removeAttribute(u);return}l.setAttributeNS(t,u,""+a)}}function st(l){switch(typeof l){case"bigint":case"boolean":case"number":case"string":case"undefined":return l;case"object":return l;default:return""}}function Ui(l){var t=l.type;return(l=l.nodeName)&&l.toLowerCase()==="input"&&(t==="checkbox"||t==="radio")}function Ko(l,t,u){var a=Object.getOwnPropertyDescriptor(l.constructor.prototype,t);if(!l.hasOwnProperty(t)&&typeof a<"u"&&typeof a.get=="function"&&typeof a.set=="function"){var e=a.get,n=a.set;return Object.defineProperty(l,t,{configurable:!0,get:function(){return e.call(this)},set:function(f){u=""+f,n.call(this,f)}}),Object.defineProperty(l,t,{enumerable:a.enumerable}),{getValue:function(){return u},setValue:function(f){u=""+f},stopTracking:function(){l._valueTracker=null,delete l[t]}}}}function Fn(l){if(!l._valueTracker){var t=Ui(l)?"checked":"value";l._valueTracker=Ko(l,t,""+l[t])}}function Ni(l){if(!l)return!1;var t=l._valueTracker;if(!t)return!0;var u=t.getValue(),a="";return l&&(a=Ui(l)?l.checked?"true":"false":l.value),l=a,l!==u?(t.setValue(l),!0):!1}function Ue(l){if(l=l||(typeof document<"u"?document:void 0),typeof l>"u")return null;try{return l.activeElement||l.body}catch{return l.body}}var Jo=/[\n"\\]/g;function dt(l){return l.replace(Jo,function(t){return"\\"+t.charCodeAt(0).toString(16)+" "})}function In(l,t,u,a,e,n,f,c){l.name="",f!=null&&typeof f!="function"&&typeof f!="symbol"&&typeof f!="boolean"?l.type=f:l.removeAttribute("type"),t!=null?f==="number"?(t===0&&l.value===""||l.value!=t)&&(l.value=""+st(t)):l.value!==""+st(t)&&(l.value=""+st(t)):f!=="submit"&&f!=="reset"||l.removeAttribute("value"),t!=null?Pn(l,f,st(t)):u!=null?Pn(l,f,st(u)):a!=null&&l.removeAttribute("value"),e==null&&n!=null&&(l.defaultChecked=!!n),e!=null&&(l.checked=e&&typeof e!="function"&&typeof e!="symbol"),c!=null&&typeof c!="function"&&typeof c!="symbol"&&typeof c!="boolean"?l.name=""+st(c):l.removeAttribute("name")}function Ci(l,t,u,a,e,n,f,c){if(n!=null&&typeof n!="function"&&typeof n!="symbol"&&typeof n!="boolean"&&(l.type=n),t!=null||u!=null){if(!(n!=="submit"&&n!=="reset"||t!=null)){Fn(l);return}u=u!=null?""+st(u):"",t=t!=null?""+st(t):u,c||t===l.value||(l.value=t),l.defaultValue=t}a=a??e,a=typeof a!="function"&&typeof a!="symbol"&&!!a,l.checked=c?l.checked:!!a,l.defaultChecked=!!a,f!=null&&typeof f!="function"&&typeof f!="symbol"&&typeof f!="boolean"&&(l.name=f),Fn(l)}function Pn(l,t,u){t==="number"&&Ue(l.ownerDocument)===l||l.defaultValue===""+u||(l.defaultValue=""+u)}function wu(l,t,u,a){if(l=l.options,t){t={};for(var e=0;e<u.length;e++)t["$"+u[e]]=!0;for(u=0;u<l.length;u++)e=t.hasOwnProperty("$"+l[u].value),l[u].selected!==e&&(l[u].selected=e),e&&a&&(l[u].defaultSelected=!0)}else{for(u=""+st(u),t=null,e=0;e<l.length;e++){if(l[e].value===u){l[e].selected=!0,a&&(l[e].defaultSelected=!0);return}t!==null||l[e].disabled||(t=l[e])}t!==null&&(t.selected=!0)}}function Hi(l,t,u){if(t!=null&&(t=""+st(t),t!==l.value&&(l.value=t),u==null)){l.defaultValue!==t&&(l.defaultValue=t);return}l.defaultValue=u!=null?""+st(u):""}function Ri(l,t,u,a){if(t==null){if(a!=null){if(u!=null)throw Error(y(92));if(rt(a)){if(1<a.length)throw Error(y(93));a=a[0]}u=a}u==null&&(u=""),t=u}u=st(t),l.defaultValue=u,a=l.textContent,a===u&&a!==""&&a!==null&&(l.value=a),Fn(l)}function Wu(l,t){if(t){var u=l.firstChild;if(u&&u===l.lastChild&&u.nodeType===3){u.nodeValue=t;return}}l.textContent=t}var wo=new Set("animationIterationCount aspectRatio borderImageOutset borderImageSlice borderImageWidth boxFlex boxFlexGroup boxOrdinalGroup columnCount columns flex flexGrow flexPositive flexShrink flexNegative flexOrder gridArea gridRow gridRowEnd gridRowSpan gridRowStart gridColumn gridColumnEnd gridColumnSpan gridColumnStart fontWeight lineClamp lineHeight opacity order orphans scale tabSize widows zIndex zoom fillOpacity floodOpacity stopOpacity strokeDasharray strokeDashoffset strokeMiterlimit strokeOpacity strokeWidth MozAnimationIterationCount MozBoxFlex MozBoxFlexGroup MozLineClamp msAnimationIterationCount msFlex msZoom msFlexGrow msFlexNegative msFlexOrder msFlexPositive msFlexShrink msGridColumn msGridColumnSpan msGridRow msGridRowSpan WebkitAnimationIterationCount WebkitBoxFlex WebKitBoxFlexGroup WebkitBoxOrdinalGroup WebkitColumnCount WebkitColumns WebkitFlex WebkitFlexGrow WebkitFlexPositive WebkitFlexShrink WebkitLineClamp".split(" "));function ji(l,t,u){var a=t.indexOf("--")===0;u==null||typeof u=="boolean"||u===""?a?l.setProperty(t,""):t==="float"?l.cssFloat="":l[t]="":a?l.setProperty(t,u):typeof u!="number"||u===0||wo.has(t)?t==="float"?l.cssFloat=u:l[t]=(""+u).trim():l[t]=u+"px"}function qi(l,t,u){if(t!=null&&typeof t!="object")throw Error(y(62));if(l=l.style,u!=null){for(var a in u)!u.hasOwnProperty(a)||t!=null&&t.hasOwnProperty(a)||(a.indexOf("--")===0?l.setProperty(a,""):a==="float"?l.cssFloat="":l[a]="");for(var e in t)a=t[e],t.hasOwnProperty(e)&&u[e]!==a&&ji(l,e,a)}else for(var n in t)t.hasOwnProperty(n)&&ji(l,n,t[n])}function lf(l){if(l.indexOf("-")===-1)return!1;switch(l){case"annotation-xml":case"color-profile":case"font-face":case"font-face-src":case"font-face-uri":case"font-face-format":case"font-face-name":case"missing-glyph":return!1;default:return!0}}var Wo=new Map([["acceptCharset","accept-charset"],["htmlFor","for"],["httpEquiv","http-equiv"],["crossOrigin","crossorigin"],["accentHeight","accent-height"],["alignmentBaseline","alignment-baseline"],["arabicForm","arabic-form"],["baselineShift","baseline-shift"],["capHeight","cap-height"],["clipPath","clip-path"],["clipRule","clip-rule"],["colorInterpolation","color-interpolation"],["colorInterpolationFilters","color-interpolation-filters"],["colorProfile","color-profile"],["colorRendering","color-rendering"],["dominantBaseline","dominant-baseline"],["enableBackground","enable-background"],["fillOpacity","fill-opacity"],["fillRule","fill-rule"],["floodColor","flood-color"],["floodOpacity","flood-opacity"],["fontFamily","font-family"],["fontSize","font-size"],["fontSizeAdjust","font-size-adjust"],["fontStretch","font-stretch"],["fontStyle","font-style"],["fontVariant","font-variant"],["fontWeight","font-weight"],["glyphName","glyph-name"],["glyphOrientationHorizontal","glyph-orientation-horizontal"],["glyphOrientationVertical","glyph-orientation-vertical"],["horizAdvX","horiz-adv-x"],["horizOriginX","horiz-origin-x"],["imageRendering","image-rendering"],["letterSpacing","letter-spacing"],["lightingColor","lighting-color"],["markerEnd","marker-end"],["markerMid","marker-mid"],["markerStart","marker-start"],["overlinePosition","overline-position"],["overlineThickness","overline-thickness"],["paintOrder","paint-order"],["panose-1","panose-1"],["pointerEvents","pointer-events"],["renderingIntent","rendering-intent"],["shapeRendering","shape-rendering"],["stopColor","stop-color"],["stopOpacity","stop-opacity"],["strikethroughPosition","strikethrough-position"],["strikethroughThickness","strikethrough-thickness"],["strokeDasharray","stroke-dasharray"],["strokeDashoffset","stroke-dashoffset"],["strokeLinecap","stroke-linecap"],["strokeLinejoin","stroke-linejoin"],["strokeMiterlimit","stroke-miterlimit"],["strokeOpacity","stroke-opacity"],["strokeWidth","stroke-width"],["textAnchor","text-anchor"],["textDecoration","text-decoration"],["textRendering","text-rendering"],["transformOrigin","transform-origin"],["underlinePosition","underline-position"],["underlineThickness","underline-thickness"],["unicodeBidi","unicode-bidi"],["unicodeRange","unicode-range"],["unitsPerEm","units-per-em"],["vAlphabetic","v-alphabetic"],["vHanging","v-hanging"],["vIdeographic","v-ideographic"],["vMathematical","v-mathematical"],["vectorEffect","vector-effect"],["vertAdvY","vert-adv-y"],["vertOriginX","vert-origin-x"],["vertOriginY","vert-origin-y"],["wordSpacing","word-spacing"],["writingMode","writing-mode"],["xmlnsXlink","xmlns:xlink"],["xHeight","x-height"]]),$o=/^[\u0000-\u001F ]*j[\r\n\t]*a[\r\n\t]*v[\r\n\t]*a[\r\n\t]*s[\r\n\t]*c[\r\n\t]*r[\r\n\t]*i[\r\n\t]*p[\r\n\t]*t[\r\n\t]*:/i;function Ne(l){return $o.test(""+l)?"javascript:throw new Error('React has blocked a javascript: URL as a security precaution.')":l}function Ht(){}var tf=null;function uf(l){return l=l.target||l.srcElement||window,l.correspondingUseElement&&(l=l.correspondingUseElement),l.nodeType===3?l.parentNode:l}var $u=null,ku=null;function Bi(l){var t=Lu(l);if(t&&(l=t.stateNode)){var u=l[Vl]||null;l:switch(l=t.stateNode,t.type){case"input":if(In(l,u.value,u.defaultValue,u.defaultValue,u.checked,u.defaultChecked,u.type,u.name),t=u.name,u.type==="radio"&&t!=null){for(u=l;u.parentNode;)u=u.parentNode;for(u=u.querySelectorAll('input[name="'+dt(""+t)+'"][type="radio"]'),t=0;t<u.length;t++){var a=u[t];if(a!==l&&a.form===l.form){var e=a[Vl]||null;if(!e)throw Error(y(90));In(a,e.value,e.defaultValue,e.defaultValue,e.checked,e.defaultChecked,e.type,e.name)}}for(t=0;t<u.length;t++)a=u[t],a.form===l.form&&Ni(a)}break l;case"textarea":Hi(l,u.value,u.defaultValue);break l;case"select":t=u.value,t!=null&&wu(l,!!u.multiple,t,!1)}}}var af=!1;function Yi(l,t,u){if(af)return l(t,u);af=!0;try{var a=l(t);return a}finally{if(af=!1,($u!==null||ku!==null)&&(bn(),$u&&(t=$u,l=ku,ku=$u=null,Bi(t),l)))for(t=0;t<l.length;t++)Bi(l[t])}}function Ha(l,t){var u=l.stateNode;if(u===null)return null;var a=u[Vl]||null;if(a===null)return null;u=a[t];l:switch(t){case"onClick":case"onClickCapture":case"onDoubleClick":case"onDoubleClickCapture":case"onMouseDown":case"onMouseDownCapture":case"onMouseMove":case"onMouseMoveCapture":case"onMouseUp":case"onMouseUpCapture":case"onMouseEnter":(a=!a.disabled)||(l=l.type,a=!(l==="button"||l==="input"||l==="select"||l==="textarea")),l=!a;break l;default:l=!1}if(l)return null;if(u&&typeof u!="function")throw Error(y(231,t,typeof u));return u}var Rt=!(typeof window>"u"||typeof window.document>"u"||typeof window.document.createElement>"u"),ef=!1;if(Rt)try{var Ra={};Object.defineProperty(Ra,"passive",{get:function(){ef=!0}}),window.addEventListener("test",Ra,Ra),window.removeEventListener("test",Ra,Ra)}catch{ef=!1}var It=null,nf=null,Ce=null;function xi(){if(Ce)return Ce;var l,t=nf,u=t.length,a,e="value"in It?It.value:It.textContent,n=e.length;for(l=0;l<u&&t[l]===e[l];l++);var f=u-l;for(a=1;a<=f&&t[u-a]===e[n-a];a++);return Ce=e.slice(l,1<a?1-a:void 0)}function He(l){var t=l.keyCode;return"charCode"in l?(l=l.charCode,l===0&&t===13&&(l=13)):l=t,l===10&&(l=13),32<=l||l===13?l:0}function Re(){return!0}function Gi(){return!1}function Ll(l){function t(u,a,e,n,f){this._reactName=u,this._targetInst=e,this.type=a,this.nativeEvent=n,this.target=f,this.currentTarget=null;for(var c in l)l.hasOwnProperty(c)&&(u=l[c],this[c]=u?u(n):n[c]);return this.isDefaultPrevented=(n.defaultPrevented!=null?n.defaultPrevented:n.returnValue===!1)?Re:Gi,this.isPropagationStopped=Gi,this}return M(t.prototype,{preventDefault:function(){this.defaultPrevented=!0;var u=this.nativeEvent;u&&(u.preventDefault?u.preventDefault():typeof u.returnValue!="unknown"&&(u.returnValue=!1),this.isDefaultPrevented=Re)},stopPropagation:function(){var u=this.nativeEvent;u&&(u.stopPropagation?u.stopPropagation():typeof u.cancelBubble!="unknown"&&(u.cancelBubble=!0),this.isPropagationStopped=Re)},persist:function(){},isPersistent:Re}),t}var Ou={eventPhase:0,bubbles:0,cancelable:0,timeStamp:function(l){return l.timeStamp||Date.now()},defaultPrevented:0,isTrusted:0},je=Ll(Ou),ja=M({},Ou,{view:0,detail:0}),ko=Ll(ja),ff,cf,qa,qe=M({},ja,{screenX:0,screenY:0,clientX:0,clientY:0,pageX:0,pageY:0,ctrlKey:0,shiftKey:0,altKey:0,metaKey:0,getModifierState:df,button:0,buttons:0,relatedTarget:function(l){return l.relatedTarget===void 0?l.fromElement===l.srcElement?l.toElement:l.fromElement:l.relatedTarget},movementX:function(l){return"movementX"in l?l.movementX:(l!==qa&&(qa&&l.type==="mousemove"?(ff=l.screenX-qa.screenX,cf=l.screenY-qa.screenY):cf=ff=0,qa=l),ff)},movementY:function(l){return"movementY"in l?l.movementY:cf}}),Xi=Ll(qe),Fo=M({},qe,{dataTransfer:0}),Io=Ll(Fo),Po=M({},ja,{relatedTarget:0}),sf=Ll(Po),ly=M({},Ou,{animationName:0,elapsedTime:0,pseudoElement:0}),ty=Ll(ly),uy=M({},Ou,{clipboardData:function(l){return"clipboardData"in l?l.clipboardData:window.clipboardData}}),ay=Ll(uy),ey=M({},Ou,{data:0}),Qi=Ll(ey),ny={Esc:"Escape",Spacebar:" ",Left:"ArrowLeft",Up:"ArrowUp",Right:"ArrowRight",Down:"ArrowDown",Del:"Delete",Win:"OS",Menu:"ContextMenu",Apps:"ContextMenu",Scroll:"ScrollLock",MozPrintableKey:"Unidentified"},fy={8:"Backspace",9:"Tab",12:"Clear",13:"Enter",16:"Shift",17:"Control",18:"Alt",19:"Pause",20:"CapsLock",27:"Escape",32:" ",33:"PageUp",34:"PageDown",35:"End",36:"Home",37:"ArrowLeft",38:"ArrowUp",39:"ArrowRight",40:"ArrowDown",45:"Insert",46:"Delete",112:"F1",113:"F2",114:"F3",115:"F4",116:"F5",117:"F6",118:"F7",119:"F8",120:"F9",121:"F10",122:"F11",123:"F12",144:"NumLock",145:"ScrollLock",224:"Meta"},cy={Alt:"altKey",Control:"ctrlKey",Meta:"metaKey",Shift:"shiftKey"};function iy(l){var t=this.nativeEvent;return t.getModifierState?t.getModifierState(l):(l=cy[l])?!!t[l]:!1}function df(){return iy}var sy=M({},ja,{key:function(l){if(l.key){var t=ny[l.key]||l.key;if(t!=="Unidentified")return t}return l.type==="keypress"?(l=He(l),l===13?"Enter":String.fromCharCode(l)):l.type==="keydown"||l.type==="keyup"?fy[l.keyCode]||"Unidentified":""},code:0,location:0,ctrlKey:0,shiftKey:0,altKey:0,metaKey:0,repeat:0,locale:0,getModifierState:df,charCode:function(l){return l.type==="keypress"?He(l):0},keyCode:function(l){return l.type==="keydown"||l.type==="keyup"?l.keyCode:0},which:function(l){return l.type==="keypress"?He(l):l.type==="keydown"||l.type==="keyup"?l.keyCode:0}}),dy=Ll(sy),oy=M({},qe,{pointerId:0,width:0,height:0,pressure:0,tangentialPressure:0,tiltX:0,tiltY:0,twist:0,pointerType:0,isPrimary:0}),Zi=Ll(oy),yy=M({},ja,{touches:0,targetTouches:0,changedTouches:0,altKey:0,metaKey:0,ctrlKey:0,shiftKey:0,getModifierState:df}),vy=Ll(yy),my=M({},Ou,{propertyName:0,elapsedTime:0,pseudoElement:0}),hy=Ll(my),gy=M({},qe,{deltaX:function(l){return"deltaX"in l?l.deltaX:"wheelDeltaX"in l?-l.wheelDeltaX:0},deltaY:function(l){return"deltaY"in l?l.deltaY:"wheelDeltaY"in l?-l.wheelDeltaY:"wheelDelta"in l?-l.wheelDelta:0},deltaZ:0,deltaMode:0}),Sy=Ll(gy),by=M({},Ou,{newState:0,oldState:0}),ry=Ll(by),zy=[9,13,27,32],of=Rt&&"CompositionEvent"in window,Ba=null;Rt&&"documentMode"in document&&(Ba=document.documentMode);var Ty=Rt&&"TextEvent"in window&&!Ba,Vi=Rt&&(!of||Ba&&8<Ba&&11>=Ba),Li=" ",Ki=!1;function Ji(l,t){switch(l){case"keyup":return zy.indexOf(t.keyCode)!==-1;case"keydown":return t.keyCode!==229;case"keypress":case"mousedown":case"focusout":return!0;default:return!1}}function wi(l){return l=l.detail,typeof l=="object"&&"data"in l?l.data:null}var Fu=!1;function Ey(l,t){switch(l){case"compositionend":return wi(t);case"keypress":return t.which!==32?null:(Ki=!0,Li);case"textInput":return l=t.data,l===Li&&Ki?null:l;default:return null}}function Ay(l,t){if(Fu)return l==="compositionend"||!of&&Ji(l,t)?(l=xi(),Ce=nf=It=null,Fu=!1,l):null;switch(l){case"paste":return null;case"keypress":if(!(t.ctrlKey||t.altKey||t.metaKey)||t.ctrlKey&&t.altKey){if(t.char&&1<t.char.length)return t.char;if(t.which)return String.fromCharCode(t.which)}return null;case"compositionend":return Vi&&t.locale!=="ko"?null:t.data;default:return null}}var _y={color:!0,date:!0,datetime:!0,"datetime-local":!0,email:!0,month:!0,number:!0,password:!0,range:!0,search:!0,tel:!0,text:!0,time:!0,url:!0,week:!0};function Wi(l){var t=l&&l.nodeName&&l.nodeName.toLowerCase();return t==="input"?!!_y[l.type]:t==="textarea"}function $i(l,t,u,a){$u?ku?ku.push(a):ku=[a]:$u=a,t=On(t,"onChange"),0<t.length&&(u=new je("onChange","change",null,u,a),l.push({event:u,listeners:t}))}var Ya=null,xa=null;function Oy(l){Cd(l,0)}function Be(l){var t=Ca(l);if(Ni(t))return l}function ki(l,t){if(l==="change")return t}var Fi=!1;if(Rt){var yf;if(Rt){var vf="oninput"in document;if(!vf){var Ii=document.createElement("div");Ii.setAttribute("oninput","return;"),vf=typeof Ii.oninput=="function"}yf=vf}else yf=!1;Fi=yf&&(!document.documentMode||9<document.documentMode)}function Pi(){Ya&&(Ya.detachEvent("onpropertychange",l0),xa=Ya=null)}function l0(l){if(l.propertyName==="value"&&Be(xa)){var t=[];$i(t,xa,l,uf(l)),Yi(Oy,t)}}function py(l,t,u){l==="focusin"?(Pi(),Ya=t,xa=u,Ya.attachEvent("onpropertychange",l0)):l==="focusout"&&Pi()}function My(l){if(l==="selectionchange"||l==="keyup"||l==="keydown")return Be(xa)}function Dy(l,t){if(l==="click")return Be(t)}function Uy(l,t){if(l==="input"||l==="change")return Be(t)}function Ny(l,t){return l===t&&(l!==0||1/l===1/t)||l!==l&&t!==t}var tt=typeof Object.is=="function"?Object.is:Ny;function Ga(l,t){if(tt(l,t))return!0;if(typeof l!="object"||l===null||typeof t!="object"||t===null)return!1;var u=Object.keys(l),a=Object.keys(t);if(u.length!==a.length)return!1;for(a=0;a<u.length;a++){var e=u[a];if(!Vn.call(t,e)||!tt(l[e],t[e]))return!1}return!0}function t0(l){for(;l&&l.firstChild;)l=l.firstChild;return l}function u0(l,t){var u=t0(l);l=0;for(var a;u;){if(u.nodeType===3){if(a=l+u.textContent.length,l<=t&&a>=t)return{node:u,offset:t-l};l=a}l:{for(;u;){if(u.nextSibling){u=u.nextSibling;break l}u=u.parentNode}u=void 0}u=t0(u)}}function a0(l,t){return l&&t?l===t?!0:l&&l.nodeType===3?!1:t&&t.nodeType===3?a0(l,t.parentNode):"contains"in l?l.contains(t):l.compareDocumentPosition?!!(l.compareDocumentPosition(t)&16):!1:!1}function e0(l){l=l!=null&&l.ownerDocument!=null&&l.ownerDocument.defaultView!=null?l.ownerDocument.defaultView:window;for(var t=Ue(l.document);t instanceof l.HTMLIFrameElement;){try{var u=typeof t.contentWindow.location.href=="string"}catch{u=!1}if(u)l=t.contentWindow;else break;t=Ue(l.document)}return t}function mf(l){var t=l&&l.nodeName&&l.nodeName.toLowerCase();return t&&(t==="input"&&(l.type==="text"||l.type==="search"||l.type==="tel"||l.type==="url"||l.type==="password")||t==="textarea"||l.contentEditable==="true")}var Cy=Rt&&"documentMode"in document&&11>=document.documentMode,Iu=null,hf=null,Xa=null,gf=!1;function n0(l,t,u){var a=u.window===u?u.document:u.nodeType===9?u:u.ownerDocument;gf||Iu==null||Iu!==Ue(a)||(a=Iu,"selectionStart"in a&&mf(a)?a={start:a.selectionStart,end:a.selectionEnd}:(a=(a.ownerDocument&&a.ownerDocument.defaultView||window).getSelection(),a={anchorNode:a.anchorNode,anchorOffset:a.anchorOffset,focusNode:a.focusNode,focusOffset:a.focusOffset}),Xa&&Ga(Xa,a)||(Xa=a,a=On(hf,"onSelect"),0<a.length&&(t=new je("onSelect","select",null,t,u),l.push({event:t,listeners:a}),t.target=Iu)))}function pu(l,t){var u={};return u[l.toLowerCase()]=t.toLowerCase(),u["Webkit"+l]="webkit"+t,u["Moz"+l]="moz"+t,u}var Pu={animationend:pu("Animation","AnimationEnd"),animationiteration:pu("Animation","AnimationIteration"),animationstart:pu("Animation","AnimationStart"),transitionrun:pu("Transition","TransitionRun"),transitionstart:pu("Transition","TransitionStart"),transitioncancel:pu("Transition","TransitionCancel"),transitionend:pu("Transition","TransitionEnd")},Sf={},f0={};Rt&&(f0=document.createElement("div").style,"AnimationEvent"in window||(delete Pu.animationend.animation,delete Pu.animationiteration.animation,delete Pu.animationstart.animation),"TransitionEvent"in window||delete Pu.transitionend.transition);function Mu(l){if(Sf[l])return Sf[l];if(!Pu[l])return l;var t=Pu[l],u;for(u in t)if(t.hasOwnProperty(u)&&u in f0)return Sf[l]=t[u];return l}var c0=Mu("animationend"),i0=Mu("animationiteration"),s0=Mu("animationstart"),Hy=Mu("transitionrun"),Ry=Mu("transitionstart"),jy=Mu("transitioncancel"),d0=Mu("transitionend"),o0=new Map,bf="abort auxClick beforeToggle cancel canPlay canPlayThrough click close contextMenu copy cut drag dragEnd dragEnter dragExit dragLeave dragOver dragStart drop durationChange emptied encrypted ended error gotPointerCapture input invalid keyDown keyPress keyUp load loadedData loadedMetadata loadStart lostPointerCapture mouseDown mouseMove mouseOut mouseOver mouseUp paste pause play playing pointerCancel pointerDown pointerMove pointerOut pointerOver pointerUp progress rateChange reset resize seeked seeking stalled submit suspend timeUpdate touchCancel touchEnd touchStart volumeChange scroll toggle touchMove waiting wheel".split(" ");bf.push("scrollEnd");function zt(l,t){o0.set(l,t),_u(t,[l])}var Ye=typeof reportError=="function"?reportError:function(l){if(typeof window=="object"&&typeof window.ErrorEvent=="function"){var t=new window.ErrorEvent("error",{bubbles:!0,cancelable:!0,message:typeof l=="object"&&l!==null&&typeof l.message=="string"?String(l.message):String(l),error:l});if(!window.dispatchEvent(t))return}else if(typeof process=="object"&&typeof process.emit=="function"){process.emit("uncaughtException",l);return}console.error(l)},ot=[],la=0,rf=0;function xe(){for(var l=la,t=rf=la=0;t<l;){var u=ot[t];ot[t++]=null;var a=ot[t];ot[t++]=null;var e=ot[t];ot[t++]=null;var n=ot[t];if(ot[t++]=null,a!==null&&e!==null){var f=a.pending;f===null?e.next=e:(e.next=f.next,f.next=e),a.pending=e}n!==0&&y0(u,e,n)}}function Ge(l,t,u,a){ot[la++]=l,ot[la++]=t,ot[la++]=u,ot[la++]=a,rf|=a,l.lanes|=a,l=l.alternate,l!==null&&(l.lanes|=a)}function zf(l,t,u,a){return Ge(l,t,u,a),Xe(l)}function Du(l,t){return Ge(l,null,null,t),Xe(l)}function y0(l,t,u){l.lanes|=u;var a=l.alternate;a!==null&&(a.lanes|=u);for(var e=!1,n=l.return;n!==null;)n.childLanes|=u,a=n.alternate,a!==null&&(a.childLanes|=u),n.tag===22&&(l=n.stateNode,l===null||l._visibility&1||(e=!0)),l=n,n=n.return;return l.tag===3?(n=l.stateNode,e&&t!==null&&(e=31-lt(u),l=n.hiddenUpdates,a=l[e],a===null?l[e]=[t]:a.push(t),t.lane=u|536870912),n):null}function Xe(l){if(50<ie)throw ie=0,Uc=null,Error(y(185));for(var t=l.return;t!==null;)l=t,t=l.return;return l.tag===3?l.stateNode:null}var ta={};function qy(l,t,u,a){this.tag=l,this.key=u,this.sibling=this.child=this.return=this.stateNode=this.type=this.elementType=null,this.index=0,this.refCleanup=this.ref=null,this.pendingProps=t,this.dependencies=this.memoizedState=this.updateQueue=this.memoizedProps=null,this.mode=a,this.subtreeFlags=this.flags=0,this.deletions=null,this.childLanes=this.lanes=0,this.alternate=null}function ut(l,t,u,a){return new qy(l,t,u,a)}function Tf(l){return l=l.prototype,!(!l||!l.isReactComponent)}function jt(l,t){var u=l.alternate;return u===null?(u=ut(l.tag,t,l.key,l.mode),u.elementType=l.elementType,u.type=l.type,u.stateNode=l.stateNode,u.alternate=l,l.alternate=u):(u.pendingProps=t,u.type=l.type,u.flags=0,u.subtreeFlags=0,u.deletions=null),u.flags=l.flags&65011712,u.childLanes=l.childLanes,u.lanes=l.lanes,u.child=l.child,u.memoizedProps=l.memoizedProps,u.memoizedState=l.memoizedState,u.updateQueue=l.updateQueue,t=l.dependencies,u.dependencies=t===null?null:{lanes:t.lanes,firstContext:t.firstContext},u.sibling=l.sibling,u.index=l.index,u.ref=l.ref,u.refCleanup=l.refCleanup,u}function v0(l,t){l.flags&=65011714;var u=l.alternate;return u===null?(l.childLanes=0,l.lanes=t,l.child=null,l.subtreeFlags=0,l.memoizedProps=null,l.memoizedState=null,l.updateQueue=null,l.dependencies=null,l.stateNode=null):(l.childLanes=u.childLanes,l.lanes=u.lanes,l.child=u.child,l.subtreeFlags=0,l.deletions=null,l.memoizedProps=u.memoizedProps,l.memoizedState=u.memoizedState,l.updateQueue=u.updateQueue,l.type=u.type,t=u.dependencies,l.dependencies=t===null?null:{lanes:t.lanes,firstContext:t.firstContext}),l}function Qe(l,t,u,a,e,n){var f=0;if(a=l,typeof l=="function")Tf(l)&&(f=1);else if(typeof l=="string")f=Xv(l,u,N.current)?26:l==="html"||l==="head"||l==="body"?27:5;else l:switch(l){case _t:return l=ut(31,u,t,e),l.elementType=_t,l.lanes=n,l;case gl:return Uu(u.children,e,n,t);case kl:f=8,e|=24;break;case Fl:return l=ut(12,u,t,e|2),l.elementType=Fl,l.lanes=n,l;case At:return l=ut(13,u,t,e),l.elementType=At,l.lanes=n,l;case Xl:return l=ut(19,u,t,e),l.elementType=Xl,l.lanes=n,l;default:if(typeof l=="object"&&l!==null)switch(l.$$typeof){case ql:f=10;break l;case $t:f=9;break l;case it:f=11;break l;case $:f=14;break l;case Ql:f=16,a=null;break l}f=29,u=Error(y(130,l===null?"null":typeof l,"")),a=null}return t=ut(f,u,t,e),t.elementType=l,t.type=a,t.lanes=n,t}function Uu(l,t,u,a){return l=ut(7,l,a,t),l.lanes=u,l}function Ef(l,t,u){return l=ut(6,l,null,t),l.lanes=u,l}function m0(l){var t=ut(18,null,null,0);return t.stateNode=l,t}function Af(l,t,u){return t=ut(4,l.children!==null?l.children:[],l.key,t),t.lanes=u,t.stateNode={containerInfo:l.containerInfo,pendingChildren:null,implementation:l.implementation},t}var h0=new WeakMap;function yt(l,t){if(typeof l=="object"&&l!==null){var u=h0.get(l);return u!==void 0?u:(t={value:l,source:t,stack:mi(t)},h0.set(l,t),t)}return{value:l,source:t,stack:mi(t)}}var ua=[],aa=0,Ze=null,Qa=0,vt=[],mt=0,Pt=null,pt=1,Mt="";function qt(l,t){ua[aa++]=Qa,ua[aa++]=Ze,Ze=l,Qa=t}function g0(l,t,u){vt[mt++]=pt,vt[mt++]=Mt,vt[mt++]=Pt,Pt=l;var a=pt;l=Mt;var e=32-lt(a)-1;a&=~(1<<e),u+=1;var n=32-lt(t)+e;if(30<n){var f=e-e%5;n=(a&(1<<f)-1).toString(32),a>>=f,e-=f,pt=1<<32-lt(t)+e|u<<e|a,Mt=n+l}else pt=1<<n|u<<e|a,Mt=l}function _f(l){l.return!==null&&(qt(l,1),g0(l,1,0))}function Of(l){for(;l===Ze;)Ze=ua[--aa],ua[aa]=null,Qa=ua[--aa],ua[aa]=null;for(;l===Pt;)Pt=vt[--mt],vt[mt]=null,Mt=vt[--mt],vt[mt]=null,pt=vt[--mt],vt[mt]=null}function S0(l,t){vt[mt++]=pt,vt[mt++]=Mt,vt[mt++]=Pt,pt=t.id,Mt=t.overflow,Pt=l}var Cl=null,yl=null,k=!1,lu=null,ht=!1,pf=Error(y(519));function tu(l){var t=Error(y(418,1<arguments.length&&arguments[1]!==void 0&&arguments[1]?"text":"HTML",""));throw Za(yt(t,l)),pf}function b0(l){var t=l.stateNode,u=l.type,a=l.memoizedProps;switch(t[Nl]=l,t[Vl]=a,u){case"dialog":J("cancel",t),J("close",t);break;case"iframe":case"object":case"embed":J("load",t);break;case"video":case"audio":for(u=0;u<de.length;u++)J(de[u],t);break;case"source":J("error",t);break;case"img":case"image":case"link":J("error",t),J("load",t);break;case"details":J("toggle",t);break;case"input":J("invalid",t),Ci(t,a.value,a.defaultValue,a.checked,a.defaultChecked,a.type,a.name,!0);break;case"select":J("invalid",t);break;case"textarea":J("invalid",t),Ri(t,a.value,a.defaultValue,a.children)}u=a.children,typeof u!="string"&&typeof u!="number"&&typeof u!="bigint"||t.textContent===""+u||a.suppressHydrationWarning===!0||qd(t.textContent,u)?(a.popover!=null&&(J("beforetoggle",t),J("toggle",t)),a.onScroll!=null&&J("scroll",t),a.onScrollEnd!=null&&J("scrollend",t),a.onClick!=null&&(t.onclick=Ht),t=!0):t=!1,t||tu(l,!0)}function r0(l){for(Cl=l.return;Cl;)switch(Cl.tag){case 5:case 31:case 13:ht=!1;return;case 27:case 3:ht=!0;return;default:Cl=Cl.return}}function ea(l){if(l!==Cl)return!1;if(!k)return r0(l),k=!0,!1;var t=l.tag,u;if((u=t!==3&&t!==27)&&((u=t===5)&&(u=l.type,u=!(u!=="form"&&u!=="button")||Lc(l.type,l.memoizedProps)),u=!u),u&&yl&&tu(l),r0(l),t===13){if(l=l.memoizedState,l=l!==null?l.dehydrated:null,!l)throw Error(y(317));yl=Ld(l)}else if(t===31){if(l=l.memoizedState,l=l!==null?l.dehydrated:null,!l)throw Error(y(317));yl=Ld(l)}else t===27?(t=yl,hu(l.type)?(l=$c,$c=null,yl=l):yl=t):yl=Cl?St(l.stateNode.nextSibling):null;return!0}function Nu(){yl=Cl=null,k=!1}function Mf(){var l=lu;return l!==null&&(Wl===null?Wl=l:Wl.push.apply(Wl,l),lu=null),l}function Za(l){lu===null?lu=[l]:lu.push(l)}var Df=d(null),Cu=null,Bt=null;function uu(l,t,u){p(Df,t._currentValue),t._currentValue=u}function Yt(l){l._currentValue=Df.current,E(Df)}function Uf(l,t,u){for(;l!==null;){var a=l.alternate;if((l.childLanes&t)!==t?(l.childLanes|=t,a!==null&&(a.childLanes|=t)):a!==null&&(a.childLanes&t)!==t&&(a.childLanes|=t),l===u)break;l=l.return}}function Nf(l,t,u,a){var e=l.child;for(e!==null&&(e.return=l);e!==null;){var n=e.dependencies;if(n!==null){var f=e.child;n=n.firstContext;l:for(;n!==null;){var c=n;n=e;for(var i=0;i<t.length;i++)if(c.context===t[i]){n.lanes|=u,c=n.alternate,c!==null&&(c.lanes|=u),Uf(n.return,u,l),a||(f=null);break l}n=c.next}}else if(e.tag===18){if(f=e.return,f===null)throw Error(y(341));f.lanes|=u,n=f.alternate,n!==null&&(n.lanes|=u),Uf(f,u,l),f=null}else f=e.child;if(f!==null)f.return=e;else for(f=e;f!==null;){if(f===l){f=null;break}if(e=f.sibling,e!==null){e.return=f.return,f=e;break}f=f.return}e=f}}function na(l,t,u,a){l=null;for(var e=t,n=!1;e!==null;){if(!n){if((e.flags&524288)!==0)n=!0;else if((e.flags&262144)!==0)break}if(e.tag===10){var f=e.alternate;if(f===null)throw Error(y(387));if(f=f.memoizedProps,f!==null){var c=e.type;tt(e.pendingProps.value,f.value)||(l!==null?l.push(c):l=[c])}}else if(e===ul.current){if(f=e.alternate,f===null)throw Error(y(387));f.memoizedState.memoizedState!==e.memoizedState.memoizedState&&(l!==null?l.push(he):l=[he])}e=e.return}l!==null&&Nf(t,l,u,a),t.flags|=262144}function Ve(l){for(l=l.firstContext;l!==null;){if(!tt(l.context._currentValue,l.memoizedValue))return!0;l=l.next}return!1}function Hu(l){Cu=l,Bt=null,l=l.dependencies,l!==null&&(l.firstContext=null)}function Hl(l){return z0(Cu,l)}function Le(l,t){return Cu===null&&Hu(l),z0(l,t)}function z0(l,t){var u=t._currentValue;if(t={context:t,memoizedValue:u,next:null},Bt===null){if(l===null)throw Error(y(308));Bt=t,l.dependencies={lanes:0,firstContext:t},l.flags|=524288}else Bt=Bt.next=t;return u}var By=typeof AbortController<"u"?AbortController:function(){var l=[],t=this.signal={aborted:!1,addEventListener:function(u,a){l.push(a)}};this.abort=function(){t.aborted=!0,l.forEach(function(u){return u()})}},Yy=_.unstable_scheduleCallback,xy=_.unstable_NormalPriority,Al={$$typeof:ql,Consumer:null,Provider:null,_currentValue:null,_currentValue2:null,_threadCount:0};function Cf(){return{controller:new By,data:new Map,refCount:0}}function Va(l){l.refCount--,l.refCount===0&&Yy(xy,function(){l.controller.abort()})}var La=null,Hf=0,fa=0,ca=null;function Gy(l,t){if(La===null){var u=La=[];Hf=0,fa=qc(),ca={status:"pending",value:void 0,then:function(a){u.push(a)}}}return Hf++,t.then(T0,T0),t}function T0(){if(--Hf===0&&La!==null){ca!==null&&(ca.status="fulfilled");var l=La;La=null,fa=0,ca=null;for(var t=0;t<l.length;t++)(0,l[t])()}}function Xy(l,t){var u=[],a={status:"pending",value:null,reason:null,then:function(e){u.push(e)}};return l.then(function(){a.status="fulfilled",a.value=t;for(var e=0;e<u.length;e++)(0,u[e])(t)},function(e){for(a.status="rejected",a.reason=e,e=0;e<u.length;e++)(0,u[e])(void 0)}),a}var E0=b.S;b.S=function(l,t){nd=Il(),typeof t=="object"&&t!==null&&typeof t.then=="function"&&Gy(l,t),E0!==null&&E0(l,t)};var Ru=d(null);function Rf(){var l=Ru.current;return l!==null?l:dl.pooledCache}function Ke(l,t){t===null?p(Ru,Ru.current):p(Ru,t.pool)}function A0(){var l=Rf();return l===null?null:{parent:Al._currentValue,pool:l}}var ia=Error(y(460)),jf=Error(y(474)),Je=Error(y(542)),we={then:function(){}};function _0(l){return l=l.status,l==="fulfilled"||l==="rejected"}function O0(l,t,u){switch(u=l[u],u===void 0?l.push(t):u!==t&&(t.then(Ht,Ht),t=u),t.status){case"fulfilled":return t.value;case"rejected":throw l=t.reason,M0(l),l;default:if(typeof t.status=="string")t.then(Ht,Ht);else{if(l=dl,l!==null&&100<l.shellSuspendCounter)throw Error(y(482));l=t,l.status="pending",l.then(function(a){if(t.status==="pending"){var e=t;e.status="fulfilled",e.value=a}},function(a){if(t.status==="pending"){var e=t;e.status="rejected",e.reason=a}})}switch(t.status){case"fulfilled":return t.value;case"rejected":throw l=t.reason,M0(l),l}throw qu=t,ia}}function ju(l){try{var t=l._init;return t(l._payload)}catch(u){throw u!==null&&typeof u=="object"&&typeof u.then=="function"?(qu=u,ia):u}}var qu=null;function p0(){if(qu===null)throw Error(y(459));var l=qu;return qu=null,l}function M0(l){if(l===ia||l===Je)throw Error(y(483))}var sa=null,Ka=0;function We(l){var t=Ka;return Ka+=1,sa===null&&(sa=[]),O0(sa,l,t)}function Ja(l,t){t=t.props.ref,l.ref=t!==void 0?t:null}function $e(l,t){throw t.$$typeof===G?Error(y(525)):(l=Object.prototype.toString.call(t),Error(y(31,l==="[object Object]"?"object with keys {"+Object.keys(t).join(", ")+"}":l)))}function D0(l){function t(o,s){if(l){var v=o.deletions;v===null?(o.deletions=[s],o.flags|=16):v.push(s)}}function u(o,s){if(!l)return null;for(;s!==null;)t(o,s),s=s.sibling;return null}function a(o){for(var s=new Map;o!==null;)o.key!==null?s.set(o.key,o):s.set(o.index,o),o=o.sibling;return s}function e(o,s){return o=jt(o,s),o.index=0,o.sibling=null,o}function n(o,s,v){return o.index=v,l?(v=o.alternate,v!==null?(v=v.index,v<s?(o.flags|=67108866,s):v):(o.flags|=67108866,s)):(o.flags|=1048576,s)}function f(o){return l&&o.alternate===null&&(o.flags|=67108866),o}function c(o,s,v,z){return s===null||s.tag!==6?(s=Ef(v,o.mode,z),s.return=o,s):(s=e(s,v),s.return=o,s)}function i(o,s,v,z){var H=v.type;return H===gl?S(o,s,v.props.children,z,v.key):s!==null&&(s.elementType===H||typeof H=="object"&&H!==null&&H.$$typeof===Ql&&ju(H)===s.type)?(s=e(s,v.props),Ja(s,v),s.return=o,s):(s=Qe(v.type,v.key,v.props,null,o.mode,z),Ja(s,v),s.return=o,s)}function m(o,s,v,z){return s===null||s.tag!==4||s.stateNode.containerInfo!==v.containerInfo||s.stateNode.implementation!==v.implementation?(s=Af(v,o.mode,z),s.return=o,s):(s=e(s,v.children||[]),s.return=o,s)}function S(o,s,v,z,H){return s===null||s.tag!==7?(s=Uu(v,o.mode,z,H),s.return=o,s):(s=e(s,v),s.return=o,s)}function T(o,s,v){if(typeof s=="string"&&s!==""||typeof s=="number"||typeof s=="bigint")return s=Ef(""+s,o.mode,v),s.return=o,s;if(typeof s=="object"&&s!==null){switch(s.$$typeof){case Sl:return v=Qe(s.type,s.key,s.props,null,o.mode,v),Ja(v,s),v.return=o,v;case hl:return s=Af(s,o.mode,v),s.return=o,s;case Ql:return s=ju(s),T(o,s,v)}if(rt(s)||Zl(s))return s=Uu(s,o.mode,v,null),s.return=o,s;if(typeof s.then=="function")return T(o,We(s),v);if(s.$$typeof===ql)return T(o,Le(o,s),v);$e(o,s)}return null}function h(o,s,v,z){var H=s!==null?s.key:null;if(typeof v=="string"&&v!==""||typeof v=="number"||typeof v=="bigint")return H!==null?null:c(o,s,""+v,z);if(typeof v=="object"&&v!==null){switch(v.$$typeof){case Sl:return v.key===H?i(o,s,v,z):null;case hl:return v.key===H?m(o,s,v,z):null;case Ql:return v=ju(v),h(o,s,v,z)}if(rt(v)||Zl(v))return H!==null?null:S(o,s,v,z,null);if(typeof v.then=="function")return h(o,s,We(v),z);if(v.$$typeof===ql)return h(o,s,Le(o,v),z);$e(o,v)}return null}function g(o,s,v,z,H){if(typeof z=="string"&&z!==""||typeof z=="number"||typeof z=="bigint")return o=o.get(v)||null,c(s,o,""+z,H);if(typeof z=="object"&&z!==null){switch(z.$$typeof){case Sl:return o=o.get(z.key===null?v:z.key)||null,i(s,o,z,H);case hl:return o=o.get(z.key===null?v:z.key)||null,m(s,o,z,H);case Ql:return z=ju(z),g(o,s,v,z,H)}if(rt(z)||Zl(z))return o=o.get(v)||null,S(s,o,z,H,null);if(typeof z.then=="function")return g(o,s,v,We(z),H);if(z.$$typeof===ql)return g(o,s,v,Le(s,z),H);$e(s,z)}return null}function U(o,s,v,z){for(var H=null,I=null,C=s,V=s=0,W=null;C!==null&&V<v.length;V++){C.index>V?(W=C,C=null):W=C.sibling;var P=h(o,C,v[V],z);if(P===null){C===null&&(C=W);break}l&&C&&P.alternate===null&&t(o,C),s=n(P,s,V),I===null?H=P:I.sibling=P,I=P,C=W}if(V===v.length)return u(o,C),k&&qt(o,V),H;if(C===null){for(;V<v.length;V++)C=T(o,v[V],z),C!==null&&(s=n(C,s,V),I===null?H=C:I.sibling=C,I=C);return k&&qt(o,V),H}for(C=a(C);V<v.length;V++)W=g(C,o,V,v[V],z),W!==null&&(l&&W.alternate!==null&&C.delete(W.key===null?V:W.key),s=n(W,s,V),I===null?H=W:I.sibling=W,I=W);return l&&C.forEach(function(zu){return t(o,zu)}),k&&qt(o,V),H}function j(o,s,v,z){if(v==null)throw Error(y(151));for(var H=null,I=null,C=s,V=s=0,W=null,P=v.next();C!==null&&!P.done;V++,P=v.next()){C.index>V?(W=C,C=null):W=C.sibling;var zu=h(o,C,P.value,z);if(zu===null){C===null&&(C=W);break}l&&C&&zu.alternate===null&&t(o,C),s=n(zu,s,V),I===null?H=zu:I.sibling=zu,I=zu,C=W}if(P.done)return u(o,C),k&&qt(o,V),H;if(C===null){for(;!P.done;V++,P=v.next())P=T(o,P.value,z),P!==null&&(s=n(P,s,V),I===null?H=P:I.sibling=P,I=P);return k&&qt(o,V),H}for(C=a(C);!P.done;V++,P=v.next())P=g(C,o,V,P.value,z),P!==null&&(l&&P.alternate!==null&&C.delete(P.key===null?V:P.key),s=n(P,s,V),I===null?H=P:I.sibling=P,I=P);return l&&C.forEach(function(Fv){return t(o,Fv)}),k&&qt(o,V),H}function il(o,s,v,z){if(typeof v=="object"&&v!==null&&v.type===gl&&v.key===null&&(v=v.props.children),typeof v=="object"&&v!==null){switch(v.$$typeof){case Sl:l:{for(var H=v.key;s!==null;){if(s.key===H){if(H=v.type,H===gl){if(s.tag===7){u(o,s.sibling),z=e(s,v.props.children),z.return=o,o=z;break l}}else if(s.elementType===H||typeof H=="object"&&H!==null&&H.$$typeof===Ql&&ju(H)===s.type){u(o,s.sibling),z=e(s,v.props),Ja(z,v),z.return=o,o=z;break l}u(o,s);break}else t(o,s);s=s.sibling}v.type===gl?(z=Uu(v.props.children,o.mode,z,v.key),z.return=o,o=z):(z=Qe(v.type,v.key,v.props,null,o.mode,z),Ja(z,v),z.return=o,o=z)}return f(o);case hl:l:{for(H=v.key;s!==null;){if(s.key===H)if(s.tag===4&&s.stateNode.containerInfo===v.containerInfo&&s.stateNode.implementation===v.implementation){u(o,s.sibling),z=e(s,v.children||[]),z.return=o,o=z;break l}else{u(o,s);break}else t(o,s);s=s.sibling}z=Af(v,o.mode,z),z.return=o,o=z}return f(o);case Ql:return v=ju(v),il(o,s,v,z)}if(rt(v))return U(o,s,v,z);if(Zl(v)){if(H=Zl(v),typeof H!="function")throw Error(y(150));return v=H.call(v),j(o,s,v,z)}if(typeof v.then=="function")return il(o,s,We(v),z);if(v.$$typeof===ql)return il(o,s,Le(o,v),z);$e(o,v)}return typeof v=="string"&&v!==""||typeof v=="number"||typeof v=="bigint"?(v=""+v,s!==null&&s.tag===6?(u(o,s.sibling),z=e(s,v),z.return=o,o=z):(u(o,s),z=Ef(v,o.mode,z),z.return=o,o=z),f(o)):u(o,s)}return function(o,s,v,z){try{Ka=0;var H=il(o,s,v,z);return sa=null,H}catch(C){if(C===ia||C===Je)throw C;var I=ut(29,C,null,o.mode);return I.lanes=z,I.return=o,I}}}var Bu=D0(!0),U0=D0(!1),au=!1;function qf(l){l.updateQueue={baseState:l.memoizedState,firstBaseUpdate:null,lastBaseUpdate:null,shared:{pending:null,lanes:0,hiddenCallbacks:null},callbacks:null}}function Bf(l,t){l=l.updateQueue,t.updateQueue===l&&(t.updateQueue={baseState:l.baseState,firstBaseUpdate:l.firstBaseUpdate,lastBaseUpdate:l.lastBaseUpdate,shared:l.shared,callbacks:null})}function eu(l){return{lane:l,tag:0,payload:null,callback:null,next:null}}function nu(l,t,u){var a=l.updateQueue;if(a===null)return null;if(a=a.shared,(tl&2)!==0){var e=a.pending;return e===null?t.next=t:(t.next=e.next,e.next=t),a.pending=t,t=Xe(l),y0(l,null,u),t}return Ge(l,a,t,u),Xe(l)}function wa(l,t,u){if(t=t.updateQueue,t!==null&&(t=t.shared,(u&4194048)!==0)){var a=t.lanes;a&=l.pendingLanes,u|=a,t.lanes=u,zi(l,u)}}function Yf(l,t){var u=l.updateQueue,a=l.alternate;if(a!==null&&(a=a.updateQueue,u===a)){var e=null,n=null;if(u=u.firstBaseUpdate,u!==null){do{var f={lane:u.lane,tag:u.tag,payload:u.payload,callback:null,next:null};n===null?e=n=f:n=n.next=f,u=u.next}while(u!==null);n===null?e=n=t:n=n.next=t}else e=n=t;u={baseState:a.baseState,firstBaseUpdate:e,lastBaseUpdate:n,shared:a.shared,callbacks:a.callbacks},l.updateQueue=u;return}l=u.lastBaseUpdate,l===null?u.firstBaseUpdate=t:l.next=t,u.lastBaseUpdate=t}var xf=!1;function Wa(){if(xf){var l=ca;if(l!==null)throw l}}function $a(l,t,u,a){xf=!1;var e=l.updateQueue;au=!1;var n=e.firstBaseUpdate,f=e.lastBaseUpdate,c=e.shared.pending;if(c!==null){e.shared.pending=null;var i=c,m=i.next;i.next=null,f===null?n=m:f.next=m,f=i;var S=l.alternate;S!==null&&(S=S.updateQueue,c=S.lastBaseUpdate,c!==f&&(c===null?S.firstBaseUpdate=m:c.next=m,S.lastBaseUpdate=i))}if(n!==null){var T=e.baseState;f=0,S=m=i=null,c=n;do{var h=c.lane&-536870913,g=h!==c.lane;if(g?(w&h)===h:(a&h)===h){h!==0&&h===fa&&(xf=!0),S!==null&&(S=S.next={lane:0,tag:c.tag,payload:c.payload,callback:null,next:null});l:{var U=l,j=c;h=t;var il=u;switch(j.tag){case 1:if(U=j.payload,typeof U=="function"){T=U.call(il,T,h);break l}T=U;break l;case 3:U.flags=U.flags&-65537|128;case 0:if(U=j.payload,h=typeof U=="function"?U.call(il,T,h):U,h==null)break l;T=M({},T,h);break l;case 2:au=!0}}h=c.callback,h!==null&&(l.flags|=64,g&&(l.flags|=8192),g=e.callbacks,g===null?e.callbacks=[h]:g.push(h))}else g={lane:h,tag:c.tag,payload:c.payload,callback:c.callback,next:null},S===null?(m=S=g,i=T):S=S.next=g,f|=h;if(c=c.next,c===null){if(c=e.shared.pending,c===null)break;g=c,c=g.next,g.next=null,e.lastBaseUpdate=g,e.shared.pending=null}}while(!0);S===null&&(i=T),e.baseState=i,e.firstBaseUpdate=m,e.lastBaseUpdate=S,n===null&&(e.shared.lanes=0),du|=f,l.lanes=f,l.memoizedState=T}}function N0(l,t){if(typeof l!="function")throw Error(y(191,l));l.call(t)}function C0(l,t){var u=l.callbacks;if(u!==null)for(l.callbacks=null,l=0;l<u.length;l++)N0(u[l],t)}var da=d(null),ke=d(0);function H0(l,t){l=Jt,p(ke,l),p(da,t),Jt=l|t.baseLanes}function Gf(){p(ke,Jt),p(da,da.current)}function Xf(){Jt=ke.current,E(da),E(ke)}var at=d(null),gt=null;function fu(l){var t=l.alternate;p(Tl,Tl.current&1),p(at,l),gt===null&&(t===null||da.current!==null||t.memoizedState!==null)&&(gt=l)}function Qf(l){p(Tl,Tl.current),p(at,l),gt===null&&(gt=l)}function R0(l){l.tag===22?(p(Tl,Tl.current),p(at,l),gt===null&&(gt=l)):cu()}function cu(){p(Tl,Tl.current),p(at,at.current)}function et(l){E(at),gt===l&&(gt=null),E(Tl)}var Tl=d(0);function Fe(l){for(var t=l;t!==null;){if(t.tag===13){var u=t.memoizedState;if(u!==null&&(u=u.dehydrated,u===null||wc(u)||Wc(u)))return t}else if(t.tag===19&&(t.memoizedProps.revealOrder==="forwards"||t.memoizedProps.revealOrder==="backwards"||t.memoizedProps.revealOrder==="unstable_legacy-backwards"||t.memoizedProps.revealOrder==="together")){if((t.flags&128)!==0)return t}else if(t.child!==null){t.child.return=t,t=t.child;continue}if(t===l)break;for(;t.sibling===null;){if(t.return===null||t.return===l)return null;t=t.return}t.sibling.return=t.return,t=t.sibling}return null}var xt=0,Z=null,fl=null,_l=null,Ie=!1,oa=!1,Yu=!1,Pe=0,ka=0,ya=null,Qy=0;function bl(){throw Error(y(321))}function Zf(l,t){if(t===null)return!1;for(var u=0;u<t.length&&u<l.length;u++)if(!tt(l[u],t[u]))return!1;return!0}function Vf(l,t,u,a,e,n){return xt=n,Z=t,t.memoizedState=null,t.updateQueue=null,t.lanes=0,b.H=l===null||l.memoizedState===null?gs:ec,Yu=!1,n=u(a,e),Yu=!1,oa&&(n=q0(t,u,a,e)),j0(l),n}function j0(l){b.H=Pa;var t=fl!==null&&fl.next!==null;if(xt=0,_l=fl=Z=null,Ie=!1,ka=0,ya=null,t)throw Error(y(300));l===null||Ol||(l=l.dependencies,l!==null&&Ve(l)&&(Ol=!0))}function q0(l,t,u,a){Z=l;var e=0;do{if(oa&&(ya=null),ka=0,oa=!1,25<=e)throw Error(y(301));if(e+=1,_l=fl=null,l.updateQueue!=null){var n=l.updateQueue;n.lastEffect=null,n.events=null,n.stores=null,n.memoCache!=null&&(n.memoCache.index=0)}b.H=Ss,n=t(u,a)}while(oa);return n}function Zy(){var l=b.H,t=l.useState()[0];return t=typeof t.then=="function"?Fa(t):t,l=l.useState()[0],(fl!==null?fl.memoizedState:null)!==l&&(Z.flags|=1024),t}function Lf(){var l=Pe!==0;return Pe=0,l}function Kf(l,t,u){t.updateQueue=l.updateQueue,t.flags&=-2053,l.lanes&=~u}function Jf(l){if(Ie){for(l=l.memoizedState;l!==null;){var t=l.queue;t!==null&&(t.pending=null),l=l.next}Ie=!1}xt=0,_l=fl=Z=null,oa=!1,ka=Pe=0,ya=null}function Gl(){var l={memoizedState:null,baseState:null,baseQueue:null,queue:null,next:null};return _l===null?Z.memoizedState=_l=l:_l=_l.next=l,_l}function El(){if(fl===null){var l=Z.alternate;l=l!==null?l.memoizedState:null}else l=fl.next;var t=_l===null?Z.memoizedState:_l.next;if(t!==null)_l=t,fl=l;else{if(l===null)throw Z.alternate===null?Error(y(467)):Error(y(310));fl=l,l={memoizedState:fl.memoizedState,baseState:fl.baseState,baseQueue:fl.baseQueue,queue:fl.queue,next:null},_l===null?Z.memoizedState=_l=l:_l=_l.next=l}return _l}function ln(){return{lastEffect:null,events:null,stores:null,memoCache:null}}function Fa(l){var t=ka;return ka+=1,ya===null&&(ya=[]),l=O0(ya,l,t),t=Z,(_l===null?t.memoizedState:_l.next)===null&&(t=t.alternate,b.H=t===null||t.memoizedState===null?gs:ec),l}function tn(l){if(l!==null&&typeof l=="object"){if(typeof l.then=="function")return Fa(l);if(l.$$typeof===ql)return Hl(l)}throw Error(y(438,String(l)))}function wf(l){var t=null,u=Z.updateQueue;if(u!==null&&(t=u.memoCache),t==null){var a=Z.alternate;a!==null&&(a=a.updateQueue,a!==null&&(a=a.memoCache,a!=null&&(t={data:a.data.map(function(e){return e.slice()}),index:0})))}if(t==null&&(t={data:[],index:0}),u===null&&(u=ln(),Z.updateQueue=u),u.memoCache=t,u=t.data[t.index],u===void 0)for(u=t.data[t.index]=Array(l),a=0;a<l;a++)u[a]=Qu;return t.index++,u}function Gt(l,t){return typeof t=="function"?t(l):t}function un(l){var t=El();return Wf(t,fl,l)}function Wf(l,t,u){var a=l.queue;if(a===null)throw Error(y(311));a.lastRenderedReducer=u;var e=l.baseQueue,n=a.pending;if(n!==null){if(e!==null){var f=e.next;e.next=n.next,n.next=f}t.baseQueue=e=n,a.pending=null}if(n=l.baseState,e===null)l.memoizedState=n;else{t=e.next;var c=f=null,i=null,m=t,S=!1;do{var T=m.lane&-536870913;if(T!==m.lane?(w&T)===T:(xt&T)===T){var h=m.revertLane;if(h===0)i!==null&&(i=i.next={lane:0,revertLane:0,gesture:null,action:m.action,hasEagerState:m.hasEagerState,eagerState:m.eagerState,next:null}),T===fa&&(S=!0);else if((xt&h)===h){m=m.next,h===fa&&(S=!0);continue}else T={lane:0,revertLane:m.revertLane,gesture:null,action:m.action,hasEagerState:m.hasEagerState,eagerState:m.eagerState,next:null},i===null?(c=i=T,f=n):i=i.next=T,Z.lanes|=h,du|=h;T=m.action,Yu&&u(n,T),n=m.hasEagerState?m.eagerState:u(n,T)}else h={lane:T,revertLane:m.revertLane,gesture:m.gesture,action:m.action,hasEagerState:m.hasEagerState,eagerState:m.eagerState,next:null},i===null?(c=i=h,f=n):i=i.next=h,Z.lanes|=T,du|=T;m=m.next}while(m!==null&&m!==t);if(i===null?f=n:i.next=c,!tt(n,l.memoizedState)&&(Ol=!0,S&&(u=ca,u!==null)))throw u;l.memoizedState=n,l.baseState=f,l.baseQueue=i,a.lastRenderedState=n}return e===null&&(a.lanes=0),[l.memoizedState,a.dispatch]}function $f(l){var t=El(),u=t.queue;if(u===null)throw Error(y(311));u.lastRenderedReducer=l;var a=u.dispatch,e=u.pending,n=t.memoizedState;if(e!==null){u.pending=null;var f=e=e.next;do n=l(n,f.action),f=f.next;while(f!==e);tt(n,t.memoizedState)||(Ol=!0),t.memoizedState=n,t.baseQueue===null&&(t.baseState=n),u.lastRenderedState=n}return[n,a]}function B0(l,t,u){var a=Z,e=El(),n=k;if(n){if(u===void 0)throw Error(y(407));u=u()}else u=t();var f=!tt((fl||e).memoizedState,u);if(f&&(e.memoizedState=u,Ol=!0),e=e.queue,If(G0.bind(null,a,e,l),[l]),e.getSnapshot!==t||f||_l!==null&&_l.memoizedState.tag&1){if(a.flags|=2048,va(9,{destroy:void 0},x0.bind(null,a,e,u,t),null),dl===null)throw Error(y(349));n||(xt&127)!==0||Y0(a,t,u)}return u}function Y0(l,t,u){l.flags|=16384,l={getSnapshot:t,value:u},t=Z.updateQueue,t===null?(t=ln(),Z.updateQueue=t,t.stores=[l]):(u=t.stores,u===null?t.stores=[l]:u.push(l))}function x0(l,t,u,a){t.value=u,t.getSnapshot=a,X0(t)&&Q0(l)}function G0(l,t,u){return u(function(){X0(t)&&Q0(l)})}function X0(l){var t=l.getSnapshot;l=l.value;try{var u=t();return!tt(l,u)}catch{return!0}}function Q0(l){var t=Du(l,2);t!==null&&$l(t,l,2)}function kf(l){var t=Gl();if(typeof l=="function"){var u=l;if(l=u(),Yu){kt(!0);try{u()}finally{kt(!1)}}}return t.memoizedState=t.baseState=l,t.queue={pending:null,lanes:0,dispatch:null,lastRenderedReducer:Gt,lastRenderedState:l},t}function Z0(l,t,u,a){return l.baseState=u,Wf(l,fl,typeof a=="function"?a:Gt)}function Vy(l,t,u,a,e){if(nn(l))throw Error(y(485));if(l=t.action,l!==null){var n={payload:e,action:l,next:null,isTransition:!0,status:"pending",value:null,reason:null,listeners:[],then:function(f){n.listeners.push(f)}};b.T!==null?u(!0):n.isTransition=!1,a(n),u=t.pending,u===null?(n.next=t.pending=n,V0(t,n)):(n.next=u.next,t.pending=u.next=n)}}function V0(l,t){var u=t.action,a=t.payload,e=l.state;if(t.isTransition){var n=b.T,f={};b.T=f;try{var c=u(e,a),i=b.S;i!==null&&i(f,c),L0(l,t,c)}catch(m){Ff(l,t,m)}finally{n!==null&&f.types!==null&&(n.types=f.types),b.T=n}}else try{n=u(e,a),L0(l,t,n)}catch(m){Ff(l,t,m)}}function L0(l,t,u){u!==null&&typeof u=="object"&&typeof u.then=="function"?u.then(function(a){K0(l,t,a)},function(a){return Ff(l,t,a)}):K0(l,t,u)}function K0(l,t,u){t.status="fulfilled",t.value=u,J0(t),l.state=u,t=l.pending,t!==null&&(u=t.next,u===t?l.pending=null:(u=u.next,t.next=u,V0(l,u)))}function Ff(l,t,u){var a=l.pending;if(l.pending=null,a!==null){a=a.next;do t.status="rejected",t.reason=u,J0(t),t=t.next;while(t!==a)}l.action=null}function J0(l){l=l.listeners;for(var t=0;t<l.length;t++)(0,l[t])()}function w0(l,t){return t}function W0(l,t){if(k){var u=dl.formState;if(u!==null){l:{var a=Z;if(k){if(yl){t:{for(var e=yl,n=ht;e.nodeType!==8;){if(!n){e=null;break t}if(e=St(e.nextSibling),e===null){e=null;break t}}n=e.data,e=n==="F!"||n==="F"?e:null}if(e){yl=St(e.nextSibling),a=e.data==="F!";break l}}tu(a)}a=!1}a&&(t=u[0])}}return u=Gl(),u.memoizedState=u.baseState=t,a={pending:null,lanes:0,dispatch:null,lastRenderedReducer:w0,lastRenderedState:t},u.queue=a,u=vs.bind(null,Z,a),a.dispatch=u,a=kf(!1),n=ac.bind(null,Z,!1,a.queue),a=Gl(),e={state:t,dispatch:null,action:l,pending:null},a.queue=e,u=Vy.bind(null,Z,e,n,u),e.dispatch=u,a.memoizedState=l,[t,u,!1]}function $0(l){var t=El();return k0(t,fl,l)}function k0(l,t,u){if(t=Wf(l,t,w0)[0],l=un(Gt)[0],typeof t=="object"&&t!==null&&typeof t.then=="function")try{var a=Fa(t)}catch(f){throw f===ia?Je:f}else a=t;t=El();var e=t.queue,n=e.dispatch;return u!==t.memoizedState&&(Z.flags|=2048,va(9,{destroy:void 0},Ly.bind(null,e,u),null)),[a,n,l]}function Ly(l,t){l.action=t}function F0(l){var t=El(),u=fl;if(u!==null)return k0(t,u,l);El(),t=t.memoizedState,u=El();var a=u.queue.dispatch;return u.memoizedState=l,[t,a,!1]}function va(l,t,u,a){return l={tag:l,create:u,deps:a,inst:t,next:null},t=Z.updateQueue,t===null&&(t=ln(),Z.updateQueue=t),u=t.lastEffect,u===null?t.lastEffect=l.next=l:(a=u.next,u.next=l,l.next=a,t.lastEffect=l),l}function I0(){return El().memoizedState}function an(l,t,u,a){var e=Gl();Z.flags|=l,e.memoizedState=va(1|t,{destroy:void 0},u,a===void 0?null:a)}function en(l,t,u,a){var e=El();a=a===void 0?null:a;var n=e.memoizedState.inst;fl!==null&&a!==null&&Zf(a,fl.memoizedState.deps)?e.memoizedState=va(t,n,u,a):(Z.flags|=l,e.memoizedState=va(1|t,n,u,a))}function P0(l,t){an(8390656,8,l,t)}function If(l,t){en(2048,8,l,t)}function Ky(l){Z.flags|=4;var t=Z.updateQueue;if(t===null)t=ln(),Z.updateQueue=t,t.events=[l];else{var u=t.events;u===null?t.events=[l]:u.push(l)}}function ls(l){var t=El().memoizedState;return Ky({ref:t,nextImpl:l}),function(){if((tl&2)!==0)throw Error(y(440));return t.impl.apply(void 0,arguments)}}function ts(l,t){return en(4,2,l,t)}function us(l,t){return en(4,4,l,t)}function as(l,t){if(typeof t=="function"){l=l();var u=t(l);return function(){typeof u=="function"?u():t(null)}}if(t!=null)return l=l(),t.current=l,function(){t.current=null}}function es(l,t,u){u=u!=null?u.concat([l]):null,en(4,4,as.bind(null,t,l),u)}function Pf(){}function ns(l,t){var u=El();t=t===void 0?null:t;var a=u.memoizedState;return t!==null&&Zf(t,a[1])?a[0]:(u.memoizedState=[l,t],l)}function fs(l,t){var u=El();t=t===void 0?null:t;var a=u.memoizedState;if(t!==null&&Zf(t,a[1]))return a[0];if(a=l(),Yu){kt(!0);try{l()}finally{kt(!1)}}return u.memoizedState=[a,t],a}function lc(l,t,u){return u===void 0||(xt&1073741824)!==0&&(w&261930)===0?l.memoizedState=t:(l.memoizedState=u,l=cd(),Z.lanes|=l,du|=l,u)}function cs(l,t,u,a){return tt(u,t)?u:da.current!==null?(l=lc(l,u,a),tt(l,t)||(Ol=!0),l):(xt&42)===0||(xt&1073741824)!==0&&(w&261930)===0?(Ol=!0,l.memoizedState=u):(l=cd(),Z.lanes|=l,du|=l,t)}function is(l,t,u,a,e){var n=O.p;O.p=n!==0&&8>n?n:8;var f=b.T,c={};b.T=c,ac(l,!1,t,u);try{var i=e(),m=b.S;if(m!==null&&m(c,i),i!==null&&typeof i=="object"&&typeof i.then=="function"){var S=Xy(i,a);Ia(l,t,S,ct(l))}else Ia(l,t,a,ct(l))}catch(T){Ia(l,t,{then:function(){},status:"rejected",reason:T},ct())}finally{O.p=n,f!==null&&c.types!==null&&(f.types=c.types),b.T=f}}function Jy(){}function tc(l,t,u,a){if(l.tag!==5)throw Error(y(476));var e=ss(l).queue;is(l,e,t,q,u===null?Jy:function(){return ds(l),u(a)})}function ss(l){var t=l.memoizedState;if(t!==null)return t;t={memoizedState:q,baseState:q,baseQueue:null,queue:{pending:null,lanes:0,dispatch:null,lastRenderedReducer:Gt,lastRenderedState:q},next:null};var u={};return t.next={memoizedState:u,baseState:u,baseQueue:null,queue:{pending:null,lanes:0,dispatch:null,lastRenderedReducer:Gt,lastRenderedState:u},next:null},l.memoizedState=t,l=l.alternate,l!==null&&(l.memoizedState=t),t}function ds(l){var t=ss(l);t.next===null&&(t=l.alternate.memoizedState),Ia(l,t.next.queue,{},ct())}function uc(){return Hl(he)}function os(){return El().memoizedState}function ys(){return El().memoizedState}function wy(l){for(var t=l.return;t!==null;){switch(t.tag){case 24:case 3:var u=ct();l=eu(u);var a=nu(t,l,u);a!==null&&($l(a,t,u),wa(a,t,u)),t={cache:Cf()},l.payload=t;return}t=t.return}}function Wy(l,t,u){var a=ct();u={lane:a,revertLane:0,gesture:null,action:u,hasEagerState:!1,eagerState:null,next:null},nn(l)?ms(t,u):(u=zf(l,t,u,a),u!==null&&($l(u,l,a),hs(u,t,a)))}function vs(l,t,u){var a=ct();Ia(l,t,u,a)}function Ia(l,t,u,a){var e={lane:a,revertLane:0,gesture:null,action:u,hasEagerState:!1,eagerState:null,next:null};if(nn(l))ms(t,e);else{var n=l.alternate;if(l.lanes===0&&(n===null||n.lanes===0)&&(n=t.lastRenderedReducer,n!==null))try{var f=t.lastRenderedState,c=n(f,u);if(e.hasEagerState=!0,e.eagerState=c,tt(c,f))return Ge(l,t,e,0),dl===null&&xe(),!1}catch{}if(u=zf(l,t,e,a),u!==null)return $l(u,l,a),hs(u,t,a),!0}return!1}function ac(l,t,u,a){if(a={lane:2,revertLane:qc(),gesture:null,action:a,hasEagerState:!1,eagerState:null,next:null},nn(l)){if(t)throw Error(y(479))}else t=zf(l,u,a,2),t!==null&&$l(t,l,2)}function nn(l){var t=l.alternate;return l===Z||t!==null&&t===Z}function ms(l,t){oa=Ie=!0;var u=l.pending;u===null?t.next=t:(t.next=u.next,u.next=t),l.pending=t}function hs(l,t,u){if((u&4194048)!==0){var a=t.lanes;a&=l.pendingLanes,u|=a,t.lanes=u,zi(l,u)}}var Pa={readContext:Hl,use:tn,useCallback:bl,useContext:bl,useEffect:bl,useImperativeHandle:bl,useLayoutEffect:bl,useInsertionEffect:bl,useMemo:bl,useReducer:bl,useRef:bl,useState:bl,useDebugValue:bl,useDeferredValue:bl,useTransition:bl,useSyncExternalStore:bl,useId:bl,useHostTransitionStatus:bl,useFormState:bl,useActionState:bl,useOptimistic:bl,useMemoCache:bl,useCacheRefresh:bl};Pa.useEffectEvent=bl;var gs={readContext:Hl,use:tn,useCallback:function(l,t){return Gl().memoizedState=[l,t===void 0?null:t],l},useContext:Hl,useEffect:P0,useImperativeHandle:function(l,t,u){u=u!=null?u.concat([l]):null,an(4194308,4,as.bind(null,t,l),u)},useLayoutEffect:function(l,t){return an(4194308,4,l,t)},useInsertionEffect:function(l,t){an(4,2,l,t)},useMemo:function(l,t){var u=Gl();t=t===void 0?null:t;var a=l();if(Yu){kt(!0);try{l()}finally{kt(!1)}}return u.memoizedState=[a,t],a},useReducer:function(l,t,u){var a=Gl();if(u!==void 0){var e=u(t);if(Yu){kt(!0);try{u(t)}finally{kt(!1)}}}else e=t;return a.memoizedState=a.baseState=e,l={pending:null,lanes:0,dispatch:null,lastRenderedReducer:l,lastRenderedState:e},a.queue=l,l=l.dispatch=Wy.bind(null,Z,l),[a.memoizedState,l]},useRef:function(l){var t=Gl();return l={current:l},t.memoizedState=l},useState:function(l){l=kf(l);var t=l.queue,u=vs.bind(null,Z,t);return t.dispatch=u,[l.memoizedState,u]},useDebugValue:Pf,useDeferredValue:function(l,t){var u=Gl();return lc(u,l,t)},useTransition:function(){var l=kf(!1);return l=is.bind(null,Z,l.queue,!0,!1),Gl().memoizedState=l,[!1,l]},useSyncExternalStore:function(l,t,u){var a=Z,e=Gl();if(k){if(u===void 0)throw Error(y(407));u=u()}else{if(u=t(),dl===null)throw Error(y(349));(w&127)!==0||Y0(a,t,u)}e.memoizedState=u;var n={value:u,getSnapshot:t};return e.queue=n,P0(G0.bind(null,a,n,l),[l]),a.flags|=2048,va(9,{destroy:void 0},x0.bind(null,a,n,u,t),null),u},useId:function(){var l=Gl(),t=dl.identifierPrefix;if(k){var u=Mt,a=pt;u=(a&~(1<<32-lt(a)-1)).toString(32)+u,t="_"+t+"R_"+u,u=Pe++,0<u&&(t+="H"+u.toString(32)),t+="_"}else u=Qy++,t="_"+t+"r_"+u.toString(32)+"_";return l.memoizedState=t},useHostTransitionStatus:uc,useFormState:W0,useActionState:W0,useOptimistic:function(l){var t=Gl();t.memoizedState=t.baseState=l;var u={pending:null,lanes:0,dispatch:null,lastRenderedReducer:null,lastRenderedState:null};return t.queue=u,t=ac.bind(null,Z,!0,u),u.dispatch=t,[l,t]},useMemoCache:wf,useCacheRefresh:function(){return Gl().memoizedState=wy.bind(null,Z)},useEffectEvent:function(l){var t=Gl(),u={impl:l};return t.memoizedState=u,function(){if((tl&2)!==0)throw Error(y(440));return u.impl.apply(void 0,arguments)}}},ec={readContext:Hl,use:tn,useCallback:ns,useContext:Hl,useEffect:If,useImperativeHandle:es,useInsertionEffect:ts,useLayoutEffect:us,useMemo:fs,useReducer:un,useRef:I0,useState:function(){return un(Gt)},useDebugValue:Pf,useDeferredValue:function(l,t){var u=El();return cs(u,fl.memoizedState,l,t)},useTransition:function(){var l=un(Gt)[0],t=El().memoizedState;return[typeof l=="boolean"?l:Fa(l),t]},useSyncExternalStore:B0,useId:os,useHostTransitionStatus:uc,useFormState:$0,useActionState:$0,useOptimistic:function(l,t){var u=El();return Z0(u,fl,l,t)},useMemoCache:wf,useCacheRefresh:ys};ec.useEffectEvent=ls;var Ss={readContext:Hl,use:tn,useCallback:ns,useContext:Hl,useEffect:If,useImperativeHandle:es,useInsertionEffect:ts,useLayoutEffect:us,useMemo:fs,useReducer:$f,useRef:I0,useState:function(){return $f(Gt)},useDebugValue:Pf,useDeferredValue:function(l,t){var u=El();return fl===null?lc(u,l,t):cs(u,fl.memoizedState,l,t)},useTransition:function(){var l=$f(Gt)[0],t=El().memoizedState;return[typeof l=="boolean"?l:Fa(l),t]},useSyncExternalStore:B0,useId:os,useHostTransitionStatus:uc,useFormState:F0,useActionState:F0,useOptimistic:function(l,t){var u=El();return fl!==null?Z0(u,fl,l,t):(u.baseState=l,[l,u.queue.dispatch])},useMemoCache:wf,useCacheRefresh:ys};Ss.useEffectEvent=ls;function nc(l,t,u,a){t=l.memoizedState,u=u(a,t),u=u==null?t:M({},t,u),l.memoizedState=u,l.lanes===0&&(l.updateQueue.baseState=u)}var fc={enqueueSetState:function(l,t,u){l=l._reactInternals;var a=ct(),e=eu(a);e.payload=t,u!=null&&(e.callback=u),t=nu(l,e,a),t!==null&&($l(t,l,a),wa(t,l,a))},enqueueReplaceState:function(l,t,u){l=l._reactInternals;var a=ct(),e=eu(a);e.tag=1,e.payload=t,u!=null&&(e.callback=u),t=nu(l,e,a),t!==null&&($l(t,l,a),wa(t,l,a))},enqueueForceUpdate:function(l,t){l=l._reactInternals;var u=ct(),a=eu(u);a.tag=2,t!=null&&(a.callback=t),t=nu(l,a,u),t!==null&&($l(t,l,u),wa(t,l,u))}};function bs(l,t,u,a,e,n,f){return l=l.stateNode,typeof l.shouldComponentUpdate=="function"?l.shouldComponentUpdate(a,n,f):t.prototype&&t.prototype.isPureReactComponent?!Ga(u,a)||!Ga(e,n):!0}function rs(l,t,u,a){l=t.state,typeof t.componentWillReceiveProps=="function"&&t.componentWillReceiveProps(u,a),typeof t.UNSAFE_componentWillReceiveProps=="function"&&t.UNSAFE_componentWillReceiveProps(u,a),t.state!==l&&fc.enqueueReplaceState(t,t.state,null)}function xu(l,t){var u=t;if("ref"in t){u={};for(var a in t)a!=="ref"&&(u[a]=t[a])}if(l=l.defaultProps){u===t&&(u=M({},u));for(var e in l)u[e]===void 0&&(u[e]=l[e])}return u}function zs(l){Ye(l)}function Ts(l){console.error(l)}function Es(l){Ye(l)}function fn(l,t){try{var u=l.onUncaughtError;u(t.value,{componentStack:t.stack})}catch(a){setTimeout(function(){throw a})}}function As(l,t,u){try{var a=l.onCaughtError;a(u.value,{componentStack:u.stack,errorBoundary:t.tag===1?t.stateNode:null})}catch(e){setTimeout(function(){throw e})}}function cc(l,t,u){return u=eu(u),u.tag=3,u.payload={element:null},u.callback=function(){fn(l,t)},u}function _s(l){return l=eu(l),l.tag=3,l}function Os(l,t,u,a){var e=u.type.getDerivedStateFromError;if(typeof e=="function"){var n=a.value;l.payload=function(){return e(n)},l.callback=function(){As(t,u,a)}}var f=u.stateNode;f!==null&&typeof f.componentDidCatch=="function"&&(l.callback=function(){As(t,u,a),typeof e!="function"&&(ou===null?ou=new Set([this]):ou.add(this));var c=a.stack;this.componentDidCatch(a.value,{componentStack:c!==null?c:""})})}function $y(l,t,u,a,e){if(u.flags|=32768,a!==null&&typeof a=="object"&&typeof a.then=="function"){if(t=u.alternate,t!==null&&na(t,u,e,!0),u=at.current,u!==null){switch(u.tag){case 31:case 13:return gt===null?rn():u.alternate===null&&rl===0&&(rl=3),u.flags&=-257,u.flags|=65536,u.lanes=e,a===we?u.flags|=16384:(t=u.updateQueue,t===null?u.updateQueue=new Set([a]):t.add(a),Hc(l,a,e)),!1;case 22:return u.flags|=65536,a===we?u.flags|=16384:(t=u.updateQueue,t===null?(t={transitions:null,markerInstances:null,retryQueue:new Set([a])},u.updateQueue=t):(u=t.retryQueue,u===null?t.retryQueue=new Set([a]):u.add(a)),Hc(l,a,e)),!1}throw Error(y(435,u.tag))}return Hc(l,a,e),rn(),!1}if(k)return t=at.current,t!==null?((t.flags&65536)===0&&(t.flags|=256),t.flags|=65536,t.lanes=e,a!==pf&&(l=Error(y(422),{cause:a}),Za(yt(l,u)))):(a!==pf&&(t=Error(y(423),{cause:a}),Za(yt(t,u))),l=l.current.alternate,l.flags|=65536,e&=-e,l.lanes|=e,a=yt(a,u),e=cc(l.stateNode,a,e),Yf(l,e),rl!==4&&(rl=2)),!1;var n=Error(y(520),{cause:a});if(n=yt(n,u),ce===null?ce=[n]:ce.push(n),rl!==4&&(rl=2),t===null)return!0;a=yt(a,u),u=t;do{switch(u.tag){case 3:return u.flags|=65536,l=e&-e,u.lanes|=l,l=cc(u.stateNode,a,l),Yf(u,l),!1;case 1:if(t=u.type,n=u.stateNode,(u.flags&128)===0&&(typeof t.getDerivedStateFromError=="function"||n!==null&&typeof n.componentDidCatch=="function"&&(ou===null||!ou.has(n))))return u.flags|=65536,e&=-e,u.lanes|=e,e=_s(e),Os(e,l,u,a),Yf(u,e),!1}u=u.return}while(u!==null);return!1}var ic=Error(y(461)),Ol=!1;function Rl(l,t,u,a){t.child=l===null?U0(t,null,u,a):Bu(t,l.child,u,a)}function ps(l,t,u,a,e){u=u.render;var n=t.ref;if("ref"in a){var f={};for(var c in a)c!=="ref"&&(f[c]=a[c])}else f=a;return Hu(t),a=Vf(l,t,u,f,n,e),c=Lf(),l!==null&&!Ol?(Kf(l,t,e),Xt(l,t,e)):(k&&c&&_f(t),t.flags|=1,Rl(l,t,a,e),t.child)}function Ms(l,t,u,a,e){if(l===null){var n=u.type;return typeof n=="function"&&!Tf(n)&&n.defaultProps===void 0&&u.compare===null?(t.tag=15,t.type=n,Ds(l,t,n,a,e)):(l=Qe(u.type,null,a,t,t.mode,e),l.ref=t.ref,l.return=t,t.child=l)}if(n=l.child,!gc(l,e)){var f=n.memoizedProps;if(u=u.compare,u=u!==null?u:Ga,u(f,a)&&l.ref===t.ref)return Xt(l,t,e)}return t.flags|=1,l=jt(n,a),l.ref=t.ref,l.return=t,t.child=l}function Ds(l,t,u,a,e){if(l!==null){var n=l.memoizedProps;if(Ga(n,a)&&l.ref===t.ref)if(Ol=!1,t.pendingProps=a=n,gc(l,e))(l.flags&131072)!==0&&(Ol=!0);else return t.lanes=l.lanes,Xt(l,t,e)}return sc(l,t,u,a,e)}function Us(l,t,u,a){var e=a.children,n=l!==null?l.memoizedState:null;if(l===null&&t.stateNode===null&&(t.stateNode={_visibility:1,_pendingMarkers:null,_retryCache:null,_transitions:null}),a.mode==="hidden"){if((t.flags&128)!==0){if(n=n!==null?n.baseLanes|u:u,l!==null){for(a=t.child=l.child,e=0;a!==null;)e=e|a.lanes|a.childLanes,a=a.sibling;a=e&~n}else a=0,t.child=null;return Ns(l,t,n,u,a)}if((u&536870912)!==0)t.memoizedState={baseLanes:0,cachePool:null},l!==null&&Ke(t,n!==null?n.cachePool:null),n!==null?H0(t,n):Gf(),R0(t);else return a=t.lanes=536870912,Ns(l,t,n!==null?n.baseLanes|u:u,u,a)}else n!==null?(Ke(t,n.cachePool),H0(t,n),cu(),t.memoizedState=null):(l!==null&&Ke(t,null),Gf(),cu());return Rl(l,t,e,u),t.child}function le(l,t){return l!==null&&l.tag===22||t.stateNode!==null||(t.stateNode={_visibility:1,_pendingMarkers:null,_retryCache:null,_transitions:null}),t.sibling}function Ns(l,t,u,a,e){var n=Rf();return n=n===null?null:{parent:Al._currentValue,pool:n},t.memoizedState={baseLanes:u,cachePool:n},l!==null&&Ke(t,null),Gf(),R0(t),l!==null&&na(l,t,a,!0),t.childLanes=e,null}function cn(l,t){return t=dn({mode:t.mode,children:t.children},l.mode),t.ref=l.ref,l.child=t,t.return=l,t}function Cs(l,t,u){return Bu(t,l.child,null,u),l=cn(t,t.pendingProps),l.flags|=2,et(t),t.memoizedState=null,l}function ky(l,t,u){var a=t.pendingProps,e=(t.flags&128)!==0;if(t.flags&=-129,l===null){if(k){if(a.mode==="hidden")return l=cn(t,a),t.lanes=536870912,le(null,l);if(Qf(t),(l=yl)?(l=Vd(l,ht),l=l!==null&&l.data==="&"?l:null,l!==null&&(t.memoizedState={dehydrated:l,treeContext:Pt!==null?{id:pt,overflow:Mt}:null,retryLane:536870912,hydrationErrors:null},u=m0(l),u.return=t,t.child=u,Cl=t,yl=null)):l=null,l===null)throw tu(t);return t.lanes=536870912,null}return cn(t,a)}var n=l.memoizedState;if(n!==null){var f=n.dehydrated;if(Qf(t),e)if(t.flags&256)t.flags&=-257,t=Cs(l,t,u);else if(t.memoizedState!==null)t.child=l.child,t.flags|=128,t=null;else throw Error(y(558));else if(Ol||na(l,t,u,!1),e=(u&l.childLanes)!==0,Ol||e){if(a=dl,a!==null&&(f=Ti(a,u),f!==0&&f!==n.retryLane))throw n.retryLane=f,Du(l,f),$l(a,l,f),ic;rn(),t=Cs(l,t,u)}else l=n.treeContext,yl=St(f.nextSibling),Cl=t,k=!0,lu=null,ht=!1,l!==null&&S0(t,l),t=cn(t,a),t.flags|=4096;return t}return l=jt(l.child,{mode:a.mode,children:a.children}),l.ref=t.ref,t.child=l,l.return=t,l}function sn(l,t){var u=t.ref;if(u===null)l!==null&&l.ref!==null&&(t.flags|=4194816);else{if(typeof u!="function"&&typeof u!="object")throw Error(y(284));(l===null||l.ref!==u)&&(t.flags|=4194816)}}function sc(l,t,u,a,e){return Hu(t),u=Vf(l,t,u,a,void 0,e),a=Lf(),l!==null&&!Ol?(Kf(l,t,e),Xt(l,t,e)):(k&&a&&_f(t),t.flags|=1,Rl(l,t,u,e),t.child)}function Hs(l,t,u,a,e,n){return Hu(t),t.updateQueue=null,u=q0(t,a,u,e),j0(l),a=Lf(),l!==null&&!Ol?(Kf(l,t,n),Xt(l,t,n)):(k&&a&&_f(t),t.flags|=1,Rl(l,t,u,n),t.child)}function Rs(l,t,u,a,e){if(Hu(t),t.stateNode===null){var n=ta,f=u.contextType;typeof f=="object"&&f!==null&&(n=Hl(f)),n=new u(a,n),t.memoizedState=n.state!==null&&n.state!==void 0?n.state:null,n.updater=fc,t.stateNode=n,n._reactInternals=t,n=t.stateNode,n.props=a,n.state=t.memoizedState,n.refs={},qf(t),f=u.contextType,n.context=typeof f=="object"&&f!==null?Hl(f):ta,n.state=t.memoizedState,f=u.getDerivedStateFromProps,typeof f=="function"&&(nc(t,u,f,a),n.state=t.memoizedState),typeof u.getDerivedStateFromProps=="function"||typeof n.getSnapshotBeforeUpdate=="function"||typeof n.UNSAFE_componentWillMount!="function"&&typeof n.componentWillMount!="function"||(f=n.state,typeof n.componentWillMount=="function"&&n.componentWillMount(),typeof n.UNSAFE_componentWillMount=="function"&&n.UNSAFE_componentWillMount(),f!==n.state&&fc.enqueueReplaceState(n,n.state,null),$a(t,a,n,e),Wa(),n.state=t.memoizedState),typeof n.componentDidMount=="function"&&(t.flags|=4194308),a=!0}else if(l===null){n=t.stateNode;var c=t.memoizedProps,i=xu(u,c);n.props=i;var m=n.context,S=u.contextType;f=ta,typeof S=="object"&&S!==null&&(f=Hl(S));var T=u.getDerivedStateFromProps;S=typeof T=="function"||typeof n.getSnapshotBeforeUpdate=="function",c=t.pendingProps!==c,S||typeof n.UNSAFE_componentWillReceiveProps!="function"&&typeof n.componentWillReceiveProps!="function"||(c||m!==f)&&rs(t,n,a,f),au=!1;var h=t.memoizedState;n.state=h,$a(t,a,n,e),Wa(),m=t.memoizedState,c||h!==m||au?(typeof T=="function"&&(nc(t,u,T,a),m=t.memoizedState),(i=au||bs(t,u,i,a,h,m,f))?(S||typeof n.UNSAFE_componentWillMount!="function"&&typeof n.componentWillMount!="function"||(typeof n.componentWillMount=="function"&&n.componentWillMount(),typeof n.UNSAFE_componentWillMount=="function"&&n.UNSAFE_componentWillMount()),typeof n.componentDidMount=="function"&&(t.flags|=4194308)):(typeof n.componentDidMount=="function"&&(t.flags|=4194308),t.memoizedProps=a,t.memoizedState=m),n.props=a,n.state=m,n.context=f,a=i):(typeof n.componentDidMount=="function"&&(t.flags|=4194308),a=!1)}else{n=t.stateNode,Bf(l,t),f=t.memoizedProps,S=xu(u,f),n.props=S,T=t.pendingProps,h=n.context,m=u.contextType,i=ta,typeof m=="object"&&m!==null&&(i=Hl(m)),c=u.getDerivedStateFromProps,(m=typeof c=="function"||typeof n.getSnapshotBeforeUpdate=="function")||typeof n.UNSAFE_componentWillReceiveProps!="function"&&typeof n.componentWillReceiveProps!="function"||(f!==T||h!==i)&&rs(t,n,a,i),au=!1,h=t.memoizedState,n.state=h,$a(t,a,n,e),Wa();var g=t.memoizedState;f!==T||h!==g||au||l!==null&&l.dependencies!==null&&Ve(l.dependencies)?(typeof c=="function"&&(nc(t,u,c,a),g=t.memoizedState),(S=au||bs(t,u,S,a,h,g,i)||l!==null&&l.dependencies!==null&&Ve(l.dependencies))?(m||typeof n.UNSAFE_componentWillUpdate!="function"&&typeof n.componentWillUpdate!="function"||(typeof n.componentWillUpdate=="function"&&n.componentWillUpdate(a,g,i),typeof n.UNSAFE_componentWillUpdate=="function"&&n.UNSAFE_componentWillUpdate(a,g,i)),typeof n.componentDidUpdate=="function"&&(t.flags|=4),typeof n.getSnapshotBeforeUpdate=="function"&&(t.flags|=1024)):(typeof n.componentDidUpdate!="function"||f===l.memoizedProps&&h===l.memoizedState||(t.flags|=4),typeof n.getSnapshotBeforeUpdate!="function"||f===l.memoizedProps&&h===l.memoizedState||(t.flags|=1024),t.memoizedProps=a,t.memoizedState=g),n.props=a,n.state=g,n.context=i,a=S):(typeof n.componentDidUpdate!="function"||f===l.memoizedProps&&h===l.memoizedState||(t.flags|=4),typeof n.getSnapshotBeforeUpdate!="function"||f===l.memoizedProps&&h===l.memoizedState||(t.flags|=1024),a=!1)}return n=a,sn(l,t),a=(t.flags&128)!==0,n||a?(n=t.stateNode,u=a&&typeof u.getDerivedStateFromError!="function"?null:n.render(),t.flags|=1,l!==null&&a?(t.child=Bu(t,l.child,null,e),t.child=Bu(t,null,u,e)):Rl(l,t,u,e),t.memoizedState=n.state,l=t.child):l=Xt(l,t,e),l}function js(l,t,u,a){return Nu(),t.flags|=256,Rl(l,t,u,a),t.child}var dc={dehydrated:null,treeContext:null,retryLane:0,hydrationErrors:null};function oc(l){return{baseLanes:l,cachePool:A0()}}function yc(l,t,u){return l=l!==null?l.childLanes&~u:0,t&&(l|=ft),l}function qs(l,t,u){var a=t.pendingProps,e=!1,n=(t.flags&128)!==0,f;if((f=n)||(f=l!==null&&l.memoizedState===null?!1:(Tl.current&2)!==0),f&&(e=!0,t.flags&=-129),f=(t.flags&32)!==0,t.flags&=-33,l===null){if(k){if(e?fu(t):cu(),(l=yl)?(l=Vd(l,ht),l=l!==null&&l.data!=="&"?l:null,l!==null&&(t.memoizedState={dehydrated:l,treeContext:Pt!==null?{id:pt,overflow:Mt}:null,retryLane:536870912,hydrationErrors:null},u=m0(l),u.return=t,t.child=u,Cl=t,yl=null)):l=null,l===null)throw tu(t);return Wc(l)?t.lanes=32:t.lanes=536870912,null}var c=a.children;return a=a.fallback,e?(cu(),e=t.mode,c=dn({mode:"hidden",children:c},e),a=Uu(a,e,u,null),c.return=t,a.return=t,c.sibling=a,t.child=c,a=t.child,a.memoizedState=oc(u),a.childLanes=yc(l,f,u),t.memoizedState=dc,le(null,a)):(fu(t),vc(t,c))}var i=l.memoizedState;if(i!==null&&(c=i.dehydrated,c!==null)){if(n)t.flags&256?(fu(t),t.flags&=-257,t=mc(l,t,u)):t.memoizedState!==null?(cu(),t.child=l.child,t.flags|=128,t=null):(cu(),c=a.fallback,e=t.mode,a=dn({mode:"visible",children:a.children},e),c=Uu(c,e,u,null),c.flags|=2,a.return=t,c.return=t,a.sibling=c,t.child=a,Bu(t,l.child,null,u),a=t.child,a.memoizedState=oc(u),a.childLanes=yc(l,f,u),t.memoizedState=dc,t=le(null,a));else if(fu(t),Wc(c)){if(f=c.nextSibling&&c.nextSibling.dataset,f)var m=f.dgst;f=m,a=Error(y(419)),a.stack="",a.digest=f,Za({value:a,source:null,stack:null}),t=mc(l,t,u)}else if(Ol||na(l,t,u,!1),f=(u&l.childLanes)!==0,Ol||f){if(f=dl,f!==null&&(a=Ti(f,u),a!==0&&a!==i.retryLane))throw i.retryLane=a,Du(l,a),$l(f,l,a),ic;wc(c)||rn(),t=mc(l,t,u)}else wc(c)?(t.flags|=192,t.child=l.child,t=null):(l=i.treeContext,yl=St(c.nextSibling),Cl=t,k=!0,lu=null,ht=!1,l!==null&&S0(t,l),t=vc(t,a.children),t.flags|=4096);return t}return e?(cu(),c=a.fallback,e=t.mode,i=l.child,m=i.sibling,a=jt(i,{mode:"hidden",children:a.children}),a.subtreeFlags=i.subtreeFlags&65011712,m!==null?c=jt(m,c):(c=Uu(c,e,u,null),c.flags|=2),c.return=t,a.return=t,a.sibling=c,t.child=a,le(null,a),a=t.child,c=l.child.memoizedState,c===null?c=oc(u):(e=c.cachePool,e!==null?(i=Al._currentValue,e=e.parent!==i?{parent:i,pool:i}:e):e=A0(),c={baseLanes:c.baseLanes|u,cachePool:e}),a.memoizedState=c,a.childLanes=yc(l,f,u),t.memoizedState=dc,le(l.child,a)):(fu(t),u=l.child,l=u.sibling,u=jt(u,{mode:"visible",children:a.children}),u.return=t,u.sibling=null,l!==null&&(f=t.deletions,f===null?(t.deletions=[l],t.flags|=16):f.push(l)),t.child=u,t.memoizedState=null,u)}function vc(l,t){return t=dn({mode:"visible",children:t},l.mode),t.return=l,l.child=t}function dn(l,t){return l=ut(22,l,null,t),l.lanes=0,l}function mc(l,t,u){return Bu(t,l.child,null,u),l=vc(t,t.pendingProps.children),l.flags|=2,t.memoizedState=null,l}function Bs(l,t,u){l.lanes|=t;var a=l.alternate;a!==null&&(a.lanes|=t),Uf(l.return,t,u)}function hc(l,t,u,a,e,n){var f=l.memoizedState;f===null?l.memoizedState={isBackwards:t,rendering:null,renderingStartTime:0,last:a,tail:u,tailMode:e,treeForkCount:n}:(f.isBackwards=t,f.rendering=null,f.renderingStartTime=0,f.last=a,f.tail=u,f.tailMode=e,f.treeForkCount=n)}function Ys(l,t,u){var a=t.pendingProps,e=a.revealOrder,n=a.tail;a=a.children;var f=Tl.current,c=(f&2)!==0;if(c?(f=f&1|2,t.flags|=128):f&=1,p(Tl,f),Rl(l,t,a,u),a=k?Qa:0,!c&&l!==null&&(l.flags&128)!==0)l:for(l=t.child;l!==null;){if(l.tag===13)l.memoizedState!==null&&Bs(l,u,t);else if(l.tag===19)Bs(l,u,t);else if(l.child!==null){l.child.return=l,l=l.child;continue}if(l===t)break l;for(;l.sibling===null;){if(l.return===null||l.return===t)break l;l=l.return}l.sibling.return=l.return,l=l.sibling}switch(e){case"forwards":for(u=t.child,e=null;u!==null;)l=u.alternate,l!==null&&Fe(l)===null&&(e=u),u=u.sibling;u=e,u===null?(e=t.child,t.child=null):(e=u.sibling,u.sibling=null),hc(t,!1,e,u,n,a);break;case"backwards":case"unstable_legacy-backwards":for(u=null,e=t.child,t.child=null;e!==null;){if(l=e.alternate,l!==null&&Fe(l)===null){t.child=e;break}l=e.sibling,e.sibling=u,u=e,e=l}hc(t,!0,u,null,n,a);break;case"together":hc(t,!1,null,null,void 0,a);break;default:t.memoizedState=null}return t.child}function Xt(l,t,u){if(l!==null&&(t.dependencies=l.dependencies),du|=t.lanes,(u&t.childLanes)===0)if(l!==null){if(na(l,t,u,!1),(u&t.childLanes)===0)return null}else return null;if(l!==null&&t.child!==l.child)throw Error(y(153));if(t.child!==null){for(l=t.child,u=jt(l,l.pendingProps),t.child=u,u.return=t;l.sibling!==null;)l=l.sibling,u=u.sibling=jt(l,l.pendingProps),u.return=t;u.sibling=null}return t.child}function gc(l,t){return(l.lanes&t)!==0?!0:(l=l.dependencies,!!(l!==null&&Ve(l)))}function Fy(l,t,u){switch(t.tag){case 3:xl(t,t.stateNode.containerInfo),uu(t,Al,l.memoizedState.cache),Nu();break;case 27:case 5:pa(t);break;case 4:xl(t,t.stateNode.containerInfo);break;case 10:uu(t,t.type,t.memoizedProps.value);break;case 31:if(t.memoizedState!==null)return t.flags|=128,Qf(t),null;break;case 13:var a=t.memoizedState;if(a!==null)return a.dehydrated!==null?(fu(t),t.flags|=128,null):(u&t.child.childLanes)!==0?qs(l,t,u):(fu(t),l=Xt(l,t,u),l!==null?l.sibling:null);fu(t);break;case 19:var e=(l.flags&128)!==0;if(a=(u&t.childLanes)!==0,a||(na(l,t,u,!1),a=(u&t.childLanes)!==0),e){if(a)return Ys(l,t,u);t.flags|=128}if(e=t.memoizedState,e!==null&&(e.rendering=null,e.tail=null,e.lastEffect=null),p(Tl,Tl.current),a)break;return null;case 22:return t.lanes=0,Us(l,t,u,t.pendingProps);case 24:uu(t,Al,l.memoizedState.cache)}return Xt(l,t,u)}function xs(l,t,u){if(l!==null)if(l.memoizedProps!==t.pendingProps)Ol=!0;else{if(!gc(l,u)&&(t.flags&128)===0)return Ol=!1,Fy(l,t,u);Ol=(l.flags&131072)!==0}else Ol=!1,k&&(t.flags&1048576)!==0&&g0(t,Qa,t.index);switch(t.lanes=0,t.tag){case 16:l:{var a=t.pendingProps;if(l=ju(t.elementType),t.type=l,typeof l=="function")Tf(l)?(a=xu(l,a),t.tag=1,t=Rs(null,t,l,a,u)):(t.tag=0,t=sc(null,t,l,a,u));else{if(l!=null){var e=l.$$typeof;if(e===it){t.tag=11,t=ps(null,t,l,a,u);break l}else if(e===$){t.tag=14,t=Ms(null,t,l,a,u);break l}}throw t=Nt(l)||l,Error(y(306,t,""))}}return t;case 0:return sc(l,t,t.type,t.pendingProps,u);case 1:return a=t.type,e=xu(a,t.pendingProps),Rs(l,t,a,e,u);case 3:l:{if(xl(t,t.stateNode.containerInfo),l===null)throw Error(y(387));a=t.pendingProps;var n=t.memoizedState;e=n.element,Bf(l,t),$a(t,a,null,u);var f=t.memoizedState;if(a=f.cache,uu(t,Al,a),a!==n.cache&&Nf(t,[Al],u,!0),Wa(),a=f.element,n.isDehydrated)if(n={element:a,isDehydrated:!1,cache:f.cache},t.updateQueue.baseState=n,t.memoizedState=n,t.flags&256){t=js(l,t,a,u);break l}else if(a!==e){e=yt(Error(y(424)),t),Za(e),t=js(l,t,a,u);break l}else for(l=t.stateNode.containerInfo,l.nodeType===9?l=l.body:l=l.nodeName==="HTML"?l.ownerDocument.body:l,yl=St(l.firstChild),Cl=t,k=!0,lu=null,ht=!0,u=U0(t,null,a,u),t.child=u;u;)u.flags=u.flags&-3|4096,u=u.sibling;else{if(Nu(),a===e){t=Xt(l,t,u);break l}Rl(l,t,a,u)}t=t.child}return t;case 26:return sn(l,t),l===null?(u=$d(t.type,null,t.pendingProps,null))?t.memoizedState=u:k||(u=t.type,l=t.pendingProps,a=pn(L.current).createElement(u),a[Nl]=t,a[Vl]=l,jl(a,u,l),Dl(a),t.stateNode=a):t.memoizedState=$d(t.type,l.memoizedProps,t.pendingProps,l.memoizedState),null;case 27:return pa(t),l===null&&k&&(a=t.stateNode=Jd(t.type,t.pendingProps,L.current),Cl=t,ht=!0,e=yl,hu(t.type)?($c=e,yl=St(a.firstChild)):yl=e),Rl(l,t,t.pendingProps.children,u),sn(l,t),l===null&&(t.flags|=4194304),t.child;case 5:return l===null&&k&&((e=a=yl)&&(a=Mv(a,t.type,t.pendingProps,ht),a!==null?(t.stateNode=a,Cl=t,yl=St(a.firstChild),ht=!1,e=!0):e=!1),e||tu(t)),pa(t),e=t.type,n=t.pendingProps,f=l!==null?l.memoizedProps:null,a=n.children,Lc(e,n)?a=null:f!==null&&Lc(e,f)&&(t.flags|=32),t.memoizedState!==null&&(e=Vf(l,t,Zy,null,null,u),he._currentValue=e),sn(l,t),Rl(l,t,a,u),t.child;case 6:return l===null&&k&&((l=u=yl)&&(u=Dv(u,t.pendingProps,ht),u!==null?(t.stateNode=u,Cl=t,yl=null,l=!0):l=!1),l||tu(t)),null;case 13:return qs(l,t,u);case 4:return xl(t,t.stateNode.containerInfo),a=t.pendingProps,l===null?t.child=Bu(t,null,a,u):Rl(l,t,a,u),t.child;case 11:return ps(l,t,t.type,t.pendingProps,u);case 7:return Rl(l,t,t.pendingProps,u),t.child;case 8:return Rl(l,t,t.pendingProps.children,u),t.child;case 12:return Rl(l,t,t.pendingProps.children,u),t.child;case 10:return a=t.pendingProps,uu(t,t.type,a.value),Rl(l,t,a.children,u),t.child;case 9:return e=t.type._context,a=t.pendingProps.children,Hu(t),e=Hl(e),a=a(e),t.flags|=1,Rl(l,t,a,u),t.child;case 14:return Ms(l,t,t.type,t.pendingProps,u);case 15:return Ds(l,t,t.type,t.pendingProps,u);case 19:return Ys(l,t,u);case 31:return ky(l,t,u);case 22:return Us(l,t,u,t.pendingProps);case 24:return Hu(t),a=Hl(Al),l===null?(e=Rf(),e===null&&(e=dl,n=Cf(),e.pooledCache=n,n.refCount++,n!==null&&(e.pooledCacheLanes|=u),e=n),t.memoizedState={parent:a,cache:e},qf(t),uu(t,Al,e)):((l.lanes&u)!==0&&(Bf(l,t),$a(t,null,null,u),Wa()),e=l.memoizedState,n=t.memoizedState,e.parent!==a?(e={parent:a,cache:a},t.memoizedState=e,t.lanes===0&&(t.memoizedState=t.updateQueue.baseState=e),uu(t,Al,a)):(a=n.cache,uu(t,Al,a),a!==e.cache&&Nf(t,[Al],u,!0))),Rl(l,t,t.pendingProps.children,u),t.child;case 29:throw t.pendingProps}throw Error(y(156,t.tag))}function Qt(l){l.flags|=4}function Sc(l,t,u,a,e){if((t=(l.mode&32)!==0)&&(t=!1),t){if(l.flags|=16777216,(e&335544128)===e)if(l.stateNode.complete)l.flags|=8192;else if(od())l.flags|=8192;else throw qu=we,jf}else l.flags&=-16777217}function Gs(l,t){if(t.type!=="stylesheet"||(t.state.loading&4)!==0)l.flags&=-16777217;else if(l.flags|=16777216,!lo(t))if(od())l.flags|=8192;else throw qu=we,jf}function on(l,t){t!==null&&(l.flags|=4),l.flags&16384&&(t=l.tag!==22?bi():536870912,l.lanes|=t,Sa|=t)}function te(l,t){if(!k)switch(l.tailMode){case"hidden":t=l.tail;for(var u=null;t!==null;)t.alternate!==null&&(u=t),t=t.sibling;u===null?l.tail=null:u.sibling=null;break;case"collapsed":u=l.tail;for(var a=null;u!==null;)u.alternate!==null&&(a=u),u=u.sibling;a===null?t||l.tail===null?l.tail=null:l.tail.sibling=null:a.sibling=null}}function vl(l){var t=l.alternate!==null&&l.alternate.child===l.child,u=0,a=0;if(t)for(var e=l.child;e!==null;)u|=e.lanes|e.childLanes,a|=e.subtreeFlags&65011712,a|=e.flags&65011712,e.return=l,e=e.sibling;else for(e=l.child;e!==null;)u|=e.lanes|e.childLanes,a|=e.subtreeFlags,a|=e.flags,e.return=l,e=e.sibling;return l.subtreeFlags|=a,l.childLanes=u,t}function Iy(l,t,u){var a=t.pendingProps;switch(Of(t),t.tag){case 16:case 15:case 0:case 11:case 7:case 8:case 12:case 9:case 14:return vl(t),null;case 1:return vl(t),null;case 3:return u=t.stateNode,a=null,l!==null&&(a=l.memoizedState.cache),t.memoizedState.cache!==a&&(t.flags|=2048),Yt(Al),zl(),u.pendingContext&&(u.context=u.pendingContext,u.pendingContext=null),(l===null||l.child===null)&&(ea(t)?Qt(t):l===null||l.memoizedState.isDehydrated&&(t.flags&256)===0||(t.flags|=1024,Mf())),vl(t),null;case 26:var e=t.type,n=t.memoizedState;return l===null?(Qt(t),n!==null?(vl(t),Gs(t,n)):(vl(t),Sc(t,e,null,a,u))):n?n!==l.memoizedState?(Qt(t),vl(t),Gs(t,n)):(vl(t),t.flags&=-16777217):(l=l.memoizedProps,l!==a&&Qt(t),vl(t),Sc(t,e,l,a,u)),null;case 27:if(Te(t),u=L.current,e=t.type,l!==null&&t.stateNode!=null)l.memoizedProps!==a&&Qt(t);else{if(!a){if(t.stateNode===null)throw Error(y(166));return vl(t),null}l=N.current,ea(t)?b0(t):(l=Jd(e,a,u),t.stateNode=l,Qt(t))}return vl(t),null;case 5:if(Te(t),e=t.type,l!==null&&t.stateNode!=null)l.memoizedProps!==a&&Qt(t);else{if(!a){if(t.stateNode===null)throw Error(y(166));return vl(t),null}if(n=N.current,ea(t))b0(t);else{var f=pn(L.current);switch(n){case 1:n=f.createElementNS("http://www.w3.org/2000/svg",e);break;case 2:n=f.createElementNS("http://www.w3.org/1998/Math/MathML",e);break;default:switch(e){case"svg":n=f.createElementNS("http://www.w3.org/2000/svg",e);break;case"math":n=f.createElementNS("http://www.w3.org/1998/Math/MathML",e);break;case"script":n=f.createElement("div"),n.innerHTML="<script><\/script>",n=n.removeChild(n.firstChild);break;case"select":n=typeof a.is=="string"?f.createElement("select",{is:a.is}):f.createElement("select"),a.multiple?n.multiple=!0:a.size&&(n.size=a.size);break;default:n=typeof a.is=="string"?f.createElement(e,{is:a.is}):f.createElement(e)}}n[Nl]=t,n[Vl]=a;l:for(f=t.child;f!==null;){if(f.tag===5||f.tag===6)n.appendChild(f.stateNode);else if(f.tag!==4&&f.tag!==27&&f.child!==null){f.child.return=f,f=f.child;continue}if(f===t)break l;for(;f.sibling===null;){if(f.return===null||f.return===t)break l;f=f.return}f.sibling.return=f.return,f=f.sibling}t.stateNode=n;l:switch(jl(n,e,a),e){case"button":case"input":case"select":case"textarea":a=!!a.autoFocus;break l;case"img":a=!0;break l;default:a=!1}a&&Qt(t)}}return vl(t),Sc(t,t.type,l===null?null:l.memoizedProps,t.pendingProps,u),null;case 6:if(l&&t.stateNode!=null)l.memoizedProps!==a&&Qt(t);else{if(typeof a!="string"&&t.stateNode===null)throw Error(y(166));if(l=L.current,ea(t)){if(l=t.stateNode,u=t.memoizedProps,a=null,e=Cl,e!==null)switch(e.tag){case 27:case 5:a=e.memoizedProps}l[Nl]=t,l=!!(l.nodeValue===u||a!==null&&a.suppressHydrationWarning===!0||qd(l.nodeValue,u)),l||tu(t,!0)}else l=pn(l).createTextNode(a),l[Nl]=t,t.stateNode=l}return vl(t),null;case 31:if(u=t.memoizedState,l===null||l.memoizedState!==null){if(a=ea(t),u!==null){if(l===null){if(!a)throw Error(y(318));if(l=t.memoizedState,l=l!==null?l.dehydrated:null,!l)throw Error(y(557));l[Nl]=t}else Nu(),(t.flags&128)===0&&(t.memoizedState=null),t.flags|=4;vl(t),l=!1}else u=Mf(),l!==null&&l.memoizedState!==null&&(l.memoizedState.hydrationErrors=u),l=!0;if(!l)return t.flags&256?(et(t),t):(et(t),null);if((t.flags&128)!==0)throw Error(y(558))}return vl(t),null;case 13:if(a=t.memoizedState,l===null||l.memoizedState!==null&&l.memoizedState.dehydrated!==null){if(e=ea(t),a!==null&&a.dehydrated!==null){if(l===null){if(!e)throw Error(y(318));if(e=t.memoizedState,e=e!==null?e.dehydrated:null,!e)throw Error(y(317));e[Nl]=t}else Nu(),(t.flags&128)===0&&(t.memoizedState=null),t.flags|=4;vl(t),e=!1}else e=Mf(),l!==null&&l.memoizedState!==null&&(l.memoizedState.hydrationErrors=e),e=!0;if(!e)return t.flags&256?(et(t),t):(et(t),null)}return et(t),(t.flags&128)!==0?(t.lanes=u,t):(u=a!==null,l=l!==null&&l.memoizedState!==null,u&&(a=t.child,e=null,a.alternate!==null&&a.alternate.memoizedState!==null&&a.alternate.memoizedState.cachePool!==null&&(e=a.alternate.memoizedState.cachePool.pool),n=null,a.memoizedState!==null&&a.memoizedState.cachePool!==null&&(n=a.memoizedState.cachePool.pool),n!==e&&(a.flags|=2048)),u!==l&&u&&(t.child.flags|=8192),on(t,t.updateQueue),vl(t),null);case 4:return zl(),l===null&&Gc(t.stateNode.containerInfo),vl(t),null;case 10:return Yt(t.type),vl(t),null;case 19:if(E(Tl),a=t.memoizedState,a===null)return vl(t),null;if(e=(t.flags&128)!==0,n=a.rendering,n===null)if(e)te(a,!1);else{if(rl!==0||l!==null&&(l.flags&128)!==0)for(l=t.child;l!==null;){if(n=Fe(l),n!==null){for(t.flags|=128,te(a,!1),l=n.updateQueue,t.updateQueue=l,on(t,l),t.subtreeFlags=0,l=u,u=t.child;u!==null;)v0(u,l),u=u.sibling;return p(Tl,Tl.current&1|2),k&&qt(t,a.treeForkCount),t.child}l=l.sibling}a.tail!==null&&Il()>gn&&(t.flags|=128,e=!0,te(a,!1),t.lanes=4194304)}else{if(!e)if(l=Fe(n),l!==null){if(t.flags|=128,e=!0,l=l.updateQueue,t.updateQueue=l,on(t,l),te(a,!0),a.tail===null&&a.tailMode==="hidden"&&!n.alternate&&!k)return vl(t),null}else 2*Il()-a.renderingStartTime>gn&&u!==536870912&&(t.flags|=128,e=!0,te(a,!1),t.lanes=4194304);a.isBackwards?(n.sibling=t.child,t.child=n):(l=a.last,l!==null?l.sibling=n:t.child=n,a.last=n)}return a.tail!==null?(l=a.tail,a.rendering=l,a.tail=l.sibling,a.renderingStartTime=Il(),l.sibling=null,u=Tl.current,p(Tl,e?u&1|2:u&1),k&&qt(t,a.treeForkCount),l):(vl(t),null);case 22:case 23:return et(t),Xf(),a=t.memoizedState!==null,l!==null?l.memoizedState!==null!==a&&(t.flags|=8192):a&&(t.flags|=8192),a?(u&536870912)!==0&&(t.flags&128)===0&&(vl(t),t.subtreeFlags&6&&(t.flags|=8192)):vl(t),u=t.updateQueue,u!==null&&on(t,u.retryQueue),u=null,l!==null&&l.memoizedState!==null&&l.memoizedState.cachePool!==null&&(u=l.memoizedState.cachePool.pool),a=null,t.memoizedState!==null&&t.memoizedState.cachePool!==null&&(a=t.memoizedState.cachePool.pool),a!==u&&(t.flags|=2048),l!==null&&E(Ru),null;case 24:return u=null,l!==null&&(u=l.memoizedState.cache),t.memoizedState.cache!==u&&(t.flags|=2048),Yt(Al),vl(t),null;case 25:return null;case 30:return null}throw Error(y(156,t.tag))}function Py(l,t){switch(Of(t),t.tag){case 1:return l=t.flags,l&65536?(t.flags=l&-65537|128,t):null;case 3:return Yt(Al),zl(),l=t.flags,(l&65536)!==0&&(l&128)===0?(t.flags=l&-65537|128,t):null;case 26:case 27:case 5:return Te(t),null;case 31:if(t.memoizedState!==null){if(et(t),t.alternate===null)throw Error(y(340));Nu()}return l=t.flags,l&65536?(t.flags=l&-65537|128,t):null;case 13:if(et(t),l=t.memoizedState,l!==null&&l.dehydrated!==null){if(t.alternate===null)throw Error(y(340));Nu()}return l=t.flags,l&65536?(t.flags=l&-65537|128,t):null;case 19:return E(Tl),null;case 4:return zl(),null;case 10:return Yt(t.type),null;case 22:case 23:return et(t),Xf(),l!==null&&E(Ru),l=t.flags,l&65536?(t.flags=l&-65537|128,t):null;case 24:return Yt(Al),null;case 25:return null;default:return null}}function Xs(l,t){switch(Of(t),t.tag){case 3:Yt(Al),zl();break;case 26:case 27:case 5:Te(t);break;case 4:zl();break;case 31:t.memoizedState!==null&&et(t);break;case 13:et(t);break;case 19:E(Tl);break;case 10:Yt(t.type);break;case 22:case 23:et(t),Xf(),l!==null&&E(Ru);break;case 24:Yt(Al)}}function ue(l,t){try{var u=t.updateQueue,a=u!==null?u.lastEffect:null;if(a!==null){var e=a.next;u=e;do{if((u.tag&l)===l){a=void 0;var n=u.create,f=u.inst;a=n(),f.destroy=a}u=u.next}while(u!==e)}}catch(c){el(t,t.return,c)}}function iu(l,t,u){try{var a=t.updateQueue,e=a!==null?a.lastEffect:null;if(e!==null){var n=e.next;a=n;do{if((a.tag&l)===l){var f=a.inst,c=f.destroy;if(c!==void 0){f.destroy=void 0,e=t;var i=u,m=c;try{m()}catch(S){el(e,i,S)}}}a=a.next}while(a!==n)}}catch(S){el(t,t.return,S)}}function Qs(l){var t=l.updateQueue;if(t!==null){var u=l.stateNode;try{C0(t,u)}catch(a){el(l,l.return,a)}}}function Zs(l,t,u){u.props=xu(l.type,l.memoizedProps),u.state=l.memoizedState;try{u.componentWillUnmount()}catch(a){el(l,t,a)}}function ae(l,t){try{var u=l.ref;if(u!==null){switch(l.tag){case 26:case 27:case 5:var a=l.stateNode;break;case 30:a=l.stateNode;break;default:a=l.stateNode}typeof u=="function"?l.refCleanup=u(a):u.current=a}}catch(e){el(l,t,e)}}function Dt(l,t){var u=l.ref,a=l.refCleanup;if(u!==null)if(typeof a=="function")try{a()}catch(e){el(l,t,e)}finally{l.refCleanup=null,l=l.alternate,l!=null&&(l.refCleanup=null)}else if(typeof u=="function")try{u(null)}catch(e){el(l,t,e)}else u.current=null}function Vs(l){var t=l.type,u=l.memoizedProps,a=l.stateNode;try{l:switch(t){case"button":case"input":case"select":case"textarea":u.autoFocus&&a.focus();break l;case"img":u.src?a.src=u.src:u.srcSet&&(a.srcset=u.srcSet)}}catch(e){el(l,l.return,e)}}function bc(l,t,u){try{var a=l.stateNode;Tv(a,l.type,u,t),a[Vl]=t}catch(e){el(l,l.return,e)}}function Ls(l){return l.tag===5||l.tag===3||l.tag===26||l.tag===27&&hu(l.type)||l.tag===4}function rc(l){l:for(;;){for(;l.sibling===null;){if(l.return===null||Ls(l.return))return null;l=l.return}for(l.sibling.return=l.return,l=l.sibling;l.tag!==5&&l.tag!==6&&l.tag!==18;){if(l.tag===27&&hu(l.type)||l.flags&2||l.child===null||l.tag===4)continue l;l.child.return=l,l=l.child}if(!(l.flags&2))return l.stateNode}}function zc(l,t,u){var a=l.tag;if(a===5||a===6)l=l.stateNode,t?(u.nodeType===9?u.body:u.nodeName==="HTML"?u.ownerDocument.body:u).insertBefore(l,t):(t=u.nodeType===9?u.body:u.nodeName==="HTML"?u.ownerDocument.body:u,t.appendChild(l),u=u._reactRootContainer,u!=null||t.onclick!==null||(t.onclick=Ht));else if(a!==4&&(a===27&&hu(l.type)&&(u=l.stateNode,t=null),l=l.child,l!==null))for(zc(l,t,u),l=l.sibling;l!==null;)zc(l,t,u),l=l.sibling}function yn(l,t,u){var a=l.tag;if(a===5||a===6)l=l.stateNode,t?u.insertBefore(l,t):u.appendChild(l);else if(a!==4&&(a===27&&hu(l.type)&&(u=l.stateNode),l=l.child,l!==null))for(yn(l,t,u),l=l.sibling;l!==null;)yn(l,t,u),l=l.sibling}function Ks(l){var t=l.stateNode,u=l.memoizedProps;try{for(var a=l.type,e=t.attributes;e.length;)t.removeAttributeNode(e[0]);jl(t,a,u),t[Nl]=l,t[Vl]=u}catch(n){el(l,l.return,n)}}var Zt=!1,pl=!1,Tc=!1,Js=typeof WeakSet=="function"?WeakSet:Set,Ul=null;function lv(l,t){if(l=l.containerInfo,Zc=Rn,l=e0(l),mf(l)){if("selectionStart"in l)var u={start:l.selectionStart,end:l.selectionEnd};else l:{u=(u=l.ownerDocument)&&u.defaultView||window;var a=u.getSelection&&u.getSelection();if(a&&a.rangeCount!==0){u=a.anchorNode;var e=a.anchorOffset,n=a.focusNode;a=a.focusOffset;try{u.nodeType,n.nodeType}catch{u=null;break l}var f=0,c=-1,i=-1,m=0,S=0,T=l,h=null;t:for(;;){for(var g;T!==u||e!==0&&T.nodeType!==3||(c=f+e),T!==n||a!==0&&T.nodeType!==3||(i=f+a),T.nodeType===3&&(f+=T.nodeValue.length),(g=T.firstChild)!==null;)h=T,T=g;for(;;){if(T===l)break t;if(h===u&&++m===e&&(c=f),h===n&&++S===a&&(i=f),(g=T.nextSibling)!==null)break;T=h,h=T.parentNode}T=g}u=c===-1||i===-1?null:{start:c,end:i}}else u=null}u=u||{start:0,end:0}}else u=null;for(Vc={focusedElem:l,selectionRange:u},Rn=!1,Ul=t;Ul!==null;)if(t=Ul,l=t.child,(t.subtreeFlags&1028)!==0&&l!==null)l.return=t,Ul=l;else for(;Ul!==null;){switch(t=Ul,n=t.alternate,l=t.flags,t.tag){case 0:if((l&4)!==0&&(l=t.updateQueue,l=l!==null?l.events:null,l!==null))for(u=0;u<l.length;u++)e=l[u],e.ref.impl=e.nextImpl;break;case 11:case 15:break;case 1:if((l&1024)!==0&&n!==null){l=void 0,u=t,e=n.memoizedProps,n=n.memoizedState,a=u.stateNode;try{var U=xu(u.type,e);l=a.getSnapshotBeforeUpdate(U,n),a.__reactInternalSnapshotBeforeUpdate=l}catch(j){el(u,u.return,j)}}break;case 3:if((l&1024)!==0){if(l=t.stateNode.containerInfo,u=l.nodeType,u===9)Jc(l);else if(u===1)switch(l.nodeName){case"HEAD":case"HTML":case"BODY":Jc(l);break;default:l.textContent=""}}break;case 5:case 26:case 27:case 6:case 4:case 17:break;default:if((l&1024)!==0)throw Error(y(163))}if(l=t.sibling,l!==null){l.return=t.return,Ul=l;break}Ul=t.return}}function ws(l,t,u){var a=u.flags;switch(u.tag){case 0:case 11:case 15:Lt(l,u),a&4&&ue(5,u);break;case 1:if(Lt(l,u),a&4)if(l=u.stateNode,t===null)try{l.componentDidMount()}catch(f){el(u,u.return,f)}else{var e=xu(u.type,t.memoizedProps);t=t.memoizedState;try{l.componentDidUpdate(e,t,l.__reactInternalSnapshotBeforeUpdate)}catch(f){el(u,u.return,f)}}a&64&&Qs(u),a&512&&ae(u,u.return);break;case 3:if(Lt(l,u),a&64&&(l=u.updateQueue,l!==null)){if(t=null,u.child!==null)switch(u.child.tag){case 27:case 5:t=u.child.stateNode;break;case 1:t=u.child.stateNode}try{C0(l,t)}catch(f){el(u,u.return,f)}}break;case 27:t===null&&a&4&&Ks(u);case 26:case 5:Lt(l,u),t===null&&a&4&&Vs(u),a&512&&ae(u,u.return);break;case 12:Lt(l,u);break;case 31:Lt(l,u),a&4&&ks(l,u);break;case 13:Lt(l,u),a&4&&Fs(l,u),a&64&&(l=u.memoizedState,l!==null&&(l=l.dehydrated,l!==null&&(u=sv.bind(null,u),Uv(l,u))));break;case 22:if(a=u.memoizedState!==null||Zt,!a){t=t!==null&&t.memoizedState!==null||pl,e=Zt;var n=pl;Zt=a,(pl=t)&&!n?Kt(l,u,(u.subtreeFlags&8772)!==0):Lt(l,u),Zt=e,pl=n}break;case 30:break;default:Lt(l,u)}}function Ws(l){var t=l.alternate;t!==null&&(l.alternate=null,Ws(t)),l.child=null,l.deletions=null,l.sibling=null,l.tag===5&&(t=l.stateNode,t!==null&&kn(t)),l.stateNode=null,l.return=null,l.dependencies=null,l.memoizedProps=null,l.memoizedState=null,l.pendingProps=null,l.stateNode=null,l.updateQueue=null}var ml=null,Kl=!1;function Vt(l,t,u){for(u=u.child;u!==null;)$s(l,t,u),u=u.sibling}function $s(l,t,u){if(Pl&&typeof Pl.onCommitFiberUnmount=="function")try{Pl.onCommitFiberUnmount(Ma,u)}catch{}switch(u.tag){case 26:pl||Dt(u,t),Vt(l,t,u),u.memoizedState?u.memoizedState.count--:u.stateNode&&(u=u.stateNode,u.parentNode.removeChild(u));break;case 27:pl||Dt(u,t);var a=ml,e=Kl;hu(u.type)&&(ml=u.stateNode,Kl=!1),Vt(l,t,u),ye(u.stateNode),ml=a,Kl=e;break;case 5:pl||Dt(u,t);case 6:if(a=ml,e=Kl,ml=null,Vt(l,t,u),ml=a,Kl=e,ml!==null)if(Kl)try{(ml.nodeType===9?ml.body:ml.nodeName==="HTML"?ml.ownerDocument.body:ml).removeChild(u.stateNode)}catch(n){el(u,t,n)}else try{ml.removeChild(u.stateNode)}catch(n){el(u,t,n)}break;case 18:ml!==null&&(Kl?(l=ml,Qd(l.nodeType===9?l.body:l.nodeName==="HTML"?l.ownerDocument.body:l,u.stateNode),Oa(l)):Qd(ml,u.stateNode));break;case 4:a=ml,e=Kl,ml=u.stateNode.containerInfo,Kl=!0,Vt(l,t,u),ml=a,Kl=e;break;case 0:case 11:case 14:case 15:iu(2,u,t),pl||iu(4,u,t),Vt(l,t,u);break;case 1:pl||(Dt(u,t),a=u.stateNode,typeof a.componentWillUnmount=="function"&&Zs(u,t,a)),Vt(l,t,u);break;case 21:Vt(l,t,u);break;case 22:pl=(a=pl)||u.memoizedState!==null,Vt(l,t,u),pl=a;break;default:Vt(l,t,u)}}function ks(l,t){if(t.memoizedState===null&&(l=t.alternate,l!==null&&(l=l.memoizedState,l!==null))){l=l.dehydrated;try{Oa(l)}catch(u){el(t,t.return,u)}}}function Fs(l,t){if(t.memoizedState===null&&(l=t.alternate,l!==null&&(l=l.memoizedState,l!==null&&(l=l.dehydrated,l!==null))))try{Oa(l)}catch(u){el(t,t.return,u)}}function tv(l){switch(l.tag){case 31:case 13:case 19:var t=l.stateNode;return t===null&&(t=l.stateNode=new Js),t;case 22:return l=l.stateNode,t=l._retryCache,t===null&&(t=l._retryCache=new Js),t;default:throw Error(y(435,l.tag))}}function vn(l,t){var u=tv(l);t.forEach(function(a){if(!u.has(a)){u.add(a);var e=dv.bind(null,l,a);a.then(e,e)}})}function Jl(l,t){var u=t.deletions;if(u!==null)for(var a=0;a<u.length;a++){var e=u[a],n=l,f=t,c=f;l:for(;c!==null;){switch(c.tag){case 27:if(hu(c.type)){ml=c.stateNode,Kl=!1;break l}break;case 5:ml=c.stateNode,Kl=!1;break l;case 3:case 4:ml=c.stateNode.containerInfo,Kl=!0;break l}c=c.return}if(ml===null)throw Error(y(160));$s(n,f,e),ml=null,Kl=!1,n=e.alternate,n!==null&&(n.return=null),e.return=null}if(t.subtreeFlags&13886)for(t=t.child;t!==null;)Is(t,l),t=t.sibling}var Tt=null;function Is(l,t){var u=l.alternate,a=l.flags;switch(l.tag){case 0:case 11:case 14:case 15:Jl(t,l),wl(l),a&4&&(iu(3,l,l.return),ue(3,l),iu(5,l,l.return));break;case 1:Jl(t,l),wl(l),a&512&&(pl||u===null||Dt(u,u.return)),a&64&&Zt&&(l=l.updateQueue,l!==null&&(a=l.callbacks,a!==null&&(u=l.shared.hiddenCallbacks,l.shared.hiddenCallbacks=u===null?a:u.concat(a))));break;case 26:var e=Tt;if(Jl(t,l),wl(l),a&512&&(pl||u===null||Dt(u,u.return)),a&4){var n=u!==null?u.memoizedState:null;if(a=l.memoizedState,u===null)if(a===null)if(l.stateNode===null){l:{a=l.type,u=l.memoizedProps,e=e.ownerDocument||e;t:switch(a){case"title":n=e.getElementsByTagName("title")[0],(!n||n[Na]||n[Nl]||n.namespaceURI==="http://www.w3.org/2000/svg"||n.hasAttribute("itemprop"))&&(n=e.createElement(a),e.head.insertBefore(n,e.querySelector("head > title"))),jl(n,a,u),n[Nl]=l,Dl(n),a=n;break l;case"link":var f=Id("link","href",e).get(a+(u.href||""));if(f){for(var c=0;c<f.length;c++)if(n=f[c],n.getAttribute("href")===(u.href==null||u.href===""?null:u.href)&&n.getAttribute("rel")===(u.rel==null?null:u.rel)&&n.getAttribute("title")===(u.title==null?null:u.title)&&n.getAttribute("crossorigin")===(u.crossOrigin==null?null:u.crossOrigin)){f.splice(c,1);break t}}n=e.createElement(a),jl(n,a,u),e.head.appendChild(n);break;case"meta":if(f=Id("meta","content",e).get(a+(u.content||""))){for(c=0;c<f.length;c++)if(n=f[c],n.getAttribute("content")===(u.content==null?null:""+u.content)&&n.getAttribute("name")===(u.name==null?null:u.name)&&n.getAttribute("property")===(u.property==null?null:u.property)&&n.getAttribute("http-equiv")===(u.httpEquiv==null?null:u.httpEquiv)&&n.getAttribute("charset")===(u.charSet==null?null:u.charSet)){f.splice(c,1);break t}}n=e.createElement(a),jl(n,a,u),e.head.appendChild(n);break;default:throw Error(y(468,a))}n[Nl]=l,Dl(n),a=n}l.stateNode=a}else Pd(e,l.type,l.stateNode);else l.stateNode=Fd(e,a,l.memoizedProps);else n!==a?(n===null?u.stateNode!==null&&(u=u.stateNode,u.parentNode.removeChild(u)):n.count--,a===null?Pd(e,l.type,l.stateNode):Fd(e,a,l.memoizedProps)):a===null&&l.stateNode!==null&&bc(l,l.memoizedProps,u.memoizedProps)}break;case 27:Jl(t,l),wl(l),a&512&&(pl||u===null||Dt(u,u.return)),u!==null&&a&4&&bc(l,l.memoizedProps,u.memoizedProps);break;case 5:if(Jl(t,l),wl(l),a&512&&(pl||u===null||Dt(u,u.return)),l.flags&32){e=l.stateNode;try{Wu(e,"")}catch(U){el(l,l.return,U)}}a&4&&l.stateNode!=null&&(e=l.memoizedProps,bc(l,e,u!==null?u.memoizedProps:e)),a&1024&&(Tc=!0);break;case 6:if(Jl(t,l),wl(l),a&4){if(l.stateNode===null)throw Error(y(162));a=l.memoizedProps,u=l.stateNode;try{u.nodeValue=a}catch(U){el(l,l.return,U)}}break;case 3:if(Un=null,e=Tt,Tt=Mn(t.containerInfo),Jl(t,l),Tt=e,wl(l),a&4&&u!==null&&u.memoizedState.isDehydrated)try{Oa(t.containerInfo)}catch(U){el(l,l.return,U)}Tc&&(Tc=!1,Ps(l));break;case 4:a=Tt,Tt=Mn(l.stateNode.containerInfo),Jl(t,l),wl(l),Tt=a;break;case 12:Jl(t,l),wl(l);break;case 31:Jl(t,l),wl(l),a&4&&(a=l.updateQueue,a!==null&&(l.updateQueue=null,vn(l,a)));break;case 13:Jl(t,l),wl(l),l.child.flags&8192&&l.memoizedState!==null!=(u!==null&&u.memoizedState!==null)&&(hn=Il()),a&4&&(a=l.updateQueue,a!==null&&(l.updateQueue=null,vn(l,a)));break;case 22:e=l.memoizedState!==null;var i=u!==null&&u.memoizedState!==null,m=Zt,S=pl;if(Zt=m||e,pl=S||i,Jl(t,l),pl=S,Zt=m,wl(l),a&8192)l:for(t=l.stateNode,t._visibility=e?t._visibility&-2:t._visibility|1,e&&(u===null||i||Zt||pl||Gu(l)),u=null,t=l;;){if(t.tag===5||t.tag===26){if(u===null){i=u=t;try{if(n=i.stateNode,e)f=n.style,typeof f.setProperty=="function"?f.setProperty("display","none","important"):f.display="none";else{c=i.stateNode;var T=i.memoizedProps.style,h=T!=null&&T.hasOwnProperty("display")?T.display:null;c.style.display=h==null||typeof h=="boolean"?"":(""+h).trim()}}catch(U){el(i,i.return,U)}}}else if(t.tag===6){if(u===null){i=t;try{i.stateNode.nodeValue=e?"":i.memoizedProps}catch(U){el(i,i.return,U)}}}else if(t.tag===18){if(u===null){i=t;try{var g=i.stateNode;e?Zd(g,!0):Zd(i.stateNode,!1)}catch(U){el(i,i.return,U)}}}else if((t.tag!==22&&t.tag!==23||t.memoizedState===null||t===l)&&t.child!==null){t.child.return=t,t=t.child;continue}if(t===l)break l;for(;t.sibling===null;){if(t.return===null||t.return===l)break l;u===t&&(u=null),t=t.return}u===t&&(u=null),t.sibling.return=t.return,t=t.sibling}a&4&&(a=l.updateQueue,a!==null&&(u=a.retryQueue,u!==null&&(a.retryQueue=null,vn(l,u))));break;case 19:Jl(t,l),wl(l),a&4&&(a=l.updateQueue,a!==null&&(l.updateQueue=null,vn(l,a)));break;case 30:break;case 21:break;default:Jl(t,l),wl(l)}}function wl(l){var t=l.flags;if(t&2){try{for(var u,a=l.return;a!==null;){if(Ls(a)){u=a;break}a=a.return}if(u==null)throw Error(y(160));switch(u.tag){case 27:var e=u.stateNode,n=rc(l);yn(l,n,e);break;case 5:var f=u.stateNode;u.flags&32&&(Wu(f,""),u.flags&=-33);var c=rc(l);yn(l,c,f);break;case 3:case 4:var i=u.stateNode.containerInfo,m=rc(l);zc(l,m,i);break;default:throw Error(y(161))}}catch(S){el(l,l.return,S)}l.flags&=-3}t&4096&&(l.flags&=-4097)}function Ps(l){if(l.subtreeFlags&1024)for(l=l.child;l!==null;){var t=l;Ps(t),t.tag===5&&t.flags&1024&&t.stateNode.reset(),l=l.sibling}}function Lt(l,t){if(t.subtreeFlags&8772)for(t=t.child;t!==null;)ws(l,t.alternate,t),t=t.sibling}function Gu(l){for(l=l.child;l!==null;){var t=l;switch(t.tag){case 0:case 11:case 14:case 15:iu(4,t,t.return),Gu(t);break;case 1:Dt(t,t.return);var u=t.stateNode;typeof u.componentWillUnmount=="function"&&Zs(t,t.return,u),Gu(t);break;case 27:ye(t.stateNode);case 26:case 5:Dt(t,t.return),Gu(t);break;case 22:t.memoizedState===null&&Gu(t);break;case 30:Gu(t);break;default:Gu(t)}l=l.sibling}}function Kt(l,t,u){for(u=u&&(t.subtreeFlags&8772)!==0,t=t.child;t!==null;){var a=t.alternate,e=l,n=t,f=n.flags;switch(n.tag){case 0:case 11:case 15:Kt(e,n,u),ue(4,n);break;case 1:if(Kt(e,n,u),a=n,e=a.stateNode,typeof e.componentDidMount=="function")try{e.componentDidMount()}catch(m){el(a,a.return,m)}if(a=n,e=a.updateQueue,e!==null){var c=a.stateNode;try{var i=e.shared.hiddenCallbacks;if(i!==null)for(e.shared.hiddenCallbacks=null,e=0;e<i.length;e++)N0(i[e],c)}catch(m){el(a,a.return,m)}}u&&f&64&&Qs(n),ae(n,n.return);break;case 27:Ks(n);case 26:case 5:Kt(e,n,u),u&&a===null&&f&4&&Vs(n),ae(n,n.return);break;case 12:Kt(e,n,u);break;case 31:Kt(e,n,u),u&&f&4&&ks(e,n);break;case 13:Kt(e,n,u),u&&f&4&&Fs(e,n);break;case 22:n.memoizedState===null&&Kt(e,n,u),ae(n,n.return);break;case 30:break;default:Kt(e,n,u)}t=t.sibling}}function Ec(l,t){var u=null;l!==null&&l.memoizedState!==null&&l.memoizedState.cachePool!==null&&(u=l.memoizedState.cachePool.pool),l=null,t.memoizedState!==null&&t.memoizedState.cachePool!==null&&(l=t.memoizedState.cachePool.pool),l!==u&&(l!=null&&l.refCount++,u!=null&&Va(u))}function Ac(l,t){l=null,t.alternate!==null&&(l=t.alternate.memoizedState.cache),t=t.memoizedState.cache,t!==l&&(t.refCount++,l!=null&&Va(l))}function Et(l,t,u,a){if(t.subtreeFlags&10256)for(t=t.child;t!==null;)ld(l,t,u,a),t=t.sibling}function ld(l,t,u,a){var e=t.flags;switch(t.tag){case 0:case 11:case 15:Et(l,t,u,a),e&2048&&ue(9,t);break;case 1:Et(l,t,u,a);break;case 3:Et(l,t,u,a),e&2048&&(l=null,t.alternate!==null&&(l=t.alternate.memoizedState.cache),t=t.memoizedState.cache,t!==l&&(t.refCount++,l!=null&&Va(l)));break;case 12:if(e&2048){Et(l,t,u,a),l=t.stateNode;try{var n=t.memoizedProps,f=n.id,c=n.onPostCommit;typeof c=="function"&&c(f,t.alternate===null?"mount":"update",l.passiveEffectDuration,-0)}catch(i){el(t,t.return,i)}}else Et(l,t,u,a);break;case 31:Et(l,t,u,a);break;case 13:Et(l,t,u,a);break;case 23:break;case 22:n=t.stateNode,f=t.alternate,t.memoizedState!==null?n._visibility&2?Et(l,t,u,a):ee(l,t):n._visibility&2?Et(l,t,u,a):(n._visibility|=2,ma(l,t,u,a,(t.subtreeFlags&10256)!==0||!1)),e&2048&&Ec(f,t);break;case 24:Et(l,t,u,a),e&2048&&Ac(t.alternate,t);break;default:Et(l,t,u,a)}}function ma(l,t,u,a,e){for(e=e&&((t.subtreeFlags&10256)!==0||!1),t=t.child;t!==null;){var n=l,f=t,c=u,i=a,m=f.flags;switch(f.tag){case 0:case 11:case 15:ma(n,f,c,i,e),ue(8,f);break;case 23:break;case 22:var S=f.stateNode;f.memoizedState!==null?S._visibility&2?ma(n,f,c,i,e):ee(n,f):(S._visibility|=2,ma(n,f,c,i,e)),e&&m&2048&&Ec(f.alternate,f);break;case 24:ma(n,f,c,i,e),e&&m&2048&&Ac(f.alternate,f);break;default:ma(n,f,c,i,e)}t=t.sibling}}function ee(l,t){if(t.subtreeFlags&10256)for(t=t.child;t!==null;){var u=l,a=t,e=a.flags;switch(a.tag){case 22:ee(u,a),e&2048&&Ec(a.alternate,a);break;case 24:ee(u,a),e&2048&&Ac(a.alternate,a);break;default:ee(u,a)}t=t.sibling}}var ne=8192;function ha(l,t,u){if(l.subtreeFlags&ne)for(l=l.child;l!==null;)td(l,t,u),l=l.sibling}function td(l,t,u){switch(l.tag){case 26:ha(l,t,u),l.flags&ne&&l.memoizedState!==null&&Qv(u,Tt,l.memoizedState,l.memoizedProps);break;case 5:ha(l,t,u);break;case 3:case 4:var a=Tt;Tt=Mn(l.stateNode.containerInfo),ha(l,t,u),Tt=a;break;case 22:l.memoizedState===null&&(a=l.alternate,a!==null&&a.memoizedState!==null?(a=ne,ne=16777216,ha(l,t,u),ne=a):ha(l,t,u));break;default:ha(l,t,u)}}function ud(l){var t=l.alternate;if(t!==null&&(l=t.child,l!==null)){t.child=null;do t=l.sibling,l.sibling=null,l=t;while(l!==null)}}function fe(l){var t=l.deletions;if((l.flags&16)!==0){if(t!==null)for(var u=0;u<t.length;u++){var a=t[u];Ul=a,ed(a,l)}ud(l)}if(l.subtreeFlags&10256)for(l=l.child;l!==null;)ad(l),l=l.sibling}function ad(l){switch(l.tag){case 0:case 11:case 15:fe(l),l.flags&2048&&iu(9,l,l.return);break;case 3:fe(l);break;case 12:fe(l);break;case 22:var t=l.stateNode;l.memoizedState!==null&&t._visibility&2&&(l.return===null||l.return.tag!==13)?(t._visibility&=-3,mn(l)):fe(l);break;default:fe(l)}}function mn(l){var t=l.deletions;if((l.flags&16)!==0){if(t!==null)for(var u=0;u<t.length;u++){var a=t[u];Ul=a,ed(a,l)}ud(l)}for(l=l.child;l!==null;){switch(t=l,t.tag){case 0:case 11:case 15:iu(8,t,t.return),mn(t);break;case 22:u=t.stateNode,u._visibility&2&&(u._visibility&=-3,mn(t));break;default:mn(t)}l=l.sibling}}function ed(l,t){for(;Ul!==null;){var u=Ul;switch(u.tag){case 0:case 11:case 15:iu(8,u,t);break;case 23:case 22:if(u.memoizedState!==null&&u.memoizedState.cachePool!==null){var a=u.memoizedState.cachePool.pool;a!=null&&a.refCount++}break;case 24:Va(u.memoizedState.cache)}if(a=u.child,a!==null)a.return=u,Ul=a;else l:for(u=l;Ul!==null;){a=Ul;var e=a.sibling,n=a.return;if(Ws(a),a===u){Ul=null;break l}if(e!==null){e.return=n,Ul=e;break l}Ul=n}}}var uv={getCacheForType:function(l){var t=Hl(Al),u=t.data.get(l);return u===void 0&&(u=l(),t.data.set(l,u)),u},cacheSignal:function(){return Hl(Al).controller.signal}},av=typeof WeakMap=="function"?WeakMap:Map,tl=0,dl=null,K=null,w=0,al=0,nt=null,su=!1,ga=!1,_c=!1,Jt=0,rl=0,du=0,Xu=0,Oc=0,ft=0,Sa=0,ce=null,Wl=null,pc=!1,hn=0,nd=0,gn=1/0,Sn=null,ou=null,Ml=0,yu=null,ba=null,wt=0,Mc=0,Dc=null,fd=null,ie=0,Uc=null;function ct(){return(tl&2)!==0&&w!==0?w&-w:b.T!==null?qc():Ei()}function cd(){if(ft===0)if((w&536870912)===0||k){var l=_e;_e<<=1,(_e&3932160)===0&&(_e=262144),ft=l}else ft=536870912;return l=at.current,l!==null&&(l.flags|=32),ft}function $l(l,t,u){(l===dl&&(al===2||al===9)||l.cancelPendingCommit!==null)&&(ra(l,0),vu(l,w,ft,!1)),Ua(l,u),((tl&2)===0||l!==dl)&&(l===dl&&((tl&2)===0&&(Xu|=u),rl===4&&vu(l,w,ft,!1)),Ut(l))}function id(l,t,u){if((tl&6)!==0)throw Error(y(327));var a=!u&&(t&127)===0&&(t&l.expiredLanes)===0||Da(l,t),e=a?fv(l,t):Cc(l,t,!0),n=a;do{if(e===0){ga&&!a&&vu(l,t,0,!1);break}else{if(u=l.current.alternate,n&&!ev(u)){e=Cc(l,t,!1),n=!1;continue}if(e===2){if(n=t,l.errorRecoveryDisabledLanes&n)var f=0;else f=l.pendingLanes&-536870913,f=f!==0?f:f&536870912?536870912:0;if(f!==0){t=f;l:{var c=l;e=ce;var i=c.current.memoizedState.isDehydrated;if(i&&(ra(c,f).flags|=256),f=Cc(c,f,!1),f!==2){if(_c&&!i){c.errorRecoveryDisabledLanes|=n,Xu|=n,e=4;break l}n=Wl,Wl=e,n!==null&&(Wl===null?Wl=n:Wl.push.apply(Wl,n))}e=f}if(n=!1,e!==2)continue}}if(e===1){ra(l,0),vu(l,t,0,!0);break}l:{switch(a=l,n=e,n){case 0:case 1:throw Error(y(345));case 4:if((t&4194048)!==t)break;case 6:vu(a,t,ft,!su);break l;case 2:Wl=null;break;case 3:case 5:break;default:throw Error(y(329))}if((t&62914560)===t&&(e=hn+300-Il(),10<e)){if(vu(a,t,ft,!su),pe(a,0,!0)!==0)break l;wt=t,a.timeoutHandle=Gd(sd.bind(null,a,u,Wl,Sn,pc,t,ft,Xu,Sa,su,n,"Throttled",-0,0),e);break l}sd(a,u,Wl,Sn,pc,t,ft,Xu,Sa,su,n,null,-0,0)}}break}while(!0);Ut(l)}function sd(l,t,u,a,e,n,f,c,i,m,S,T,h,g){if(l.timeoutHandle=-1,T=t.subtreeFlags,T&8192||(T&16785408)===16785408){T={stylesheets:null,count:0,imgCount:0,imgBytes:0,suspenseyImages:[],waitingForImages:!0,waitingForViewTransition:!1,unsuspend:Ht},td(t,n,T);var U=(n&62914560)===n?hn-Il():(n&4194048)===n?nd-Il():0;if(U=Zv(T,U),U!==null){wt=n,l.cancelPendingCommit=U(Sd.bind(null,l,t,n,u,a,e,f,c,i,S,T,null,h,g)),vu(l,n,f,!m);return}}Sd(l,t,n,u,a,e,f,c,i)}function ev(l){for(var t=l;;){var u=t.tag;if((u===0||u===11||u===15)&&t.flags&16384&&(u=t.updateQueue,u!==null&&(u=u.stores,u!==null)))for(var a=0;a<u.length;a++){var e=u[a],n=e.getSnapshot;e=e.value;try{if(!tt(n(),e))return!1}catch{return!1}}if(u=t.child,t.subtreeFlags&16384&&u!==null)u.return=t,t=u;else{if(t===l)break;for(;t.sibling===null;){if(t.return===null||t.return===l)return!0;t=t.return}t.sibling.return=t.return,t=t.sibling}}return!0}function vu(l,t,u,a){t&=~Oc,t&=~Xu,l.suspendedLanes|=t,l.pingedLanes&=~t,a&&(l.warmLanes|=t),a=l.expirationTimes;for(var e=t;0<e;){var n=31-lt(e),f=1<<n;a[n]=-1,e&=~f}u!==0&&ri(l,u,t)}function bn(){return(tl&6)===0?(se(0),!1):!0}function Nc(){if(K!==null){if(al===0)var l=K.return;else l=K,Bt=Cu=null,Jf(l),sa=null,Ka=0,l=K;for(;l!==null;)Xs(l.alternate,l),l=l.return;K=null}}function ra(l,t){var u=l.timeoutHandle;u!==-1&&(l.timeoutHandle=-1,_v(u)),u=l.cancelPendingCommit,u!==null&&(l.cancelPendingCommit=null,u()),wt=0,Nc(),dl=l,K=u=jt(l.current,null),w=t,al=0,nt=null,su=!1,ga=Da(l,t),_c=!1,Sa=ft=Oc=Xu=du=rl=0,Wl=ce=null,pc=!1,(t&8)!==0&&(t|=t&32);var a=l.entangledLanes;if(a!==0)for(l=l.entanglements,a&=t;0<a;){var e=31-lt(a),n=1<<e;t|=l[e],a&=~n}return Jt=t,xe(),u}function dd(l,t){Z=null,b.H=Pa,t===ia||t===Je?(t=p0(),al=3):t===jf?(t=p0(),al=4):al=t===ic?8:t!==null&&typeof t=="object"&&typeof t.then=="function"?6:1,nt=t,K===null&&(rl=1,fn(l,yt(t,l.current)))}function od(){var l=at.current;return l===null?!0:(w&4194048)===w?gt===null:(w&62914560)===w||(w&536870912)!==0?l===gt:!1}function yd(){var l=b.H;return b.H=Pa,l===null?Pa:l}function vd(){var l=b.A;return b.A=uv,l}function rn(){rl=4,su||(w&4194048)!==w&&at.current!==null||(ga=!0),(du&134217727)===0&&(Xu&134217727)===0||dl===null||vu(dl,w,ft,!1)}function Cc(l,t,u){var a=tl;tl|=2;var e=yd(),n=vd();(dl!==l||w!==t)&&(Sn=null,ra(l,t)),t=!1;var f=rl;l:do try{if(al!==0&&K!==null){var c=K,i=nt;switch(al){case 8:Nc(),f=6;break l;case 3:case 2:case 9:case 6:at.current===null&&(t=!0);var m=al;if(al=0,nt=null,za(l,c,i,m),u&&ga){f=0;break l}break;default:m=al,al=0,nt=null,za(l,c,i,m)}}nv(),f=rl;break}catch(S){dd(l,S)}while(!0);return t&&l.shellSuspendCounter++,Bt=Cu=null,tl=a,b.H=e,b.A=n,K===null&&(dl=null,w=0,xe()),f}function nv(){for(;K!==null;)md(K)}function fv(l,t){var u=tl;tl|=2;var a=yd(),e=vd();dl!==l||w!==t?(Sn=null,gn=Il()+500,ra(l,t)):ga=Da(l,t);l:do try{if(al!==0&&K!==null){t=K;var n=nt;t:switch(al){case 1:al=0,nt=null,za(l,t,n,1);break;case 2:case 9:if(_0(n)){al=0,nt=null,hd(t);break}t=function(){al!==2&&al!==9||dl!==l||(al=7),Ut(l)},n.then(t,t);break l;case 3:al=7;break l;case 4:al=5;break l;case 7:_0(n)?(al=0,nt=null,hd(t)):(al=0,nt=null,za(l,t,n,7));break;case 5:var f=null;switch(K.tag){case 26:f=K.memoizedState;case 5:case 27:var c=K;if(f?lo(f):c.stateNode.complete){al=0,nt=null;var i=c.sibling;if(i!==null)K=i;else{var m=c.return;m!==null?(K=m,zn(m)):K=null}break t}}al=0,nt=null,za(l,t,n,5);break;case 6:al=0,nt=null,za(l,t,n,6);break;case 8:Nc(),rl=6;break l;default:throw Error(y(462))}}cv();break}catch(S){dd(l,S)}while(!0);return Bt=Cu=null,b.H=a,b.A=e,tl=u,K!==null?0:(dl=null,w=0,xe(),rl)}function cv(){for(;K!==null&&!No();)md(K)}function md(l){var t=xs(l.alternate,l,Jt);l.memoizedProps=l.pendingProps,t===null?zn(l):K=t}function hd(l){var t=l,u=t.alternate;switch(t.tag){case 15:case 0:t=Hs(u,t,t.pendingProps,t.type,void 0,w);break;case 11:t=Hs(u,t,t.pendingProps,t.type.render,t.ref,w);break;case 5:Jf(t);default:Xs(u,t),t=K=v0(t,Jt),t=xs(u,t,Jt)}l.memoizedProps=l.pendingProps,t===null?zn(l):K=t}function za(l,t,u,a){Bt=Cu=null,Jf(t),sa=null,Ka=0;var e=t.return;try{if($y(l,e,t,u,w)){rl=1,fn(l,yt(u,l.current)),K=null;return}}catch(n){if(e!==null)throw K=e,n;rl=1,fn(l,yt(u,l.current)),K=null;return}t.flags&32768?(k||a===1?l=!0:ga||(w&536870912)!==0?l=!1:(su=l=!0,(a===2||a===9||a===3||a===6)&&(a=at.current,a!==null&&a.tag===13&&(a.flags|=16384))),gd(t,l)):zn(t)}function zn(l){var t=l;do{if((t.flags&32768)!==0){gd(t,su);return}l=t.return;var u=Iy(t.alternate,t,Jt);if(u!==null){K=u;return}if(t=t.sibling,t!==null){K=t;return}K=t=l}while(t!==null);rl===0&&(rl=5)}function gd(l,t){do{var u=Py(l.alternate,l);if(u!==null){u.flags&=32767,K=u;return}if(u=l.return,u!==null&&(u.flags|=32768,u.subtreeFlags=0,u.deletions=null),!t&&(l=l.sibling,l!==null)){K=l;return}K=l=u}while(l!==null);rl=6,K=null}function Sd(l,t,u,a,e,n,f,c,i){l.cancelPendingCommit=null;do Tn();while(Ml!==0);if((tl&6)!==0)throw Error(y(327));if(t!==null){if(t===l.current)throw Error(y(177));if(n=t.lanes|t.childLanes,n|=rf,Xo(l,u,n,f,c,i),l===dl&&(K=dl=null,w=0),ba=t,yu=l,wt=u,Mc=n,Dc=e,fd=a,(t.subtreeFlags&10256)!==0||(t.flags&10256)!==0?(l.callbackNode=null,l.callbackPriority=0,ov(Ee,function(){return Ed(),null})):(l.callbackNode=null,l.callbackPriority=0),a=(t.flags&13878)!==0,(t.subtreeFlags&13878)!==0||a){a=b.T,b.T=null,e=O.p,O.p=2,f=tl,tl|=4;try{lv(l,t,u)}finally{tl=f,O.p=e,b.T=a}}Ml=1,bd(),rd(),zd()}}function bd(){if(Ml===1){Ml=0;var l=yu,t=ba,u=(t.flags&13878)!==0;if((t.subtreeFlags&13878)!==0||u){u=b.T,b.T=null;var a=O.p;O.p=2;var e=tl;tl|=4;try{Is(t,l);var n=Vc,f=e0(l.containerInfo),c=n.focusedElem,i=n.selectionRange;if(f!==c&&c&&c.ownerDocument&&a0(c.ownerDocument.documentElement,c)){if(i!==null&&mf(c)){var m=i.start,S=i.end;if(S===void 0&&(S=m),"selectionStart"in c)c.selectionStart=m,c.selectionEnd=Math.min(S,c.value.length);else{var T=c.ownerDocument||document,h=T&&T.defaultView||window;if(h.getSelection){var g=h.getSelection(),U=c.textContent.length,j=Math.min(i.start,U),il=i.end===void 0?j:Math.min(i.end,U);!g.extend&&j>il&&(f=il,il=j,j=f);var o=u0(c,j),s=u0(c,il);if(o&&s&&(g.rangeCount!==1||g.anchorNode!==o.node||g.anchorOffset!==o.offset||g.focusNode!==s.node||g.focusOffset!==s.offset)){var v=T.createRange();v.setStart(o.node,o.offset),g.removeAllRanges(),j>il?(g.addRange(v),g.extend(s.node,s.offset)):(v.setEnd(s.node,s.offset),g.addRange(v))}}}}for(T=[],g=c;g=g.parentNode;)g.nodeType===1&&T.push({element:g,left:g.scrollLeft,top:g.scrollTop});for(typeof c.focus=="function"&&c.focus(),c=0;c<T.length;c++){var z=T[c];z.element.scrollLeft=z.left,z.element.scrollTop=z.top}}Rn=!!Zc,Vc=Zc=null}finally{tl=e,O.p=a,b.T=u}}l.current=t,Ml=2}}function rd(){if(Ml===2){Ml=0;var l=yu,t=ba,u=(t.flags&8772)!==0;if((t.subtreeFlags&8772)!==0||u){u=b.T,b.T=null;var a=O.p;O.p=2;var e=tl;tl|=4;try{ws(l,t.alternate,t)}finally{tl=e,O.p=a,b.T=u}}Ml=3}}function zd(){if(Ml===4||Ml===3){Ml=0,Co();var l=yu,t=ba,u=wt,a=fd;(t.subtreeFlags&10256)!==0||(t.flags&10256)!==0?Ml=5:(Ml=0,ba=yu=null,Td(l,l.pendingLanes));var e=l.pendingLanes;if(e===0&&(ou=null),Wn(u),t=t.stateNode,Pl&&typeof Pl.onCommitFiberRoot=="function")try{Pl.onCommitFiberRoot(Ma,t,void 0,(t.current.flags&128)===128)}catch{}if(a!==null){t=b.T,e=O.p,O.p=2,b.T=null;try{for(var n=l.onRecoverableError,f=0;f<a.length;f++){var c=a[f];n(c.value,{componentStack:c.stack})}}finally{b.T=t,O.p=e}}(wt&3)!==0&&Tn(),Ut(l),e=l.pendingLanes,(u&261930)!==0&&(e&42)!==0?l===Uc?ie++:(ie=0,Uc=l):ie=0,se(0)}}function Td(l,t){(l.pooledCacheLanes&=t)===0&&(t=l.pooledCache,t!=null&&(l.pooledCache=null,Va(t)))}function Tn(){return bd(),rd(),zd(),Ed()}function Ed(){if(Ml!==5)return!1;var l=yu,t=Mc;Mc=0;var u=Wn(wt),a=b.T,e=O.p;try{O.p=32>u?32:u,b.T=null,u=Dc,Dc=null;var n=yu,f=wt;if(Ml=0,ba=yu=null,wt=0,(tl&6)!==0)throw Error(y(331));var c=tl;if(tl|=4,ad(n.current),ld(n,n.current,f,u),tl=c,se(0,!1),Pl&&typeof Pl.onPostCommitFiberRoot=="function")try{Pl.onPostCommitFiberRoot(Ma,n)}catch{}return!0}finally{O.p=e,b.T=a,Td(l,t)}}function Ad(l,t,u){t=yt(u,t),t=cc(l.stateNode,t,2),l=nu(l,t,2),l!==null&&(Ua(l,2),Ut(l))}function el(l,t,u){if(l.tag===3)Ad(l,l,u);else for(;t!==null;){if(t.tag===3){Ad(t,l,u);break}else if(t.tag===1){var a=t.stateNode;if(typeof t.type.getDerivedStateFromError=="function"||typeof a.componentDidCatch=="function"&&(ou===null||!ou.has(a))){l=yt(u,l),u=_s(2),a=nu(t,u,2),a!==null&&(Os(u,a,t,l),Ua(a,2),Ut(a));break}}t=t.return}}function Hc(l,t,u){var a=l.pingCache;if(a===null){a=l.pingCache=new av;var e=new Set;a.set(t,e)}else e=a.get(t),e===void 0&&(e=new Set,a.set(t,e));e.has(u)||(_c=!0,e.add(u),l=iv.bind(null,l,t,u),t.then(l,l))}function iv(l,t,u){var a=l.pingCache;a!==null&&a.delete(t),l.pingedLanes|=l.suspendedLanes&u,l.warmLanes&=~u,dl===l&&(w&u)===u&&(rl===4||rl===3&&(w&62914560)===w&&300>Il()-hn?(tl&2)===0&&ra(l,0):Oc|=u,Sa===w&&(Sa=0)),Ut(l)}function _d(l,t){t===0&&(t=bi()),l=Du(l,t),l!==null&&(Ua(l,t),Ut(l))}function sv(l){var t=l.memoizedState,u=0;t!==null&&(u=t.retryLane),_d(l,u)}function dv(l,t){var u=0;switch(l.tag){case 31:case 13:var a=l.stateNode,e=l.memoizedState;e!==null&&(u=e.retryLane);break;case 19:a=l.stateNode;break;case 22:a=l.stateNode._retryCache;break;default:throw Error(y(314))}a!==null&&a.delete(t),_d(l,u)}function ov(l,t){return Ln(l,t)}var En=null,Ta=null,Rc=!1,An=!1,jc=!1,mu=0;function Ut(l){l!==Ta&&l.next===null&&(Ta===null?En=Ta=l:Ta=Ta.next=l),An=!0,Rc||(Rc=!0,vv())}function se(l,t){if(!jc&&An){jc=!0;do for(var u=!1,a=En;a!==null;){if(l!==0){var e=a.pendingLanes;if(e===0)var n=0;else{var f=a.suspendedLanes,c=a.pingedLanes;n=(1<<31-lt(42|l)+1)-1,n&=e&~(f&~c),n=n&201326741?n&201326741|1:n?n|2:0}n!==0&&(u=!0,Dd(a,n))}else n=w,n=pe(a,a===dl?n:0,a.cancelPendingCommit!==null||a.timeoutHandle!==-1),(n&3)===0||Da(a,n)||(u=!0,Dd(a,n));a=a.next}while(u);jc=!1}}function yv(){Od()}function Od(){An=Rc=!1;var l=0;mu!==0&&Av()&&(l=mu);for(var t=Il(),u=null,a=En;a!==null;){var e=a.next,n=pd(a,t);n===0?(a.next=null,u===null?En=e:u.next=e,e===null&&(Ta=u)):(u=a,(l!==0||(n&3)!==0)&&(An=!0)),a=e}Ml!==0&&Ml!==5||se(l),mu!==0&&(mu=0)}function pd(l,t){for(var u=l.suspendedLanes,a=l.pingedLanes,e=l.expirationTimes,n=l.pendingLanes&-62914561;0<n;){var f=31-lt(n),c=1<<f,i=e[f];i===-1?((c&u)===0||(c&a)!==0)&&(e[f]=Go(c,t)):i<=t&&(l.expiredLanes|=c),n&=~c}if(t=dl,u=w,u=pe(l,l===t?u:0,l.cancelPendingCommit!==null||l.timeoutHandle!==-1),a=l.callbackNode,u===0||l===t&&(al===2||al===9)||l.cancelPendingCommit!==null)return a!==null&&a!==null&&Kn(a),l.callbackNode=null,l.callbackPriority=0;if((u&3)===0||Da(l,u)){if(t=u&-u,t===l.callbackPriority)return t;switch(a!==null&&Kn(a),Wn(u)){case 2:case 8:u=gi;break;case 32:u=Ee;break;case 268435456:u=Si;break;default:u=Ee}return a=Md.bind(null,l),u=Ln(u,a),l.callbackPriority=t,l.callbackNode=u,t}return a!==null&&a!==null&&Kn(a),l.callbackPriority=2,l.callbackNode=null,2}function Md(l,t){if(Ml!==0&&Ml!==5)return l.callbackNode=null,l.callbackPriority=0,null;var u=l.callbackNode;if(Tn()&&l.callbackNode!==u)return null;var a=w;return a=pe(l,l===dl?a:0,l.cancelPendingCommit!==null||l.timeoutHandle!==-1),a===0?null:(id(l,a,t),pd(l,Il()),l.callbackNode!=null&&l.callbackNode===u?Md.bind(null,l):null)}function Dd(l,t){if(Tn())return null;id(l,t,!0)}function vv(){Ov(function(){(tl&6)!==0?Ln(hi,yv):Od()})}function qc(){if(mu===0){var l=fa;l===0&&(l=Ae,Ae<<=1,(Ae&261888)===0&&(Ae=256)),mu=l}return mu}function Ud(l){return l==null||typeof l=="symbol"||typeof l=="boolean"?null:typeof l=="function"?l:Ne(""+l)}function Nd(l,t){var u=t.ownerDocument.createElement("input");return u.name=t.name,u.value=t.value,l.id&&u.setAttribute("form",l.id),t.parentNode.insertBefore(u,t),l=new FormData(l),u.parentNode.removeChild(u),l}function mv(l,t,u,a,e){if(t==="submit"&&u&&u.stateNode===e){var n=Ud((e[Vl]||null).action),f=a.submitter;f&&(t=(t=f[Vl]||null)?Ud(t.formAction):f.getAttribute("formAction"),t!==null&&(n=t,f=null));var c=new je("action","action",null,a,e);l.push({event:c,listeners:[{instance:null,listener:function(){if(a.defaultPrevented){if(mu!==0){var i=f?Nd(e,f):new FormData(e);tc(u,{pending:!0,data:i,method:e.method,action:n},null,i)}}else typeof n=="function"&&(c.preventDefault(),i=f?Nd(e,f):new FormData(e),tc(u,{pending:!0,data:i,method:e.method,action:n},n,i))},currentTarget:e}]})}}for(var Bc=0;Bc<bf.length;Bc++){var Yc=bf[Bc],hv=Yc.toLowerCase(),gv=Yc[0].toUpperCase()+Yc.slice(1);zt(hv,"on"+gv)}zt(c0,"onAnimationEnd"),zt(i0,"onAnimationIteration"),zt(s0,"onAnimationStart"),zt("dblclick","onDoubleClick"),zt("focusin","onFocus"),zt("focusout","onBlur"),zt(Hy,"onTransitionRun"),zt(Ry,"onTransitionStart"),zt(jy,"onTransitionCancel"),zt(d0,"onTransitionEnd"),Ju("onMouseEnter",["mouseout","mouseover"]),Ju("onMouseLeave",["mouseout","mouseover"]),Ju("onPointerEnter",["pointerout","pointerover"]),Ju("onPointerLeave",["pointerout","pointerover"]),_u("onChange","change click focusin focusout input keydown keyup selectionchange".split(" ")),_u("onSelect","focusout contextmenu dragend focusin keydown keyup mousedown mouseup selectionchange".split(" ")),_u("onBeforeInput",["compositionend","keypress","textInput","paste"]),_u("onCompositionEnd","compositionend focusout keydown keypress keyup mousedown".split(" ")),_u("onCompositionStart","compositionstart focusout keydown keypress keyup mousedown".split(" ")),_u("onCompositionUpdate","compositionupdate focusout keydown keypress keyup mousedown".split(" "));var de="abort canplay canplaythrough durationchange emptied encrypted ended error loadeddata loadedmetadata loadstart pause play playing progress ratechange resize seeked seeking stalled suspend timeupdate volumechange waiting".split(" "),Sv=new Set("beforetoggle cancel close invalid load scroll scrollend toggle".split(" ").concat(de));function Cd(l,t){t=(t&4)!==0;for(var u=0;u<l.length;u++){var a=l[u],e=a.event;a=a.listeners;l:{var n=void 0;if(t)for(var f=a.length-1;0<=f;f--){var c=a[f],i=c.instance,m=c.currentTarget;if(c=c.listener,i!==n&&e.isPropagationStopped())break l;n=c,e.currentTarget=m;try{n(e)}catch(S){Ye(S)}e.currentTarget=null,n=i}else for(f=0;f<a.length;f++){if(c=a[f],i=c.instance,m=c.currentTarget,c=c.listener,i!==n&&e.isPropagationStopped())break l;n=c,e.currentTarget=m;try{n(e)}catch(S){Ye(S)}e.currentTarget=null,n=i}}}}function J(l,t){var u=t[$n];u===void 0&&(u=t[$n]=new Set);var a=l+"__bubble";u.has(a)||(Hd(t,l,2,!1),u.add(a))}function xc(l,t,u){var a=0;t&&(a|=4),Hd(u,l,a,t)}var _n="_reactListening"+Math.random().toString(36).slice(2);function Gc(l){if(!l[_n]){l[_n]=!0,Oi.forEach(function(u){u!=="selectionchange"&&(Sv.has(u)||xc(u,!1,l),xc(u,!0,l))});var t=l.nodeType===9?l:l.ownerDocument;t===null||t[_n]||(t[_n]=!0,xc("selectionchange",!1,t))}}function Hd(l,t,u,a){switch(co(t)){case 2:var e=Kv;break;case 8:e=Jv;break;default:e=li}u=e.bind(null,t,u,l),e=void 0,!ef||t!=="touchstart"&&t!=="touchmove"&&t!=="wheel"||(e=!0),a?e!==void 0?l.addEventListener(t,u,{capture:!0,passive:e}):l.addEventListener(t,u,!0):e!==void 0?l.addEventListener(t,u,{passive:e}):l.addEventListener(t,u,!1)}function Xc(l,t,u,a,e){var n=a;if((t&1)===0&&(t&2)===0&&a!==null)l:for(;;){if(a===null)return;var f=a.tag;if(f===3||f===4){var c=a.stateNode.containerInfo;if(c===e)break;if(f===4)for(f=a.return;f!==null;){var i=f.tag;if((i===3||i===4)&&f.stateNode.containerInfo===e)return;f=f.return}for(;c!==null;){if(f=Vu(c),f===null)return;if(i=f.tag,i===5||i===6||i===26||i===27){a=n=f;continue l}c=c.parentNode}}a=a.return}Yi(function(){var m=n,S=uf(u),T=[];l:{var h=o0.get(l);if(h!==void 0){var g=je,U=l;switch(l){case"keypress":if(He(u)===0)break l;case"keydown":case"keyup":g=dy;break;case"focusin":U="focus",g=sf;break;case"focusout":U="blur",g=sf;break;case"beforeblur":case"afterblur":g=sf;break;case"click":if(u.button===2)break l;case"auxclick":case"dblclick":case"mousedown":case"mousemove":case"mouseup":case"mouseout":case"mouseover":case"contextmenu":g=Xi;break;case"drag":case"dragend":case"dragenter":case"dragexit":case"dragleave":case"dragover":case"dragstart":case"drop":g=Io;break;case"touchcancel":case"touchend":case"touchmove":case"touchstart":g=vy;break;case c0:case i0:case s0:g=ty;break;case d0:g=hy;break;case"scroll":case"scrollend":g=ko;break;case"wheel":g=Sy;break;case"copy":case"cut":case"paste":g=ay;break;case"gotpointercapture":case"lostpointercapture":case"pointercancel":case"pointerdown":case"pointermove":case"pointerout":case"pointerover":case"pointerup":g=Zi;break;case"toggle":case"beforetoggle":g=ry}var j=(t&4)!==0,il=!j&&(l==="scroll"||l==="scrollend"),o=j?h!==null?h+"Capture":null:h;j=[];for(var s=m,v;s!==null;){var z=s;if(v=z.stateNode,z=z.tag,z!==5&&z!==26&&z!==27||v===null||o===null||(z=Ha(s,o),z!=null&&j.push(oe(s,z,v))),il)break;s=s.return}0<j.length&&(h=new g(h,U,null,u,S),T.push({event:h,listeners:j}))}}if((t&7)===0){l:{if(h=l==="mouseover"||l==="pointerover",g=l==="mouseout"||l==="pointerout",h&&u!==tf&&(U=u.relatedTarget||u.fromElement)&&(Vu(U)||U[Zu]))break l;if((g||h)&&(h=S.window===S?S:(h=S.ownerDocument)?h.defaultView||h.parentWindow:window,g?(U=u.relatedTarget||u.toElement,g=m,U=U?Vu(U):null,U!==null&&(il=X(U),j=U.tag,U!==il||j!==5&&j!==27&&j!==6)&&(U=null)):(g=null,U=m),g!==U)){if(j=Xi,z="onMouseLeave",o="onMouseEnter",s="mouse",(l==="pointerout"||l==="pointerover")&&(j=Zi,z="onPointerLeave",o="onPointerEnter",s="pointer"),il=g==null?h:Ca(g),v=U==null?h:Ca(U),h=new j(z,s+"leave",g,u,S),h.target=il,h.relatedTarget=v,z=null,Vu(S)===m&&(j=new j(o,s+"enter",U,u,S),j.target=v,j.relatedTarget=il,z=j),il=z,g&&U)t:{for(j=bv,o=g,s=U,v=0,z=o;z;z=j(z))v++;z=0;for(var H=s;H;H=j(H))z++;for(;0<v-z;)o=j(o),v--;for(;0<z-v;)s=j(s),z--;for(;v--;){if(o===s||s!==null&&o===s.alternate){j=o;break t}o=j(o),s=j(s)}j=null}else j=null;g!==null&&Rd(T,h,g,j,!1),U!==null&&il!==null&&Rd(T,il,U,j,!0)}}l:{if(h=m?Ca(m):window,g=h.nodeName&&h.nodeName.toLowerCase(),g==="select"||g==="input"&&h.type==="file")var I=ki;else if(Wi(h))if(Fi)I=Uy;else{I=My;var C=py}else g=h.nodeName,!g||g.toLowerCase()!=="input"||h.type!=="checkbox"&&h.type!=="radio"?m&&lf(m.elementType)&&(I=ki):I=Dy;if(I&&(I=I(l,m))){$i(T,I,u,S);break l}C&&C(l,h,m),l==="focusout"&&m&&h.type==="number"&&m.memoizedProps.value!=null&&Pn(h,"number",h.value)}switch(C=m?Ca(m):window,l){case"focusin":(Wi(C)||C.contentEditable==="true")&&(Iu=C,hf=m,Xa=null);break;case"focusout":Xa=hf=Iu=null;break;case"mousedown":gf=!0;break;case"contextmenu":case"mouseup":case"dragend":gf=!1,n0(T,u,S);break;case"selectionchange":if(Cy)break;case"keydown":case"keyup":n0(T,u,S)}var V;if(of)l:{switch(l){case"compositionstart":var W="onCompositionStart";break l;case"compositionend":W="onCompositionEnd";break l;case"compositionupdate":W="onCompositionUpdate";break l}W=void 0}else Fu?Ji(l,u)&&(W="onCompositionEnd"):l==="keydown"&&u.keyCode===229&&(W="onCompositionStart");W&&(Vi&&u.locale!=="ko"&&(Fu||W!=="onCompositionStart"?W==="onCompositionEnd"&&Fu&&(V=xi()):(It=S,nf="value"in It?It.value:It.textContent,Fu=!0)),C=On(m,W),0<C.length&&(W=new Qi(W,l,null,u,S),T.push({event:W,listeners:C}),V?W.data=V:(V=wi(u),V!==null&&(W.data=V)))),(V=Ty?Ey(l,u):Ay(l,u))&&(W=On(m,"onBeforeInput"),0<W.length&&(C=new Qi("onBeforeInput","beforeinput",null,u,S),T.push({event:C,listeners:W}),C.data=V)),mv(T,l,m,u,S)}Cd(T,t)})}function oe(l,t,u){return{instance:l,listener:t,currentTarget:u}}function On(l,t){for(var u=t+"Capture",a=[];l!==null;){var e=l,n=e.stateNode;if(e=e.tag,e!==5&&e!==26&&e!==27||n===null||(e=Ha(l,u),e!=null&&a.unshift(oe(l,e,n)),e=Ha(l,t),e!=null&&a.push(oe(l,e,n))),l.tag===3)return a;l=l.return}return[]}function bv(l){if(l===null)return null;do l=l.return;while(l&&l.tag!==5&&l.tag!==27);return l||null}function Rd(l,t,u,a,e){for(var n=t._reactName,f=[];u!==null&&u!==a;){var c=u,i=c.alternate,m=c.stateNode;if(c=c.tag,i!==null&&i===a)break;c!==5&&c!==26&&c!==27||m===null||(i=m,e?(m=Ha(u,n),m!=null&&f.unshift(oe(u,m,i))):e||(m=Ha(u,n),m!=null&&f.push(oe(u,m,i)))),u=u.return}f.length!==0&&l.push({event:t,listeners:f})}var rv=/\r\n?/g,zv=/\u0000|\uFFFD/g;function jd(l){return(typeof l=="string"?l:""+l).replace(rv,`
-`).replace(zv,"")}function qd(l,t){return t=jd(t),jd(l)===t}function cl(l,t,u,a,e,n){switch(u){case"children":typeof a=="string"?t==="body"||t==="textarea"&&a===""||Wu(l,a):(typeof a=="number"||typeof a=="bigint")&&t!=="body"&&Wu(l,""+a);break;case"className":De(l,"class",a);break;case"tabIndex":De(l,"tabindex",a);break;case"dir":case"role":case"viewBox":case"width":case"height":De(l,u,a);break;case"style":qi(l,a,n);break;case"data":if(t!=="object"){De(l,"data",a);break}case"src":case"href":if(a===""&&(t!=="a"||u!=="href")){l.removeAttribute(u);break}if(a==null||typeof a=="function"||typeof a=="symbol"||typeof a=="boolean"){l.removeAttribute(u);break}a=Ne(""+a),l.setAttribute(u,a);break;case"action":case"formAction":if(typeof a=="function"){l.setAttribute(u,"javascript:throw new Error('A React form was unexpectedly submitted. If you called form.submit() manually, consider using form.requestSubmit() instead. If you\\'re trying to use event.stopPropagation() in a submit event handler, consider also calling event.preventDefault().')");break}else typeof n=="function"&&(u==="formAction"?(t!=="input"&&cl(l,t,"name",e.name,e,null),cl(l,t,"formEncType",e.formEncType,e,null),cl(l,t,"formMethod",e.formMethod,e,null),cl(l,t,"formTarget",e.formTarget,e,null)):(cl(l,t,"encType",e.encType,e,null),cl(l,t,"method",e.method,e,null),cl(l,t,"target",e.target,e,null)));if(a==null||typeof a=="symbol"||typeof a=="boolean"){l.removeAttribute(u);break}a=Ne(""+a),l.setAttribute(u,a);break;case"onClick":a!=null&&(l.onclick=Ht);break;case"onScroll":a!=null&&J("scroll",l);break;case"onScrollEnd":a!=null&&J("scrollend",l);break;case"dangerouslySetInnerHTML":if(a!=null){if(typeof a!="object"||!("__html"in a))throw Error(y(61));if(u=a.__html,u!=null){if(e.children!=null)throw Error(y(60));l.innerHTML=u}}break;case"multiple":l.multiple=a&&typeof a!="function"&&typeof a!="symbol";break;case"muted":l.muted=a&&typeof a!="function"&&typeof a!="symbol";break;case"suppressContentEditableWarning":case"suppressHydrationWarning":case"defaultValue":case"defaultChecked":case"innerHTML":case"ref":break;case"autoFocus":break;case"xlinkHref":if(a==null||typeof a=="function"||typeof a=="boolean"||typeof a=="symbol"){l.removeAttribute("xlink:href");break}u=Ne(""+a),l.setAttributeNS("http://www.w3.org/1999/xlink","xlink:href",u);break;case"contentEditable":case"spellCheck":case"draggable":case"value":case"autoReverse":case"externalResourcesRequired":case"focusable":case"preserveAlpha":a!=null&&typeof a!="function"&&typeof a!="symbol"?l.setAttribute(u,""+a):l.removeAttribute(u);break;case"inert":case"allowFullScreen":case"async":case"autoPlay":case"controls":case"default":case"defer":case"disabled":case"disablePictureInPicture":case"disableRemotePlayback":case"formNoValidate":case"hidden":case"loop":case"noModule":case"noValidate":case"open":case"playsInline":case"readOnly":case"required":case"reversed":case"scoped":case"seamless":case"itemScope":a&&typeof a!="function"&&typeof a!="symbol"?l.setAttribute(u,""):l.removeAttribute(u);break;case"capture":case"download":a===!0?l.setAttribute(u,""):a!==!1&&a!=null&&typeof a!="function"&&typeof a!="symbol"?l.setAttribute(u,a):l.removeAttribute(u);break;case"cols":case"rows":case"size":case"span":a!=null&&typeof a!="function"&&typeof a!="symbol"&&!isNaN(a)&&1<=a?l.setAttribute(u,a):l.removeAttribute(u);break;case"rowSpan":case"start":a==null||typeof a=="function"||typeof a=="symbol"||isNaN(a)?l.removeAttribute(u):l.setAttribute(u,a);break;case"popover":J("beforetoggle",l),J("toggle",l),Me(l,"popover",a);break;case"xlinkActuate":Ct(l,"http://www.w3.org/1999/xlink","xlink:actuate",a);break;case"xlinkArcrole":Ct(l,"http://www.w3.org/1999/xlink","xlink:arcrole",a);break;case"xlinkRole":Ct(l,"http://www.w3.org/1999/xlink","xlink:role",a);break;case"xlinkShow":Ct(l,"http://www.w3.org/1999/xlink","xlink:show",a);break;case"xlinkTitle":Ct(l,"http://www.w3.org/1999/xlink","xlink:title",a);break;case"xlinkType":Ct(l,"http://www.w3.org/1999/xlink","xlink:type",a);break;case"xmlBase":Ct(l,"http://www.w3.org/XML/1998/namespace","xml:base",a);break;case"xmlLang":Ct(l,"http://www.w3.org/XML/1998/namespace","xml:lang",a);break;case"xmlSpace":Ct(l,"http://www.w3.org/XML/1998/namespace","xml:space",a);break;case"is":Me(l,"is",a);break;case"innerText":case"textContent":break;default:(!(2<u.length)||u[0]!=="o"&&u[0]!=="O"||u[1]!=="n"&&u[1]!=="N")&&(u=Wo.get(u)||u,Me(l,u,a))}}function Qc(l,t,u,a,e,n){switch(u){case"style":qi(l,a,n);break;case"dangerouslySetInnerHTML":if(a!=null){if(typeof a!="object"||!("__html"in a))throw Error(y(61));if(u=a.__html,u!=null){if(e.children!=null)throw Error(y(60));l.innerHTML=u}}break;case"children":typeof a=="string"?Wu(l,a):(typeof a=="number"||typeof a=="bigint")&&Wu(l,""+a);break;case"onScroll":a!=null&&J("scroll",l);break;case"onScrollEnd":a!=null&&J("scrollend",l);break;case"onClick":a!=null&&(l.onclick=Ht);break;case"suppressContentEditableWarning":case"suppressHydrationWarning":case"innerHTML":case"ref":break;case"innerText":case"textContent":break;default:if(!pi.hasOwnProperty(u))l:{if(u[0]==="o"&&u[1]==="n"&&(e=u.endsWith("Capture"),t=u.slice(2,e?u.length-7:void 0),n=l[Vl]||null,n=n!=null?n[u]:null,typeof n=="function"&&l.removeEventListener(t,n,e),typeof a=="function")){typeof n!="function"&&n!==null&&(u in l?l[u]=null:l.hasAttribute(u)&&l.removeAttribute(u)),l.addEventListener(t,a,e);break l}u in l?l[u]=a:a===!0?l.setAttribute(u,""):Me(l,u,a)}}}function jl(l,t,u){switch(t){case"div":case"span":case"svg":case"path":case"a":case"g":case"p":case"li":break;case"img":J("error",l),J("load",l);var a=!1,e=!1,n;for(n in u)if(u.hasOwnProperty(n)){var f=u[n];if(f!=null)switch(n){case"src":a=!0;break;case"srcSet":e=!0;break;case"children":case"dangerouslySetInnerHTML":throw Error(y(137,t));default:cl(l,t,n,f,u,null)}}e&&cl(l,t,"srcSet",u.srcSet,u,null),a&&cl(l,t,"src",u.src,u,null);return;case"input":J("invalid",l);var c=n=f=e=null,i=null,m=null;for(a in u)if(u.hasOwnProperty(a)){var S=u[a];if(S!=null)switch(a){case"name":e=S;break;case"type":f=S;break;case"checked":i=S;break;case"defaultChecked":m=S;break;case"value":n=S;break;case"defaultValue":c=S;break;case"children":case"dangerouslySetInnerHTML":if(S!=null)throw Error(y(137,t));break;default:cl(l,t,a,S,u,null)}}Ci(l,n,c,i,m,f,e,!1);return;case"select":J("invalid",l),a=f=n=null;for(e in u)if(u.hasOwnProperty(e)&&(c=u[e],c!=null))switch(e){case"value":n=c;break;case"defaultValue":f=c;break;case"multiple":a=c;default:cl(l,t,e,c,u,null)}t=n,u=f,l.multiple=!!a,t!=null?wu(l,!!a,t,!1):u!=null&&wu(l,!!a,u,!0);return;case"textarea":J("invalid",l),n=e=a=null;for(f in u)if(u.hasOwnProperty(f)&&(c=u[f],c!=null))switch(f){case"value":a=c;break;case"defaultValue":e=c;break;case"children":n=c;break;case"dangerouslySetInnerHTML":if(c!=null)throw Error(y(91));break;default:cl(l,t,f,c,u,null)}Ri(l,a,e,n);return;case"option":for(i in u)u.hasOwnProperty(i)&&(a=u[i],a!=null)&&(i==="selected"?l.selected=a&&typeof a!="function"&&typeof a!="symbol":cl(l,t,i,a,u,null));return;case"dialog":J("beforetoggle",l),J("toggle",l),J("cancel",l),J("close",l);break;case"iframe":case"object":J("load",l);break;case"video":case"audio":for(a=0;a<de.length;a++)J(de[a],l);break;case"image":J("error",l),J("load",l);break;case"details":J("toggle",l);break;case"embed":case"source":case"link":J("error",l),J("load",l);case"area":case"base":case"br":case"col":case"hr":case"keygen":case"meta":case"param":case"track":case"wbr":case"menuitem":for(m in u)if(u.hasOwnProperty(m)&&(a=u[m],a!=null))switch(m){case"children":case"dangerouslySetInnerHTML":throw Error(y(137,t));default:cl(l,t,m,a,u,null)}return;default:if(lf(t)){for(S in u)u.hasOwnProperty(S)&&(a=u[S],a!==void 0&&Qc(l,t,S,a,u,void 0));return}}for(c in u)u.hasOwnProperty(c)&&(a=u[c],a!=null&&cl(l,t,c,a,u,null))}function Tv(l,t,u,a){switch(t){case"div":case"span":case"svg":case"path":case"a":case"g":case"p":case"li":break;case"input":var e=null,n=null,f=null,c=null,i=null,m=null,S=null;for(g in u){var T=u[g];if(u.hasOwnProperty(g)&&T!=null)switch(g){case"checked":break;case"value":break;case"defaultValue":i=T;default:a.hasOwnProperty(g)||cl(l,t,g,null,a,T)}}for(var h in a){var g=a[h];if(T=u[h],a.hasOwnProperty(h)&&(g!=null||T!=null))switch(h){case"type":n=g;break;case"name":e=g;break;case"checked":m=g;break;case"defaultChecked":S=g;break;case"value":f=g;break;case"defaultValue":c=g;break;case"children":case"dangerouslySetInnerHTML":if(g!=null)throw Error(y(137,t));break;default:g!==T&&cl(l,t,h,g,a,T)}}In(l,f,c,i,m,S,n,e);return;case"select":g=f=c=h=null;for(n in u)if(i=u[n],u.hasOwnProperty(n)&&i!=null)switch(n){case"value":break;case"multiple":g=i;default:a.hasOwnProperty(n)||cl(l,t,n,null,a,i)}for(e in a)if(n=a[e],i=u[e],a.hasOwnProperty(e)&&(n!=null||i!=null))switch(e){case"value":h=n;break;case"defaultValue":c=n;break;case"multiple":f=n;default:n!==i&&cl(l,t,e,n,a,i)}t=c,u=f,a=g,h!=null?wu(l,!!u,h,!1):!!a!=!!u&&(t!=null?wu(l,!!u,t,!0):wu(l,!!u,u?[]:"",!1));return;case"textarea":g=h=null;for(c in u)if(e=u[c],u.hasOwnProperty(c)&&e!=null&&!a.hasOwnProperty(c))switch(c){case"value":break;case"children":break;default:cl(l,t,c,null,a,e)}for(f in a)if(e=a[f],n=u[f],a.hasOwnProperty(f)&&(e!=null||n!=null))switch(f){case"value":h=e;break;case"defaultValue":g=e;break;case"children":break;case"dangerouslySetInnerHTML":if(e!=null)throw Error(y(91));break;default:e!==n&&cl(l,t,f,e,a,n)}Hi(l,h,g);return;case"option":for(var U in u)h=u[U],u.hasOwnProperty(U)&&h!=null&&!a.hasOwnProperty(U)&&(U==="selected"?l.selected=!1:cl(l,t,U,null,a,h));for(i in a)h=a[i],g=u[i],a.hasOwnProperty(i)&&h!==g&&(h!=null||g!=null)&&(i==="selected"?l.selected=h&&typeof h!="function"&&typeof h!="symbol":cl(l,t,i,h,a,g));return;case"img":case"link":case"area":case"base":case"br":case"col":case"embed":case"hr":case"keygen":case"meta":case"param":case"source":case"track":case"wbr":case"menuitem":for(var j in u)h=u[j],u.hasOwnProperty(j)&&h!=null&&!a.hasOwnProperty(j)&&cl(l,t,j,null,a,h);for(m in a)if(h=a[m],g=u[m],a.hasOwnProperty(m)&&h!==g&&(h!=null||g!=null))switch(m){case"children":case"dangerouslySetInnerHTML":if(h!=null)throw Error(y(137,t));break;default:cl(l,t,m,h,a,g)}return;default:if(lf(t)){for(var il in u)h=u[il],u.hasOwnProperty(il)&&h!==void 0&&!a.hasOwnProperty(il)&&Qc(l,t,il,void 0,a,h);for(S in a)h=a[S],g=u[S],!a.hasOwnProperty(S)||h===g||h===void 0&&g===void 0||Qc(l,t,S,h,a,g);return}}for(var o in u)h=u[o],u.hasOwnProperty(o)&&h!=null&&!a.hasOwnProperty(o)&&cl(l,t,o,null,a,h);for(T in a)h=a[T],g=u[T],!a.hasOwnProperty(T)||h===g||h==null&&g==null||cl(l,t,T,h,a,g)}function Bd(l){switch(l){case"css":case"script":case"font":case"img":case"image":case"input":case"link":return!0;default:return!1}}function Ev(){if(typeof performance.getEntriesByType=="function"){for(var l=0,t=0,u=performance.getEntriesByType("resource"),a=0;a<u.length;a++){var e=u[a],n=e.transferSize,f=e.initiatorType,c=e.duration;if(n&&c&&Bd(f)){for(f=0,c=e.responseEnd,a+=1;a<u.length;a++){var i=u[a],m=i.startTime;if(m>c)break;var S=i.transferSize,T=i.initiatorType;S&&Bd(T)&&(i=i.responseEnd,f+=S*(i<c?1:(c-m)/(i-m)))}if(--a,t+=8*(n+f)/(e.duration/1e3),l++,10<l)break}}if(0<l)return t/l/1e6}return navigator.connection&&(l=navigator.connection.downlink,typeof l=="number")?l:5}var Zc=null,Vc=null;function pn(l){return l.nodeType===9?l:l.ownerDocument}function Yd(l){switch(l){case"http://www.w3.org/2000/svg":return 1;case"http://www.w3.org/1998/Math/MathML":return 2;default:return 0}}function xd(l,t){if(l===0)switch(t){case"svg":return 1;case"math":return 2;default:return 0}return l===1&&t==="foreignObject"?0:l}function Lc(l,t){return l==="textarea"||l==="noscript"||typeof t.children=="string"||typeof t.children=="number"||typeof t.children=="bigint"||typeof t.dangerouslySetInnerHTML=="object"&&t.dangerouslySetInnerHTML!==null&&t.dangerouslySetInnerHTML.__html!=null}var Kc=null;function Av(){var l=window.event;return l&&l.type==="popstate"?l===Kc?!1:(Kc=l,!0):(Kc=null,!1)}var Gd=typeof setTimeout=="function"?setTimeout:void 0,_v=typeof clearTimeout=="function"?clearTimeout:void 0,Xd=typeof Promise=="function"?Promise:void 0,Ov=typeof queueMicrotask=="function"?queueMicrotask:typeof Xd<"u"?function(l){return Xd.resolve(null).then(l).catch(pv)}:Gd;function pv(l){setTimeout(function(){throw l})}function hu(l){return l==="head"}function Qd(l,t){var u=t,a=0;do{var e=u.nextSibling;if(l.removeChild(u),e&&e.nodeType===8)if(u=e.data,u==="/$"||u==="/&"){if(a===0){l.removeChild(e),Oa(t);return}a--}else if(u==="$"||u==="$?"||u==="$~"||u==="$!"||u==="&")a++;else if(u==="html")ye(l.ownerDocument.documentElement);else if(u==="head"){u=l.ownerDocument.head,ye(u);for(var n=u.firstChild;n;){var f=n.nextSibling,c=n.nodeName;n[Na]||c==="SCRIPT"||c==="STYLE"||c==="LINK"&&n.rel.toLowerCase()==="stylesheet"||u.removeChild(n),n=f}}else u==="body"&&ye(l.ownerDocument.body);u=e}while(u);Oa(t)}function Zd(l,t){var u=l;l=0;do{var a=u.nextSibling;if(u.nodeType===1?t?(u._stashedDisplay=u.style.display,u.style.display="none"):(u.style.display=u._stashedDisplay||"",u.getAttribute("style")===""&&u.removeAttribute("style")):u.nodeType===3&&(t?(u._stashedText=u.nodeValue,u.nodeValue=""):u.nodeValue=u._stashedText||""),a&&a.nodeType===8)if(u=a.data,u==="/$"){if(l===0)break;l--}else u!=="$"&&u!=="$?"&&u!=="$~"&&u!=="$!"||l++;u=a}while(u)}function Jc(l){var t=l.firstChild;for(t&&t.nodeType===10&&(t=t.nextSibling);t;){var u=t;switch(t=t.nextSibling,u.nodeName){case"HTML":case"HEAD":case"BODY":Jc(u),kn(u);continue;case"SCRIPT":case"STYLE":continue;case"LINK":if(u.rel.toLowerCase()==="stylesheet")continue}l.removeChild(u)}}function Mv(l,t,u,a){for(;l.nodeType===1;){var e=u;if(l.nodeName.toLowerCase()!==t.toLowerCase()){if(!a&&(l.nodeName!=="INPUT"||l.type!=="hidden"))break}else if(a){if(!l[Na])switch(t){case"meta":if(!l.hasAttribute("itemprop"))break;return l;case"link":if(n=l.getAttribute("rel"),n==="stylesheet"&&l.hasAttribute("data-precedence"))break;if(n!==e.rel||l.getAttribute("href")!==(e.href==null||e.href===""?null:e.href)||l.getAttribute("crossorigin")!==(e.crossOrigin==null?null:e.crossOrigin)||l.getAttribute("title")!==(e.title==null?null:e.title))break;return l;case"style":if(l.hasAttribute("data-precedence"))break;return l;case"script":if(n=l.getAttribute("src"),(n!==(e.src==null?null:e.src)||l.getAttribute("type")!==(e.type==null?null:e.type)||l.getAttribute("crossorigin")!==(e.crossOrigin==null?null:e.crossOrigin))&&n&&l.hasAttribute("async")&&!l.hasAttribute("itemprop"))break;return l;default:return l}}else if(t==="input"&&l.type==="hidden"){var n=e.name==null?null:""+e.name;if(e.type==="hidden"&&l.getAttribute("name")===n)return l}else return l;if(l=St(l.nextSibling),l===null)break}return null}function Dv(l,t,u){if(t==="")return null;for(;l.nodeType!==3;)if((l.nodeType!==1||l.nodeName!=="INPUT"||l.type!=="hidden")&&!u||(l=St(l.nextSibling),l===null))return null;return l}function Vd(l,t){for(;l.nodeType!==8;)if((l.nodeType!==1||l.nodeName!=="INPUT"||l.type!=="hidden")&&!t||(l=St(l.nextSibling),l===null))return null;return l}function wc(l){return l.data==="$?"||l.data==="$~"}function Wc(l){return l.data==="$!"||l.data==="$?"&&l.ownerDocument.readyState!=="loading"}function Uv(l,t){var u=l.ownerDocument;if(l.data==="$~")l._reactRetry=t;else if(l.data!=="$?"||u.readyState!=="loading")t();else{var a=function(){t(),u.removeEventListener("DOMContentLoaded",a)};u.addEventListener("DOMContentLoaded",a),l._reactRetry=a}}function St(l){for(;l!=null;l=l.nextSibling){var t=l.nodeType;if(t===1||t===3)break;if(t===8){if(t=l.data,t==="$"||t==="$!"||t==="$?"||t==="$~"||t==="&"||t==="F!"||t==="F")break;if(t==="/$"||t==="/&")return null}}return l}var $c=null;function Ld(l){l=l.nextSibling;for(var t=0;l;){if(l.nodeType===8){var u=l.data;if(u==="/$"||u==="/&"){if(t===0)return St(l.nextSibling);t--}else u!=="$"&&u!=="$!"&&u!=="$?"&&u!=="$~"&&u!=="&"||t++}l=l.nextSibling}return null}function Kd(l){l=l.previousSibling;for(var t=0;l;){if(l.nodeType===8){var u=l.data;if(u==="$"||u==="$!"||u==="$?"||u==="$~"||u==="&"){if(t===0)return l;t--}else u!=="/$"&&u!=="/&"||t++}l=l.previousSibling}return null}function Jd(l,t,u){switch(t=pn(u),l){case"html":if(l=t.documentElement,!l)throw Error(y(452));return l;case"head":if(l=t.head,!l)throw Error(y(453));return l;case"body":if(l=t.body,!l)throw Error(y(454));return l;default:throw Error(y(451))}}function ye(l){for(var t=l.attributes;t.length;)l.removeAttributeNode(t[0]);kn(l)}var bt=new Map,wd=new Set;function Mn(l){return typeof l.getRootNode=="function"?l.getRootNode():l.nodeType===9?l:l.ownerDocument}var Wt=O.d;O.d={f:Nv,r:Cv,D:Hv,C:Rv,L:jv,m:qv,X:Yv,S:Bv,M:xv};function Nv(){var l=Wt.f(),t=bn();return l||t}function Cv(l){var t=Lu(l);t!==null&&t.tag===5&&t.type==="form"?ds(t):Wt.r(l)}var Ea=typeof document>"u"?null:document;function Wd(l,t,u){var a=Ea;if(a&&typeof t=="string"&&t){var e=dt(t);e='link[rel="'+l+'"][href="'+e+'"]',typeof u=="string"&&(e+='[crossorigin="'+u+'"]'),wd.has(e)||(wd.add(e),l={rel:l,crossOrigin:u,href:t},a.querySelector(e)===null&&(t=a.createElement("link"),jl(t,"link",l),Dl(t),a.head.appendChild(t)))}}function Hv(l){Wt.D(l),Wd("dns-prefetch",l,null)}function Rv(l,t){Wt.C(l,t),Wd("preconnect",l,t)}function jv(l,t,u){Wt.L(l,t,u);var a=Ea;if(a&&l&&t){var e='link[rel="preload"][as="'+dt(t)+'"]';t==="image"&&u&&u.imageSrcSet?(e+='[imagesrcset="'+dt(u.imageSrcSet)+'"]',typeof u.imageSizes=="string"&&(e+='[imagesizes="'+dt(u.imageSizes)+'"]')):e+='[href="'+dt(l)+'"]';var n=e;switch(t){case"style":n=Aa(l);break;case"script":n=_a(l)}bt.has(n)||(l=M({rel:"preload",href:t==="image"&&u&&u.imageSrcSet?void 0:l,as:t},u),bt.set(n,l),a.querySelector(e)!==null||t==="style"&&a.querySelector(ve(n))||t==="script"&&a.querySelector(me(n))||(t=a.createElement("link"),jl(t,"link",l),Dl(t),a.head.appendChild(t)))}}function qv(l,t){Wt.m(l,t);var u=Ea;if(u&&l){var a=t&&typeof t.as=="string"?t.as:"script",e='link[rel="modulepreload"][as="'+dt(a)+'"][href="'+dt(l)+'"]',n=e;switch(a){case"audioworklet":case"paintworklet":case"serviceworker":case"sharedworker":case"worker":case"script":n=_a(l)}if(!bt.has(n)&&(l=M({rel:"modulepreload",href:l},t),bt.set(n,l),u.querySelector(e)===null)){switch(a){case"audioworklet":case"paintworklet":case"serviceworker":case"sharedworker":case"worker":case"script":if(u.querySelector(me(n)))return}a=u.createElement("link"),jl(a,"link",l),Dl(a),u.head.appendChild(a)}}}function Bv(l,t,u){Wt.S(l,t,u);var a=Ea;if(a&&l){var e=Ku(a).hoistableStyles,n=Aa(l);t=t||"default";var f=e.get(n);if(!f){var c={loading:0,preload:null};if(f=a.querySelector(ve(n)))c.loading=5;else{l=M({rel:"stylesheet",href:l,"data-precedence":t},u),(u=bt.get(n))&&kc(l,u);var i=f=a.createElement("link");Dl(i),jl(i,"link",l),i._p=new Promise(function(m,S){i.onload=m,i.onerror=S}),i.addEventListener("load",function(){c.loading|=1}),i.addEventListener("error",function(){c.loading|=2}),c.loading|=4,Dn(f,t,a)}f={type:"stylesheet",instance:f,count:1,state:c},e.set(n,f)}}}function Yv(l,t){Wt.X(l,t);var u=Ea;if(u&&l){var a=Ku(u).hoistableScripts,e=_a(l),n=a.get(e);n||(n=u.querySelector(me(e)),n||(l=M({src:l,async:!0},t),(t=bt.get(e))&&Fc(l,t),n=u.createElement("script"),Dl(n),jl(n,"link",l),u.head.appendChild(n)),n={type:"script",instance:n,count:1,state:null},a.set(e,n))}}function xv(l,t){Wt.M(l,t);var u=Ea;if(u&&l){var a=Ku(u).hoistableScripts,e=_a(l),n=a.get(e);n||(n=u.querySelector(me(e)),n||(l=M({src:l,async:!0,type:"module"},t),(t=bt.get(e))&&Fc(l,t),n=u.createElement("script"),Dl(n),jl(n,"link",l),u.head.appendChild(n)),n={type:"script",instance:n,count:1,state:null},a.set(e,n))}}function $d(l,t,u,a){var e=(e=L.current)?Mn(e):null;if(!e)throw Error(y(446));switch(l){case"meta":case"title":return null;case"style":return typeof u.precedence=="string"&&typeof u.href=="string"?(t=Aa(u.href),u=Ku(e).hoistableStyles,a=u.get(t),a||(a={type:"style",instance:null,count:0,state:null},u.set(t,a)),a):{type:"void",instance:null,count:0,state:null};case"link":if(u.rel==="stylesheet"&&typeof u.href=="string"&&typeof u.precedence=="string"){l=Aa(u.href);var n=Ku(e).hoistableStyles,f=n.get(l);if(f||(e=e.ownerDocument||e,f={type:"stylesheet",instance:null,count:0,state:{loading:0,preload:null}},n.set(l,f),(n=e.querySelector(ve(l)))&&!n._p&&(f.instance=n,f.state.loading=5),bt.has(l)||(u={rel:"preload",as:"style",href:u.href,crossOrigin:u.crossOrigin,integrity:u.integrity,media:u.media,hrefLang:u.hrefLang,referrerPolicy:u.referrerPolicy},bt.set(l,u),n||Gv(e,l,u,f.state))),t&&a===null)throw Error(y(528,""));return f}if(t&&a!==null)throw Error(y(529,""));return null;case"script":return t=u.async,u=u.src,typeof u=="string"&&t&&typeof t!="function"&&typeof t!="symbol"?(t=_a(u),u=Ku(e).hoistableScripts,a=u.get(t),a||(a={type:"script",instance:null,count:0,state:null},u.set(t,a)),a):{type:"void",instance:null,count:0,state:null};default:throw Error(y(444,l))}}function Aa(l){return'href="'+dt(l)+'"'}function ve(l){return'link[rel="stylesheet"]['+l+"]"}function kd(l){return M({},l,{"data-precedence":l.precedence,precedence:null})}function Gv(l,t,u,a){l.querySelector('link[rel="preload"][as="style"]['+t+"]")?a.loading=1:(t=l.createElement("link"),a.preload=t,t.addEventListener("load",function(){return a.loading|=1}),t.addEventListener("error",function(){return a.loading|=2}),jl(t,"link",u),Dl(t),l.head.appendChild(t))}function _a(l){return'[src="'+dt(l)+'"]'}function me(l){return"script[async]"+l}function Fd(l,t,u){if(t.count++,t.instance===null)switch(t.type){case"style":var a=l.querySelector('style[data-href~="'+dt(u.href)+'"]');if(a)return t.instance=a,Dl(a),a;var e=M({},u,{"data-href":u.href,"data-precedence":u.precedence,href:null,precedence:null});return a=(l.ownerDocument||l).createElement("style"),Dl(a),jl(a,"style",e),Dn(a,u.precedence,l),t.instance=a;case"stylesheet":e=Aa(u.href);var n=l.querySelector(ve(e));if(n)return t.state.loading|=4,t.instance=n,Dl(n),n;a=kd(u),(e=bt.get(e))&&kc(a,e),n=(l.ownerDocument||l).createElement("link"),Dl(n);var f=n;return f._p=new Promise(function(c,i){f.onload=c,f.onerror=i}),jl(n,"link",a),t.state.loading|=4,Dn(n,u.precedence,l),t.instance=n;case"script":return n=_a(u.src),(e=l.querySelector(me(n)))?(t.instance=e,Dl(e),e):(a=u,(e=bt.get(n))&&(a=M({},u),Fc(a,e)),l=l.ownerDocument||l,e=l.createElement("script"),Dl(e),jl(e,"link",a),l.head.appendChild(e),t.instance=e);case"void":return null;default:throw Error(y(443,t.type))}else t.type==="stylesheet"&&(t.state.loading&4)===0&&(a=t.instance,t.state.loading|=4,Dn(a,u.precedence,l));return t.instance}function Dn(l,t,u){for(var a=u.querySelectorAll('link[rel="stylesheet"][data-precedence],style[data-precedence]'),e=a.length?a[a.length-1]:null,n=e,f=0;f<a.length;f++){var c=a[f];if(c.dataset.precedence===t)n=c;else if(n!==e)break}n?n.parentNode.insertBefore(l,n.nextSibling):(t=u.nodeType===9?u.head:u,t.insertBefore(l,t.firstChild))}function kc(l,t){l.crossOrigin==null&&(l.crossOrigin=t.crossOrigin),l.referrerPolicy==null&&(l.referrerPolicy=t.referrerPolicy),l.title==null&&(l.title=t.title)}function Fc(l,t){l.crossOrigin==null&&(l.crossOrigin=t.crossOrigin),l.referrerPolicy==null&&(l.referrerPolicy=t.referrerPolicy),l.integrity==null&&(l.integrity=t.integrity)}var Un=null;function Id(l,t,u){if(Un===null){var a=new Map,e=Un=new Map;e.set(u,a)}else e=Un,a=e.get(u),a||(a=new Map,e.set(u,a));if(a.has(l))return a;for(a.set(l,null),u=u.getElementsByTagName(l),e=0;e<u.length;e++){var n=u[e];if(!(n[Na]||n[Nl]||l==="link"&&n.getAttribute("rel")==="stylesheet")&&n.namespaceURI!=="http://www.w3.org/2000/svg"){var f=n.getAttribute(t)||"";f=l+f;var c=a.get(f);c?c.push(n):a.set(f,[n])}}return a}function Pd(l,t,u){l=l.ownerDocument||l,l.head.insertBefore(u,t==="title"?l.querySelector("head > title"):null)}function Xv(l,t,u){if(u===1||t.itemProp!=null)return!1;switch(l){case"meta":case"title":return!0;case"style":if(typeof t.precedence!="string"||typeof t.href!="string"||t.href==="")break;return!0;case"link":if(typeof t.rel!="string"||typeof t.href!="string"||t.href===""||t.onLoad||t.onError)break;return t.rel==="stylesheet"?(l=t.disabled,typeof t.precedence=="string"&&l==null):!0;case"script":if(t.async&&typeof t.async!="function"&&typeof t.async!="symbol"&&!t.onLoad&&!t.onError&&t.src&&typeof t.src=="string")return!0}return!1}function lo(l){return!(l.type==="stylesheet"&&(l.state.loading&3)===0)}function Qv(l,t,u,a){if(u.type==="stylesheet"&&(typeof a.media!="string"||matchMedia(a.media).matches!==!1)&&(u.state.loading&4)===0){if(u.instance===null){var e=Aa(a.href),n=t.querySelector(ve(e));if(n){t=n._p,t!==null&&typeof t=="object"&&typeof t.then=="function"&&(l.count++,l=Nn.bind(l),t.then(l,l)),u.state.loading|=4,u.instance=n,Dl(n);return}n=t.ownerDocument||t,a=kd(a),(e=bt.get(e))&&kc(a,e),n=n.createElement("link"),Dl(n);var f=n;f._p=new Promise(function(c,i){f.onload=c,f.onerror=i}),jl(n,"link",a),u.instance=n}l.stylesheets===null&&(l.stylesheets=new Map),l.stylesheets.set(u,t),(t=u.state.preload)&&(u.state.loading&3)===0&&(l.count++,u=Nn.bind(l),t.addEventListener("load",u),t.addEventListener("error",u))}}var Ic=0;function Zv(l,t){return l.stylesheets&&l.count===0&&Hn(l,l.stylesheets),0<l.count||0<l.imgCount?function(u){var a=setTimeout(function(){if(l.stylesheets&&Hn(l,l.stylesheets),l.unsuspend){var n=l.unsuspend;l.unsuspend=null,n()}},6e4+t);0<l.imgBytes&&Ic===0&&(Ic=62500*Ev());var e=setTimeout(function(){if(l.waitingForImages=!1,l.count===0&&(l.stylesheets&&Hn(l,l.stylesheets),l.unsuspend)){var n=l.unsuspend;l.unsuspend=null,n()}},(l.imgBytes>Ic?50:800)+t);return l.unsuspend=u,function(){l.unsuspend=null,clearTimeout(a),clearTimeout(e)}}:null}function Nn(){if(this.count--,this.count===0&&(this.imgCount===0||!this.waitingForImages)){if(this.stylesheets)Hn(this,this.stylesheets);else if(this.unsuspend){var l=this.unsuspend;this.unsuspend=null,l()}}}var Cn=null;function Hn(l,t){l.stylesheets=null,l.unsuspend!==null&&(l.count++,Cn=new Map,t.forEach(Vv,l),Cn=null,Nn.call(l))}function Vv(l,t){if(!(t.state.loading&4)){var u=Cn.get(l);if(u)var a=u.get(null);else{u=new Map,Cn.set(l,u);for(var e=l.querySelectorAll("link[data-precedence],style[data-precedence]"),n=0;n<e.length;n++){var f=e[n];(f.nodeName==="LINK"||f.getAttribute("media")!=="not all")&&(u.set(f.dataset.precedence,f),a=f)}a&&u.set(null,a)}e=t.instance,f=e.getAttribute("data-precedence"),n=u.get(f)||a,n===a&&u.set(null,e),u.set(f,e),this.count++,a=Nn.bind(this),e.addEventListener("load",a),e.addEventListener("error",a),n?n.parentNode.insertBefore(e,n.nextSibling):(l=l.nodeType===9?l.head:l,l.insertBefore(e,l.firstChild)),t.state.loading|=4}}var he={$$typeof:ql,Provider:null,Consumer:null,_currentValue:q,_currentValue2:q,_threadCount:0};function Lv(l,t,u,a,e,n,f,c,i){this.tag=1,this.containerInfo=l,this.pingCache=this.current=this.pendingChildren=null,this.timeoutHandle=-1,this.callbackNode=this.next=this.pendingContext=this.context=this.cancelPendingCommit=null,this.callbackPriority=0,this.expirationTimes=Jn(-1),this.entangledLanes=this.shellSuspendCounter=this.errorRecoveryDisabledLanes=this.expiredLanes=this.warmLanes=this.pingedLanes=this.suspendedLanes=this.pendingLanes=0,this.entanglements=Jn(0),this.hiddenUpdates=Jn(null),this.identifierPrefix=a,this.onUncaughtError=e,this.onCaughtError=n,this.onRecoverableError=f,this.pooledCache=null,this.pooledCacheLanes=0,this.formState=i,this.incompleteTransitions=new Map}function to(l,t,u,a,e,n,f,c,i,m,S,T){return l=new Lv(l,t,u,f,i,m,S,T,c),t=1,n===!0&&(t|=24),n=ut(3,null,null,t),l.current=n,n.stateNode=l,t=Cf(),t.refCount++,l.pooledCache=t,t.refCount++,n.memoizedState={element:a,isDehydrated:u,cache:t},qf(n),l}function uo(l){return l?(l=ta,l):ta}function ao(l,t,u,a,e,n){e=uo(e),a.context===null?a.context=e:a.pendingContext=e,a=eu(t),a.payload={element:u},n=n===void 0?null:n,n!==null&&(a.callback=n),u=nu(l,a,t),u!==null&&($l(u,l,t),wa(u,l,t))}function eo(l,t){if(l=l.memoizedState,l!==null&&l.dehydrated!==null){var u=l.retryLane;l.retryLane=u!==0&&u<t?u:t}}function Pc(l,t){eo(l,t),(l=l.alternate)&&eo(l,t)}function no(l){if(l.tag===13||l.tag===31){var t=Du(l,67108864);t!==null&&$l(t,l,67108864),Pc(l,67108864)}}function fo(l){if(l.tag===13||l.tag===31){var t=ct();t=wn(t);var u=Du(l,t);u!==null&&$l(u,l,t),Pc(l,t)}}var Rn=!0;function Kv(l,t,u,a){var e=b.T;b.T=null;var n=O.p;try{O.p=2,li(l,t,u,a)}finally{O.p=n,b.T=e}}function Jv(l,t,u,a){var e=b.T;b.T=null;var n=O.p;try{O.p=8,li(l,t,u,a)}finally{O.p=n,b.T=e}}function li(l,t,u,a){if(Rn){var e=ti(a);if(e===null)Xc(l,t,a,jn,u),io(l,a);else if(Wv(e,l,t,u,a))a.stopPropagation();else if(io(l,a),t&4&&-1<wv.indexOf(l)){for(;e!==null;){var n=Lu(e);if(n!==null)switch(n.tag){case 3:if(n=n.stateNode,n.current.memoizedState.isDehydrated){var f=Au(n.pendingLanes);if(f!==0){var c=n;for(c.pendingLanes|=2,c.entangledLanes|=2;f;){var i=1<<31-lt(f);c.entanglements[1]|=i,f&=~i}Ut(n),(tl&6)===0&&(gn=Il()+500,se(0))}}break;case 31:case 13:c=Du(n,2),c!==null&&$l(c,n,2),bn(),Pc(n,2)}if(n=ti(a),n===null&&Xc(l,t,a,jn,u),n===e)break;e=n}e!==null&&a.stopPropagation()}else Xc(l,t,a,null,u)}}function ti(l){return l=uf(l),ui(l)}var jn=null;function ui(l){if(jn=null,l=Vu(l),l!==null){var t=X(l);if(t===null)l=null;else{var u=t.tag;if(u===13){if(l=ll(t),l!==null)return l;l=null}else if(u===31){if(l=ol(t),l!==null)return l;l=null}else if(u===3){if(t.stateNode.current.memoizedState.isDehydrated)return t.tag===3?t.stateNode.containerInfo:null;l=null}else t!==l&&(l=null)}}return jn=l,null}function co(l){switch(l){case"beforetoggle":case"cancel":case"click":case"close":case"contextmenu":case"copy":case"cut":case"auxclick":case"dblclick":case"dragend":case"dragstart":case"drop":case"focusin":case"focusout":case"input":case"invalid":case"keydown":case"keypress":case"keyup":case"mousedown":case"mouseup":case"paste":case"pause":case"play":case"pointercancel":case"pointerdown":case"pointerup":case"ratechange":case"reset":case"resize":case"seeked":case"submit":case"toggle":case"touchcancel":case"touchend":case"touchstart":case"volumechange":case"change":case"selectionchange":case"textInput":case"compositionstart":case"compositionend":case"compositionupdate":case"beforeblur":case"afterblur":case"beforeinput":case"blur":case"fullscreenchange":case"focus":case"hashchange":case"popstate":case"select":case"selectstart":return 2;case"drag":case"dragenter":case"dragexit":case"dragleave":case"dragover":case"mousemove":case"mouseout":case"mouseover":case"pointermove":case"pointerout":case"pointerover":case"scroll":case"touchmove":case"wheel":case"mouseenter":case"mouseleave":case"pointerenter":case"pointerleave":return 8;case"message":switch(Ho()){case hi:return 2;case gi:return 8;case Ee:case Ro:return 32;case Si:return 268435456;default:return 32}default:return 32}}var ai=!1,gu=null,Su=null,bu=null,ge=new Map,Se=new Map,ru=[],wv="mousedown mouseup touchcancel touchend touchstart auxclick dblclick pointercancel pointerdown pointerup dragend dragstart drop compositionend compositionstart keydown keypress keyup input textInput copy cut paste click change contextmenu reset".split(" ");function io(l,t){switch(l){case"focusin":case"focusout":gu=null;break;case"dragenter":case"dragleave":Su=null;break;case"mouseover":case"mouseout":bu=null;break;case"pointerover":case"pointerout":ge.delete(t.pointerId);break;case"gotpointercapture":case"lostpointercapture":Se.delete(t.pointerId)}}function be(l,t,u,a,e,n){return l===null||l.nativeEvent!==n?(l={blockedOn:t,domEventName:u,eventSystemFlags:a,nativeEvent:n,targetContainers:[e]},t!==null&&(t=Lu(t),t!==null&&no(t)),l):(l.eventSystemFlags|=a,t=l.targetContainers,e!==null&&t.indexOf(e)===-1&&t.push(e),l)}function Wv(l,t,u,a,e){switch(t){case"focusin":return gu=be(gu,l,t,u,a,e),!0;case"dragenter":return Su=be(Su,l,t,u,a,e),!0;case"mouseover":return bu=be(bu,l,t,u,a,e),!0;case"pointerover":var n=e.pointerId;return ge.set(n,be(ge.get(n)||null,l,t,u,a,e)),!0;case"gotpointercapture":return n=e.pointerId,Se.set(n,be(Se.get(n)||null,l,t,u,a,e)),!0}return!1}function so(l){var t=Vu(l.target);if(t!==null){var u=X(t);if(u!==null){if(t=u.tag,t===13){if(t=ll(u),t!==null){l.blockedOn=t,Ai(l.priority,function(){fo(u)});return}}else if(t===31){if(t=ol(u),t!==null){l.blockedOn=t,Ai(l.priority,function(){fo(u)});return}}else if(t===3&&u.stateNode.current.memoizedState.isDehydrated){l.blockedOn=u.tag===3?u.stateNode.containerInfo:null;return}}}l.blockedOn=null}function qn(l){if(l.blockedOn!==null)return!1;for(var t=l.targetContainers;0<t.length;){var u=ti(l.nativeEvent);if(u===null){u=l.nativeEvent;var a=new u.constructor(u.type,u);tf=a,u.target.dispatchEvent(a),tf=null}else return t=Lu(u),t!==null&&no(t),l.blockedOn=u,!1;t.shift()}return!0}function oo(l,t,u){qn(l)&&u.delete(t)}function $v(){ai=!1,gu!==null&&qn(gu)&&(gu=null),Su!==null&&qn(Su)&&(Su=null),bu!==null&&qn(bu)&&(bu=null),ge.forEach(oo),Se.forEach(oo)}function Bn(l,t){l.blockedOn===t&&(l.blockedOn=null,ai||(ai=!0,_.unstable_scheduleCallback(_.unstable_NormalPriority,$v)))}var Yn=null;function yo(l){Yn!==l&&(Yn=l,_.unstable_scheduleCallback(_.unstable_NormalPriority,function(){Yn===l&&(Yn=null);for(var t=0;t<l.length;t+=3){var u=l[t],a=l[t+1],e=l[t+2];if(typeof a!="function"){if(ui(a||u)===null)continue;break}var n=Lu(u);n!==null&&(l.splice(t,3),t-=3,tc(n,{pending:!0,data:e,method:u.method,action:a},a,e))}}))}function Oa(l){function t(i){return Bn(i,l)}gu!==null&&Bn(gu,l),Su!==null&&Bn(Su,l),bu!==null&&Bn(bu,l),ge.forEach(t),Se.forEach(t);for(var u=0;u<ru.length;u++){var a=ru[u];a.blockedOn===l&&(a.blockedOn=null)}for(;0<ru.length&&(u=ru[0],u.blockedOn===null);)so(u),u.blockedOn===null&&ru.shift();if(u=(l.ownerDocument||l).$$reactFormReplay,u!=null)for(a=0;a<u.length;a+=3){var e=u[a],n=u[a+1],f=e[Vl]||null;if(typeof n=="function")f||yo(u);else if(f){var c=null;if(n&&n.hasAttribute("formAction")){if(e=n,f=n[Vl]||null)c=f.formAction;else if(ui(e)!==null)continue}else c=f.action;typeof c=="function"?u[a+1]=c:(u.splice(a,3),a-=3),yo(u)}}}function vo(){function l(n){n.canIntercept&&n.info==="react-transition"&&n.intercept({handler:function(){return new Promise(function(f){return e=f})},focusReset:"manual",scroll:"manual"})}function t(){e!==null&&(e(),e=null),a||setTimeout(u,20)}function u(){if(!a&&!navigation.transition){var n=navigation.currentEntry;n&&n.url!=null&&navigation.navigate(n.url,{state:n.getState(),info:"react-transition",history:"replace"})}}if(typeof navigation=="object"){var a=!1,e=null;return navigation.addEventListener("navigate",l),navigation.addEventListener("navigatesuccess",t),navigation.addEventListener("navigateerror",t),setTimeout(u,100),function(){a=!0,navigation.removeEventListener("navigate",l),navigation.removeEventListener("navigatesuccess",t),navigation.removeEventListener("navigateerror",t),e!==null&&(e(),e=null)}}}function ei(l){this._internalRoot=l}xn.prototype.render=ei.prototype.render=function(l){var t=this._internalRoot;if(t===null)throw Error(y(409));var u=t.current,a=ct();ao(u,a,l,t,null,null)},xn.prototype.unmount=ei.prototype.unmount=function(){var l=this._internalRoot;if(l!==null){this._internalRoot=null;var t=l.containerInfo;ao(l.current,2,null,l,null,null),bn(),t[Zu]=null}};function xn(l){this._internalRoot=l}xn.prototype.unstable_scheduleHydration=function(l){if(l){var t=Ei();l={blockedOn:null,target:l,priority:t};for(var u=0;u<ru.length&&t!==0&&t<ru[u].priority;u++);ru.splice(u,0,l),u===0&&so(l)}};var mo=F.version;if(mo!=="19.2.4")throw Error(y(527,mo,"19.2.4"));O.findDOMNode=function(l){var t=l._reactInternals;if(t===void 0)throw typeof l.render=="function"?Error(y(188)):(l=Object.keys(l).join(","),Error(y(268,l)));return l=r(t),l=l!==null?B(l):null,l=l===null?null:l.stateNode,l};var kv={bundleType:0,version:"19.2.4",rendererPackageName:"react-dom",currentDispatcherRef:b,reconcilerVersion:"19.2.4"};if(typeof __REACT_DEVTOOLS_GLOBAL_HOOK__<"u"){var Gn=__REACT_DEVTOOLS_GLOBAL_HOOK__;if(!Gn.isDisabled&&Gn.supportsFiber)try{Ma=Gn.inject(kv),Pl=Gn}catch{}}return ze.createRoot=function(l,t){if(!R(l))throw Error(y(299));var u=!1,a="",e=zs,n=Ts,f=Es;return t!=null&&(t.unstable_strictMode===!0&&(u=!0),t.identifierPrefix!==void 0&&(a=t.identifierPrefix),t.onUncaughtError!==void 0&&(e=t.onUncaughtError),t.onCaughtError!==void 0&&(n=t.onCaughtError),t.onRecoverableError!==void 0&&(f=t.onRecoverableError)),t=to(l,1,!1,null,null,u,a,null,e,n,f,vo),l[Zu]=t.current,Gc(l),new ei(t)},ze.hydrateRoot=function(l,t,u){if(!R(l))throw Error(y(299));var a=!1,e="",n=zs,f=Ts,c=Es,i=null;return u!=null&&(u.unstable_strictMode===!0&&(a=!0),u.identifierPrefix!==void 0&&(e=u.identifierPrefix),u.onUncaughtError!==void 0&&(n=u.onUncaughtError),u.onCaughtError!==void 0&&(f=u.onCaughtError),u.onRecoverableError!==void 0&&(c=u.onRecoverableError),u.formState!==void 0&&(i=u.formState)),t=to(l,1,!0,t,u??null,a,e,i,n,f,c,vo),t.context=uo(null),u=t.current,a=ct(),a=wn(a),e=eu(a),e.callback=null,nu(u,e,a),u=a,t.current.lanes=u,Ua(t,u),Ut(t),l[Zu]=t.current,Gc(l),new xn(t)},ze.version="19.2.4",ze}var _o;function fm(){if(_o)return ci.exports;_o=1;function _(){if(!(typeof __REACT_DEVTOOLS_GLOBAL_HOOK__>"u"||typeof __REACT_DEVTOOLS_GLOBAL_HOOK__.checkDCE!="function"))try{__REACT_DEVTOOLS_GLOBAL_HOOK__.checkDCE(_)}catch(F){console.error(F)}}return _(),ci.exports=nm(),ci.exports}var cm=fm();const Do=po(cm);function im({onBookAdded:_}){const[F,x]=Yl.useState(!1),[y,R]=Yl.useState(""),[X,ll]=Yl.useState(""),ol=async r=>{r.preventDefault();const B=await fetch("/books/add/",{method:"POST",headers:{"Content-Type":"application/json","X-CSRFToken":A()},body:JSON.stringify({title:y,author:X})});if(B.ok){const M=await B.json();_(M),R(""),ll(""),x(!1)}else alert("Error adding book")};function A(){return document.cookie.split("; ").find(r=>r.startsWith("csrftoken="))?.split("=")[1]}return D.jsxs(D.Fragment,{children:[D.jsx("button",{onClick:()=>x(!0),children:"+ Add Book"}),F&&D.jsx("div",{style:sm,children:D.jsxs("div",{style:dm,children:[D.jsx("h2",{children:"Add Book"}),D.jsxs("form",{onSubmit:ol,children:[D.jsx("input",{type:"text",placeholder:"Title",value:y,onChange:r=>R(r.target.value),required:!0}),D.jsx("br",{}),D.jsx("br",{}),D.jsx("input",{type:"text",placeholder:"Author",value:X,onChange:r=>ll(r.target.value),required:!0}),D.jsx("br",{}),D.jsx("br",{}),D.jsx("button",{type:"submit",children:"Save"}),D.jsx("button",{type:"button",onClick:()=>x(!1),children:"Cancel"})]})]})})]})}const sm={position:"fixed",top:0,left:0,width:"100%",height:"100%",backgroundColor:"rgba(0,0,0,0.4)",display:"flex",justifyContent:"center",alignItems:"center",zIndex:9999},dm={background:"white",padding:"20px",borderRadius:"8px",minWidth:"300px"};function om(){const[_,F]=Yl.useState([]);Yl.useEffect(()=>{fetch("/books/api/books/").then(y=>y.json()).then(y=>F(y)).catch(y=>console.error("Error fetching books:",y))},[]);const x=y=>{F(R=>[...R,y])};return D.jsx("div",{style:{marginBottom:"20px"},children:D.jsx(im,{onBookAdded:x})})}function ym({bookId:_,onNoteAdded:F}){const[x,y]=Yl.useState(!1),[R,X]=Yl.useState(""),[ll,ol]=Yl.useState(""),[A,r]=Yl.useState(""),B=async G=>{G.preventDefault();const Sl=await fetch(`/books/api/books/${_}/notes/add/`,{method:"POST",headers:{"Content-Type":"application/json","X-CSRFToken":M()},body:JSON.stringify({content:R,page_number:ll,chapter:A})});if(Sl.ok){const hl=await Sl.json();F(hl),X(""),ol(""),r(""),y(!1)}else alert("Error adding note")};function M(){const G="csrftoken=",hl=decodeURIComponent(document.cookie).split(";");for(let gl=0;gl<hl.length;gl++){let kl=hl[gl].trim();if(kl.indexOf(G)===0)return kl.substring(G.length,kl.length)}return""}return D.jsxs(D.Fragment,{children:[D.jsx("button",{onClick:()=>y(!0),children:"+ Add Note"}),x&&D.jsx("div",{style:vm,children:D.jsxs("div",{style:mm,children:[D.jsx("h2",{children:"Add Note"}),D.jsxs("form",{onSubmit:B,children:[D.jsx("textarea",{placeholder:"Write your note...",value:R,onChange:G=>X(G.target.value),required:!0}),D.jsx("br",{}),D.jsx("br",{}),D.jsx("input",{type:"number",placeholder:"Page (optional)",value:ll,onChange:G=>ol(G.target.value)}),D.jsx("br",{}),D.jsx("br",{}),D.jsx("input",{type:"text",placeholder:"Chapter (optional)",value:A,onChange:G=>r(G.target.value)}),D.jsx("br",{}),D.jsx("br",{}),D.jsx("button",{type:"submit",children:"Save"}),D.jsx("button",{type:"button",onClick:()=>y(!1),children:"Cancel"})]})]})})]})}const vm={position:"fixed",top:0,left:0,width:"100%",height:"100%",backgroundColor:"rgba(0,0,0,0.4)",display:"flex",justifyContent:"center",alignItems:"center"},mm={background:"white",padding:"20px",borderRadius:"8px",minWidth:"300px"};function hm({note:_,onClose:F,onUpdated:x}){const[y,R]=Yl.useState(_.content),[X,ll]=Yl.useState(_.page_number||""),[ol,A]=Yl.useState(_.chapter||""),r=async M=>{M.preventDefault();const G=await fetch(`/books/api/notes/${_.id}/edit/`,{method:"POST",headers:{"Content-Type":"application/json","X-CSRFToken":B()},body:JSON.stringify({content:y,page_number:X,chapter:ol})});if(G.ok){const Sl=await G.json();x(Sl)}else alert("Error updating note")};function B(){const M="csrftoken=",Sl=decodeURIComponent(document.cookie).split(";");for(let hl=0;hl<Sl.length;hl++){let gl=Sl[hl].trim();if(gl.indexOf(M)===0)return gl.substring(M.length,gl.length)}return""}return D.jsx("div",{style:gm,children:D.jsxs("div",{style:Sm,children:[D.jsx("h2",{children:"Edit Note"}),D.jsxs("form",{onSubmit:r,children:[D.jsx("textarea",{value:y,onChange:M=>R(M.target.value),required:!0}),D.jsx("br",{}),D.jsx("br",{}),D.jsx("input",{type:"number",value:X,onChange:M=>ll(M.target.value),placeholder:"Page"}),D.jsx("br",{}),D.jsx("br",{}),D.jsx("input",{type:"text",value:ol,onChange:M=>A(M.target.value),placeholder:"Chapter"}),D.jsx("br",{}),D.jsx("br",{}),D.jsx("button",{type:"submit",children:"Save"}),D.jsx("button",{type:"button",onClick:F,children:"Cancel"})]})]})})}const gm={position:"fixed",top:0,left:0,width:"100%",height:"100%",backgroundColor:"rgba(0,0,0,0.4)",display:"flex",justifyContent:"center",alignItems:"center"},Sm={background:"white",padding:"20px",borderRadius:"8px",minWidth:"300px"};function bm({bookId:_}){const[F,x]=Yl.useState([]),[y,R]=Yl.useState(null),X=async A=>{(await fetch(`/books/api/notes/${A}/delete/`,{method:"POST",headers:{"X-CSRFToken":ll()}})).ok?x(F.filter(B=>B.id!==A)):alert("Error deleting note")};function ll(){const A="csrftoken=",B=decodeURIComponent(document.cookie).split(";");for(let M=0;M<B.length;M++){let G=B[M].trim();if(G.indexOf(A)===0)return G.substring(A.length,G.length)}return""}Yl.useEffect(()=>{fetch(`/books/api/books/${_}/notes/`).then(A=>A.json()).then(A=>x(A))},[_]);const ol=A=>{x(r=>[A,...r])};return D.jsxs("div",{children:[D.jsx(ym,{bookId:_,onNoteAdded:ol}),D.jsx("h3",{children:"Notes"}),F.map(A=>D.jsxs("div",{style:rm,children:[A.chapter&&D.jsxs("p",{children:[D.jsx("strong",{children:"Chapter:"})," ",A.chapter]}),A.page_number&&D.jsxs("p",{children:[D.jsx("strong",{children:"Page:"})," ",A.page_number]}),D.jsx("p",{children:A.content}),D.jsx("button",{onClick:()=>R(A),children:"Edit"}),D.jsx("button",{onClick:()=>X(A.id),children:"Delete"})]},A.id)),y&&D.jsx(hm,{note:y,onClose:()=>R(null),onUpdated:A=>{x(r=>r.map(B=>B.id===A.id?A:B)),R(null)}})]})}const rm={background:"black",padding:"10px",borderRadius:"8px",marginBottom:"10px"},Oo=document.getElementById("react-root");Oo&&Do.createRoot(Oo).render(D.jsx(Mo.StrictMode,{children:D.jsx(om,{})}));const oi=document.getElementById("notes-root");if(oi){const _=oi.dataset.bookId;Do.createRoot(oi).render(D.jsx(Mo.StrictMode,{children:D.jsx(bm,{bookId:_})}))}
+`).replace(zv,"")}function qd(l,t){return t=jd(t),jd(l)===t}function cl(l,t,u,a,e,n){switch(u){case"children":typeof a=="string"?t==="body"||t==="textarea"&&a===""||Wu(l,a):(typeof a=="number"||typeof a=="bigint")&&t!=="body"&&Wu(l,""+a);break;case"className":De(l,"class",a);break;case"tabIndex":De(l,"tabindex",a);break;case"dir":case"role":case"viewBox":case"width":case"height":De(l,u,a);break;case"style":qi(l,a,n);break;case"data":if(t!=="object"){De(l,"data",a);break}case"src":case"href":if(a===""&&(t!=="a"||u!=="href")){l.removeAttribute(u);break}if(a==null||typeof a=="function"||typeof a=="symbol"||typeof a=="boolean"){l.removeAttribute(u);break}a=Ne(""+a),l.setAttribute(u,a);break;case"action":case"formAction":if(typeof a=="function"){l.setAttribute(u,"javascript:throw new Error('A React form was unexpectedly submitted. If you called form.submit() manually, consider using form.requestSubmit() instead. If you\\'re trying to use event.stopPropagation() in a submit event handler, consider also calling event.preventDefault().')");break}else typeof n=="function"&&(u==="formAction"?(t!=="input"&&cl(l,t,"name",e.name,e,null),cl(l,t,"formEncType",e.formEncType,e,null),cl(l,t,"formMethod",e.formMethod,e,null),cl(l,t,"formTarget",e.formTarget,e,null)):(cl(l,t,"encType",e.encType,e,null),cl(l,t,"method",e.method,e,null),cl(l,t,"target",e.target,e,null)));if(a==null||typeof a=="symbol"||typeof a=="boolean"){l.removeAttribute(u);break}a=Ne(""+a),l.setAttribute(u,a);break;case"onClick":a!=null&&(l.onclick=Ht);break;case"onScroll":a!=null&&J("scroll",l);break;case"onScrollEnd":a!=null&&J("scrollend",l);break;case"dangerouslySetInnerHTML":if(a!=null){if(typeof a!="object"||!("__html"in a))throw Error(y(61));if(u=a.__html,u!=null){if(e.children!=null)throw Error(y(60));l.innerHTML=u}}break;case"multiple":l.multiple=a&&typeof a!="function"&&typeof a!="symbol";break;case"muted":l.muted=a&&typeof a!="function"&&typeof a!="symbol";break;case"suppressContentEditableWarning":case"suppressHydrationWarning":case"defaultValue":case"defaultChecked":case"innerHTML":case"ref":break;case"autoFocus":break;case"xlinkHref":if(a==null||typeof a=="function"||typeof a=="boolean"||typeof a=="symbol"){l.removeAttribute("xlink:href");break}u=Ne(""+a),l.setAttributeNS("http://www.w3.org/1999/xlink","xlink:href",u);break;case"contentEditable":case"spellCheck":case"draggable":case"value":case"autoReverse":case"externalResourcesRequired":case"focusable":case"preserveAlpha":a!=null&&typeof a!="function"&&typeof a!="symbol"?l.setAttribute(u,""+a):l.removeAttribute(u);break;case"inert":case"allowFullScreen":case"async":case"autoPlay":case"controls":case"default":case"defer":case"disabled":case"disablePictureInPicture":case"disableRemotePlayback":case"formNoValidate":case"hidden":case"loop":case"noModule":case"noValidate":case"open":case"playsInline":case"readOnly":case"required":case"reversed":case"scoped":case"seamless":case"itemScope":a&&typeof a!="function"&&typeof a!="symbol"?l.setAttribute(u,""):l.removeAttribute(u);break;case"capture":case"download":a===!0?l.setAttribute(u,""):a!==!1&&a!=null&&typeof a!="function"&&typeof a!="symbol"?l.setAttribute(u,a):l.removeAttribute(u);break;case"cols":case"rows":case"size":case"span":a!=null&&typeof a!="function"&&typeof a!="symbol"&&!isNaN(a)&&1<=a?l.setAttribute(u,a):l.removeAttribute(u);break;case"rowSpan":case"start":a==null||typeof a=="function"||typeof a=="symbol"||isNaN(a)?l.removeAttribute(u):l.setAttribute(u,a);break;case"popover":J("beforetoggle",l),J("toggle",l),Me(l,"popover",a);break;case"xlinkActuate":Ct(l,"http://www.w3.org/1999/xlink","xlink:actuate",a);break;case"xlinkArcrole":Ct(l,"http://www.w3.org/1999/xlink","xlink:arcrole",a);break;case"xlinkRole":Ct(l,"http://www.w3.org/1999/xlink","xlink:role",a);break;case"xlinkShow":Ct(l,"http://www.w3.org/1999/xlink","xlink:show",a);break;case"xlinkTitle":Ct(l,"http://www.w3.org/1999/xlink","xlink:title",a);break;case"xlinkType":Ct(l,"http://www.w3.org/1999/xlink","xlink:type",a);break;case"xmlBase":Ct(l,"http://www.w3.org/XML/1998/namespace","xml:base",a);break;case"xmlLang":Ct(l,"http://www.w3.org/XML/1998/namespace","xml:lang",a);break;case"xmlSpace":Ct(l,"http://www.w3.org/XML/1998/namespace","xml:space",a);break;case"is":Me(l,"is",a);break;case"innerText":case"textContent":break;default:(!(2<u.length)||u[0]!=="o"&&u[0]!=="O"||u[1]!=="n"&&u[1]!=="N")&&(u=Wo.get(u)||u,Me(l,u,a))}}function Qc(l,t,u,a,e,n){switch(u){case"style":qi(l,a,n);break;case"dangerouslySetInnerHTML":if(a!=null){if(typeof a!="object"||!("__html"in a))throw Error(y(61));if(u=a.__html,u!=null){if(e.children!=null)throw Error(y(60));l.innerHTML=u}}break;case"children":typeof a=="string"?Wu(l,a):(typeof a=="number"||typeof a=="bigint")&&Wu(l,""+a);break;case"onScroll":a!=null&&J("scroll",l);break;case"onScrollEnd":a!=null&&J("scrollend",l);break;case"onClick":a!=null&&(l.onclick=Ht);break;case"suppressContentEditableWarning":case"suppressHydrationWarning":case"innerHTML":case"ref":break;case"innerText":case"textContent":break;default:if(!pi.hasOwnProperty(u))l:{if(u[0]==="o"&&u[1]==="n"&&(e=u.endsWith("Capture"),t=u.slice(2,e?u.length-7:void 0),n=l[Vl]||null,n=n!=null?n[u]:null,typeof n=="function"&&l.removeEventListener(t,n,e),typeof a=="function")){typeof n!="function"&&n!==null&&(u in l?l[u]=null:l.hasAttribute(u)&&l.removeAttribute(u)),l.addEventListener(t,a,e);break l}u in l?l[u]=a:a===!0?l.setAttribute(u,""):Me(l,u,a)}}}function jl(l,t,u){switch(t){case"div":case"span":case"svg":case"path":case"a":case"g":case"p":case"li":break;case"img":J("error",l),J("load",l);var a=!1,e=!1,n;for(n in u)if(u.hasOwnProperty(n)){var f=u[n];if(f!=null)switch(n){case"src":a=!0;break;case"srcSet":e=!0;break;case"children":case"dangerouslySetInnerHTML":throw Error(y(137,t));default:cl(l,t,n,f,u,null)}}e&&cl(l,t,"srcSet",u.srcSet,u,null),a&&cl(l,t,"src",u.src,u,null);return;case"input":J("invalid",l);var c=n=f=e=null,i=null,m=null;for(a in u)if(u.hasOwnProperty(a)){var S=u[a];if(S!=null)switch(a){case"name":e=S;break;case"type":f=S;break;case"checked":i=S;break;case"defaultChecked":m=S;break;case"value":n=S;break;case"defaultValue":c=S;break;case"children":case"dangerouslySetInnerHTML":if(S!=null)throw Error(y(137,t));break;default:cl(l,t,a,S,u,null)}}Ci(l,n,c,i,m,f,e,!1);return;case"select":J("invalid",l),a=f=n=null;for(e in u)if(u.hasOwnProperty(e)&&(c=u[e],c!=null))switch(e){case"value":n=c;break;case"defaultValue":f=c;break;case"multiple":a=c;default:cl(l,t,e,c,u,null)}t=n,u=f,l.multiple=!!a,t!=null?wu(l,!!a,t,!1):u!=null&&wu(l,!!a,u,!0);return;case"textarea":J("invalid",l),n=e=a=null;for(f in u)if(u.hasOwnProperty(f)&&(c=u[f],c!=null))switch(f){case"value":a=c;break;case"defaultValue":e=c;break;case"children":n=c;break;case"dangerouslySetInnerHTML":if(c!=null)throw Error(y(91));break;default:cl(l,t,f,c,u,null)}Ri(l,a,e,n);return;case"option":for(i in u)u.hasOwnProperty(i)&&(a=u[i],a!=null)&&(i==="selected"?l.selected=a&&typeof a!="function"&&typeof a!="symbol":cl(l,t,i,a,u,null));return;case"dialog":J("beforetoggle",l),J("toggle",l),J("cancel",l),J("close",l);break;case"iframe":case"object":J("load",l);break;case"video":case"audio":for(a=0;a<de.length;a++)J(de[a],l);break;case"image":J("error",l),J("load",l);break;case"details":J("toggle",l);break;case"embed":case"source":case"link":J("error",l),J("load",l);case"area":case"base":case"br":case"col":case"hr":case"keygen":case"meta":case"param":case"track":case"wbr":case"menuitem":for(m in u)if(u.hasOwnProperty(m)&&(a=u[m],a!=null))switch(m){case"children":case"dangerouslySetInnerHTML":throw Error(y(137,t));default:cl(l,t,m,a,u,null)}return;default:if(lf(t)){for(S in u)u.hasOwnProperty(S)&&(a=u[S],a!==void 0&&Qc(l,t,S,a,u,void 0));return}}for(c in u)u.hasOwnProperty(c)&&(a=u[c],a!=null&&cl(l,t,c,a,u,null))}function Tv(l,t,u,a){switch(t){case"div":case"span":case"svg":case"path":case"a":case"g":case"p":case"li":break;case"input":var e=null,n=null,f=null,c=null,i=null,m=null,S=null;for(g in u){var T=u[g];if(u.hasOwnProperty(g)&&T!=null)switch(g){case"checked":break;case"value":break;case"defaultValue":i=T;default:a.hasOwnProperty(g)||cl(l,t,g,null,a,T)}}for(var h in a){var g=a[h];if(T=u[h],a.hasOwnProperty(h)&&(g!=null||T!=null))switch(h){case"type":n=g;break;case"name":e=g;break;case"checked":m=g;break;case"defaultChecked":S=g;break;case"value":f=g;break;case"defaultValue":c=g;break;case"children":case"dangerouslySetInnerHTML":if(g!=null)throw Error(y(137,t));break;default:g!==T&&cl(l,t,h,g,a,T)}}In(l,f,c,i,m,S,n,e);return;case"select":g=f=c=h=null;for(n in u)if(i=u[n],u.hasOwnProperty(n)&&i!=null)switch(n){case"value":break;case"multiple":g=i;default:a.hasOwnProperty(n)||cl(l,t,n,null,a,i)}for(e in a)if(n=a[e],i=u[e],a.hasOwnProperty(e)&&(n!=null||i!=null))switch(e){case"value":h=n;break;case"defaultValue":c=n;break;case"multiple":f=n;default:n!==i&&cl(l,t,e,n,a,i)}t=c,u=f,a=g,h!=null?wu(l,!!u,h,!1):!!a!=!!u&&(t!=null?wu(l,!!u,t,!0):wu(l,!!u,u?[]:"",!1));return;case"textarea":g=h=null;for(c in u)if(e=u[c],u.hasOwnProperty(c)&&e!=null&&!a.hasOwnProperty(c))switch(c){case"value":break;case"children":break;default:cl(l,t,c,null,a,e)}for(f in a)if(e=a[f],n=u[f],a.hasOwnProperty(f)&&(e!=null||n!=null))switch(f){case"value":h=e;break;case"defaultValue":g=e;break;case"children":break;case"dangerouslySetInnerHTML":if(e!=null)throw Error(y(91));break;default:e!==n&&cl(l,t,f,e,a,n)}Hi(l,h,g);return;case"option":for(var U in u)h=u[U],u.hasOwnProperty(U)&&h!=null&&!a.hasOwnProperty(U)&&(U==="selected"?l.selected=!1:cl(l,t,U,null,a,h));for(i in a)h=a[i],g=u[i],a.hasOwnProperty(i)&&h!==g&&(h!=null||g!=null)&&(i==="selected"?l.selected=h&&typeof h!="function"&&typeof h!="symbol":cl(l,t,i,h,a,g));return;case"img":case"link":case"area":case"base":case"br":case"col":case"embed":case"hr":case"keygen":case"meta":case"param":case"source":case"track":case"wbr":case"menuitem":for(var j in u)h=u[j],u.hasOwnProperty(j)&&h!=null&&!a.hasOwnProperty(j)&&cl(l,t,j,null,a,h);for(m in a)if(h=a[m],g=u[m],a.hasOwnProperty(m)&&h!==g&&(h!=null||g!=null))switch(m){case"children":case"dangerouslySetInnerHTML":if(h!=null)throw Error(y(137,t));break;default:cl(l,t,m,h,a,g)}return;default:if(lf(t)){for(var il in u)h=u[il],u.hasOwnProperty(il)&&h!==void 0&&!a.hasOwnProperty(il)&&Qc(l,t,il,void 0,a,h);for(S in a)h=a[S],g=u[S],!a.hasOwnProperty(S)||h===g||h===void 0&&g===void 0||Qc(l,t,S,h,a,g);return}}for(var o in u)h=u[o],u.hasOwnProperty(o)&&h!=null&&!a.hasOwnProperty(o)&&cl(l,t,o,null,a,h);for(T in a)h=a[T],g=u[T],!a.hasOwnProperty(T)||h===g||h==null&&g==null||cl(l,t,T,h,a,g)}function Bd(l){switch(l){case"css":case"script":case"font":case"img":case"image":case"input":case"link":return!0;default:return!1}}function Ev(){if(typeof performance.getEntriesByType=="function"){for(var l=0,t=0,u=performance.getEntriesByType("resource"),a=0;a<u.length;a++){var e=u[a],n=e.transferSize,f=e.initiatorType,c=e.duration;if(n&&c&&Bd(f)){for(f=0,c=e.responseEnd,a+=1;a<u.length;a++){var i=u[a],m=i.startTime;if(m>c)break;var S=i.transferSize,T=i.initiatorType;S&&Bd(T)&&(i=i.responseEnd,f+=S*(i<c?1:(c-m)/(i-m)))}if(--a,t+=8*(n+f)/(e.duration/1e3),l++,10<l)break}}if(0<l)return t/l/1e6}return navigator.connection&&(l=navigator.connection.downlink,typeof l=="number")?l:5}var Zc=null,Vc=null;function pn(l){return l.nodeType===9?l:l.ownerDocument}function Yd(l){switch(l){case"http://www.w3.org/2000/svg":return 1;case"http://www.w3.org/1998/Math/MathML":return 2;default:return 0}}function xd(l,t){if(l===0)switch(t){case"svg":return 1;case"math":return 2;default:return 0}return l===1&&t==="foreignObject"?0:l}function Lc(l,t){return l==="textarea"||l==="noscript"||typeof t.children=="string"||typeof t.children=="number"||typeof t.children=="bigint"||typeof t.dangerouslySetInnerHTML=="object"&&t.dangerouslySetInnerHTML!==null&&t.dangerouslySetInnerHTML.__html!=null}var Kc=null;function Av(){var l=window.event;return l&&l.type==="popstate"?l===Kc?!1:(Kc=l,!0):(Kc=null,!1)}var Gd=typeof setTimeout=="function"?setTimeout:void 0,_v=typeof clearTimeout=="function"?clearTimeout:void 0,Xd=typeof Promise=="function"?Promise:void 0,Ov=typeof queueMicrotask=="function"?queueMicrotask:typeof Xd<"u"?function(l){return Xd.resolve(null).then(l).catch(pv)}:Gd;function pv(l){setTimeout(function(){throw l})}function hu(l){return l==="head"}function Qd(l,t){var u=t,a=0;do{var e=u.nextSibling;if(l.removeChild(u),e&&e.nodeType===8)if(u=e.data,u==="/$"||u==="/&"){if(a===0){l.removeChild(e),Oa(t);return}a--}else if(u==="$"||u==="$?"||u==="$~"||u==="$!"||u==="&")a++;else if(u==="html")ye(l.ownerDocument.documentElement);else if(u==="head"){u=l.ownerDocument.head,ye(u);for(var n=u.firstChild;n;){var f=n.nextSibling,c=n.nodeName;n[Na]||c==="SCRIPT"||c==="STYLE"||c==="LINK"&&n.rel.toLowerCase()==="stylesheet"||u.removeChild(n),n=f}}else u==="body"&&ye(l.ownerDocument.body);u=e}while(u);Oa(t)}function Zd(l,t){var u=l;l=0;do{var a=u.nextSibling;if(u.nodeType===1?t?(u._stashedDisplay=u.style.display,u.style.display="none"):(u.style.display=u._stashedDisplay||"",u.getAttribute("style")===""&&u.removeAttribute("style")):u.nodeType===3&&(t?(u._stashedText=u.nodeValue,u.nodeValue=""):u.nodeValue=u._stashedText||""),a&&a.nodeType===8)if(u=a.data,u==="/$"){if(l===0)break;l--}else u!=="$"&&u!=="$?"&&u!=="$~"&&u!=="$!"||l++;u=a}while(u)}function Jc(l){var t=l.firstChild;for(t&&t.nodeType===10&&(t=t.nextSibling);t;){var u=t;switch(t=t.nextSibling,u.nodeName){case"HTML":case"HEAD":case"BODY":Jc(u),kn(u);continue;case"SCRIPT":case"STYLE":continue;case"LINK":if(u.rel.toLowerCase()==="stylesheet")continue}l.removeChild(u)}}function Mv(l,t,u,a){for(;l.nodeType===1;){var e=u;if(l.nodeName.toLowerCase()!==t.toLowerCase()){if(!a&&(l.nodeName!=="INPUT"||l.type!=="hidden"))break}else if(a){if(!l[Na])switch(t){case"meta":if(!l.hasAttribute("itemprop"))break;return l;case"link":if(n=l.getAttribute("rel"),n==="stylesheet"&&l.hasAttribute("data-precedence"))break;if(n!==e.rel||l.getAttribute("href")!==(e.href==null||e.href===""?null:e.href)||l.getAttribute("crossorigin")!==(e.crossOrigin==null?null:e.crossOrigin)||l.getAttribute("title")!==(e.title==null?null:e.title))break;return l;case"style":if(l.hasAttribute("data-precedence"))break;return l;case"script":if(n=l.getAttribute("src"),(n!==(e.src==null?null:e.src)||l.getAttribute("type")!==(e.type==null?null:e.type)||l.getAttribute("crossorigin")!==(e.crossOrigin==null?null:e.crossOrigin))&&n&&l.hasAttribute("async")&&!l.hasAttribute("itemprop"))break;return l;default:return l}}else if(t==="input"&&l.type==="hidden"){var n=e.name==null?null:""+e.name;if(e.type==="hidden"&&l.getAttribute("name")===n)return l}else return l;if(l=St(l.nextSibling),l===null)break}return null}function Dv(l,t,u){if(t==="")return null;for(;l.nodeType!==3;)if((l.nodeType!==1||l.nodeName!=="INPUT"||l.type!=="hidden")&&!u||(l=St(l.nextSibling),l===null))return null;return l}function Vd(l,t){for(;l.nodeType!==8;)if((l.nodeType!==1||l.nodeName!=="INPUT"||l.type!=="hidden")&&!t||(l=St(l.nextSibling),l===null))return null;return l}function wc(l){return l.data==="$?"||l.data==="$~"}function Wc(l){return l.data==="$!"||l.data==="$?"&&l.ownerDocument.readyState!=="loading"}function Uv(l,t){var u=l.ownerDocument;if(l.data==="$~")l._reactRetry=t;else if(l.data!=="$?"||u.readyState!=="loading")t();else{var a=function(){t(),u.removeEventListener("DOMContentLoaded",a)};u.addEventListener("DOMContentLoaded",a),l._reactRetry=a}}function St(l){for(;l!=null;l=l.nextSibling){var t=l.nodeType;if(t===1||t===3)break;if(t===8){if(t=l.data,t==="$"||t==="$!"||t==="$?"||t==="$~"||t==="&"||t==="F!"||t==="F")break;if(t==="/$"||t==="/&")return null}}return l}var $c=null;function Ld(l){l=l.nextSibling;for(var t=0;l;){if(l.nodeType===8){var u=l.data;if(u==="/$"||u==="/&"){if(t===0)return St(l.nextSibling);t--}else u!=="$"&&u!=="$!"&&u!=="$?"&&u!=="$~"&&u!=="&"||t++}l=l.nextSibling}return null}function Kd(l){l=l.previousSibling;for(var t=0;l;){if(l.nodeType===8){var u=l.data;if(u==="$"||u==="$!"||u==="$?"||u==="$~"||u==="&"){if(t===0)return l;t--}else u!=="/$"&&u!=="/&"||t++}l=l.previousSibling}return null}function Jd(l,t,u){switch(t=pn(u),l){case"html":if(l=t.documentElement,!l)throw Error(y(452));return l;case"head":if(l=t.head,!l)throw Error(y(453));return l;case"body":if(l=t.body,!l)throw Error(y(454));return l;default:throw Error(y(451))}}function ye(l){for(var t=l.attributes;t.length;)l.removeAttributeNode(t[0]);kn(l)}var bt=new Map,wd=new Set;function Mn(l){return typeof l.getRootNode=="function"?l.getRootNode():l.nodeType===9?l:l.ownerDocument}var Wt=O.d;O.d={f:Nv,r:Cv,D:Hv,C:Rv,L:jv,m:qv,X:Yv,S:Bv,M:xv};function Nv(){var l=Wt.f(),t=bn();return l||t}function Cv(l){var t=Lu(l);t!==null&&t.tag===5&&t.type==="form"?ds(t):Wt.r(l)}var Ea=typeof document>"u"?null:document;function Wd(l,t,u){var a=Ea;if(a&&typeof t=="string"&&t){var e=dt(t);e='link[rel="'+l+'"][href="'+e+'"]',typeof u=="string"&&(e+='[crossorigin="'+u+'"]'),wd.has(e)||(wd.add(e),l={rel:l,crossOrigin:u,href:t},a.querySelector(e)===null&&(t=a.createElement("link"),jl(t,"link",l),Dl(t),a.head.appendChild(t)))}}function Hv(l){Wt.D(l),Wd("dns-prefetch",l,null)}function Rv(l,t){Wt.C(l,t),Wd("preconnect",l,t)}function jv(l,t,u){Wt.L(l,t,u);var a=Ea;if(a&&l&&t){var e='link[rel="preload"][as="'+dt(t)+'"]';t==="image"&&u&&u.imageSrcSet?(e+='[imagesrcset="'+dt(u.imageSrcSet)+'"]',typeof u.imageSizes=="string"&&(e+='[imagesizes="'+dt(u.imageSizes)+'"]')):e+='[href="'+dt(l)+'"]';var n=e;switch(t){case"style":n=Aa(l);break;case"script":n=_a(l)}bt.has(n)||(l=M({rel:"preload",href:t==="image"&&u&&u.imageSrcSet?void 0:l,as:t},u),bt.set(n,l),a.querySelector(e)!==null||t==="style"&&a.querySelector(ve(n))||t==="script"&&a.querySelector(me(n))||(t=a.createElement("link"),jl(t,"link",l),Dl(t),a.head.appendChild(t)))}}function qv(l,t){Wt.m(l,t);var u=Ea;if(u&&l){var a=t&&typeof t.as=="string"?t.as:"script",e='link[rel="modulepreload"][as="'+dt(a)+'"][href="'+dt(l)+'"]',n=e;switch(a){case"audioworklet":case"paintworklet":case"serviceworker":case"sharedworker":case"worker":case"script":n=_a(l)}if(!bt.has(n)&&(l=M({rel:"modulepreload",href:l},t),bt.set(n,l),u.querySelector(e)===null)){switch(a){case"audioworklet":case"paintworklet":case"serviceworker":case"sharedworker":case"worker":case"script":if(u.querySelector(me(n)))return}a=u.createElement("link"),jl(a,"link",l),Dl(a),u.head.appendChild(a)}}}function Bv(l,t,u){Wt.S(l,t,u);var a=Ea;if(a&&l){var e=Ku(a).hoistableStyles,n=Aa(l);t=t||"default";var f=e.get(n);if(!f){var c={loading:0,preload:null};if(f=a.querySelector(ve(n)))c.loading=5;else{l=M({rel:"stylesheet",href:l,"data-precedence":t},u),(u=bt.get(n))&&kc(l,u);var i=f=a.createElement("link");Dl(i),jl(i,"link",l),i._p=new Promise(function(m,S){i.onload=m,i.onerror=S}),i.addEventListener("load",function(){c.loading|=1}),i.addEventListener("error",function(){c.loading|=2}),c.loading|=4,Dn(f,t,a)}f={type:"stylesheet",instance:f,count:1,state:c},e.set(n,f)}}}function Yv(l,t){Wt.X(l,t);var u=Ea;if(u&&l){var a=Ku(u).hoistableScripts,e=_a(l),n=a.get(e);n||(n=u.querySelector(me(e)),n||(l=M({src:l,async:!0},t),(t=bt.get(e))&&Fc(l,t),n=u.createElement("script"),Dl(n),jl(n,"link",l),u.head.appendChild(n)),n={type:"script",instance:n,count:1,state:null},a.set(e,n))}}function xv(l,t){Wt.M(l,t);var u=Ea;if(u&&l){var a=Ku(u).hoistableScripts,e=_a(l),n=a.get(e);n||(n=u.querySelector(me(e)),n||(l=M({src:l,async:!0,type:"module"},t),(t=bt.get(e))&&Fc(l,t),n=u.createElement("script"),Dl(n),jl(n,"link",l),u.head.appendChild(n)),n={type:"script",instance:n,count:1,state:null},a.set(e,n))}}function $d(l,t,u,a){var e=(e=L.current)?Mn(e):null;if(!e)throw Error(y(446));switch(l){case"meta":case"title":return null;case"style":return typeof u.precedence=="string"&&typeof u.href=="string"?(t=Aa(u.href),u=Ku(e).hoistableStyles,a=u.get(t),a||(a={type:"style",instance:null,count:0,state:null},u.set(t,a)),a):{type:"void",instance:null,count:0,state:null};case"link":if(u.rel==="stylesheet"&&typeof u.href=="string"&&typeof u.precedence=="string"){l=Aa(u.href);var n=Ku(e).hoistableStyles,f=n.get(l);if(f||(e=e.ownerDocument||e,f={type:"stylesheet",instance:null,count:0,state:{loading:0,preload:null}},n.set(l,f),(n=e.querySelector(ve(l)))&&!n._p&&(f.instance=n,f.state.loading=5),bt.has(l)||(u={rel:"preload",as:"style",href:u.href,crossOrigin:u.crossOrigin,integrity:u.integrity,media:u.media,hrefLang:u.hrefLang,referrerPolicy:u.referrerPolicy},bt.set(l,u),n||Gv(e,l,u,f.state))),t&&a===null)throw Error(y(528,""));return f}if(t&&a!==null)throw Error(y(529,""));return null;case"script":return t=u.async,u=u.src,typeof u=="string"&&t&&typeof t!="function"&&typeof t!="symbol"?(t=_a(u),u=Ku(e).hoistableScripts,a=u.get(t),a||(a={type:"script",instance:null,count:0,state:null},u.set(t,a)),a):{type:"void",instance:null,count:0,state:null};default:throw Error(y(444,l))}}function Aa(l){return'href="'+dt(l)+'"'}function ve(l){return'link[rel="stylesheet"]['+l+"]"}function kd(l){return M({},l,{"data-precedence":l.precedence,precedence:null})}function Gv(l,t,u,a){l.querySelector('link[rel="preload"][as="style"]['+t+"]")?a.loading=1:(t=l.createElement("link"),a.preload=t,t.addEventListener("load",function(){return a.loading|=1}),t.addEventListener("error",function(){return a.loading|=2}),jl(t,"link",u),Dl(t),l.head.appendChild(t))}function _a(l){return'[src="'+dt(l)+'"]'}function me(l){return"script[async]"+l}function Fd(l,t,u){if(t.count++,t.instance===null)switch(t.type){case"style":var a=l.querySelector('style[data-href~="'+dt(u.href)+'"]');if(a)return t.instance=a,Dl(a),a;var e=M({},u,{"data-href":u.href,"data-precedence":u.precedence,href:null,precedence:null});return a=(l.ownerDocument||l).createElement("style"),Dl(a),jl(a,"style",e),Dn(a,u.precedence,l),t.instance=a;case"stylesheet":e=Aa(u.href);var n=l.querySelector(ve(e));if(n)return t.state.loading|=4,t.instance=n,Dl(n),n;a=kd(u),(e=bt.get(e))&&kc(a,e),n=(l.ownerDocument||l).createElement("link"),Dl(n);var f=n;return f._p=new Promise(function(c,i){f.onload=c,f.onerror=i}),jl(n,"link",a),t.state.loading|=4,Dn(n,u.precedence,l),t.instance=n;case"script":return n=_a(u.src),(e=l.querySelector(me(n)))?(t.instance=e,Dl(e),e):(a=u,(e=bt.get(n))&&(a=M({},u),Fc(a,e)),l=l.ownerDocument||l,e=l.createElement("script"),Dl(e),jl(e,"link",a),l.head.appendChild(e),t.instance=e);case"void":return null;default:throw Error(y(443,t.type))}else t.type==="stylesheet"&&(t.state.loading&4)===0&&(a=t.instance,t.state.loading|=4,Dn(a,u.precedence,l));return t.instance}function Dn(l,t,u){for(var a=u.querySelectorAll('link[rel="stylesheet"][data-precedence],style[data-precedence]'),e=a.length?a[a.length-1]:null,n=e,f=0;f<a.length;f++){var c=a[f];if(c.dataset.precedence===t)n=c;else if(n!==e)break}n?n.parentNode.insertBefore(l,n.nextSibling):(t=u.nodeType===9?u.head:u,t.insertBefore(l,t.firstChild))}function kc(l,t){l.crossOrigin==null&&(l.crossOrigin=t.crossOrigin),l.referrerPolicy==null&&(l.referrerPolicy=t.referrerPolicy),l.title==null&&(l.title=t.title)}function Fc(l,t){l.crossOrigin==null&&(l.crossOrigin=t.crossOrigin),l.referrerPolicy==null&&(l.referrerPolicy=t.referrerPolicy),l.integrity==null&&(l.integrity=t.integrity)}var Un=null;function Id(l,t,u){if(Un===null){var a=new Map,e=Un=new Map;e.set(u,a)}else e=Un,a=e.get(u),a||(a=new Map,e.set(u,a));if(a.has(l))return a;for(a.set(l,null),u=u.getElementsByTagName(l),e=0;e<u.length;e++){var n=u[e];if(!(n[Na]||n[Nl]||l==="link"&&n.getAttribute("rel")==="stylesheet")&&n.namespaceURI!=="http://www.w3.org/2000/svg"){var f=n.getAttribute(t)||"";f=l+f;var c=a.get(f);c?c.push(n):a.set(f,[n])}}return a}function Pd(l,t,u){l=l.ownerDocument||l,l.head.insertBefore(u,t==="title"?l.querySelector("head > title"):null)}function Xv(l,t,u){if(u===1||t.itemProp!=null)return!1;switch(l){case"meta":case"title":return!0;case"style":if(typeof t.precedence!="string"||typeof t.href!="string"||t.href==="")break;return!0;case"link":if(typeof t.rel!="string"||typeof t.href!="string"||t.href===""||t.onLoad||t.onError)break;return t.rel==="stylesheet"?(l=t.disabled,typeof t.precedence=="string"&&l==null):!0;case"script":if(t.async&&typeof t.async!="function"&&typeof t.async!="symbol"&&!t.onLoad&&!t.onError&&t.src&&typeof t.src=="string")return!0}return!1}function lo(l){return!(l.type==="stylesheet"&&(l.state.loading&3)===0)}function Qv(l,t,u,a){if(u.type==="stylesheet"&&(typeof a.media!="string"||matchMedia(a.media).matches!==!1)&&(u.state.loading&4)===0){if(u.instance===null){var e=Aa(a.href),n=t.querySelector(ve(e));if(n){t=n._p,t!==null&&typeof t=="object"&&typeof t.then=="function"&&(l.count++,l=Nn.bind(l),t.then(l,l)),u.state.loading|=4,u.instance=n,Dl(n);return}n=t.ownerDocument||t,a=kd(a),(e=bt.get(e))&&kc(a,e),n=n.createElement("link"),Dl(n);var f=n;f._p=new Promise(function(c,i){f.onload=c,f.onerror=i}),jl(n,"link",a),u.instance=n}l.stylesheets===null&&(l.stylesheets=new Map),l.stylesheets.set(u,t),(t=u.state.preload)&&(u.state.loading&3)===0&&(l.count++,u=Nn.bind(l),t.addEventListener("load",u),t.addEventListener("error",u))}}var Ic=0;function Zv(l,t){return l.stylesheets&&l.count===0&&Hn(l,l.stylesheets),0<l.count||0<l.imgCount?function(u){var a=setTimeout(function(){if(l.stylesheets&&Hn(l,l.stylesheets),l.unsuspend){var n=l.unsuspend;l.unsuspend=null,n()}},6e4+t);0<l.imgBytes&&Ic===0&&(Ic=62500*Ev());var e=setTimeout(function(){if(l.waitingForImages=!1,l.count===0&&(l.stylesheets&&Hn(l,l.stylesheets),l.unsuspend)){var n=l.unsuspend;l.unsuspend=null,n()}},(l.imgBytes>Ic?50:800)+t);return l.unsuspend=u,function(){l.unsuspend=null,clearTimeout(a),clearTimeout(e)}}:null}function Nn(){if(this.count--,this.count===0&&(this.imgCount===0||!this.waitingForImages)){if(this.stylesheets)Hn(this,this.stylesheets);else if(this.unsuspend){var l=this.unsuspend;this.unsuspend=null,l()}}}var Cn=null;function Hn(l,t){l.stylesheets=null,l.unsuspend!==null&&(l.count++,Cn=new Map,t.forEach(Vv,l),Cn=null,Nn.call(l))}function Vv(l,t){if(!(t.state.loading&4)){var u=Cn.get(l);if(u)var a=u.get(null);else{u=new Map,Cn.set(l,u);for(var e=l.querySelectorAll("link[data-precedence],style[data-precedence]"),n=0;n<e.length;n++){var f=e[n];(f.nodeName==="LINK"||f.getAttribute("media")!=="not all")&&(u.set(f.dataset.precedence,f),a=f)}a&&u.set(null,a)}e=t.instance,f=e.getAttribute("data-precedence"),n=u.get(f)||a,n===a&&u.set(null,e),u.set(f,e),this.count++,a=Nn.bind(this),e.addEventListener("load",a),e.addEventListener("error",a),n?n.parentNode.insertBefore(e,n.nextSibling):(l=l.nodeType===9?l.head:l,l.insertBefore(e,l.firstChild)),t.state.loading|=4}}var he={$$typeof:ql,Provider:null,Consumer:null,_currentValue:q,_currentValue2:q,_threadCount:0};function Lv(l,t,u,a,e,n,f,c,i){this.tag=1,this.containerInfo=l,this.pingCache=this.current=this.pendingChildren=null,this.timeoutHandle=-1,this.callbackNode=this.next=this.pendingContext=this.context=this.cancelPendingCommit=null,this.callbackPriority=0,this.expirationTimes=Jn(-1),this.entangledLanes=this.shellSuspendCounter=this.errorRecoveryDisabledLanes=this.expiredLanes=this.warmLanes=this.pingedLanes=this.suspendedLanes=this.pendingLanes=0,this.entanglements=Jn(0),this.hiddenUpdates=Jn(null),this.identifierPrefix=a,this.onUncaughtError=e,this.onCaughtError=n,this.onRecoverableError=f,this.pooledCache=null,this.pooledCacheLanes=0,this.formState=i,this.incompleteTransitions=new Map}function to(l,t,u,a,e,n,f,c,i,m,S,T){return l=new Lv(l,t,u,f,i,m,S,T,c),t=1,n===!0&&(t|=24),n=ut(3,null,null,t),l.current=n,n.stateNode=l,t=Cf(),t.refCount++,l.pooledCache=t,t.refCount++,n.memoizedState={element:a,isDehydrated:u,cache:t},qf(n),l}function uo(l){return l?(l=ta,l):ta}function ao(l,t,u,a,e,n){e=uo(e),a.context===null?a.context=e:a.pendingContext=e,a=eu(t),a.payload={element:u},n=n===void 0?null:n,n!==null&&(a.callback=n),u=nu(l,a,t),u!==null&&($l(u,l,t),wa(u,l,t))}function eo(l,t){if(l=l.memoizedState,l!==null&&l.dehydrated!==null){var u=l.retryLane;l.retryLane=u!==0&&u<t?u:t}}function Pc(l,t){eo(l,t),(l=l.alternate)&&eo(l,t)}function no(l){if(l.tag===13||l.tag===31){var t=Du(l,67108864);t!==null&&$l(t,l,67108864),Pc(l,67108864)}}function fo(l){if(l.tag===13||l.tag===31){var t=ct();t=wn(t);var u=Du(l,t);u!==null&&$l(u,l,t),Pc(l,t)}}var Rn=!0;function Kv(l,t,u,a){var e=b.T;b.T=null;var n=O.p;try{O.p=2,li(l,t,u,a)}finally{O.p=n,b.T=e}}function Jv(l,t,u,a){var e=b.T;b.T=null;var n=O.p;try{O.p=8,li(l,t,u,a)}finally{O.p=n,b.T=e}}function li(l,t,u,a){if(Rn){var e=ti(a);if(e===null)Xc(l,t,a,jn,u),io(l,a);else if(Wv(e,l,t,u,a))a.stopPropagation();else if(io(l,a),t&4&&-1<wv.indexOf(l)){for(;e!==null;){var n=Lu(e);if(n!==null)switch(n.tag){case 3:if(n=n.stateNode,n.current.memoizedState.isDehydrated){var f=Au(n.pendingLanes);if(f!==0){var c=n;for(c.pendingLanes|=2,c.entangledLanes|=2;f;){var i=1<<31-lt(f);c.entanglements[1]|=i,f&=~i}Ut(n),(tl&6)===0&&(gn=Il()+500,se(0))}}break;case 31:case 13:c=Du(n,2),c!==null&&$l(c,n,2),bn(),Pc(n,2)}if(n=ti(a),n===null&&Xc(l,t,a,jn,u),n===e)break;e=n}e!==null&&a.stopPropagation()}else Xc(l,t,a,null,u)}}function ti(l){return l=uf(l),ui(l)}var jn=null;function ui(l){if(jn=null,l=Vu(l),l!==null){var t=X(l);if(t===null)l=null;else{var u=t.tag;if(u===13){if(l=ll(t),l!==null)return l;l=null}else if(u===31){if(l=ol(t),l!==null)return l;l=null}else if(u===3){if(t.stateNode.current.memoizedState.isDehydrated)return t.tag===3?t.stateNode.containerInfo:null;l=null}else t!==l&&(l=null)}}return jn=l,null}function co(l){switch(l){case"beforetoggle":case"cancel":case"click":case"close":case"contextmenu":case"copy":case"cut":case"auxclick":case"dblclick":case"dragend":case"dragstart":case"drop":case"focusin":case"focusout":case"input":case"invalid":case"keydown":case"keypress":case"keyup":case"mousedown":case"mouseup":case"paste":case"pause":case"play":case"pointercancel":case"pointerdown":case"pointerup":case"ratechange":case"reset":case"resize":case"seeked":case"submit":case"toggle":case"touchcancel":case"touchend":case"touchstart":case"volumechange":case"change":case"selectionchange":case"textInput":case"compositionstart":case"compositionend":case"compositionupdate":case"beforeblur":case"afterblur":case"beforeinput":case"blur":case"fullscreenchange":case"focus":case"hashchange":case"popstate":case"select":case"selectstart":return 2;case"drag":case"dragenter":case"dragexit":case"dragleave":case"dragover":case"mousemove":case"mouseout":case"mouseover":case"pointermove":case"pointerout":case"pointerover":case"scroll":case"touchmove":case"wheel":case"mouseenter":case"mouseleave":case"pointerenter":case"pointerleave":return 8;case"message":switch(Ho()){case hi:return 2;case gi:return 8;case Ee:case Ro:return 32;case Si:return 268435456;default:return 32}default:return 32}}var ai=!1,gu=null,Su=null,bu=null,ge=new Map,Se=new Map,ru=[],wv="mousedown mouseup touchcancel touchend touchstart auxclick dblclick pointercancel pointerdown pointerup dragend dragstart drop compositionend compositionstart keydown keypress keyup input textInput copy cut paste click change contextmenu reset".split(" ");function io(l,t){switch(l){case"focusin":case"focusout":gu=null;break;case"dragenter":case"dragleave":Su=null;break;case"mouseover":case"mouseout":bu=null;break;case"pointerover":case"pointerout":ge.delete(t.pointerId);break;case"gotpointercapture":case"lostpointercapture":Se.delete(t.pointerId)}}function be(l,t,u,a,e,n){return l===null||l.nativeEvent!==n?(l={blockedOn:t,domEventName:u,eventSystemFlags:a,nativeEvent:n,targetContainers:[e]},t!==null&&(t=Lu(t),t!==null&&no(t)),l):(l.eventSystemFlags|=a,t=l.targetContainers,e!==null&&t.indexOf(e)===-1&&t.push(e),l)}function Wv(l,t,u,a,e){switch(t){case"focusin":return gu=be(gu,l,t,u,a,e),!0;case"dragenter":return Su=be(Su,l,t,u,a,e),!0;case"mouseover":return bu=be(bu,l,t,u,a,e),!0;case"pointerover":var n=e.pointerId;return ge.set(n,be(ge.get(n)||null,l,t,u,a,e)),!0;case"gotpointercapture":return n=e.pointerId,Se.set(n,be(Se.get(n)||null,l,t,u,a,e)),!0}return!1}function so(l){var t=Vu(l.target);if(t!==null){var u=X(t);if(u!==null){if(t=u.tag,t===13){if(t=ll(u),t!==null){l.blockedOn=t,Ai(l.priority,function(){fo(u)});return}}else if(t===31){if(t=ol(u),t!==null){l.blockedOn=t,Ai(l.priority,function(){fo(u)});return}}else if(t===3&&u.stateNode.current.memoizedState.isDehydrated){l.blockedOn=u.tag===3?u.stateNode.containerInfo:null;return}}}l.blockedOn=null}function qn(l){if(l.blockedOn!==null)return!1;for(var t=l.targetContainers;0<t.length;){var u=ti(l.nativeEvent);if(u===null){u=l.nativeEvent;var a=new u.constructor(u.type,u);tf=a,u.target.dispatchEvent(a),tf=null}else return t=Lu(u),t!==null&&no(t),l.blockedOn=u,!1;t.shift()}return!0}function oo(l,t,u){qn(l)&&u.delete(t)}function $v(){ai=!1,gu!==null&&qn(gu)&&(gu=null),Su!==null&&qn(Su)&&(Su=null),bu!==null&&qn(bu)&&(bu=null),ge.forEach(oo),Se.forEach(oo)}function Bn(l,t){l.blockedOn===t&&(l.blockedOn=null,ai||(ai=!0,_.unstable_scheduleCallback(_.unstable_NormalPriority,$v)))}var Yn=null;function yo(l){Yn!==l&&(Yn=l,_.unstable_scheduleCallback(_.unstable_NormalPriority,function(){Yn===l&&(Yn=null);for(var t=0;t<l.length;t+=3){var u=l[t],a=l[t+1],e=l[t+2];if(typeof a!="function"){if(ui(a||u)===null)continue;break}var n=Lu(u);n!==null&&(l.splice(t,3),t-=3,tc(n,{pending:!0,data:e,method:u.method,action:a},a,e))}}))}function Oa(l){function t(i){return Bn(i,l)}gu!==null&&Bn(gu,l),Su!==null&&Bn(Su,l),bu!==null&&Bn(bu,l),ge.forEach(t),Se.forEach(t);for(var u=0;u<ru.length;u++){var a=ru[u];a.blockedOn===l&&(a.blockedOn=null)}for(;0<ru.length&&(u=ru[0],u.blockedOn===null);)so(u),u.blockedOn===null&&ru.shift();if(u=(l.ownerDocument||l).$$reactFormReplay,u!=null)for(a=0;a<u.length;a+=3){var e=u[a],n=u[a+1],f=e[Vl]||null;if(typeof n=="function")f||yo(u);else if(f){var c=null;if(n&&n.hasAttribute("formAction")){if(e=n,f=n[Vl]||null)c=f.formAction;else if(ui(e)!==null)continue}else c=f.action;typeof c=="function"?u[a+1]=c:(u.splice(a,3),a-=3),yo(u)}}}function vo(){function l(n){n.canIntercept&&n.info==="react-transition"&&n.intercept({handler:function(){return new Promise(function(f){return e=f})},focusReset:"manual",scroll:"manual"})}function t(){e!==null&&(e(),e=null),a||setTimeout(u,20)}function u(){if(!a&&!navigation.transition){var n=navigation.currentEntry;n&&n.url!=null&&navigation.navigate(n.url,{state:n.getState(),info:"react-transition",history:"replace"})}}if(typeof navigation=="object"){var a=!1,e=null;return navigation.addEventListener("navigate",l),navigation.addEventListener("navigatesuccess",t),navigation.addEventListener("navigateerror",t),setTimeout(u,100),function(){a=!0,navigation.removeEventListener("navigate",l),navigation.removeEventListener("navigatesuccess",t),navigation.removeEventListener("navigateerror",t),e!==null&&(e(),e=null)}}}function ei(l){this._internalRoot=l}xn.prototype.render=ei.prototype.render=function(l){var t=this._internalRoot;if(t===null)throw Error(y(409));var u=t.current,a=ct();ao(u,a,l,t,null,null)},xn.prototype.unmount=ei.prototype.unmount=function(){var l=this._internalRoot;if(l!==null){this._internalRoot=null;var t=l.containerInfo;ao(l.current,2,null,l,null,null),bn(),t[Zu]=null}};function xn(l){this._internalRoot=l}xn.prototype.unstable_scheduleHydration=function(l){if(l){var t=Ei();l={blockedOn:null,target:l,priority:t};for(var u=0;u<ru.length&&t!==0&&t<ru[u].priority;u++);ru.splice(u,0,l),u===0&&so(l)}};var mo=F.version;if(mo!=="19.2.4")throw Error(y(527,mo,"19.2.4"));O.findDOMNode=function(l){var t=l._reactInternals;if(t===void 0)throw typeof l.render=="function"?Error(y(188)):(l=Object.keys(l).join(","),Error(y(268,l)));return l=r(t),l=l!==null?B(l):null,l=l===null?null:l.stateNode,l};var kv={bundleType:0,version:"19.2.4",rendererPackageName:"react-dom",currentDispatcherRef:b,reconcilerVersion:"19.2.4"};if(typeof __REACT_DEVTOOLS_GLOBAL_HOOK__<"u"){var Gn=__REACT_DEVTOOLS_GLOBAL_HOOK__;if(!Gn.isDisabled&&Gn.supportsFiber)try{Ma=Gn.inject(kv),Pl=Gn}catch{}}return ze.createRoot=function(l,t){if(!R(l))throw Error(y(299));var u=!1,a="",e=zs,n=Ts,f=Es;return t!=null&&(t.unstable_strictMode===!0&&(u=!0),t.identifierPrefix!==void 0&&(a=t.identifierPrefix),t.onUncaughtError!==void 0&&(e=t.onUncaughtError),t.onCaughtError!==void 0&&(n=t.onCaughtError),t.onRecoverableError!==void 0&&(f=t.onRecoverableError)),t=to(l,1,!1,null,null,u,a,null,e,n,f,vo),l[Zu]=t.current,Gc(l),new ei(t)},ze.hydrateRoot=function(l,t,u){if(!R(l))throw Error(y(299));var a=!1,e="",n=zs,f=Ts,c=Es,i=null;return u!=null&&(u.unstable_strictMode===!0&&(a=!0),u.identifierPrefix!==void 0&&(e=u.identifierPrefix),u.onUncaughtError!==void 0&&(n=u.onUncaughtError),u.onCaughtError!==void 0&&(f=u.onCaughtError),u.onRecoverableError!==void 0&&(c=u.onRecoverableError),u.formState!==void 0&&(i=u.formState)),t=to(l,1,!0,t,u??null,a,e,i,n,f,c,vo),t.context=uo(null),u=t.current,a=ct(),a=wn(a),e=eu(a),e.callback=null,nu(u,e,a),u=a,t.current.lanes=u,Ua(t,u),Ut(t),l[Zu]=t.current,Gc(l),new xn(t)},ze.version="19.2.4",ze}var _o;function fm(){if(_o)return ci.exports;_o=1;function _(){if(!(typeof __REACT_DEVTOOLS_GLOBAL_HOOK__>"u"||typeof __REACT_DEVTOOLS_GLOBAL_HOOK__.checkDCE!="function"))try{__REACT_DEVTOOLS_GLOBAL_HOOK__.checkDCE(_)}catch(F){console.error(F)}}return _(),ci.exports=nm(),ci.exports}var cm=fm();const Do=po(cm);function im({onBookAdded:_}){const[F,x]=Yl.useState(!1),[y,R]=Yl.useState(""),[X,ll]=Yl.useState(""),ol=async r=>{r.preventDefault();const B=await fetch("/books/add/",{method:"POST",headers:{"Content-Type":"application/json","X-CSRFToken":A()},body:JSON.stringify({title:y,author:X})});if(B.ok){const M=await B.json();_(M),R(""),ll(""),x(!1)}else alert("Error adding book")};function A(){return document.cookie.split("; ").find(r=>r.startsWith("csrftoken="))?.split("=")[1]}return D.jsxs(D.Fragment,{children:[D.jsx("button",{onClick:()=>x(!0),children:"+ Add Book"}),F&&D.jsx("div",{style:sm,children:D.jsxs("div",{style:dm,children:[D.jsx("h2",{children:"Add Book"}),D.jsxs("form",{onSubmit:ol,children:[D.jsx("input",{type:"text",placeholder:"Title",value:y,onChange:r=>R(r.target.value),required:!0}),D.jsx("br",{}),D.jsx("br",{}),D.jsx("input",{type:"text",placeholder:"Author",value:X,onChange:r=>ll(r.target.value),required:!0}),D.jsx("br",{}),D.jsx("br",{}),D.jsx("button",{type:"submit",children:"Save"}),D.jsx("button",{type:"button",onClick:()=>x(!1),children:"Cancel"})]})]})})]})}const sm={position:"fixed",top:0,left:0,width:"100%",height:"100%",backgroundColor:"rgba(0,0,0,0.4)",display:"flex",justifyContent:"center",alignItems:"center",zIndex:9999},dm={background:"white",padding:"20px",borderRadius:"8px",minWidth:"300px"};function om(){const[_,F]=Yl.useState([]);Yl.useEffect(()=>{fetch("/books/api/books/").then(y=>y.json()).then(y=>F(y)).catch(y=>console.error("Error fetching books:",y))},[]);const x=y=>{F(R=>[...R,y])};return D.jsx("div",{style:{marginBottom:"20px"},children:D.jsx(im,{onBookAdded:x})})}function ym({bookId:_,onNoteAdded:F}){const[x,y]=Yl.useState(!1),[R,X]=Yl.useState(""),[ll,ol]=Yl.useState(""),[A,r]=Yl.useState(""),B=async G=>{G.preventDefault();const Sl=await fetch(`/books/api/books/${_}/notes/add/`,{method:"POST",headers:{"Content-Type":"application/json","X-CSRFToken":M()},body:JSON.stringify({content:R,page_number:ll,chapter:A})});if(Sl.ok){const hl=await Sl.json();F(hl),X(""),ol(""),r(""),y(!1)}else alert("Error adding note")};function M(){const G="csrftoken=",hl=decodeURIComponent(document.cookie).split(";");for(let gl=0;gl<hl.length;gl++){let kl=hl[gl].trim();if(kl.indexOf(G)===0)return kl.substring(G.length,kl.length)}return""}return D.jsxs(D.Fragment,{children:[D.jsx("button",{onClick:()=>y(!0),children:"+ Add Note"}),x&&D.jsx("div",{style:vm,children:D.jsxs("div",{style:mm,children:[D.jsx("h2",{children:"Add Note"}),D.jsxs("form",{onSubmit:B,children:[D.jsx("textarea",{placeholder:"Write your note...",value:R,onChange:G=>X(G.target.value),required:!0}),D.jsx("br",{}),D.jsx("br",{}),D.jsx("input",{type:"number",placeholder:"Page (optional)",value:ll,onChange:G=>ol(G.target.value)}),D.jsx("br",{}),D.jsx("br",{}),D.jsx("input",{type:"text",placeholder:"Chapter (optional)",value:A,onChange:G=>r(G.target.value)}),D.jsx("br",{}),D.jsx("br",{}),D.jsx("button",{type:"submit",children:"Save"}),D.jsx("button",{type:"button",onClick:()=>y(!1),children:"Cancel"})]})]})})]})}const vm={position:"fixed",top:0,left:0,width:"100%",height:"100%",backgroundColor:"rgba(0,0,0,0.4)",display:"flex",justifyContent:"center",alignItems:"center"},mm={background:"white",padding:"20px",borderRadius:"8px",minWidth:"300px"};function hm({note:_,onClose:F,onUpdated:x}){const[y,R]=Yl.useState(_.content),[X,ll]=Yl.useState(_.page_number||""),[ol,A]=Yl.useState(_.chapter||""),r=async M=>{M.preventDefault();const G=await fetch(`/books/api/notes/${_.id}/edit/`,{method:"POST",headers:{"Content-Type":"application/json","X-CSRFToken":B()},body:JSON.stringify({content:y,page_number:X,chapter:ol})});if(G.ok){const Sl=await G.json();x(Sl)}else alert("Error updating note")};function B(){const M="csrftoken=",Sl=decodeURIComponent(document.cookie).split(";");for(let hl=0;hl<Sl.length;hl++){let gl=Sl[hl].trim();if(gl.indexOf(M)===0)return gl.substring(M.length,gl.length)}return""}return D.jsx("div",{style:gm,children:D.jsxs("div",{style:Sm,children:[D.jsx("h2",{children:"Edit Note"}),D.jsxs("form",{onSubmit:r,children:[D.jsx("textarea",{value:y,onChange:M=>R(M.target.value),required:!0}),D.jsx("br",{}),D.jsx("br",{}),D.jsx("input",{type:"number",value:X,onChange:M=>ll(M.target.value),placeholder:"Page"}),D.jsx("br",{}),D.jsx("br",{}),D.jsx("input",{type:"text",value:ol,onChange:M=>A(M.target.value),placeholder:"Chapter"}),D.jsx("br",{}),D.jsx("br",{}),D.jsx("button",{type:"submit",children:"Save"}),D.jsx("button",{type:"button",onClick:F,children:"Cancel"})]})]})})}const gm={position:"fixed",top:0,left:0,width:"100%",height:"100%",backgroundColor:"rgba(0,0,0,0.4)",display:"flex",justifyContent:"center",alignItems:"center"},Sm={background:"white",padding:"20px",borderRadius:"8px",minWidth:"300px"};function bm({bookId:_}){const[F,x]=Yl.useState([]),[y,R]=Yl.useState(null),[nc,snc]=Yl.useState(null),X=async A=>{(await fetch(`/books/api/notes/${A}/delete/`,{method:"POST",headers:{"X-CSRFToken":ll()}})).ok?x(F.filter(B=>B.id!==A)):alert("Error deleting note")};function ll(){const A="csrftoken=",B=decodeURIComponent(document.cookie).split(";");for(let M=0;M<B.length;M++){let G=B[M].trim();if(G.indexOf(A)===0)return G.substring(A.length,G.length)}return""}const fn=async A=>{const r=await fetch(A?`/books/api/books/${_}/notes/?page_size=50&cursor=${encodeURIComponent(A)}`:`/books/api/books/${_}/notes/?page_size=50`);return{notes:await r.json(),nextCursor:r.headers.get("X-Next-Cursor")}};Yl.useEffect(()=>{fn(null).then(A=>{x(A.notes),snc(A.nextCursor)})},[_]);const lm=async()=>{const A=await fn(nc);x(r=>[...r,...A.notes]),snc(A.nextCursor)};const ol=A=>{x(r=>[A,...r])};return D.jsxs("div",{children:[D.jsx(ym,{bookId:_,onNoteAdded:ol}),D.jsx("h3",{children:"Notes"}),F.map(A=>D.jsxs("div",{style:rm,children:[A.chapter&&D.jsxs("p",{children:[D.jsx("strong",{children:"Chapter:"})," ",A.chapter]}),A.page_number&&D.jsxs("p",{children:[D.jsx("strong",{children:"Page:"})," ",A.page_number]}),D.jsx("p",{children:A.content}),D.jsx("button",{onClick:()=>R(A),children:"Edit"}),D.jsx("button",{onClick:()=>X(A.id),children:"Delete"})]},A.id)),nc&&D.jsx("button",{onClick:lm,children:"Load more"}),y&&D.jsx(hm,{note:y,onClose:()=>R(null),onUpdated:A=>{x(r=>r.map(B=>B.id===A.id?A:B)),R(null)}})]})}const rm={background:"black",padding:"10px",borderRadius:"8px",marginBottom:"10px"},Oo=document.getElementById("react-root");Oo&&Do.createRoot(Oo).render(D.jsx(Mo.StrictMode,{children:D.jsx(om,{})}));const oi=document.getElementById("notes-root");if(oi){const _=oi.dataset.bookId;Do.createRoot(oi).render(D.jsx(Mo.StrictMode,{children:D.jsx(bm,{bookId:_})}))}